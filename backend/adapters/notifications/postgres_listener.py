@@ -0,0 +1,237 @@
+"""Fan Postgres ``LISTEN`` notifications out to asyncio subscribers.
+
+Each process keeps a single listening connection for its whole life: it is
+opened on a worker thread when the app starts, closed when it stops, and
+reopened with backoff whenever it fails. Notifications are read on the
+event loop and copied into a bounded queue per subscriber. A subscriber
+whose queue fills up is dropped rather than allowed to slow the listener
+down or grow without bound; its stream ends and the client is expected to
+reconnect and resynchronise. Subscribers are ended the same way when the
+connection fails, and when it is reopened after they joined, since
+notifications sent while nothing was listening are lost.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import suppress
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT, connection
+from sqlalchemy.engine import make_url
+
+from backend.adapters.persistence.sqlalchemy.notifications import (
+    CHANGES_CHANNEL,
+    decode_change,
+)
+from backend.domain.incidents.read_models import IncidentChange
+
+logger = logging.getLogger(__name__)
+
+
+def libpq_dsn(database_url: str) -> str:
+    """Turn a SQLAlchemy database URL into a DSN psycopg2 can connect with."""
+    url = make_url(database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class ChangeSubscription:
+    """One subscriber's view of the change stream."""
+
+    def __init__(self, *, incident_id: int | None, max_pending: int):
+        self.incident_id = incident_id
+        self.overflowed = False
+        self.closed = False
+        self._queue: asyncio.Queue[IncidentChange | None] = asyncio.Queue(
+            maxsize=max_pending
+        )
+
+    def matches(self, change: IncidentChange) -> bool:
+        return self.incident_id is None or change.incident_id == self.incident_id
+
+    def offer(self, change: IncidentChange) -> bool:
+        """Queue ``change`` without waiting; ``False`` once the subscriber lags."""
+        if self.closed:
+            return False
+        try:
+            self._queue.put_nowait(change)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self.close()
+            return False
+        return True
+
+    def close(self) -> None:
+        """End the subscription, discarding anything not yet consumed."""
+        if self.closed:
+            return
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def get(self) -> IncidentChange | None:
+        """Next change, or ``None`` once the subscription has ended."""
+        return await self._queue.get()
+
+
+class PostgresChangeListener:
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        channel: str = CHANGES_CHANNEL,
+        max_pending: int = 100,
+        connect: Callable[[str], connection] = psycopg2.connect,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        self._dsn = dsn
+        self._channel = channel
+        self._max_pending = max_pending
+        self._connect = connect
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._connection: connection | None = None
+        self._lost: asyncio.Future[None] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._subscriptions: set[ChangeSubscription] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    @property
+    def listening(self) -> bool:
+        return self._connection is not None
+
+    async def start(self) -> None:
+        """Open the listening connection and keep it open until :meth:`stop`.
+
+        Returns after the first connection attempt. If it fails, startup goes
+        on and the listener keeps retrying in the background.
+        """
+        if self._task is not None:
+            return
+        first_attempt = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(first_attempt))
+        await first_attempt
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        self._close_subscriptions()
+
+    def subscribe(self, *, incident_id: int | None = None) -> ChangeSubscription:
+        """Start receiving changes, for one incident or for all of them.
+
+        Must be called from the event loop that will consume the changes.
+        """
+        subscription = ChangeSubscription(
+            incident_id=incident_id, max_pending=self._max_pending
+        )
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ChangeSubscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    def dispatch(self, change: IncidentChange) -> None:
+        for subscription in list(self._subscriptions):
+            if subscription.matches(change) and not subscription.offer(change):
+                logger.warning(
+                    "dropping change stream subscriber that fell %d changes behind",
+                    self._max_pending,
+                )
+                self._subscriptions.discard(subscription)
+
+    async def _run(self, first_attempt: asyncio.Future[None]) -> None:
+        loop = asyncio.get_running_loop()
+        delay = self._reconnect_delay
+        try:
+            while True:
+                opening = loop.run_in_executor(None, self._open)
+                try:
+                    conn = await asyncio.shield(opening)
+                except asyncio.CancelledError:
+                    opening.add_done_callback(_close_opened)
+                    raise
+                except Exception:
+                    logger.exception(
+                        "change listener could not connect; retrying in %.1fs", delay
+                    )
+                    if not first_attempt.done():
+                        first_attempt.set_result(None)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self._max_reconnect_delay)
+                    continue
+
+                # Anyone already subscribed joined while nothing was listening.
+                self._close_subscriptions()
+                delay = self._reconnect_delay
+                fd = conn.fileno()
+                self._connection = conn
+                self._lost = loop.create_future()
+                loop.add_reader(fd, self._on_readable)
+                if not first_attempt.done():
+                    first_attempt.set_result(None)
+                try:
+                    await self._lost
+                finally:
+                    loop.remove_reader(fd)
+                    self._connection = None
+                    self._lost = None
+                    conn.close()
+        finally:
+            if not first_attempt.done():
+                first_attempt.set_result(None)
+
+    def _open(self) -> connection:
+        conn = self._connect(self._dsn)
+        try:
+            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN "{self._channel}"')
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _close_subscriptions(self) -> None:
+        for subscription in self._subscriptions:
+            subscription.close()
+        self._subscriptions.clear()
+
+    def _on_readable(self) -> None:
+        conn = self._connection
+        if conn is None:
+            return
+        try:
+            conn.poll()
+        except psycopg2.Error:
+            # Subscribers resync; the connection is reopened in _run.
+            logger.exception("change listener connection failed; reconnecting")
+            self._close_subscriptions()
+            if self._lost is not None and not self._lost.done():
+                self._lost.set_result(None)
+            return
+
+        while conn.notifies:
+            notify = conn.notifies.pop(0)
+            try:
+                change = decode_change(notify.payload)
+            except (ValueError, KeyError, TypeError):
+                logger.warning("ignoring malformed change notification: %r", notify.payload)
+                continue
+            self.dispatch(change)
+
+
+def _close_opened(opening: asyncio.Future[connection]) -> None:
+    # The listener stopped while a connection was being opened.
+    if not opening.cancelled() and opening.exception() is None:
+        opening.result().close()
@@ -1,33 +1,85 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+from datetime import datetime
+
 from backend.db.models.incident import Incident as IncidentModel
 from backend.db.models.timeline_event import TimelineEvent as TimelineEventModel
 from backend.domain.incidents.entities import Incident, TimelineEvent
+from backend.domain.incidents.enums import Severity, Status
+
+def _column(model, name: str, fields: Collection[str] | None):
+    # Columns left out of a sparse projection map to None rather than
+    # triggering a lazy load per row.
+    if fields is not None and name not in fields:
+        return None
+    return getattr(model, name)
 
-def to_domain_event(model: TimelineEventModel) -> TimelineEvent:
+def to_domain_event(
+    model: TimelineEventModel, *, fields: Collection[str] | None = None
+) -> TimelineEvent:
     return TimelineEvent(
         id=model.id,
-        incident_id=model.incident_id,
-        occurred_at=model.occurred_at,
-        event_type=model.event_type,
-        message=model.message,
-        created_at=model.created_at,
-        updated_at=model.updated_at,
+        incident_id=_column(model, "incident_id", fields),
+        occurred_at=_column(model, "occurred_at", fields),
+        event_type=_column(model, "event_type", fields),
+        message=_column(model, "message", fields),
+        created_at=_column(model, "created_at", fields),
+        updated_at=_column(model, "updated_at", fields),
     )
 
-def to_domain_incident(model: IncidentModel, *, includes_events: bool = False) -> Incident:
+def to_domain_incident(
+    model: IncidentModel,
+    *,
+    includes_events: bool = False,
+    fields: Collection[str] | None = None,
+) -> Incident:
     incident = Incident(
         id=model.id,
-        title=model.title,
-        description=model.description,
-        severity=model.severity,
-        status=model.status,
-        created_at=model.created_at,
-        updated_at=model.updated_at,
+        title=_column(model, "title", fields),
+        description=_column(model, "description", fields),
+        severity=_column(model, "severity", fields),
+        status=_column(model, "status", fields),
+        created_at=_column(model, "created_at", fields),
+        updated_at=_column(model, "updated_at", fields),
         events=[],
+        event_count=_column(model, "event_count", fields),
+        last_event_at=_column(model, "last_event_at", fields),
     )
 
     if includes_events:
         incident.events = [to_domain_event(e) for e in (model.events or [])]
-    
-    return incident
\ No newline at end of file
+
+    return incident
+
+def _timestamp(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
+
+def event_from_json(row: dict) -> TimelineEvent:
+    """Map a ``row_to_json`` object of ``timeline_events`` columns."""
+    return TimelineEvent(
+        id=row["id"],
+        incident_id=row["incident_id"],
+        occurred_at=_timestamp(row["occurred_at"]),
+        event_type=row["event_type"],
+        message=row["message"],
+        created_at=_timestamp(row["created_at"]),
+        updated_at=_timestamp(row["updated_at"]),
+    )
+
+def incident_from_json(row: dict) -> Incident:
+    """Map a ``row_to_json`` object of ``incidents`` columns.
+
+    Enum columns arrive as their stored member names.
+    """
+    return Incident(
+        id=row["id"],
+        title=row["title"],
+        description=row.get("description"),
+        severity=Severity[row["severity"]],
+        status=Status[row["status"]],
+        created_at=_timestamp(row["created_at"]),
+        updated_at=_timestamp(row["updated_at"]),
+        event_count=row["event_count"],
+        last_event_at=_timestamp(row["last_event_at"]),
+    )
@@ -0,0 +1,97 @@
+"""Change log entries and Postgres ``NOTIFY`` for incident and timeline writes.
+
+Repositories record each write on the session; just before it commits, the
+unit of work appends the recorded changes to ``change_log`` and sends them
+with ``pg_notify``. Postgres only delivers notifications when the transaction
+commits, so listeners never see changes that were rolled back.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from backend.db.models.change_log import ChangeLogEntry
+
+from backend.domain.incidents.enums import ChangeAction, ChangeEntity
+from backend.domain.incidents.read_models import IncidentChange
+
+CHANGES_CHANNEL = "incident_changes"
+
+# Advisory lock key serialising change log appends; see publish_pending_changes.
+CHANGE_LOG_LOCK_KEY = 0x6368616E6765  # "change"
+
+_PENDING_KEY = "pending_incident_changes"
+
+
+def record_change(
+    session: Session,
+    entity: ChangeEntity,
+    action: ChangeAction,
+    *,
+    incident_id: int,
+    id: int,
+) -> None:
+    session.info.setdefault(_PENDING_KEY, []).append(
+        IncidentChange(entity=entity, action=action, incident_id=incident_id, id=id)
+    )
+
+
+def publish_pending_changes(session: Session) -> None:
+    """Log and notify every recorded change as part of the current transaction."""
+    changes = session.info.pop(_PENDING_KEY, [])
+    if not changes:
+        return
+
+    # Held until commit, so writers take change log sequence numbers in
+    # commit order: once a reader has seen seq N, no smaller seq can still
+    # appear. Only this last step of each write transaction is serialised.
+    session.execute(select(func.pg_advisory_xact_lock(CHANGE_LOG_LOCK_KEY)))
+    seqs = session.scalars(
+        insert(ChangeLogEntry).returning(
+            ChangeLogEntry.seq, sort_by_parameter_order=True
+        ),
+        [
+            {
+                "entity": change.entity,
+                "action": change.action,
+                "incident_id": change.incident_id,
+                "entity_id": change.id,
+            }
+            for change in changes
+        ],
+    ).all()
+    for change, seq in zip(changes, seqs):
+        logged = replace(change, seq=seq)
+        session.execute(select(func.pg_notify(CHANGES_CHANNEL, encode_change(logged))))
+
+
+def discard_pending_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def encode_change(change: IncidentChange) -> str:
+    return json.dumps(
+        {
+            "entity": change.entity.value,
+            "action": change.action.value,
+            "incident_id": change.incident_id,
+            "id": change.id,
+            "seq": change.seq,
+        },
+        separators=(",", ":"),
+    )
+
+
+def decode_change(payload: str) -> IncidentChange:
+    data = json.loads(payload)
+    return IncidentChange(
+        entity=ChangeEntity(data["entity"]),
+        action=ChangeAction(data["action"]),
+        incident_id=int(data["incident_id"]),
+        id=int(data["id"]),
+        seq=data.get("seq"),
+    )
@@ -1,34 +1,239 @@
 from __future__ import annotations
 
-from sqlalchemy import exists, func, select
-from sqlalchemy.orm import Session, selectinload
+from collections import Counter
+from collections.abc import Collection
+from datetime import datetime, timedelta
 
+from sqlalchemy import (
+    BigInteger,
+    Float,
+    any_,
+    cast,
+    exists,
+    func,
+    literal,
+    select,
+    text,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by, array
+from sqlalchemy.orm import Session, aliased, load_only, selectinload
+
+from backend.db.models.change_log import ChangeLogEntry
 from backend.db.models.incident import Incident as IncidentModel
+from backend.db.models.incident_status_change import IncidentStatusChange
+from backend.db.models.rollup import IncidentHourlyRollup, TimelineEventHourlyRollup
 from backend.db.models.timeline_event import TimelineEvent as TimelineEventModel
 from backend.domain.incidents.entities import Incident, TimelineEvent
-from backend.domain.incidents.enums import Severity, Status
+from backend.domain.incidents.enums import (
+    ChangeAction,
+    ChangeEntity,
+    IncidentSort,
+    Severity,
+    SortDirection,
+    StatsBucket,
+    StatsSource,
+    Status,
+    TimelineOrder,
+)
+from backend.domain.incidents.read_models import (
+    CreatedBucketCount,
+    DashboardSnapshot,
+    IncidentChange,
+    DurationPercentiles,
+    EventTypeCount,
+    IncidentStats,
+    SeverityResponseTimes,
+    StatusSeverityCount,
+)
 from backend.adapters.persistence.sqlalchemy.mappers import (
+    event_from_json,
+    incident_from_json,
     to_domain_incident,
     to_domain_event,
 )
+from backend.adapters.persistence.sqlalchemy.notifications import record_change
+from backend.adapters.persistence.sqlalchemy.rollups import (
+    apply_event_deltas,
+    apply_incident_deltas,
+    event_rollup_key,
+    hour_bucket,
+    incident_events_deltas,
+    incident_rollup_key,
+)
+
+
+def _timeline_order_by(order_by: TimelineOrder):
+    if order_by == TimelineOrder.OCCURRED_AT:
+        return (TimelineEventModel.occurred_at.desc(), TimelineEventModel.id.desc())
+    return (TimelineEventModel.created_at.desc(), TimelineEventModel.id.desc())
+
+
+def _incident_sort_columns(sort: IncidentSort) -> tuple:
+    """Sort key columns, each ending in the leading columns of an index.
+
+    ``id`` is appended as the final tie-breaker. Every key column and ``id``
+    run in the same direction, so one index serves both directions and a
+    keyset row comparison maps onto a single index range.
+    """
+    if sort == IncidentSort.UPDATED_AT:
+        return (IncidentModel.updated_at,)
+    if sort == IncidentSort.SEVERITY:
+        # Served by ix_incidents_severity_created_at.
+        return (IncidentModel.severity, IncidentModel.created_at)
+    if sort == IncidentSort.LAST_ACTIVITY:
+        # Matches the expression index ix_incidents_last_activity.
+        last_activity = func.coalesce(
+            IncidentModel.last_event_at, IncidentModel.created_at
+        )
+        return (last_activity,)
+    return (IncidentModel.created_at,)
+
+
+# Columns the keyset cursor reads back from the last incident of a page.
+_INCIDENT_SORT_FIELDS = {
+    IncidentSort.CREATED_AT: ("created_at",),
+    IncidentSort.UPDATED_AT: ("updated_at",),
+    IncidentSort.SEVERITY: ("severity", "created_at"),
+    IncidentSort.LAST_ACTIVITY: ("last_event_at", "created_at"),
+}
+
+
+def _sparse_columns(
+    model_cls, fields: Collection[str], required: Collection[str] = ()
+) -> tuple[set[str], object]:
+    """Column names to load for a sparse fieldset and the matching load_only().
+
+    Names that are not columns (such as ``events``) are ignored; the primary
+    key is always loaded.
+    """
+    columns = model_cls.__table__.columns
+    names = {"id", *required, *(name for name in fields if name in columns)}
+    return names, load_only(*(getattr(model_cls, name) for name in names))
+
+
+def _json_rows(cte, *order_by):
+    """Scalar subquery aggregating every row of ``cte`` into a JSON array."""
+    row = func.row_to_json(cte.table_valued())
+    rows = func.json_agg(aggregate_order_by(row, *order_by) if order_by else row)
+    return (
+        select(func.coalesce(rows, text("'[]'::json")))
+        .select_from(cte)
+        .scalar_subquery()
+    )
+
+
+def _apply_incident_keyset(
+    stmt,
+    sort: IncidentSort,
+    direction: SortDirection,
+    after: tuple | None,
+):
+    columns = (*_incident_sort_columns(sort), IncidentModel.id)
+    if after is not None:
+        key = tuple_(*columns)
+        if direction == SortDirection.DESC:
+            stmt = stmt.where(key < after)
+        else:
+            stmt = stmt.where(key > after)
+    if direction == SortDirection.DESC:
+        return stmt.order_by(*(column.desc() for column in columns))
+    return stmt.order_by(*(column.asc() for column in columns))
+
+
+def _enum_filter(column, value):
+    """Equality for a single value, ``IN`` for several; ``None`` when unfiltered."""
+    values = (value,) if isinstance(value, (Status, Severity)) else tuple(value or ())
+    if not values:
+        return None
+    if len(values) == 1:
+        return column == values[0]
+    return column.in_(values)
+
+
+RESPONSE_TIME_PERCENTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+def _rollup_with_edges(
+    rollup, bucket_hour, raw, created_at, created_after, created_before
+):
+    """Whole hours from a rollup plus raw rows for the partial hours at either edge."""
+    first_hour = hour_bucket(created_after) if created_after else None
+    if first_hour is not None and first_hour < created_after:
+        first_hour += timedelta(hours=1)
+    last_hour = hour_bucket(created_before) if created_before else None
+    if first_hour is not None and last_hour is not None:
+        last_hour = max(last_hour, first_hour)
+
+    if first_hour is not None:
+        rollup = rollup.where(bucket_hour >= first_hour)
+    if last_hour is not None:
+        rollup = rollup.where(bucket_hour < last_hour)
+
+    parts = [rollup]
+    if first_hour is not None and first_hour > created_after:
+        parts.append(
+            raw.where(
+                created_at >= created_after,
+                created_at < min(first_hour, created_before or first_hour),
+            )
+        )
+    if last_hour is not None and last_hour < created_before:
+        parts.append(raw.where(created_at >= last_hour, created_at < created_before))
+    return union_all(*parts)
+
+
+def _duration_percentiles(count: int, values: list[float] | None) -> DurationPercentiles:
+    if not count or values is None:
+        return DurationPercentiles(count=0)
+    return DurationPercentiles(count, *values)
 
 
 class SqlAlchemyIncidentRepository:
     def __init__(self, session: Session):
         self.session = session
 
-    def _apply_filters(self, stmt, *, status: Status | None, severity: Severity | None):
-        if status:
-            stmt = stmt.where(IncidentModel.status == status)
-        if severity:
-            stmt = stmt.where(IncidentModel.severity == severity)
+    def _apply_filters(
+        self,
+        stmt,
+        *,
+        status: Status | Collection[Status] | None,
+        severity: Severity | Collection[Severity] | None,
+        created_after: datetime | None,
+        created_before: datetime | None,
+        active_only: bool = False,
+    ):
+        if active_only:
+            # Matches the predicate of ix_incidents_active_created_at.
+            stmt = stmt.where(IncidentModel.status != Status.RESOLVED)
+        for condition in (
+            _enum_filter(IncidentModel.status, status),
+            _enum_filter(IncidentModel.severity, severity),
+        ):
+            if condition is not None:
+                stmt = stmt.where(condition)
+        if created_after:
+            stmt = stmt.where(IncidentModel.created_at >= created_after)
+        if created_before:
+            stmt = stmt.where(IncidentModel.created_at < created_before)
         return stmt
 
     def list(
         self,
         *,
-        status: Status | None = None,
-        severity: Severity | None = None,
+        status: Status | Collection[Status] | None = None,
+        severity: Severity | Collection[Severity] | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        active_only: bool = False,
+        sort: IncidentSort = IncidentSort.CREATED_AT,
+        direction: SortDirection = SortDirection.DESC,
+        after: tuple | None = None,
+        include_latest_events: int = 0,
+        fields: Collection[str] | None = None,
         limit: int = 50,
         offset: int = 0,
     ) -> list[Incident]:
@@ -36,44 +241,415 @@ class SqlAlchemyIncidentRepository:
             select(IncidentModel),
             status=status,
             severity=severity,
+            created_after=created_after,
+            created_before=created_before,
+            active_only=active_only,
+        )
+        if fields is not None:
+            fields, option = _sparse_columns(
+                IncidentModel, fields, _INCIDENT_SORT_FIELDS[sort]
+            )
+            stmt = stmt.options(option)
+        stmt = _apply_incident_keyset(stmt, sort, direction, after)
+        stmt = stmt.limit(limit).offset(offset)
+        models = self.session.execute(stmt).scalars().all()
+        incidents = [to_domain_incident(m, fields=fields) for m in models]
+        if include_latest_events and incidents:
+            self._attach_latest_events(incidents, include_latest_events)
+        return incidents
+
+    def _attach_latest_events(
+        self, incidents: list[Incident], per_incident: int
+    ) -> None:
+        # A LATERAL subquery per page row reads at most per_incident entries
+        # from ix_timeline_incident_created, however long each timeline is.
+        latest = (
+            select(TimelineEventModel)
+            .where(TimelineEventModel.incident_id == IncidentModel.id)
+            .order_by(*_timeline_order_by(TimelineOrder.CREATED_AT))
+            .limit(per_incident)
+            .lateral("latest_events")
         )
+        latest_event = aliased(TimelineEventModel, latest)
+        ids = literal([incident.id for incident in incidents], ARRAY(BigInteger))
         stmt = (
-            stmt.order_by(IncidentModel.created_at.desc(), IncidentModel.id.desc())
-            .limit(limit)
-            .offset(offset)
+            select(latest_event)
+            .select_from(IncidentModel)
+            .join(latest, true())
+            .where(IncidentModel.id == any_(ids))
+            .order_by(
+                latest.c.incident_id,
+                latest.c.created_at.desc(),
+                latest.c.id.desc(),
+            )
         )
-        models = self.session.execute(stmt).scalars().all()
-        return [to_domain_incident(m) for m in models]
+        events_by_incident: dict[int, list[TimelineEvent]] = {}
+        for model in self.session.execute(stmt).scalars():
+            events_by_incident.setdefault(model.incident_id, []).append(
+                to_domain_event(model)
+            )
+        for incident in incidents:
+            incident.events = events_by_incident.get(incident.id, [])
 
     def count(
-        self, *, status: Status | None = None, severity: Severity | None = None
+        self,
+        *,
+        status: Status | Collection[Status] | None = None,
+        severity: Severity | Collection[Severity] | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        active_only: bool = False,
     ) -> int:
         stmt = self._apply_filters(
             select(func.count()).select_from(IncidentModel),
             status=status,
             severity=severity,
+            created_after=created_after,
+            created_before=created_before,
+            active_only=active_only,
         )
         return int(self.session.scalar(stmt))
 
-    def get(self, incident_id: int) -> Incident | None:
-        stmt = select(IncidentModel).where(IncidentModel.id == incident_id)
-        model = self.session.execute(stmt).scalar_one_or_none()
-        return to_domain_incident(model) if model else None
+    def dashboard(
+        self, *, active_limit: int = 50, recent_events: int = 20
+    ) -> DashboardSnapshot:
+        # Three CTEs folded into JSON columns of a single row, so the whole
+        # dashboard is one statement and one round trip. Each CTE is served
+        # by its own index: the active partial index, the status/severity
+        # rollups and the global created_at index on timeline_events.
+        active = (
+            select(
+                IncidentModel.id,
+                IncidentModel.title,
+                IncidentModel.status,
+                IncidentModel.severity,
+                IncidentModel.created_at,
+                IncidentModel.updated_at,
+                IncidentModel.event_count,
+                IncidentModel.last_event_at,
+            )
+            .where(IncidentModel.status != Status.RESOLVED)
+            .order_by(IncidentModel.created_at.desc(), IncidentModel.id.desc())
+            .limit(active_limit)
+            .cte("active")
+        )
+        counts = (
+            select(
+                IncidentHourlyRollup.status,
+                IncidentHourlyRollup.severity,
+                func.sum(IncidentHourlyRollup.incident_count).label("count"),
+            )
+            .group_by(IncidentHourlyRollup.status, IncidentHourlyRollup.severity)
+            .cte("counts")
+        )
+        recent = (
+            select(TimelineEventModel.__table__)
+            .order_by(
+                TimelineEventModel.created_at.desc(), TimelineEventModel.id.desc()
+            )
+            .limit(recent_events)
+            .cte("recent")
+        )
+        stmt = select(
+            _json_rows(active, active.c.created_at.desc(), active.c.id.desc()),
+            _json_rows(counts),
+            _json_rows(recent, recent.c.created_at.desc(), recent.c.id.desc()),
+        )
+        active_rows, count_rows, recent_rows = self.session.execute(stmt).one()
 
-    def get_with_events(self, incident_id: int) -> Incident | None:
+        counted = {
+            (Status[row["status"]], Severity[row["severity"]]): int(row["count"])
+            for row in count_rows
+        }
+        return DashboardSnapshot(
+            active_incidents=[incident_from_json(row) for row in active_rows],
+            by_status_severity=[
+                StatusSeverityCount(status, severity, counted.get((status, severity), 0))
+                for status in Status
+                for severity in Severity
+            ],
+            recent_events=[event_from_json(row) for row in recent_rows],
+        )
+
+    def stats(
+        self,
+        *,
+        bucket: StatsBucket = StatsBucket.DAY,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        source: StatsSource = StatsSource.RAW,
+    ) -> IncidentStats:
+        if any(
+            bound is not None and bound.tzinfo is None
+            for bound in (created_after, created_before)
+        ):
+            raise ValueError("stats window bounds must be timezone-aware")
+        if source == StatsSource.ROLLUP:
+            rows = self._rollup_stats_rows(created_after, created_before)
+        else:
+            rows = self._apply_filters(
+                select(
+                    IncidentModel.status,
+                    IncidentModel.severity,
+                    IncidentModel.created_at,
+                    literal(1).label("n"),
+                ),
+                status=None,
+                severity=None,
+                created_after=created_after,
+                created_before=created_before,
+            )
+        rows = rows.subquery("stats_rows")
+
+        # Buckets are truncated in UTC so they do not shift with the session
+        # time zone.
+        bucket_start = func.date_trunc(bucket.value, rows.c.created_at, "UTC")
+        stmt = select(
+            rows.c.status,
+            rows.c.severity,
+            bucket_start.label("bucket_start"),
+            func.sum(rows.c.n).label("count"),
+        ).group_by(
+            func.grouping_sets(
+                tuple_(rows.c.status, rows.c.severity),
+                tuple_(bucket_start),
+                tuple_(),
+            )
+        )
+
+        # status and created_at are NOT NULL, so a NULL in a grouping column
+        # can only mean that column was rolled up by the grouping set.
+        total = 0
+        matrix: dict[tuple[Status, Severity], int] = {}
+        created: list[CreatedBucketCount] = []
+        for row in self.session.execute(stmt):
+            count = int(row.count or 0)
+            if row.status is not None:
+                matrix[(row.status, row.severity)] = count
+            elif row.bucket_start is not None:
+                if count:
+                    created.append(CreatedBucketCount(row.bucket_start, count))
+            else:
+                total = count
+
+        return IncidentStats(
+            bucket=bucket,
+            total=total,
+            source=source,
+            by_status_severity=[
+                StatusSeverityCount(status, severity, matrix.get((status, severity), 0))
+                for status in Status
+                for severity in Severity
+            ],
+            created=sorted(created, key=lambda item: item.bucket_start),
+            events_by_type=self._event_type_counts(
+                created_after, created_before, source
+            ),
+        )
+
+    def response_times(
+        self,
+        *,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> list[SeverityResponseTimes]:
+        change = IncidentStatusChange
+        transitioned = change.from_status.is_not(None)
+        acknowledged_at = func.min(change.changed_at).filter(
+            transitioned, change.to_status != Status.OPEN
+        )
+        resolved_at = func.min(change.changed_at).filter(
+            transitioned, change.to_status == Status.RESOLVED
+        )
+        per_incident = self._apply_filters(
+            select(
+                IncidentModel.severity,
+                cast(
+                    func.extract("epoch", acknowledged_at - IncidentModel.created_at),
+                    Float,
+                ).label("time_to_acknowledge"),
+                cast(
+                    func.extract("epoch", resolved_at - IncidentModel.created_at),
+                    Float,
+                ).label("time_to_resolve"),
+            )
+            .join(change, change.incident_id == IncidentModel.id)
+            .group_by(IncidentModel.id),
+            status=None,
+            severity=None,
+            created_after=created_after,
+            created_before=created_before,
+        ).subquery("per_incident")
+
+        # One ordered-set aggregate per metric computes every percentile in a
+        # single sort instead of one pass per percentile.
+        fractions = array(RESPONSE_TIME_PERCENTILES)
+        stmt = select(
+            per_incident.c.severity,
+            func.count(per_incident.c.time_to_acknowledge).label("acknowledged"),
+            func.percentile_cont(fractions)
+            .within_group(per_incident.c.time_to_acknowledge)
+            .label("acknowledge_percentiles"),
+            func.count(per_incident.c.time_to_resolve).label("resolved"),
+            func.percentile_cont(fractions)
+            .within_group(per_incident.c.time_to_resolve)
+            .label("resolve_percentiles"),
+        ).group_by(per_incident.c.severity)
+        rows = {row.severity: row for row in self.session.execute(stmt)}
+
+        results = []
+        for severity in Severity:
+            row = rows.get(severity)
+            results.append(
+                SeverityResponseTimes(
+                    severity=severity,
+                    time_to_acknowledge=_duration_percentiles(
+                        row.acknowledged if row else 0,
+                        row.acknowledge_percentiles if row else None,
+                    ),
+                    time_to_resolve=_duration_percentiles(
+                        row.resolved if row else 0,
+                        row.resolve_percentiles if row else None,
+                    ),
+                )
+            )
+        return results
+
+    def _rollup_stats_rows(
+        self,
+        created_after: datetime | None,
+        created_before: datetime | None,
+    ):
+        return _rollup_with_edges(
+            select(
+                IncidentHourlyRollup.status,
+                IncidentHourlyRollup.severity,
+                IncidentHourlyRollup.bucket_hour.label("created_at"),
+                IncidentHourlyRollup.incident_count.label("n"),
+            ),
+            IncidentHourlyRollup.bucket_hour,
+            select(
+                IncidentModel.status,
+                IncidentModel.severity,
+                IncidentModel.created_at,
+                literal(1).label("n"),
+            ),
+            IncidentModel.created_at,
+            created_after,
+            created_before,
+        )
+
+    def _event_type_counts(
+        self,
+        created_after: datetime | None,
+        created_before: datetime | None,
+        source: StatsSource,
+    ) -> list[EventTypeCount]:
+        raw = select(TimelineEventModel.event_type, literal(1).label("n"))
+        if source == StatsSource.ROLLUP:
+            rows = _rollup_with_edges(
+                select(
+                    TimelineEventHourlyRollup.event_type,
+                    TimelineEventHourlyRollup.event_count.label("n"),
+                ),
+                TimelineEventHourlyRollup.bucket_hour,
+                raw,
+                TimelineEventModel.created_at,
+                created_after,
+                created_before,
+            )
+        else:
+            rows = raw
+            if created_after is not None:
+                rows = rows.where(TimelineEventModel.created_at >= created_after)
+            if created_before is not None:
+                rows = rows.where(TimelineEventModel.created_at < created_before)
+        rows = rows.subquery("event_rows")
         stmt = (
-            select(IncidentModel)
-            .where(IncidentModel.id == incident_id)
-            .options(selectinload(IncidentModel.events))
+            select(rows.c.event_type, func.sum(rows.c.n).label("count"))
+            .group_by(rows.c.event_type)
+            .having(func.sum(rows.c.n) > 0)
+            .order_by(rows.c.event_type)
         )
+        return [
+            EventTypeCount(row.event_type, int(row.count))
+            for row in self.session.execute(stmt)
+        ]
+
+    def get(
+        self, incident_id: int, *, fields: Collection[str] | None = None
+    ) -> Incident | None:
+        stmt = select(IncidentModel).where(IncidentModel.id == incident_id)
+        if fields is not None:
+            fields, option = _sparse_columns(IncidentModel, fields)
+            stmt = stmt.options(option)
         model = self.session.execute(stmt).scalar_one_or_none()
-        return to_domain_incident(model, includes_events=True) if model else None
+        return to_domain_incident(model, fields=fields) if model else None
+
+    def get_many(
+        self, incident_ids: Collection[int], *, with_events: bool = False
+    ) -> list[Incident]:
+        # A single array parameter keeps the statement text identical for any
+        # number of ids, unlike an expanded IN list.
+        ids = literal(list(incident_ids), ARRAY(BigInteger))
+        stmt = select(IncidentModel).where(IncidentModel.id == any_(ids))
+        if with_events:
+            # One extra SELECT ... WHERE incident_id IN (...) for every event,
+            # ordered by the relationship's created_at DESC, id DESC.
+            stmt = stmt.options(selectinload(IncidentModel.events))
+        models = self.session.execute(stmt).scalars().all()
+        return [to_domain_incident(m, includes_events=with_events) for m in models]
+
+    def get_with_events(
+        self,
+        incident_id: int,
+        *,
+        events_order_by: TimelineOrder = TimelineOrder.CREATED_AT,
+        fields: Collection[str] | None = None,
+    ) -> Incident | None:
+        stmt = select(IncidentModel).where(IncidentModel.id == incident_id)
+        if fields is not None:
+            fields, option = _sparse_columns(IncidentModel, fields)
+            stmt = stmt.options(option)
+        model = self.session.execute(stmt).scalar_one_or_none()
+        if not model:
+            return None
+
+        # Load the timeline with an explicit ORDER BY rather than through the
+        # relationship so either report ordering is served by its own index.
+        events_stmt = (
+            select(TimelineEventModel)
+            .where(TimelineEventModel.incident_id == incident_id)
+            .order_by(*_timeline_order_by(events_order_by))
+        )
+        event_models = self.session.execute(events_stmt).scalars().all()
+
+        incident = to_domain_incident(model, fields=fields)
+        incident.events = [to_domain_event(e) for e in event_models]
+        return incident
 
     def create(self, incident_data: dict) -> Incident:
         model = IncidentModel(**incident_data)
         self.session.add(model)
         self.session.flush()
         self.session.refresh(model)
+        apply_incident_deltas(self.session, Counter({incident_rollup_key(model): 1}))
+        self.session.add(
+            IncidentStatusChange(
+                incident_id=model.id,
+                from_status=None,
+                to_status=model.status,
+                changed_at=model.created_at,
+            )
+        )
+        self.session.flush()
+        record_change(
+            self.session,
+            ChangeEntity.INCIDENT,
+            ChangeAction.CREATED,
+            incident_id=model.id,
+            id=model.id,
+        )
         return to_domain_incident(model)
 
     def update(self, incident_id: int, changes: dict) -> Incident | None:
@@ -82,12 +658,36 @@ class SqlAlchemyIncidentRepository:
         if not model:
             return None
 
+        previous_key = incident_rollup_key(model)
+        previous_status = model.status
         for key, value in changes.items():
             setattr(model, key, value)
 
         self.session.add(model)
         self.session.flush()
         self.session.refresh(model)
+        current_key = incident_rollup_key(model)
+        if current_key != previous_key:
+            apply_incident_deltas(
+                self.session, Counter({previous_key: -1, current_key: 1})
+            )
+        if model.status != previous_status:
+            self.session.add(
+                IncidentStatusChange(
+                    incident_id=model.id,
+                    from_status=previous_status,
+                    to_status=model.status,
+                    changed_at=model.updated_at,
+                )
+            )
+            self.session.flush()
+        record_change(
+            self.session,
+            ChangeEntity.INCIDENT,
+            ChangeAction.UPDATED,
+            incident_id=model.id,
+            id=model.id,
+        )
         return to_domain_incident(model)
 
     def delete(self, incident_id: int) -> bool:
@@ -96,8 +696,17 @@ class SqlAlchemyIncidentRepository:
         if not model:
             return False
 
+        apply_event_deltas(self.session, incident_events_deltas(self.session, incident_id))
+        apply_incident_deltas(self.session, Counter({incident_rollup_key(model): -1}))
         self.session.delete(model)
         self.session.flush()
+        record_change(
+            self.session,
+            ChangeEntity.INCIDENT,
+            ChangeAction.DELETED,
+            incident_id=incident_id,
+            id=incident_id,
+        )
         return True
 
     def exists(self, incident_id: int) -> bool:
@@ -109,42 +718,144 @@ class SqlAlchemyTimelineEventRepository:
     def __init__(self, session: Session):
         self.session = session
 
+    def _apply_filters(
+        self,
+        stmt,
+        *,
+        incident_id: int,
+        event_type: str | None,
+        occurred_after: datetime | None,
+        occurred_before: datetime | None,
+    ):
+        stmt = stmt.where(TimelineEventModel.incident_id == incident_id)
+        if event_type:
+            stmt = stmt.where(TimelineEventModel.event_type == event_type)
+        if occurred_after:
+            stmt = stmt.where(TimelineEventModel.occurred_at >= occurred_after)
+        if occurred_before:
+            stmt = stmt.where(TimelineEventModel.occurred_at < occurred_before)
+        return stmt
+
     def list_incident_events(
-        self, incident_id: int, *, limit: int = 50, offset: int = 0
+        self,
+        incident_id: int,
+        *,
+        event_type: str | None = None,
+        occurred_after: datetime | None = None,
+        occurred_before: datetime | None = None,
+        order_by: TimelineOrder = TimelineOrder.CREATED_AT,
+        fields: Collection[str] | None = None,
+        limit: int = 50,
+        offset: int = 0,
     ) -> list[TimelineEvent]:
-        stmt = (
-            select(TimelineEventModel)
-            .where(
-                TimelineEventModel.incident_id == incident_id,
-            )
-            .order_by(
-                TimelineEventModel.created_at.desc(), TimelineEventModel.id.desc()
-            )
-            .limit(limit)
-            .offset(offset)
+        stmt = self._apply_filters(
+            select(TimelineEventModel),
+            incident_id=incident_id,
+            event_type=event_type,
+            occurred_after=occurred_after,
+            occurred_before=occurred_before,
         )
+        if fields is not None:
+            fields, option = _sparse_columns(TimelineEventModel, fields)
+            stmt = stmt.options(option)
+        stmt = stmt.order_by(*_timeline_order_by(order_by)).limit(limit).offset(offset)
+        models = self.session.execute(stmt).scalars().all()
+        return [to_domain_event(model, fields=fields) for model in models]
+
+    def list_recent(
+        self,
+        *,
+        event_type: str | None = None,
+        severity: Severity | Collection[Severity] | None = None,
+        after: tuple[datetime, int] | None = None,
+        limit: int = 50,
+    ) -> list[TimelineEvent]:
+        # Walks ix_timeline_events_created_at (or the event_type variant)
+        # newest first and stops after ``limit`` rows; the keyset comparison
+        # becomes the index start point, so deep pages cost the same.
+        stmt = select(TimelineEventModel)
+        if event_type:
+            stmt = stmt.where(TimelineEventModel.event_type == event_type)
+        severity_filter = _enum_filter(IncidentModel.severity, severity)
+        if severity_filter is not None:
+            stmt = stmt.join(
+                IncidentModel, IncidentModel.id == TimelineEventModel.incident_id
+            ).where(severity_filter)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(TimelineEventModel.created_at, TimelineEventModel.id) < after
+            )
+        stmt = stmt.order_by(
+            TimelineEventModel.created_at.desc(), TimelineEventModel.id.desc()
+        ).limit(limit)
         models = self.session.execute(stmt).scalars().all()
         return [to_domain_event(model) for model in models]
 
-    def count_incident_events(self, incident_id: int) -> int:
-        stmt = select(func.count()).select_from(TimelineEventModel).where(
-            TimelineEventModel.incident_id == incident_id,
+    def count_incident_events(
+        self,
+        incident_id: int,
+        *,
+        event_type: str | None = None,
+        occurred_after: datetime | None = None,
+        occurred_before: datetime | None = None,
+    ) -> int:
+        if not (event_type or occurred_after or occurred_before):
+            # The unfiltered total is kept on the incident row.
+            stmt = select(IncidentModel.event_count).where(
+                IncidentModel.id == incident_id
+            )
+            return int(self.session.scalar(stmt) or 0)
+
+        stmt = self._apply_filters(
+            select(func.count()).select_from(TimelineEventModel),
+            incident_id=incident_id,
+            event_type=event_type,
+            occurred_after=occurred_after,
+            occurred_before=occurred_before,
         )
         return int(self.session.scalar(stmt))
 
-    def get(self, incident_id: int, event_id: int) -> TimelineEvent | None:
+    def get(
+        self,
+        incident_id: int,
+        event_id: int,
+        *,
+        fields: Collection[str] | None = None,
+    ) -> TimelineEvent | None:
         stmt = select(TimelineEventModel).where(
             TimelineEventModel.id == event_id,
             TimelineEventModel.incident_id == incident_id,
         )
+        if fields is not None:
+            fields, option = _sparse_columns(TimelineEventModel, fields)
+            stmt = stmt.options(option)
         model = self.session.execute(stmt).scalar_one_or_none()
-        return to_domain_event(model) if model else None
+        return to_domain_event(model, fields=fields) if model else None
+
+    def get_many(self, event_ids: Collection[int]) -> list[TimelineEvent]:
+        ids = literal(list(event_ids), ARRAY(BigInteger))
+        stmt = select(TimelineEventModel).where(TimelineEventModel.id == any_(ids))
+        models = self.session.execute(stmt).scalars().all()
+        return [to_domain_event(model) for model in models]
 
     def create(self, incident_id: int, event_data: dict) -> TimelineEvent:
         model = TimelineEventModel(**event_data, incident_id=incident_id)
         self.session.add(model)
         self.session.flush()
         self.session.refresh(model)
+        apply_event_deltas(self.session, Counter({event_rollup_key(model): 1}))
+        self._update_incident_activity(
+            incident_id,
+            event_count=IncidentModel.event_count + 1,
+            last_event_at=func.greatest(IncidentModel.last_event_at, model.created_at),
+        )
+        record_change(
+            self.session,
+            ChangeEntity.EVENT,
+            ChangeAction.CREATED,
+            incident_id=incident_id,
+            id=model.id,
+        )
         return to_domain_event(model)
 
     def update(
@@ -158,12 +869,23 @@ class SqlAlchemyTimelineEventRepository:
         if not model:
             return None
 
+        previous_key = event_rollup_key(model)
         for key, value in changes.items():
             setattr(model, key, value)
 
         self.session.add(model)
         self.session.flush()
         self.session.refresh(model)
+        current_key = event_rollup_key(model)
+        if current_key != previous_key:
+            apply_event_deltas(self.session, Counter({previous_key: -1, current_key: 1}))
+        record_change(
+            self.session,
+            ChangeEntity.EVENT,
+            ChangeAction.UPDATED,
+            incident_id=incident_id,
+            id=model.id,
+        )
         return to_domain_event(model)
 
     def delete(self, incident_id: int, event_id: int) -> bool:
@@ -175,6 +897,69 @@ class SqlAlchemyTimelineEventRepository:
         if not model:
             return False
 
+        apply_event_deltas(self.session, Counter({event_rollup_key(model): -1}))
         self.session.delete(model)
         self.session.flush()
+        self._update_incident_activity(
+            incident_id,
+            event_count=IncidentModel.event_count - 1,
+            last_event_at=(
+                select(func.max(TimelineEventModel.created_at))
+                .where(TimelineEventModel.incident_id == incident_id)
+                .scalar_subquery()
+            ),
+        )
+        record_change(
+            self.session,
+            ChangeEntity.EVENT,
+            ChangeAction.DELETED,
+            incident_id=incident_id,
+            id=event_id,
+        )
         return True
+
+    def _update_incident_activity(self, incident_id: int, **values) -> None:
+        # Keep updated_at as is: adding or removing an event is not an edit
+        # of the incident itself.
+        stmt = (
+            update(IncidentModel)
+            .where(IncidentModel.id == incident_id)
+            .values(**values, updated_at=IncidentModel.updated_at)
+        )
+        self.session.execute(stmt)
+        # event_count and last_event_at changed, so synced copies are stale.
+        record_change(
+            self.session,
+            ChangeEntity.INCIDENT,
+            ChangeAction.UPDATED,
+            incident_id=incident_id,
+            id=incident_id,
+        )
+
+
+class SqlAlchemyChangeLogRepository:
+    def __init__(self, session: Session):
+        self.session = session
+
+    def list_since(self, since: int, *, limit: int) -> list[IncidentChange]:
+        # A primary key range scan: the cost follows the number of changes
+        # returned, not the size of the log.
+        stmt = (
+            select(ChangeLogEntry)
+            .where(ChangeLogEntry.seq > since)
+            .order_by(ChangeLogEntry.seq)
+            .limit(limit)
+        )
+        return [
+            IncidentChange(
+                entity=entry.entity,
+                action=entry.action,
+                incident_id=entry.incident_id,
+                id=entry.entity_id,
+                seq=entry.seq,
+            )
+            for entry in self.session.execute(stmt).scalars()
+        ]
+
+    def latest_seq(self) -> int:
+        return int(self.session.scalar(select(func.max(ChangeLogEntry.seq))) or 0)
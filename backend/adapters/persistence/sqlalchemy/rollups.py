@@ -0,0 +1,150 @@
+"""Incremental maintenance of the hourly rollup tables.
+
+Repositories call these helpers in the same transaction as the write they
+describe, so the rollups never drift from ``incidents`` and
+``timeline_events``. ``rebuild_rollups`` recomputes both tables from scratch
+for backfills and repairs.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from backend.db.models.incident import Incident as IncidentModel
+from backend.db.models.rollup import IncidentHourlyRollup, TimelineEventHourlyRollup
+from backend.db.models.timeline_event import TimelineEvent as TimelineEventModel
+from backend.domain.incidents.enums import Severity, Status
+
+
+def hour_bucket(value: datetime) -> datetime:
+    """Truncate a timestamp to the start of its UTC hour."""
+    if value.tzinfo is None:
+        # astimezone would read it as server local time.
+        raise ValueError("hour_bucket needs a timezone-aware datetime")
+    return value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def hour_bucket_sql(column):
+    return func.date_trunc("hour", column, "UTC")
+
+
+IncidentRollupKey = tuple[datetime, Severity, Status]
+EventRollupKey = tuple[datetime, str]
+
+
+def incident_rollup_key(model: IncidentModel) -> IncidentRollupKey:
+    return (hour_bucket(model.created_at), model.severity, model.status)
+
+
+def event_rollup_key(model: TimelineEventModel) -> EventRollupKey:
+    return (hour_bucket(model.created_at), model.event_type)
+
+
+def apply_incident_deltas(
+    session: Session, deltas: Counter[IncidentRollupKey]
+) -> None:
+    rows = [
+        {
+            "bucket_hour": bucket_hour,
+            "severity": severity,
+            "status": status,
+            "incident_count": delta,
+        }
+        for (bucket_hour, severity, status), delta in _sorted_deltas(deltas)
+    ]
+    if not rows:
+        return
+    stmt = pg_insert(IncidentHourlyRollup).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["bucket_hour", "severity", "status"],
+        set_={
+            "incident_count": IncidentHourlyRollup.incident_count
+            + stmt.excluded.incident_count
+        },
+    )
+    session.execute(stmt)
+
+
+def apply_event_deltas(session: Session, deltas: Counter[EventRollupKey]) -> None:
+    rows = [
+        {"bucket_hour": bucket_hour, "event_type": event_type, "event_count": delta}
+        for (bucket_hour, event_type), delta in _sorted_deltas(deltas)
+    ]
+    if not rows:
+        return
+    stmt = pg_insert(TimelineEventHourlyRollup).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["bucket_hour", "event_type"],
+        set_={
+            "event_count": TimelineEventHourlyRollup.event_count
+            + stmt.excluded.event_count
+        },
+    )
+    session.execute(stmt)
+
+
+def incident_events_deltas(session: Session, incident_id: int) -> Counter[EventRollupKey]:
+    """Negative deltas that remove every event of an incident from the rollup."""
+    bucket = hour_bucket_sql(TimelineEventModel.created_at)
+    stmt = (
+        select(bucket, TimelineEventModel.event_type, func.count())
+        .where(TimelineEventModel.incident_id == incident_id)
+        .group_by(bucket, TimelineEventModel.event_type)
+    )
+    return Counter(
+        {
+            (bucket_hour, event_type): -count
+            for bucket_hour, event_type, count in session.execute(stmt)
+        }
+    )
+
+
+def rebuild_rollups(session: Session) -> None:
+    """Recompute both rollup tables from the raw tables.
+
+    Writers are blocked for the duration so no delta can land between the
+    delete and the re-aggregation.
+    """
+    session.execute(text("LOCK TABLE incidents, timeline_events IN SHARE MODE"))
+    session.execute(delete(IncidentHourlyRollup))
+    session.execute(delete(TimelineEventHourlyRollup))
+
+    incident_bucket = hour_bucket_sql(IncidentModel.created_at)
+    session.execute(
+        insert(IncidentHourlyRollup).from_select(
+            ["bucket_hour", "severity", "status", "incident_count"],
+            select(
+                incident_bucket,
+                IncidentModel.severity,
+                IncidentModel.status,
+                func.count(),
+            ).group_by(incident_bucket, IncidentModel.severity, IncidentModel.status),
+        )
+    )
+
+    event_bucket = hour_bucket_sql(TimelineEventModel.created_at)
+    session.execute(
+        insert(TimelineEventHourlyRollup).from_select(
+            ["bucket_hour", "event_type", "event_count"],
+            select(
+                event_bucket,
+                TimelineEventModel.event_type,
+                func.count(),
+            ).group_by(event_bucket, TimelineEventModel.event_type),
+        )
+    )
+
+
+def _sorted_deltas(deltas: Counter) -> Iterable[tuple[tuple, int]]:
+    # A stable key order keeps concurrent writers from deadlocking on the
+    # same rollup rows.
+    return sorted(
+        ((key, delta) for key, delta in deltas.items() if delta),
+        key=lambda item: tuple(str(part) for part in item[0]),
+    )
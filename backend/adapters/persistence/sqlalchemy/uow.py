@@ -5,7 +5,12 @@ from typing import Callable, Optional
 from sqlalchemy.orm import Session
 
 from backend.domain.incidents.ports import UnitOfWork
+from backend.adapters.persistence.sqlalchemy.notifications import (
+    discard_pending_changes,
+    publish_pending_changes,
+)
 from backend.adapters.persistence.sqlalchemy.repositories import (
+    SqlAlchemyChangeLogRepository,
     SqlAlchemyIncidentRepository,
     SqlAlchemyTimelineEventRepository,
 )
@@ -29,6 +34,7 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
 
         self.incidents = None
         self.events = None
+        self.changes = None
 
     @property
     def session(self) -> Session:
@@ -41,6 +47,7 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
             self._session = self._session_factory()
         self.incidents = SqlAlchemyIncidentRepository(self.session)
         self.events = SqlAlchemyTimelineEventRepository(self.session)
+        self.changes = SqlAlchemyChangeLogRepository(self.session)
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
@@ -54,7 +61,9 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
                 self.session.close()
 
     def commit(self) -> None:
+        publish_pending_changes(self.session)
         self.session.commit()
 
     def rollback(self) -> None:
+        discard_pending_changes(self.session)
         self.session.rollback()
@@ -0,0 +1,62 @@
+"""Server-Sent Events framing for the incident change stream."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+from backend.adapters.notifications.postgres_listener import PostgresChangeListener
+from backend.domain.incidents.read_models import IncidentChange
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Stop reverse proxies such as nginx from buffering the stream.
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_change(change: IncidentChange) -> str:
+    """SSE message for ``change``; its id is the change log token."""
+    data = json.dumps(
+        {
+            "entity": change.entity.value,
+            "action": change.action.value,
+            "incident_id": change.incident_id,
+            "id": change.id,
+            "seq": change.seq,
+        },
+        separators=(",", ":"),
+    )
+    event = f"event: {change.entity.value}.{change.action.value}\ndata: {data}\n\n"
+    return event if change.seq is None else f"id: {change.seq}\n{event}"
+
+
+async def stream_changes(
+    listener: PostgresChangeListener,
+    *,
+    incident_id: int | None = None,
+    heartbeat_seconds: float = 15,
+) -> AsyncIterator[str]:
+    """Yield SSE messages for committed changes until the client goes away.
+
+    Comment lines are sent while idle so dead connections are noticed and
+    proxies keep the stream open.
+    """
+    subscription = listener.subscribe(incident_id=incident_id)
+    try:
+        yield ": connected\n\n"
+        while True:
+            try:
+                change = await asyncio.wait_for(subscription.get(), heartbeat_seconds)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if change is None:
+                # Dropped for falling behind (or the listener failed): tell the
+                # client to refetch before it reconnects.
+                yield "event: resync\ndata: {}\n\n"
+                return
+            yield format_change(change)
+    finally:
+        listener.unsubscribe(subscription)
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from secrets import compare_digest
 from typing import Annotated, Generator
 
-from fastapi import Depends, HTTPException, Security, status
+from fastapi import Depends, HTTPException, Request, Security, status
 from fastapi.security import APIKeyHeader
 from sqlalchemy.orm import Session
 
 from backend.db.sessions import get_db
+from backend.adapters.notifications.postgres_listener import PostgresChangeListener
 from backend.adapters.persistence.sqlalchemy.uow import SqlAlchemyUnitOfWork
+from backend.core.cache import TTLCache
 from backend.core.config import Settings, get_settings
+from backend.core.request_context import current_request, route_template
 from backend.domain.incidents.ports import UnitOfWork
 from backend.services.incidents.usecases import IncidentUseCases
 
@@ -22,6 +26,32 @@ def get_uow(session: Session = Depends(get_db)) -> Generator[UnitOfWork, None, N
 def get_incident_usecases(uow: UnitOfWork = Depends(get_uow)) -> IncidentUseCases:
     return IncidentUseCases(uow)
 
+def get_stream_incident_usecases(
+    session: Session = Depends(get_db, scope="function"),
+) -> Generator[IncidentUseCases, None, None]:
+    # Streaming responses outlive the path operation; give the session back
+    # before the stream starts instead of holding a connection per client.
+    with SqlAlchemyUnitOfWork(session=session, close_on_exit=False) as uow:
+        yield IncidentUseCases(uow)
+
+@lru_cache
+def get_incident_stats_cache() -> TTLCache:
+    return TTLCache(get_settings().INCIDENT_STATS_CACHE_TTL_SECONDS)
+
+@lru_cache
+def get_dashboard_cache() -> TTLCache:
+    return TTLCache(get_settings().DASHBOARD_CACHE_TTL_SECONDS)
+
+def get_change_listener(request: Request) -> PostgresChangeListener:
+    # Started and stopped with the app; see backend.main.lifespan.
+    return request.app.state.change_listener
+
+async def record_route(request: Request) -> None:
+    # Runs once the router has matched, before any other dependency queries.
+    current = current_request()
+    if current is not None:
+        current.route = route_template(request.scope)
+
 def require_api_key(
     api_key: Annotated[str | None, Security(api_key_header)],
     settings: Annotated[Settings, Depends(get_settings)],
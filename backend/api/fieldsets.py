@@ -0,0 +1,59 @@
+"""Sparse fieldsets: let clients pick which fields a read endpoint returns.
+
+``fields=id,status,severity`` is validated against the response schema and
+passed down to the repositories, which then load only those columns.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+
+def sparse_fieldset(
+    schema: type[BaseModel], *, example: str
+) -> Callable[..., list[str] | None]:
+    """Dependency parsing a ``fields`` query parameter for ``schema``.
+
+    Resolves to ``None`` when the parameter is absent, so callers keep their
+    full-object behaviour.
+    """
+    allowed = tuple(schema.model_fields)
+
+    def _fields(
+        fields: str | None = Query(
+            default=None,
+            description=(
+                "Comma-separated subset of fields to return. Allowed: "
+                f"{', '.join(allowed)}."
+            ),
+            examples=[example],
+        ),
+    ) -> list[str] | None:
+        if fields is None:
+            return None
+        names = (name.strip() for name in fields.split(","))
+        requested = list(dict.fromkeys(name for name in names if name))
+        if not requested:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="fields cannot be empty",
+            )
+        unknown = [name for name in requested if name not in allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}",
+            )
+        return requested
+
+    return _fields
+
+
+def project(entity: Any, fields: list[str]) -> dict[str, Any]:
+    """JSON-ready mapping of only the requested attributes of ``entity``."""
+    return jsonable_encoder({name: getattr(entity, name) for name in fields})
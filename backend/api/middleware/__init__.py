@@ -1,4 +1,13 @@
+from backend.api.middleware.metrics import MetricsMiddleware
+from backend.api.middleware.profiling import PROFILE_HEADER, ProfilingMiddleware
 from backend.api.middleware.request_id import REQUEST_ID_HEADER, RequestIDMiddleware
 from backend.api.middleware.request_logging import RequestLoggingMiddleware
 
-__all__ = ["REQUEST_ID_HEADER", "RequestIDMiddleware", "RequestLoggingMiddleware"]
+__all__ = [
+    "PROFILE_HEADER",
+    "REQUEST_ID_HEADER",
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "RequestIDMiddleware",
+    "RequestLoggingMiddleware",
+]
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.metrics import UNMATCHED_ROUTE, MetricsRegistry
+from backend.core.request_context import route_template
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = perf_counter()
+        status_code = 500
+
+        async def send_with_status_capture(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status_capture)
+        finally:
+            self.registry.observe_request(
+                scope["method"],
+                route_template(scope) or UNMATCHED_ROUTE,
+                status_code,
+                perf_counter() - start_time,
+            )
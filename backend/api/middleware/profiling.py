@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import sys
+from secrets import compare_digest
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.config import Settings
+from backend.core.profiling import RequestProfiler
+from backend.core.request_context import current_request
+
+PROFILE_HEADER = "X-Profile"
+
+
+class ProfilingMiddleware:
+    """Profile requests sent with ``X-Profile: 1`` and the admin API key.
+
+    Only installed while PROFILING_ENABLED is set, inside RequestIDMiddleware
+    so the request context is bound. Nothing between it and the router may
+    run the app in a task of its own, or the anchor frame is lost.
+    """
+
+    def __init__(
+        self, app: ASGIApp, profiler: RequestProfiler, settings: Settings
+    ) -> None:
+        self.app = app
+        self.profiler = profiler
+        self.settings = settings
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request = current_request()
+        if (
+            scope["type"] != "http"
+            or request is None
+            or not self._profile_requested(Headers(scope=scope))
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        sampler = self.profiler.start(
+            request,
+            anchor=sys._getframe(),
+            method=scope["method"],
+            path=scope["path"],
+        )
+        status_code = 500
+
+        async def send_after_profiling(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                # Record before the body completes, so a client can fetch
+                # the profile as soon as it has the response.
+                await sampler.stop_async(status_code)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_after_profiling)
+        finally:
+            await sampler.stop_async(status_code)
+
+    def _profile_requested(self, headers: Headers) -> bool:
+        if headers.get(PROFILE_HEADER) != "1":
+            return False
+        # Same rule as require_api_key: open only while API auth is off.
+        if not self.settings.API_AUTH_ENABLED:
+            return True
+        api_key = headers.get("X-API-Key")
+        return bool(
+            self.settings.API_KEY
+            and api_key
+            and compare_digest(api_key, self.settings.API_KEY)
+        )
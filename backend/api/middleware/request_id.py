@@ -5,6 +5,8 @@ from uuid import uuid4
 from starlette.datastructures import Headers, MutableHeaders
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from backend.core.request_context import bind_request
+
 REQUEST_ID_HEADER = "X-Request-ID"
 MAX_REQUEST_ID_LENGTH = 128
 
@@ -27,7 +29,8 @@ class RequestIDMiddleware:
                 headers[REQUEST_ID_HEADER] = request_id
             await send(message)
 
-        await self.app(scope, receive, send_with_request_id)
+        with bind_request(request_id):
+            await self.app(scope, receive, send_with_request_id)
 
 
 def _request_id_from_scope(scope: Scope) -> str:
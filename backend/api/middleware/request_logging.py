@@ -1,16 +1,37 @@
 from __future__ import annotations
 
 import logging
+import random
+from collections.abc import Callable
 from time import perf_counter
 
+from starlette.datastructures import MutableHeaders
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from backend.db.query_stats import QueryStats, track_queries
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
 logger = logging.getLogger("backend.api.request")
 
 
 class RequestLoggingMiddleware:
-    def __init__(self, app: ASGIApp) -> None:
+    """Log one structured record per request.
+
+    Only ``success_sample_rate`` of the 2xx responses are logged; every
+    other status always is.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        success_sample_rate: float = 1.0,
+        sample: Callable[[], float] = random.random,
+    ) -> None:
         self.app = app
+        self.success_sample_rate = success_sample_rate
+        self._sample = sample
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
@@ -19,36 +40,62 @@ class RequestLoggingMiddleware:
 
         start_time = perf_counter()
         status_code = 500
+        request_id = scope.get("state", {}).get("request_id", "-")
+
+        with track_queries(request_id) as query_stats:
 
-        async def send_with_status_capture(message: Message) -> None:
-            nonlocal status_code
-            if message["type"] == "http.response.start":
-                status_code = message["status"]
-            await send(message)
+            async def send_with_status_capture(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    # Streamed bodies may query later; the header reports
+                    # the work done before the response started.
+                    MutableHeaders(scope=message).append(
+                        SERVER_TIMING_HEADER, _server_timing(query_stats)
+                    )
+                await send(message)
 
-        try:
-            await self.app(scope, receive, send_with_status_capture)
-        except Exception:
-            self._log_request(scope, status_code, start_time)
-            raise
+            try:
+                await self.app(scope, receive, send_with_status_capture)
+            except Exception:
+                self._log_request(scope, status_code, start_time, query_stats)
+                raise
 
-        self._log_request(scope, status_code, start_time)
+            self._log_request(scope, status_code, start_time, query_stats)
 
     def _log_request(
         self,
         scope: Scope,
         status_code: int,
         start_time: float,
+        query_stats: QueryStats,
     ) -> None:
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        fields = {}
+        if 200 <= status_code < 300 and self.success_sample_rate < 1:
+            if self._sample() >= self.success_sample_rate:
+                return
+            # Lets log queries weight sampled requests back up.
+            fields["sample_rate"] = self.success_sample_rate
         duration_ms = (perf_counter() - start_time) * 1000
-        request_id = scope.get("state", {}).get("request_id", "-")
 
         logger.info(
-            "request completed request_id=%s method=%s path=%s "
-            "status_code=%s duration_ms=%.2f",
-            request_id,
-            scope["method"],
-            scope["path"],
-            status_code,
-            duration_ms,
+            "request completed",
+            extra={
+                "request_id": query_stats.request_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status_code,
+                "duration_ms": round(duration_ms, 2),
+                "db_queries": query_stats.count,
+                "db_ms": round(query_stats.duration_ms, 2),
+                **fields,
+            },
         )
+
+
+def _server_timing(query_stats: QueryStats) -> str:
+    return (
+        f'db;dur={query_stats.duration_ms:.2f};desc="{query_stats.count} queries"'
+    )
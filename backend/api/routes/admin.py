@@ -0,0 +1,149 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
+
+from backend.api.dependencies import require_api_key
+from backend.api.routes.incidents import API_KEY_AUTH_RESPONSE
+from backend.db.sessions import get_slow_query_monitor
+from backend.db.slow_queries import SlowQueryMonitor
+from backend.schemas.admin import RequestProfilesResponse, SlowQueriesResponse
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_api_key)],
+)
+
+SLOW_QUERIES_RESPONSE_EXAMPLE = {
+    "enabled": True,
+    "threshold_ms": 250,
+    "items": [
+        {
+            "statement": (
+                "SELECT incidents.id, incidents.title FROM incidents "
+                "ORDER BY incidents.created_at DESC LIMIT %(param_1)s "
+                "OFFSET %(param_2)s /*action='list_incidents',"
+                "controller='IncidentUseCases',route='/api/v1/incidents'*/"
+            ),
+            "parameters": {"param_1": "int", "param_2": "int"},
+            "duration_ms": 412.7,
+            "recorded_at": "2026-01-23T12:00:00Z",
+            "request_id": "3f2c0d9b6a2e4c1f8e7d5b4a3c2b1a09",
+            "route": "/api/v1/incidents",
+            "plan": [{"Plan": {"Node Type": "Limit", "Total Cost": 9214.5}}],
+            "explain_error": None,
+        }
+    ],
+}
+
+@router.get(
+    "/slow-queries",
+    response_model=SlowQueriesResponse,
+    summary="List recent slow SQL statements",
+    description=(
+        "Return the statements that took longer than SLOW_QUERY_THRESHOLD_MS, "
+        "newest first, from a bounded in-memory buffer of this worker. A sample "
+        "of them carries a plan captured in the background with EXPLAIN "
+        "(ANALYZE off, FORMAT JSON). Bound parameter values are never kept."
+    ),
+    responses={
+        200: {
+            "description": "Slow query log",
+            "content": {
+                "application/json": {
+                    "example": SLOW_QUERIES_RESPONSE_EXAMPLE,
+                }
+            },
+        },
+        401: API_KEY_AUTH_RESPONSE,
+    },
+)
+def list_slow_queries(
+    monitor: SlowQueryMonitor | None = Depends(get_slow_query_monitor),
+):
+    if monitor is None:
+        return SlowQueriesResponse(enabled=False, threshold_ms=0, items=[])
+    return SlowQueriesResponse(
+        enabled=True,
+        threshold_ms=monitor.threshold_ms,
+        items=monitor.entries(),
+    )
+
+REQUEST_PROFILES_RESPONSE_EXAMPLE = {
+    "enabled": True,
+    "items": [
+        {
+            "request_id": "3f2c0d9b6a2e4c1f8e7d5b4a3c2b1a09",
+            "method": "GET",
+            "path": "/api/v1/incidents/42/report/markdown",
+            "route": "/api/v1/incidents/{incident_id}/report/markdown",
+            "status_code": 200,
+            "duration_ms": 184.2,
+            "interval_ms": 1,
+            "samples": 171,
+            "recorded_at": "2026-01-23T12:00:00Z",
+        }
+    ],
+}
+
+@router.get(
+    "/profiles",
+    response_model=RequestProfilesResponse,
+    summary="List recent request profiles",
+    description=(
+        "Return the requests profiled by this worker, newest first, from a "
+        "bounded in-memory buffer. A request is profiled when PROFILING_ENABLED "
+        "is set and it is sent with X-Profile: 1 and the API key."
+    ),
+    responses={
+        200: {
+            "description": "Request profiles",
+            "content": {
+                "application/json": {
+                    "example": REQUEST_PROFILES_RESPONSE_EXAMPLE,
+                }
+            },
+        },
+        401: API_KEY_AUTH_RESPONSE,
+    },
+)
+def list_request_profiles(request: Request):
+    profiler = request.app.state.profiler
+    if profiler is None:
+        return RequestProfilesResponse(enabled=False, items=[])
+    return RequestProfilesResponse(enabled=True, items=profiler.entries())
+
+@router.get(
+    "/profiles/{request_id}",
+    response_class=PlainTextResponse,
+    summary="Get a request profile as collapsed stacks",
+    description=(
+        "Return the sampled stacks of a profiled request, root first, one "
+        "line per distinct stack followed by its sample count. The output "
+        "can be fed to flamegraph.pl, inferno or speedscope."
+    ),
+    responses={
+        200: {
+            "description": "Collapsed stacks",
+            "content": {
+                "text/plain": {
+                    "example": (
+                        "ProfilingMiddleware.__call__ (backend/api/middleware/"
+                        "profiling.py:31);...;render_incident_report_markdown "
+                        "(backend/services/incidents/report_markdown.py:18) 37\n"
+                    ),
+                }
+            },
+        },
+        401: API_KEY_AUTH_RESPONSE,
+        404: {"description": "No profile recorded for this request id"},
+    },
+)
+def get_request_profile(request_id: str, request: Request):
+    profiler = request.app.state.profiler
+    profile = profiler.get(request_id) if profiler is not None else None
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Request profile not found",
+        )
+    return PlainTextResponse(profile.collapsed())
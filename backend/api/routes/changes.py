@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, Query
+
+from backend.api.dependencies import get_incident_usecases, require_api_key
+from backend.api.routes.incidents import (
+    API_KEY_AUTH_RESPONSE,
+    SERVICE_VALIDATION_RESPONSE,
+)
+from backend.schemas.changes import ChangeSetResponse
+from backend.services.incidents.usecases import MAX_SYNC_CHANGES, IncidentUseCases
+
+router = APIRouter(
+    prefix="/changes",
+    tags=["changes"],
+    dependencies=[Depends(require_api_key)],
+)
+
+CHANGE_SET_RESPONSE_EXAMPLE = {
+    "next_token": 1042,
+    "has_more": False,
+    "incidents": [
+        {
+            "title": "Database Outage",
+            "description": "Production database is unavailable.",
+            "status": "investigating",
+            "severity": "sev1",
+            "id": 1,
+            "created_at": "2026-01-23T12:00:00Z",
+            "updated_at": "2026-01-23T12:05:00Z",
+            "events": [],
+        }
+    ],
+    "events": [
+        {
+            "occurred_at": "2026-01-23T12:00:00Z",
+            "event_type": "update",
+            "message": "Failover to the replica started.",
+            "id": 7,
+            "incident_id": 1,
+            "created_at": "2026-01-23T12:02:00Z",
+            "updated_at": "2026-01-23T12:02:00Z",
+        }
+    ],
+    "deleted_incident_ids": [],
+    "deleted_event_ids": [5],
+}
+
+@router.get(
+    "",
+    response_model=ChangeSetResponse,
+    summary="List changes since a sync token",
+    description=(
+        "Return incidents and timeline events created, updated or deleted "
+        "after since, read from the change log in commit order. Start with "
+        "since=0 for a full sync, then pass next_token back as since; repeat "
+        "while has_more is true. The cost follows the number of changes, not "
+        "the size of the data set. Change stream messages carry the same "
+        "token as their id."
+    ),
+    responses={
+        200: {
+            "description": "Change set response",
+            "content": {
+                "application/json": {
+                    "example": CHANGE_SET_RESPONSE_EXAMPLE,
+                }
+            },
+        },
+        400: SERVICE_VALIDATION_RESPONSE,
+        401: API_KEY_AUTH_RESPONSE,
+    },
+)
+def list_changes(
+    since: int = Query(
+        default=0,
+        ge=0,
+        description="next_token from the previous sync; 0 for everything.",
+        examples=[1000],
+    ),
+    limit: int = Query(
+        default=500,
+        ge=1,
+        le=MAX_SYNC_CHANGES,
+        description="Maximum number of change log entries to read.",
+        examples=[500],
+    ),
+    use_case: IncidentUseCases = Depends(get_incident_usecases),
+):
+    change_set = use_case.list_changes(since=since, limit=limit)
+    return ChangeSetResponse.model_validate(change_set)
@@ -0,0 +1,103 @@
+from fastapi import APIRouter, Depends, Query
+
+from backend.api.dependencies import (
+    get_dashboard_cache,
+    get_incident_usecases,
+    require_api_key,
+)
+from backend.api.routes.incidents import (
+    API_KEY_AUTH_RESPONSE,
+    SERVICE_VALIDATION_RESPONSE,
+)
+from backend.core.cache import TTLCache
+from backend.schemas.dashboard import DashboardResponse
+from backend.services.incidents.usecases import MAX_DASHBOARD_ITEMS, IncidentUseCases
+
+router = APIRouter(
+    prefix="/dashboard",
+    tags=["dashboard"],
+    dependencies=[Depends(require_api_key)],
+)
+
+DASHBOARD_RESPONSE_EXAMPLE = {
+    "active_incidents": [
+        {
+            "id": 1,
+            "title": "Database Outage",
+            "status": "investigating",
+            "severity": "sev1",
+            "created_at": "2026-06-28T13:45:35.344353+01:00",
+            "updated_at": "2026-06-28T13:45:35.344353+01:00",
+            "event_count": 1,
+            "last_event_at": "2026-06-28T14:10:02.118204+01:00",
+            "events": [],
+        }
+    ],
+    "by_status_severity": [
+        {"status": "investigating", "severity": "sev1", "count": 1},
+        {"status": "resolved", "severity": "sev2", "count": 2},
+    ],
+    "recent_events": [
+        {
+            "id": 7,
+            "incident_id": 1,
+            "occurred_at": "2026-06-28T14:09:00+01:00",
+            "event_type": "note",
+            "message": "Failover to the replica started.",
+            "created_at": "2026-06-28T14:10:02.118204+01:00",
+            "updated_at": "2026-06-28T14:10:02.118204+01:00",
+        }
+    ],
+}
+
+@router.get(
+    "",
+    response_model=DashboardResponse,
+    summary="Get the incident dashboard",
+    description=(
+        "Return the newest unresolved incidents, incident counts for every "
+        "status and severity combination, and the most recent timeline events "
+        "across all incidents. Everything is read with a single CTE-based "
+        "query. Responses may be served from a short-lived cache when "
+        "DASHBOARD_CACHE_TTL_SECONDS is set."
+    ),
+    responses={
+        200: {
+            "description": "Dashboard response",
+            "content": {
+                "application/json": {
+                    "example": DASHBOARD_RESPONSE_EXAMPLE,
+                }
+            },
+        },
+        400: SERVICE_VALIDATION_RESPONSE,
+        401: API_KEY_AUTH_RESPONSE,
+    },
+)
+def get_dashboard(
+    active_limit: int = Query(
+        default=50,
+        ge=1,
+        le=MAX_DASHBOARD_ITEMS,
+        description="Maximum number of active incidents to return.",
+        examples=[50],
+    ),
+    recent_events: int = Query(
+        default=20,
+        ge=1,
+        le=MAX_DASHBOARD_ITEMS,
+        description="Number of recent timeline events to return.",
+        examples=[20],
+    ),
+    use_case: IncidentUseCases = Depends(get_incident_usecases),
+    cache: TTLCache = Depends(get_dashboard_cache),
+):
+    cache_key = (active_limit, recent_events)
+    response = cache.get(cache_key)
+    if response is None:
+        snapshot = use_case.get_dashboard(
+            active_limit=active_limit, recent_events=recent_events
+        )
+        response = DashboardResponse.model_validate(snapshot)
+        cache.set(cache_key, response)
+    return response
@@ -0,0 +1,97 @@
+from fastapi import APIRouter, Depends, Query
+
+from backend.api.dependencies import get_incident_usecases, require_api_key
+from backend.api.routes.incidents import (
+    API_KEY_AUTH_RESPONSE,
+    SERVICE_VALIDATION_RESPONSE,
+)
+from backend.domain.incidents.enums import Severity
+from backend.schemas.timeline_event import RecentTimelineEventsResponse
+from backend.services.incidents.pagination import next_event_page_cursor
+from backend.services.incidents.usecases import IncidentUseCases
+
+router = APIRouter(
+    prefix="/events",
+    tags=["events"],
+    dependencies=[Depends(require_api_key)],
+)
+
+RECENT_EVENTS_RESPONSE_EXAMPLE = {
+    "items": [
+        {
+            "id": 2,
+            "incident_id": 1,
+            "occurred_at": "2026-07-11T12:00:00Z",
+            "event_type": "update",
+            "message": "Investigating database latency.",
+            "created_at": "2026-07-11T12:05:00Z",
+            "updated_at": "2026-07-11T12:05:00Z",
+        }
+    ],
+    "limit": 1,
+    "next_cursor": "eyJjcmVhdGVkX2F0IjoiMjAyNi0wNy0xMVQxMjowNTowMCswMDowMCIsImlkIjoyfQ",
+}
+
+@router.get(
+    "/recent",
+    response_model=RecentTimelineEventsResponse,
+    summary="List recent timeline events across incidents",
+    description=(
+        "Return the newest timeline events from every incident, ordered by "
+        "created_at DESC and id DESC. Filter by event_type or by the severity "
+        "of the owning incident. Pass next_cursor back as cursor to fetch the "
+        "following page; pages are read straight from an index, so they stay "
+        "fast however large the timeline table grows. No total is returned."
+    ),
+    responses={
+        200: {
+            "description": "Recent timeline events response",
+            "content": {
+                "application/json": {
+                    "example": RECENT_EVENTS_RESPONSE_EXAMPLE,
+                }
+            },
+        },
+        400: SERVICE_VALIDATION_RESPONSE,
+        401: API_KEY_AUTH_RESPONSE,
+    },
+)
+def list_recent_events(
+    event_type: str | None = Query(
+        default=None,
+        max_length=50,
+        description="Only return events of this type.",
+        examples=["update"],
+    ),
+    severity: list[Severity] | None = Query(
+        default=None,
+        description=(
+            "Only return events of incidents with this severity; repeat to "
+            "match any of several."
+        ),
+        examples=[["sev1", "sev2"]],
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="next_cursor from the previous page.",
+    ),
+    limit: int = Query(
+        default=50,
+        ge=1,
+        le=100,
+        description="Maximum number of timeline events to return.",
+        examples=[50],
+    ),
+    use_case: IncidentUseCases = Depends(get_incident_usecases),
+):
+    events = use_case.list_recent_events(
+        event_type=event_type,
+        severity=severity,
+        cursor=cursor,
+        limit=limit,
+    )
+    return RecentTimelineEventsResponse(
+        items=events,
+        limit=limit,
+        next_cursor=next_event_page_cursor(events, limit=limit),
+    )
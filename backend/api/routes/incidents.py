@@ -1,9 +1,33 @@
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from backend.api.dependencies import get_incident_usecases, require_api_key
-from backend.domain.incidents.enums import Severity, Status
+from backend.api.change_stream import SSE_HEADERS, stream_changes
+from backend.api.dependencies import (
+    get_change_listener,
+    get_incident_stats_cache,
+    get_incident_usecases,
+    get_stream_incident_usecases,
+    require_api_key,
+)
+from backend.api.fieldsets import project, sparse_fieldset
+from backend.adapters.notifications.postgres_listener import PostgresChangeListener
+from backend.core.cache import TTLCache
+from backend.core.config import Settings, get_settings
+from backend.domain.incidents.enums import (
+    IncidentSort,
+    Severity,
+    SortDirection,
+    StatsBucket,
+    Status,
+    TimelineOrder,
+)
+from backend.schemas.analytics import IncidentResponseTimesResponse
 from backend.schemas.error import ErrorResponse
 from backend.schemas.incident import (
+    IncidentBatchGetRequest,
+    IncidentBatchGetResponse,
     IncidentCreate,
     IncidentListItem,
     IncidentListResponse,
@@ -11,6 +35,7 @@ from backend.schemas.incident import (
     IncidentRead,
     IncidentUpdate,
 )
+from backend.schemas.stats import IncidentStatsResponse
 from backend.schemas.timeline_event import (
     TimelineEventCreate,
     TimelineEventListResponse,
@@ -19,8 +44,16 @@ from backend.schemas.timeline_event import (
 )
 from backend.services.errors import NotFoundError, ValidationError
 from backend.services.incidents.commands import CreateIncidentCmd, CreateTimelineEventCmd, UpdateIncidentCmd, UpdateTimelineEventCmd
-from backend.services.incidents.report_markdown import render_incident_report_markdown
-from backend.services.incidents.usecases import IncidentUseCases
+from backend.services.incidents.pagination import next_page_cursor
+from backend.services.incidents.report_markdown import (
+    TIMELINE_ORDERS,
+    render_incident_report_markdown,
+)
+from backend.services.incidents.usecases import (
+    MAX_EMBEDDED_EVENTS,
+    IncidentUseCases,
+    as_utc,
+)
 
 router = APIRouter(
     prefix="/incidents",
@@ -58,11 +91,17 @@ INCIDENT_LIST_RESPONSE_EXAMPLE = {
             "severity": "sev1",
             "created_at": "2026-06-28T13:45:35.344353+01:00",
             "updated_at": "2026-06-28T13:45:35.344353+01:00",
+            "event_count": 3,
+            "last_event_at": "2026-06-28T14:10:02.118204+01:00",
         }
     ],
-    "limit": 50,
+    "limit": 1,
     "offset": 0,
-    "total": 1,
+    "total": 3,
+    "next_cursor": (
+        "eyJzb3J0IjoiY3JlYXRlZF9hdCIsImRpcmVjdGlvbiI6ImRlc2MiLCJrZXkiOlsiMjAyNi0w"
+        "Ni0yOFQxMzo0NTozNS4zNDQzNTMrMDE6MDAiXSwiaWQiOjF9"
+    ),
 }
 TIMELINE_EVENT_LIST_RESPONSE_EXAMPLE = {
     "items": [
@@ -104,6 +143,66 @@ INCIDENT_REPORT_RESPONSE_EXAMPLE = {
     "timeline_order": "created_at_desc_id_desc",
     "timeline_event_count": 1,
 }
+CHANGE_STREAM_EXAMPLE = """: connected
+
+event: event.created
+data: {"entity":"event","action":"created","incident_id":1,"id":7}
+
+event: incident.updated
+data: {"entity":"incident","action":"updated","incident_id":1,"id":1}
+
+"""
+CHANGE_STREAM_RESPONSE = {
+    "description": (
+        "Server-Sent Events stream. Each message names the change as "
+        "<entity>.<action> and carries the ids needed to refetch it."
+    ),
+    "content": {
+        "text/event-stream": {
+            "schema": {"type": "string"},
+            "example": CHANGE_STREAM_EXAMPLE,
+        }
+    },
+}
+INCIDENT_STATS_RESPONSE_EXAMPLE = {
+    "bucket": "day",
+    "created_after": "2026-01-22T00:00:00Z",
+    "created_before": "2026-01-24T00:00:00Z",
+    "source": "rollup",
+    "total": 3,
+    "by_status_severity": [
+        {"status": "open", "severity": "sev1", "count": 1},
+        {"status": "open", "severity": "sev2", "count": 0},
+        {"status": "resolved", "severity": "sev2", "count": 2},
+    ],
+    "created": [
+        {"bucket_start": "2026-01-22T00:00:00Z", "count": 2},
+        {"bucket_start": "2026-01-23T00:00:00Z", "count": 1},
+    ],
+}
+INCIDENT_RESPONSE_TIMES_RESPONSE_EXAMPLE = {
+    "created_after": "2026-01-01T00:00:00Z",
+    "created_before": "2026-02-01T00:00:00Z",
+    "by_severity": [
+        {
+            "severity": "sev1",
+            "time_to_acknowledge": {
+                "count": 12,
+                "p50": 240.0,
+                "p90": 610.5,
+                "p95": 780.0,
+                "p99": 1150.2,
+            },
+            "time_to_resolve": {
+                "count": 10,
+                "p50": 5400.0,
+                "p90": 14400.0,
+                "p95": 16020.0,
+                "p99": 21000.0,
+            },
+        }
+    ],
+}
 INCIDENT_REPORT_MARKDOWN_EXAMPLE = """# Incident Report: Database Outage
 
 ## Incident
@@ -130,14 +229,37 @@ Timeline event count: 1
 Restarting the primary node.
 """
 
+
+def _timeline_order_query() -> TimelineOrder:
+    return Query(
+        default=TimelineOrder.CREATED_AT,
+        description=(
+            "Order timeline events newest first by created_at DESC, id DESC "
+            "(created_at) or by occurred_at DESC, id DESC (occurred_at)."
+        ),
+        examples=["occurred_at"],
+    )
+
 @router.get(
     "",
     response_model=IncidentListResponse,
     summary="List incidents",
     description=(
-        "List paginated incident summaries, optionally filtered by status and "
-        "severity. Results are ordered newest first by created_at DESC, id DESC. "
-        "The response envelope contains items, limit, offset, and total."
+        "List paginated incident summaries, optionally filtered by one or more "
+        "statuses, one or more severities, and a created_at window. Repeat "
+        "status_filter or severity_filter to match any of several values. "
+        "Set active_only to exclude resolved incidents. "
+        "Results are ordered newest first by created_at DESC, id DESC by "
+        "default; sort and direction select created_at, updated_at, severity, "
+        "or last_activity ordering, with id as the tie-breaker. "
+        "Pass next_cursor back as cursor to fetch the following page in the "
+        "same order; cursor pages stay fast however deep they go. "
+        "Set include_latest_events to embed each incident's newest timeline "
+        "events, fetched for the whole page in one query. "
+        "Set fields to return only the listed item fields; only those "
+        "columns are read from the database. "
+        "The response envelope contains items, limit, offset, total, and "
+        "next_cursor."
     ),
     responses={
         200: {
@@ -148,19 +270,69 @@ Restarting the primary node.
                 }
             },
         },
+        400: SERVICE_VALIDATION_RESPONSE,
         401: API_KEY_AUTH_RESPONSE,
     },
 )
 def get_all_incidents(
-    status_filter: Status | None = Query(
+    status_filter: list[Status] | None = Query(
+        default=None,
+        description="Filter incidents by status; repeat to match any of several.",
+        examples=[["open", "investigating"]],
+    ),
+    severity_filter: list[Severity] | None = Query(
+        default=None,
+        description="Filter incidents by severity; repeat to match any of several.",
+        examples=[["sev1", "sev2"]],
+    ),
+    created_after: datetime | None = Query(
+        default=None,
+        description="Only return incidents created at or after this time.",
+        examples=["2026-01-01T00:00:00Z"],
+    ),
+    created_before: datetime | None = Query(
         default=None,
-        description="Filter incidents by status.",
-        examples=["open"],
+        description="Only return incidents created before this time.",
+        examples=["2026-02-01T00:00:00Z"],
     ),
-    severity_filter: Severity | None = Query(
+    active_only: bool = Query(
+        default=False,
+        description="Only return incidents that are not resolved.",
+        examples=[True],
+    ),
+    sort: IncidentSort = Query(
+        default=IncidentSort.CREATED_AT,
+        description=(
+            "Order by created_at, updated_at, severity (then created_at), or "
+            "last_activity (the latest timeline event, falling back to "
+            "created_at)."
+        ),
+        examples=["severity"],
+    ),
+    direction: SortDirection | None = Query(
         default=None,
-        description="Filter incidents by severity.",
-        examples=["sev1"],
+        description=(
+            "Sort direction. Defaults to desc (newest first) for timestamps "
+            "and asc (sev1 first) for severity."
+        ),
+        examples=["asc"],
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description=(
+            "next_cursor from a previous page with the same sort and "
+            "direction. Cannot be combined with offset."
+        ),
+    ),
+    include_latest_events: int = Query(
+        default=0,
+        ge=0,
+        le=MAX_EMBEDDED_EVENTS,
+        description=(
+            "Embed up to this many of each incident's most recent timeline "
+            "events in items[].events."
+        ),
+        examples=[3],
     ),
     limit: int = Query(
         default=50,
@@ -175,14 +347,38 @@ def get_all_incidents(
         description="Number of matching incidents to skip.",
         examples=[0],
     ),
+    fields: list[str] | None = Depends(
+        sparse_fieldset(IncidentListItem, example="id,status,severity")
+    ),
     use_case: IncidentUseCases = Depends(get_incident_usecases),
 ):
     incidents, total = use_case.list_incidents(
         status=status_filter,
         severity=severity_filter,
+        created_after=created_after,
+        created_before=created_before,
+        active_only=active_only,
+        sort=sort,
+        direction=direction,
+        cursor=cursor,
+        include_latest_events=include_latest_events,
+        fields=fields,
         limit=limit,
         offset=offset,
     )
+    next_cursor = next_page_cursor(
+        incidents, sort=sort, direction=direction, limit=limit
+    )
+    if fields is not None:
+        return JSONResponse(
+            {
+                "items": [project(incident, fields) for incident in incidents],
+                "limit": limit,
+                "offset": offset,
+                "total": total,
+                "next_cursor": next_cursor,
+            }
+        )
     items = [
         IncidentListItem.model_validate(incident, from_attributes=True)
         for incident in incidents
@@ -192,6 +388,123 @@ def get_all_incidents(
         limit=limit,
         offset=offset,
         total=total,
+        next_cursor=next_cursor,
+    )
+
+@router.get(
+    "/stats",
+    response_model=IncidentStatsResponse,
+    summary="Get incident statistics",
+    description=(
+        "Return incident counts for every status and severity combination and "
+        "the number of incidents created per hour or day (UTC buckets), "
+        "optionally restricted to a created_at window. All aggregates come from "
+        "a single grouped query; windows longer than a day (or unbounded) read "
+        "the hourly rollups. Responses may be served from a short-lived cache "
+        "when INCIDENT_STATS_CACHE_TTL_SECONDS is set."
+    ),
+    responses={
+        200: {
+            "description": "Incident statistics response",
+            "content": {
+                "application/json": {
+                    "example": INCIDENT_STATS_RESPONSE_EXAMPLE,
+                }
+            },
+        },
+        400: SERVICE_VALIDATION_RESPONSE,
+        401: API_KEY_AUTH_RESPONSE,
+    },
+)
+def get_incident_stats(
+    bucket: StatsBucket = Query(
+        default=StatsBucket.DAY,
+        description="Bucket width for created_at counts.",
+        examples=["hour"],
+    ),
+    created_after: datetime | None = Query(
+        default=None,
+        description="Only count incidents created at or after this time.",
+        examples=["2026-01-01T00:00:00Z"],
+    ),
+    created_before: datetime | None = Query(
+        default=None,
+        description="Only count incidents created before this time.",
+        examples=["2026-02-01T00:00:00Z"],
+    ),
+    use_case: IncidentUseCases = Depends(get_incident_usecases),
+    cache: TTLCache = Depends(get_incident_stats_cache),
+):
+    # One cache entry per instant, however the bounds were written.
+    created_after, created_before = as_utc(created_after), as_utc(created_before)
+    cache_key = (bucket, created_after, created_before)
+    response = cache.get(cache_key)
+    if response is None:
+        stats = use_case.get_incident_stats(
+            bucket=bucket,
+            created_after=created_after,
+            created_before=created_before,
+        )
+        response = IncidentStatsResponse(
+            bucket=stats.bucket,
+            created_after=created_after,
+            created_before=created_before,
+            source=stats.source,
+            total=stats.total,
+            by_status_severity=stats.by_status_severity,
+            created=stats.created,
+            events_by_type=stats.events_by_type,
+        )
+        cache.set(cache_key, response)
+    return response
+
+@router.get(
+    "/analytics/response-times",
+    response_model=IncidentResponseTimesResponse,
+    summary="Get incident response time percentiles",
+    description=(
+        "Return time-to-acknowledge (MTTA) and time-to-resolve (MTTR) "
+        "percentiles in seconds for each severity, computed from the incident "
+        "status change history. Acknowledgement is the first transition away "
+        "from open; resolution is the first transition to resolved. Incidents "
+        "are selected by an optional created_at window and grouped by their "
+        "current severity. Incidents created before status history was "
+        "recorded have no transitions and are not counted."
+    ),
+    responses={
+        200: {
+            "description": "Incident response time percentiles",
+            "content": {
+                "application/json": {
+                    "example": INCIDENT_RESPONSE_TIMES_RESPONSE_EXAMPLE,
+                }
+            },
+        },
+        400: SERVICE_VALIDATION_RESPONSE,
+        401: API_KEY_AUTH_RESPONSE,
+    },
+)
+def get_incident_response_times(
+    created_after: datetime | None = Query(
+        default=None,
+        description="Only include incidents created at or after this time.",
+        examples=["2026-01-01T00:00:00Z"],
+    ),
+    created_before: datetime | None = Query(
+        default=None,
+        description="Only include incidents created before this time.",
+        examples=["2026-02-01T00:00:00Z"],
+    ),
+    use_case: IncidentUseCases = Depends(get_incident_usecases),
+):
+    by_severity = use_case.get_response_times(
+        created_after=created_after,
+        created_before=created_before,
+    )
+    return IncidentResponseTimesResponse(
+        created_after=created_after,
+        created_before=created_before,
+        by_severity=by_severity,
     )
 
 @router.get(
@@ -202,7 +515,9 @@ def get_all_incidents(
         "Get a deterministic, non-AI structured incident report with incident "
         "fields and timeline events. The report does not include a generated "
         "summary. Timeline events are ordered by created_at DESC, then id DESC, "
-        "and the response includes timeline_order and timeline_event_count."
+        "unless order_by=occurred_at is given, in which case they are ordered by "
+        "occurred_at DESC, then id DESC. The response includes timeline_order "
+        "and timeline_event_count."
     ),
     responses={
         200: {
@@ -219,12 +534,14 @@ def get_all_incidents(
 )
 def get_incident_report(
     incident_id: int,
+    order_by: TimelineOrder = _timeline_order_query(),
     use_case: IncidentUseCases = Depends(get_incident_usecases),
 ):
-    incident = use_case.get_incident_report(incident_id)
+    incident = use_case.get_incident_report(incident_id, order_by=order_by)
     return IncidentReportResponse(
         incident=incident,
         timeline_events=incident.events,
+        timeline_order=TIMELINE_ORDERS[order_by],
         timeline_event_count=len(incident.events),
     )
 
@@ -235,8 +552,8 @@ def get_incident_report(
     description=(
         "Get a deterministic, non-AI Markdown incident report with incident "
         "fields and timeline events. The export does not include a generated "
-        "summary. It preserves report timeline ordering and includes "
-        "timeline_order and timeline_event_count."
+        "summary. It preserves report timeline ordering, including the "
+        "order_by option, and includes timeline_order and timeline_event_count."
     ),
     responses={
         200: {
@@ -254,26 +571,136 @@ def get_incident_report(
 )
 def get_incident_report_markdown(
     incident_id: int,
+    order_by: TimelineOrder = _timeline_order_query(),
     use_case: IncidentUseCases = Depends(get_incident_usecases),
 ):
-    incident = use_case.get_incident_report(incident_id)
-    markdown = render_incident_report_markdown(incident)
+    incident = use_case.get_incident_report(incident_id, order_by=order_by)
+    markdown = render_incident_report_markdown(incident, order_by=order_by)
     return Response(content=markdown, media_type="text/markdown")
 
+@router.post(
+    ":batchGet",
+    response_model=IncidentBatchGetResponse,
+    summary="Batch get incidents",
+    description=(
+        "Fetch up to 200 incidents by ID in a single query. Items follow the "
+        "order of the requested IDs; IDs that do not exist are listed in "
+        "missing_ids instead of failing the request. Set include_events to "
+        "load every incident's timeline with one additional query."
+    ),
+    responses={
+        400: SERVICE_VALIDATION_RESPONSE,
+        401: API_KEY_AUTH_RESPONSE,
+    },
+)
+def batch_get_incidents(
+    request: IncidentBatchGetRequest,
+    use_case: IncidentUseCases = Depends(get_incident_usecases),
+):
+    incidents, missing_ids = use_case.get_incidents(
+        request.ids, with_events=request.include_events
+    )
+    return IncidentBatchGetResponse(
+        items=[
+            IncidentRead.model_validate(incident, from_attributes=True)
+            for incident in incidents
+        ],
+        missing_ids=missing_ids,
+    )
+
+CHANGE_STREAM_DESCRIPTION = (
+    "Events are sent when the writing transaction commits. Idle streams "
+    "receive keep-alive comments. A client that falls too far behind gets a "
+    "resync event and the stream ends; refetch, then reconnect."
+)
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    summary="Stream incident and timeline changes",
+    description=(
+        "Stream every incident and timeline event change as Server-Sent "
+        "Events, instead of polling the list endpoints. "
+        + CHANGE_STREAM_DESCRIPTION
+    ),
+    responses={
+        200: CHANGE_STREAM_RESPONSE,
+        401: API_KEY_AUTH_RESPONSE,
+    },
+)
+def stream_incident_changes(
+    listener: PostgresChangeListener = Depends(get_change_listener),
+    settings: Settings = Depends(get_settings),
+):
+    return StreamingResponse(
+        stream_changes(
+            listener, heartbeat_seconds=settings.CHANGE_STREAM_HEARTBEAT_SECONDS
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+@router.get(
+    "/{incident_id}/stream",
+    response_class=StreamingResponse,
+    summary="Stream changes to one incident",
+    description=(
+        "Stream changes to an incident and its timeline events as Server-Sent "
+        "Events, instead of polling the incident and its events. "
+        + CHANGE_STREAM_DESCRIPTION
+    ),
+    responses={
+        200: CHANGE_STREAM_RESPONSE,
+        401: API_KEY_AUTH_RESPONSE,
+        404: INCIDENT_NOT_FOUND_RESPONSE,
+    },
+)
+def stream_single_incident_changes(
+    incident_id: int,
+    use_case: IncidentUseCases = Depends(
+        get_stream_incident_usecases, scope="function"
+    ),
+    listener: PostgresChangeListener = Depends(get_change_listener),
+    settings: Settings = Depends(get_settings),
+):
+    use_case.ensure_incident_exists(incident_id)
+    return StreamingResponse(
+        stream_changes(
+            listener,
+            incident_id=incident_id,
+            heartbeat_seconds=settings.CHANGE_STREAM_HEARTBEAT_SECONDS,
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
 @router.get(
     "/{incident_id}",
     response_model=IncidentRead,
     summary="Get incident",
-    description="Get an incident by ID, including timeline events.",
+    description=(
+        "Get an incident by ID, including timeline events. With fields, only "
+        "the listed fields are returned, and the timeline is only loaded when "
+        "events is one of them."
+    ),
     responses={
+        400: SERVICE_VALIDATION_RESPONSE,
         401: API_KEY_AUTH_RESPONSE,
         404: INCIDENT_NOT_FOUND_RESPONSE,
     },
 )
 def get_incident(
     incident_id: int,
+    fields: list[str] | None = Depends(
+        sparse_fieldset(IncidentRead, example="id,status,severity")
+    ),
     use_case: IncidentUseCases = Depends(get_incident_usecases),
 ):
+    if fields is not None:
+        incident = use_case.get_incident(
+            incident_id, with_events="events" in fields, fields=fields
+        )
+        return JSONResponse(project(incident, fields))
     incident = use_case.get_incident(incident_id, with_events=True)
     return IncidentRead.model_validate(incident, from_attributes=True)
 
@@ -356,8 +783,12 @@ def create_timeline_event(
     response_model=TimelineEventListResponse,
     summary="List timeline events",
     description=(
-        "List timeline events for an incident in a paginated envelope. Results "
-        "are ordered newest first by created_at DESC, id DESC."
+        "List timeline events for an incident in a paginated envelope, "
+        "optionally filtered by event_type and an occurred_at window. Results "
+        "are ordered newest first by created_at DESC, id DESC, or by "
+        "occurred_at DESC, id DESC when order_by=occurred_at. The total counts "
+        "events matching the filters. Set fields to return only the listed "
+        "item fields; only those columns are read from the database."
     ),
     responses={
         200: {
@@ -369,11 +800,29 @@ def create_timeline_event(
             },
         },
         401: API_KEY_AUTH_RESPONSE,
+        400: SERVICE_VALIDATION_RESPONSE,
         404: INCIDENT_NOT_FOUND_RESPONSE,
     },
 )
 def list_timeline_events(
     incident_id: int,
+    event_type: str | None = Query(
+        default=None,
+        max_length=50,
+        description="Only return events of this type.",
+        examples=["status_change"],
+    ),
+    occurred_after: datetime | None = Query(
+        default=None,
+        description="Only return events that occurred at or after this time.",
+        examples=["2026-01-23T14:02:00Z"],
+    ),
+    occurred_before: datetime | None = Query(
+        default=None,
+        description="Only return events that occurred before this time.",
+        examples=["2026-01-23T14:30:00Z"],
+    ),
+    order_by: TimelineOrder = _timeline_order_query(),
     limit: int = Query(
         default=50,
         ge=1,
@@ -387,9 +836,30 @@ def list_timeline_events(
         description="Number of matching timeline events to skip.",
         examples=[0],
     ),
+    fields: list[str] | None = Depends(
+        sparse_fieldset(TimelineEventRead, example="id,event_type,occurred_at")
+    ),
     use_case: IncidentUseCases = Depends(get_incident_usecases),
 ):
-    events, total = use_case.list_events(incident_id, limit=limit, offset=offset)
+    events, total = use_case.list_events(
+        incident_id,
+        event_type=event_type,
+        occurred_after=occurred_after,
+        occurred_before=occurred_before,
+        order_by=order_by,
+        fields=fields,
+        limit=limit,
+        offset=offset,
+    )
+    if fields is not None:
+        return JSONResponse(
+            {
+                "items": [project(event, fields) for event in events],
+                "limit": limit,
+                "offset": offset,
+                "total": total,
+            }
+        )
     items = [
         TimelineEventRead.model_validate(event, from_attributes=True)
         for event in events
@@ -405,8 +875,12 @@ def list_timeline_events(
     "/{incident_id}/events/{event_id}",
     response_model=TimelineEventRead,
     summary="Get timeline event",
-    description="Get one timeline event scoped to an incident.",
+    description=(
+        "Get one timeline event scoped to an incident. With fields, only the "
+        "listed fields are returned."
+    ),
     responses={
+        400: SERVICE_VALIDATION_RESPONSE,
         401: API_KEY_AUTH_RESPONSE,
         404: EVENT_NOT_FOUND_RESPONSE,
     },
@@ -414,9 +888,14 @@ def list_timeline_events(
 def get_timeline_event(
     incident_id: int,
     event_id: int,
+    fields: list[str] | None = Depends(
+        sparse_fieldset(TimelineEventRead, example="id,event_type,occurred_at")
+    ),
     use_case: IncidentUseCases = Depends(get_incident_usecases),
 ):
-    event = use_case.get_event(incident_id, event_id)
+    event = use_case.get_event(incident_id, event_id, fields=fields)
+    if fields is not None:
+        return JSONResponse(project(event, fields))
     return TimelineEventRead.model_validate(event, from_attributes=True)
 
 @router.patch(
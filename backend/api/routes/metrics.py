@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+
+from backend.core.metrics import CONTENT_TYPE, render
+
+router = APIRouter(tags=["metrics"])
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Export Prometheus metrics",
+    description=(
+        "Request counts and latency histograms per route template and status "
+        "class, connection pool gauges and cache hit and miss counters, in the "
+        "Prometheus text format. With METRICS_DIR set, the totals cover every "
+        "worker sharing that directory."
+    ),
+    responses={
+        200: {
+            "description": "Metrics in the Prometheus text format",
+            "content": {
+                "text/plain": {
+                    "example": (
+                        "# TYPE http_requests_total counter\n"
+                        'http_requests_total{method="GET",route="/api/v1/incidents",'
+                        'status="2xx"} 42\n'
+                    ),
+                }
+            },
+        },
+    },
+)
+def metrics(request: Request):
+    snapshots = request.app.state.metrics_snapshots
+    if snapshots is not None:
+        snapshot = snapshots.collect()
+    else:
+        snapshot = request.app.state.metrics.snapshot()
+    return PlainTextResponse(render(snapshot), media_type=CONTENT_TYPE)
@@ -0,0 +1,51 @@
+"""Maintenance commands for the hourly rollup tables.
+
+Usage::
+
+    python -m backend.background.rollups rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from collections.abc import Callable, Sequence
+
+from sqlalchemy.orm import Session
+
+from backend.adapters.persistence.sqlalchemy.rollups import rebuild_rollups
+from backend.core.config import get_settings
+from backend.core.logging import configure_logging
+from backend.db.sessions import get_session_factory
+
+logger = logging.getLogger(__name__)
+
+
+def main(
+    argv: Sequence[str] | None = None,
+    *,
+    session_factory: Callable[[], Session] | None = None,
+) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.background.rollups",
+        description="Maintain the incident and timeline event hourly rollups.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "rebuild",
+        help="Recompute both rollup tables from incidents and timeline events.",
+    )
+    parser.parse_args(argv)
+
+    session_factory = session_factory or get_session_factory()
+    with session_factory() as session:
+        rebuild_rollups(session)
+        session.commit()
+    logger.info("hourly rollups rebuilt")
+    return 0
+
+
+if __name__ == "__main__":
+    settings = get_settings()
+    configure_logging(settings.LOG_LEVEL, json_format=settings.LOG_JSON)
+    raise SystemExit(main())
@@ -0,0 +1,552 @@
+"""Synthetic incident data at benchmark scale.
+
+Usage::
+
+    python -m backend.benchmarks.dataset --events 1m [--seed 7] [--replace]
+
+Incidents arrive during working hours more often than at night, most are
+low severity, and timelines are heavy tailed: a few incidents carry
+thousands of events. Each incident moves through the status workflow with
+plausible acknowledge and resolve times, so whatever is still in progress
+when the data ends stays active. Messages come in realistic lengths.
+
+The same seed and anchor always produce the same rows. Rows are streamed
+into the tables with ``COPY``; the change log and hourly rollups are then
+derived in SQL and the tables analyzed, so the database looks like one the
+API has been writing to.
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import io
+import itertools
+import logging
+import math
+import random
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from backend.adapters.persistence.sqlalchemy.rollups import rebuild_rollups
+from backend.core.config import get_settings
+from backend.core.logging import configure_logging
+from backend.db.models.incident import Incident as IncidentModel
+from backend.db.sessions import get_session_factory
+from backend.domain.incidents.enums import Severity, Status
+
+logger = logging.getLogger(__name__)
+
+SCALES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+DATASET_TABLES = (
+    "incidents",
+    "timeline_events",
+    "incident_status_changes",
+    "incident_hourly_rollups",
+    "timeline_event_hourly_rollups",
+    "change_log",
+)
+
+MEAN_EVENTS_PER_INCIDENT = 10
+MAX_EVENTS_PER_INCIDENT = 5_000
+SEVERITY_WEIGHTS = {
+    Severity.SEV1: 0.03,
+    Severity.SEV2: 0.12,
+    Severity.SEV3: 0.35,
+    Severity.SEV4: 0.50,
+}
+EVENT_TYPE_WEIGHTS = {
+    "note": 0.40,
+    "update": 0.25,
+    "status_change": 0.12,
+    "mitigation": 0.08,
+    "alert": 0.08,
+    "deploy": 0.05,
+    "customer_report": 0.02,
+}
+# Severe incidents draw more responders, so longer timelines, and are
+# resolved sooner.
+_TIMELINE_FACTOR = {
+    Severity.SEV1: 4.0,
+    Severity.SEV2: 2.0,
+    Severity.SEV3: 1.0,
+    Severity.SEV4: 0.6,
+}
+_MEDIAN_RESOLVE_MINUTES = {
+    Severity.SEV1: 90,
+    Severity.SEV2: 180,
+    Severity.SEV3: 720,
+    Severity.SEV4: 2_880,
+}
+_MEDIAN_ACKNOWLEDGE_MINUTES = 8
+# Share of incidents nobody ever resolves.
+_ABANDONED_RATE = 0.004
+
+_SERVICES = (
+    "checkout-api",
+    "payments",
+    "search",
+    "auth",
+    "notifications",
+    "billing",
+    "inventory",
+    "edge-proxy",
+    "postgres-primary",
+    "kafka",
+    "cdn",
+    "mobile-gateway",
+)
+_SYMPTOMS = (
+    "elevated 5xx error rate",
+    "p99 latency above SLO",
+    "intermittent timeouts",
+    "degraded throughput",
+    "connection pool exhaustion",
+    "memory leak after deploy",
+    "certificate expiry",
+    "replication lag",
+    "queue backlog growing",
+    "partial outage in eu-west-1",
+)
+_PHRASES = (
+    "paged the on-call",
+    "rolled back the deploy",
+    "error rate is recovering",
+    "customers report failed checkouts",
+    "dashboards show elevated latency",
+    "traffic shifted to the standby region",
+    "the canary looks healthy",
+    "root cause looks like a bad config push",
+    "increased capacity",
+    "retries are saturating the database",
+    "we are monitoring",
+    "mitigation applied",
+    "waiting on the upstream provider",
+    "failover completed",
+    "alerts cleared",
+    "no customer impact so far",
+    "investigating logs",
+    "restarted the affected pods",
+    "feature flag disabled",
+    "queue drained",
+    "blast radius is limited to one cluster",
+    "next update in 30 minutes",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DatasetSize:
+    incidents: int
+    events: int
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticIncident:
+    title: str
+    description: str
+    severity: Severity
+    status: Status
+    created_at: datetime
+    updated_at: datetime
+    # (occurred_at, created_at, event_type, message), oldest first.
+    events: list[tuple[datetime, datetime, str, str]]
+    # (from_status, to_status, changed_at), starting with the creation row.
+    status_changes: list[tuple[Status | None, Status, datetime]]
+
+
+class DatasetNotEmptyError(Exception):
+    pass
+
+
+def generate(
+    events: int,
+    *,
+    anchor: datetime,
+    seed: int = 0,
+    days: int = 365,
+) -> Iterator[SyntheticIncident]:
+    """Incidents holding exactly ``events`` timeline events, oldest first.
+
+    Incidents are created within ``days`` before ``anchor``, and nothing
+    happens after it.
+    """
+    rng = random.Random(seed)
+    messages = _text_pool(rng, median=110, cap=5_000)
+    descriptions = _text_pool(rng, median=300, cap=2_000)
+    pick_severity = _weighted(rng, SEVERITY_WEIGHTS)
+    pick_event_type = _weighted(rng, EVENT_TYPE_WEIGHTS)
+
+    # Lognormal timeline lengths averaging MEAN_EVENTS_PER_INCIDENT before
+    # the severity factor, drawn until the event budget is spent.
+    sigma = 1.3
+    mu = math.log(MEAN_EVENTS_PER_INCIDENT) - sigma**2 / 2
+    plan: list[tuple[Severity, int]] = []
+    remaining = events
+    while remaining > 0:
+        severity = pick_severity()
+        length = round(rng.lognormvariate(mu, sigma) * _TIMELINE_FACTOR[severity])
+        length = min(max(length, 1), MAX_EVENTS_PER_INCIDENT, remaining)
+        plan.append((severity, length))
+        remaining -= length
+
+    window = days * 86_400
+    start = anchor - timedelta(seconds=window)
+    arrivals = sorted(_arrival(rng, start, window) for _ in plan)
+
+    for (severity, length), offset in zip(plan, arrivals):
+        created_at = start + timedelta(seconds=offset)
+        changes = _status_changes(rng, severity, created_at, anchor)
+        status = changes[-1][1]
+        end = changes[-1][2] if status == Status.RESOLVED else anchor
+        span = (end - created_at).total_seconds()
+
+        timeline = []
+        for fraction in sorted(rng.random() for _ in range(length)):
+            occurred_at = created_at + timedelta(seconds=span * fraction)
+            # Events are written up shortly after they happen.
+            logged_at = min(
+                occurred_at + timedelta(seconds=rng.expovariate(1 / 45)), anchor
+            )
+            message = messages[int(rng.random() * len(messages))]
+            timeline.append((occurred_at, logged_at, pick_event_type(), message))
+
+        yield SyntheticIncident(
+            title=f"{rng.choice(_SERVICES)}: {rng.choice(_SYMPTOMS)}",
+            description=descriptions[int(rng.random() * len(descriptions))],
+            severity=severity,
+            status=status,
+            created_at=created_at,
+            updated_at=changes[-1][2],
+            events=timeline,
+            status_changes=changes,
+        )
+
+
+def _weighted(rng: random.Random, weights: dict) -> Callable[[], object]:
+    values = list(weights)
+    cumulative = list(itertools.accumulate(weights.values()))
+
+    def pick():
+        return values[bisect.bisect(cumulative, rng.random() * cumulative[-1])]
+
+    return pick
+
+
+def _arrival(rng: random.Random, start: datetime, window: float) -> float:
+    # 09:00-18:00 UTC on weekdays is three times as likely as other hours.
+    while True:
+        offset = rng.random() * window
+        moment = start + timedelta(seconds=offset)
+        if (moment.weekday() < 5 and 9 <= moment.hour < 18) or rng.random() < 1 / 3:
+            return offset
+
+
+def _status_changes(
+    rng: random.Random, severity: Severity, created_at: datetime, anchor: datetime
+) -> list[tuple[Status | None, Status, datetime]]:
+    acknowledged = rng.lognormvariate(math.log(_MEDIAN_ACKNOWLEDGE_MINUTES), 0.8)
+    resolved = acknowledged + rng.lognormvariate(
+        math.log(_MEDIAN_RESOLVE_MINUTES[severity]), 1.0
+    )
+    path = [(Status.INVESTIGATING, acknowledged)]
+    if rng.random() < 0.7:
+        path.append(
+            (Status.MITIGATED, acknowledged + (resolved - acknowledged) * 0.6)
+        )
+    if rng.random() >= _ABANDONED_RATE:
+        path.append((Status.RESOLVED, resolved))
+
+    changes: list[tuple[Status | None, Status, datetime]] = [
+        (None, Status.OPEN, created_at)
+    ]
+    for to_status, minutes in path:
+        changed_at = created_at + timedelta(minutes=minutes)
+        if changed_at > anchor:
+            break
+        changes.append((changes[-1][1], to_status, changed_at))
+    return changes
+
+
+def _text_pool(
+    rng: random.Random, *, median: int, cap: int, size: int = 2_048
+) -> list[str]:
+    """Sentences with lognormally distributed lengths, shared between rows."""
+    pool = []
+    for _ in range(size):
+        target = min(max(int(rng.lognormvariate(math.log(median), 0.8)), 12), cap)
+        parts, length = [], 0
+        while length < target:
+            phrase = rng.choice(_PHRASES)
+            parts.append(phrase)
+            length += len(phrase) + 2
+        sentence = "; ".join(parts)[: cap - 1]
+        pool.append(sentence[0].upper() + sentence[1:] + ".")
+    return pool
+
+
+def load(
+    session: Session,
+    *,
+    events: int,
+    seed: int = 0,
+    anchor: datetime | None = None,
+    days: int = 365,
+    replace: bool = False,
+    batch_size: int = 5_000,
+) -> DatasetSize:
+    """Generate a dataset and ``COPY`` it into the incident tables.
+
+    ``anchor`` defaults to the start of the current hour; pass it explicitly
+    to reproduce a dataset exactly.
+    """
+    if replace:
+        session.execute(
+            text(f"TRUNCATE {', '.join(DATASET_TABLES)} RESTART IDENTITY")
+        )
+    elif session.scalar(select(IncidentModel.id).limit(1)) is not None:
+        raise DatasetNotEmptyError("incidents table is not empty")
+    if anchor is None:
+        anchor = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+    incident_id = first_incident_id = _last_id(session, "incidents")
+    event_id = _last_id(session, "timeline_events")
+    change_id = _last_id(session, "incident_status_changes")
+    batches = _CopyBatches(session.connection().connection.driver_connection)
+
+    for incident in generate(events, anchor=anchor, seed=seed, days=days):
+        incident_id += 1
+        batches.incidents.append(
+            _copy_row(
+                incident_id,
+                incident.title,
+                incident.description,
+                incident.severity.name,
+                incident.status.name,
+                incident.created_at,
+                incident.updated_at,
+                len(incident.events),
+                max((event[1] for event in incident.events), default=None),
+            )
+        )
+        for occurred_at, created_at, event_type, message in incident.events:
+            event_id += 1
+            batches.events.append(
+                _copy_row(
+                    event_id,
+                    incident_id,
+                    occurred_at,
+                    event_type,
+                    message,
+                    created_at,
+                    created_at,
+                )
+            )
+        for from_status, to_status, changed_at in incident.status_changes:
+            change_id += 1
+            batches.status_changes.append(
+                _copy_row(
+                    change_id,
+                    incident_id,
+                    from_status.name if from_status else None,
+                    to_status.name,
+                    changed_at,
+                )
+            )
+        if len(batches.incidents) >= batch_size:
+            batches.flush()
+    batches.flush()
+
+    for table, last_id in (
+        ("incidents", incident_id),
+        ("timeline_events", event_id),
+        ("incident_status_changes", change_id),
+    ):
+        if last_id:
+            session.execute(
+                text("SELECT setval(pg_get_serial_sequence(:table, 'id'), :id)"),
+                {"table": table, "id": last_id},
+            )
+    session.execute(_CHANGE_LOG_SQL, {"after_incident_id": first_incident_id})
+    rebuild_rollups(session)
+    for table in DATASET_TABLES:
+        session.execute(text(f"ANALYZE {table}"))
+    return DatasetSize(incidents=incident_id - first_incident_id, events=events)
+
+
+# Log every loaded row as created, like the change log migration backfill.
+_CHANGE_LOG_SQL = text(
+    """
+    INSERT INTO change_log (entity, action, incident_id, entity_id, changed_at)
+    SELECT entity::changeentity, 'CREATED'::changeaction, incident_id, entity_id, changed_at
+    FROM (
+        SELECT 'INCIDENT' AS entity, id AS incident_id, id AS entity_id, created_at AS changed_at
+        FROM incidents
+        WHERE id > :after_incident_id
+        UNION ALL
+        SELECT 'EVENT', incident_id, id, created_at
+        FROM timeline_events
+        WHERE incident_id > :after_incident_id
+    ) AS loaded
+    ORDER BY changed_at, entity_id
+    """
+)
+
+
+class _CopyBatches:
+    """Rows buffered in ``COPY`` text format, written a batch at a time."""
+
+    _TARGETS = (
+        (
+            "incidents",
+            "incidents (id, title, description, severity, status, created_at, "
+            "updated_at, event_count, last_event_at)",
+        ),
+        (
+            "events",
+            "timeline_events (id, incident_id, occurred_at, event_type, message, "
+            "created_at, updated_at)",
+        ),
+        (
+            "status_changes",
+            "incident_status_changes (id, incident_id, from_status, to_status, "
+            "changed_at)",
+        ),
+    )
+
+    def __init__(self, dbapi_connection):
+        self._connection = dbapi_connection
+        self.incidents: list[str] = []
+        self.events: list[str] = []
+        self.status_changes: list[str] = []
+
+    def flush(self) -> None:
+        # Incidents go first: the other tables reference them.
+        with self._connection.cursor() as cursor:
+            for name, target in self._TARGETS:
+                rows = getattr(self, name)
+                if rows:
+                    cursor.copy_expert(
+                        f"COPY {target} FROM STDIN", io.StringIO("".join(rows))
+                    )
+                    rows.clear()
+
+
+_COPY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+def _copy_row(*values) -> str:
+    fields = []
+    for value in values:
+        if value is None:
+            fields.append("\\N")
+        elif isinstance(value, datetime):
+            fields.append(value.isoformat())
+        elif isinstance(value, str):
+            fields.append(value.translate(_COPY_ESCAPES))
+        else:
+            fields.append(str(value))
+    return "\t".join(fields) + "\n"
+
+
+def _last_id(session: Session, table: str) -> int:
+    # Continue from the sequence rather than max(id), so ids handed out
+    # before (even by rolled back transactions) are never reused.
+    return session.execute(
+        text(
+            "SELECT coalesce(pg_sequence_last_value("
+            "pg_get_serial_sequence(:table, 'id')::regclass), 0)"
+        ),
+        {"table": table},
+    ).scalar_one()
+
+
+def dataset_size(session: Session) -> DatasetSize:
+    """Row counts of an already loaded dataset."""
+    return DatasetSize(
+        incidents=session.execute(text("SELECT count(*) FROM incidents")).scalar_one(),
+        events=session.execute(
+            text("SELECT count(*) FROM timeline_events")
+        ).scalar_one(),
+    )
+
+
+def parse_scale(value: str) -> int:
+    if value.lower() in SCALES:
+        return SCALES[value.lower()]
+    if value.isdigit() and int(value) > 0:
+        return int(value)
+    raise argparse.ArgumentTypeError(
+        f"expected one of {', '.join(SCALES)} or a number of events"
+    )
+
+
+def _parse_anchor(value: str) -> datetime:
+    anchor = datetime.fromisoformat(value)
+    return anchor if anchor.tzinfo else anchor.replace(tzinfo=timezone.utc)
+
+
+def main(
+    argv: Sequence[str] | None = None,
+    *,
+    session_factory: Callable[[], Session] | None = None,
+) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.benchmarks.dataset",
+        description="Load a synthetic incident dataset for benchmarks.",
+    )
+    parser.add_argument(
+        "--events",
+        type=parse_scale,
+        default=SCALES["10k"],
+        help=f"timeline events to create: {', '.join(SCALES)} or a number",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--anchor",
+        type=_parse_anchor,
+        help="ISO timestamp the data ends at (default: start of the current hour)",
+    )
+    parser.add_argument(
+        "--days", type=int, default=365, help="days of history before the anchor"
+    )
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="truncate the incident tables first; they must be empty otherwise",
+    )
+    args = parser.parse_args(argv)
+
+    session_factory = session_factory or get_session_factory()
+    with session_factory() as session:
+        try:
+            size = load(
+                session,
+                events=args.events,
+                seed=args.seed,
+                anchor=args.anchor,
+                days=args.days,
+                replace=args.replace,
+            )
+        except DatasetNotEmptyError:
+            logger.error("incidents table is not empty; rerun with --replace")
+            return 1
+        session.commit()
+    logger.info(
+        "dataset loaded incidents=%s events=%s seed=%s",
+        size.incidents,
+        size.events,
+        args.seed,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    settings = get_settings()
+    configure_logging(settings.LOG_LEVEL, json_format=settings.LOG_JSON)
+    raise SystemExit(main())
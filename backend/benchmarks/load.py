@@ -0,0 +1,396 @@
+"""HTTP load tests of the API under realistic traffic profiles.
+
+Usage::
+
+    python -m backend.benchmarks.load dashboard-polling --concurrency 1,8,32,64
+    python -m backend.benchmarks.load outage-event-storm --url http://localhost:8000
+
+Without ``--url`` the app is created in this process and driven through
+ASGI, which measures the application without a network hop; with it, a
+running uvicorn is tested over HTTP. Each virtual user sends its next
+request as soon as the previous one completes, so throughput at a
+concurrency level is what the instance sustains with that many requests in
+flight. Point it at a benchmark database: some profiles write.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from time import perf_counter
+
+import httpx
+from fastapi import FastAPI
+
+from backend.benchmarks.results import percentile
+from backend.core.config import get_settings
+from backend.core.logging import configure_logging
+
+Request = tuple[str, str, dict | None]
+
+
+@dataclass
+class Targets:
+    """Incidents the profiles send requests about, discovered through the API."""
+
+    incident_ids: list[int]
+    active_incident_ids: list[int]
+    rng: random.Random = field(default_factory=lambda: random.Random(0))
+
+    def incident_id(self) -> int:
+        return self.rng.choice(self.incident_ids)
+
+    def active_incident_id(self) -> int:
+        return self.rng.choice(self.active_incident_ids or self.incident_ids)
+
+
+@dataclass(frozen=True, slots=True)
+class Endpoint:
+    name: str
+    weight: float
+    build: Callable[[Targets], Request]
+
+
+@dataclass(frozen=True, slots=True)
+class Profile:
+    name: str
+    description: str
+    endpoints: tuple[Endpoint, ...]
+
+    def pick(self, rng: random.Random) -> Endpoint:
+        return rng.choices(
+            self.endpoints, weights=[endpoint.weight for endpoint in self.endpoints]
+        )[0]
+
+
+@dataclass(frozen=True, slots=True)
+class LevelResult:
+    concurrency: int
+    requests: int
+    errors: int
+    seconds: float
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    # Failed requests by status code, or by exception name.
+    error_kinds: dict[str, int]
+    # Completed requests by endpoint name.
+    endpoints: dict[str, int]
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+
+def _new_event(targets: Targets) -> Request:
+    return (
+        "POST",
+        f"/incidents/{targets.active_incident_id()}/events",
+        {
+            "occurred_at": datetime.now(timezone.utc).isoformat(),
+            "event_type": targets.rng.choice(["note", "update", "mitigation"]),
+            "message": "Error rate still elevated; rolling back the last deploy.",
+        },
+    )
+
+
+PROFILES = {
+    profile.name: profile
+    for profile in (
+        Profile(
+            "dashboard-polling",
+            "Responders' browsers refreshing the dashboard and active board.",
+            (
+                Endpoint("dashboard", 6, lambda t: ("GET", "/dashboard", None)),
+                Endpoint(
+                    "active_incidents",
+                    3,
+                    lambda t: ("GET", "/incidents?active_only=true&limit=25", None),
+                ),
+                Endpoint(
+                    "recent_events", 1, lambda t: ("GET", "/events/recent", None)
+                ),
+            ),
+        ),
+        Profile(
+            "outage-event-storm",
+            "A major outage: responders flood a few active incidents with "
+            "timeline events while watching them.",
+            (
+                Endpoint("create_event", 6, _new_event),
+                Endpoint(
+                    "incident_events",
+                    3,
+                    lambda t: (
+                        "GET",
+                        f"/incidents/{t.active_incident_id()}/events?limit=20",
+                        None,
+                    ),
+                ),
+                Endpoint("dashboard", 1, lambda t: ("GET", "/dashboard", None)),
+            ),
+        ),
+        Profile(
+            "postmortem-report-reading",
+            "Reviewers reading incident reports and full timelines.",
+            (
+                Endpoint(
+                    "report",
+                    5,
+                    lambda t: ("GET", f"/incidents/{t.incident_id()}/report", None),
+                ),
+                Endpoint(
+                    "report_markdown",
+                    3,
+                    lambda t: (
+                        "GET",
+                        f"/incidents/{t.incident_id()}/report/markdown",
+                        None,
+                    ),
+                ),
+                Endpoint(
+                    "timeline",
+                    2,
+                    lambda t: (
+                        "GET",
+                        f"/incidents/{t.incident_id()}/events"
+                        "?order_by=occurred_at&limit=100",
+                        None,
+                    ),
+                ),
+            ),
+        ),
+    )
+}
+
+
+async def discover_targets(client: httpx.AsyncClient, *, seed: int = 0) -> Targets:
+    recent = await client.get("/incidents", params={"limit": 100})
+    recent.raise_for_status()
+    active = await client.get("/incidents", params={"limit": 100, "active_only": True})
+    active.raise_for_status()
+    incident_ids = [item["id"] for item in recent.json()["items"]]
+    if not incident_ids:
+        raise ValueError("no incidents to load test; load a dataset first")
+    return Targets(
+        incident_ids=incident_ids,
+        active_incident_ids=[item["id"] for item in active.json()["items"]][:5],
+        rng=random.Random(seed),
+    )
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    profile: Profile,
+    targets: Targets,
+    *,
+    concurrency: int,
+    seconds: float,
+) -> LevelResult:
+    latencies: list[float] = []
+    errors: Counter[str] = Counter()
+    endpoints: Counter[str] = Counter()
+    deadline = perf_counter() + seconds
+
+    async def user() -> None:
+        while perf_counter() < deadline:
+            endpoint = profile.pick(targets.rng)
+            method, path, body = endpoint.build(targets)
+            started = perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+            except httpx.HTTPError as exc:
+                errors[type(exc).__name__] += 1
+            else:
+                if response.status_code >= 400:
+                    errors[str(response.status_code)] += 1
+            latencies.append(perf_counter() - started)
+            endpoints[endpoint.name] += 1
+
+    started = perf_counter()
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    elapsed = perf_counter() - started
+
+    ordered = sorted(latencies)
+    return LevelResult(
+        concurrency=concurrency,
+        requests=len(ordered),
+        errors=sum(errors.values()),
+        seconds=elapsed,
+        throughput=len(ordered) / elapsed,
+        p50_ms=percentile(ordered, 50) * 1000 if ordered else 0.0,
+        p95_ms=percentile(ordered, 95) * 1000 if ordered else 0.0,
+        p99_ms=percentile(ordered, 99) * 1000 if ordered else 0.0,
+        error_kinds=dict(errors),
+        endpoints=dict(endpoints),
+    )
+
+
+async def run_profile(
+    client: httpx.AsyncClient,
+    profile: Profile,
+    *,
+    levels: Sequence[int],
+    seconds: float,
+    seed: int = 0,
+) -> list[LevelResult]:
+    targets = await discover_targets(client, seed=seed)
+    return [
+        await run_level(
+            client, profile, targets, concurrency=concurrency, seconds=seconds
+        )
+        for concurrency in levels
+    ]
+
+
+def sustained(
+    results: Sequence[LevelResult], *, p99_ms: float, max_error_rate: float = 0.01
+) -> LevelResult | None:
+    """The highest-throughput level that kept p99 latency and errors in bounds."""
+    healthy = [
+        result
+        for result in results
+        if result.p99_ms <= p99_ms and result.error_rate <= max_error_rate
+    ]
+    return max(healthy, key=lambda result: result.throughput, default=None)
+
+
+@asynccontextmanager
+async def open_client(
+    url: str | None,
+    *,
+    api_key: str,
+    concurrency: int,
+    app: FastAPI | None = None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """A client for the API at ``url``, or for ``app`` (by default a new one)."""
+    settings = get_settings()
+    headers = {"X-API-Key": api_key} if api_key else {}
+    if url:
+        async with httpx.AsyncClient(
+            base_url=url.rstrip("/") + settings.API_PREFIX,
+            headers=headers,
+            limits=httpx.Limits(max_connections=concurrency),
+            timeout=30,
+        ) as client:
+            yield client
+        return
+
+    if app is None:
+        from backend.main import create_app
+
+        app = create_app(settings)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://load-test" + settings.API_PREFIX,
+            headers=headers,
+            timeout=30,
+        ) as client:
+            yield client
+
+
+def format_levels(results: Sequence[LevelResult]) -> str:
+    lines = [
+        f"{'users':>6} {'requests':>9} {'req/s':>9} {'p50 ms':>9} "
+        f"{'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.concurrency:>6} {result.requests:>9} {result.throughput:>9.1f} "
+            f"{result.p50_ms:>9.2f} {result.p95_ms:>9.2f} {result.p99_ms:>9.2f} "
+            f"{result.error_rate:>7.1%}"
+        )
+    return "\n".join(lines)
+
+
+def _levels(value: str) -> list[int]:
+    try:
+        levels = [int(part) for part in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected comma-separated integers") from None
+    if not levels or min(levels) < 1:
+        raise argparse.ArgumentTypeError("concurrency levels must be at least 1")
+    return levels
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.benchmarks.load",
+        description="Load test the API with a traffic profile.",
+    )
+    parser.add_argument("profile", choices=sorted(PROFILES))
+    parser.add_argument(
+        "--concurrency",
+        type=_levels,
+        default=[1, 4, 16, 64],
+        help="comma-separated virtual user counts, run in order (default 1,4,16,64)",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10, help="seconds per concurrency level"
+    )
+    parser.add_argument("--url", help="base URL of a running API; in-process if omitted")
+    parser.add_argument("--api-key", help="defaults to the configured API_KEY")
+    parser.add_argument(
+        "--slo-p99-ms",
+        type=float,
+        default=250,
+        help="p99 latency a level must stay under to count as sustained",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    profile = PROFILES[args.profile]
+    api_key = args.api_key if args.api_key is not None else get_settings().API_KEY
+
+    async def run() -> list[LevelResult]:
+        async with open_client(
+            args.url, api_key=api_key, concurrency=max(args.concurrency)
+        ) as client:
+            return await run_profile(
+                client,
+                profile,
+                levels=args.concurrency,
+                seconds=args.duration,
+                seed=args.seed,
+            )
+
+    results = asyncio.run(run())
+    print(f"{profile.name}: {profile.description}")
+    print(format_levels(results))
+    best = sustained(results, p99_ms=args.slo_p99_ms)
+    if best is None:
+        print(f"no level kept p99 under {args.slo_p99_ms:g} ms with <1% errors")
+    else:
+        print(
+            f"sustained {best.throughput:.1f} req/s at {best.concurrency} users "
+            f"(p99 {best.p99_ms:.1f} ms)"
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "profile": profile.name,
+                    "target": args.url or "in-process",
+                    "levels": [asdict(result) for result in results],
+                },
+                f,
+                indent=2,
+            )
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    settings = get_settings()
+    configure_logging(settings.LOG_LEVEL, json_format=settings.LOG_JSON)
+    raise SystemExit(main())
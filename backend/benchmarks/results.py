@@ -0,0 +1,168 @@
+"""Timing, summarising and comparing benchmark runs.
+
+Results are written as JSON so runs from different commits can be compared;
+``compare`` flags every case whose latency percentiles grew, or whose
+throughput fell, by more than a relative threshold.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any
+
+RESULTS_VERSION = 1
+LATENCY_PERCENTILES = ("p50_ms", "p95_ms", "p99_ms")
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    name: str
+    iterations: int
+    throughput: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkRun:
+    label: str
+    dataset: dict[str, int]
+    results: list[BenchmarkResult]
+    created_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return (self.current - self.baseline) / self.baseline if self.baseline else 0.0
+
+
+def measure(
+    name: str,
+    run: Callable[[Any], object],
+    *,
+    iterations: int,
+    warmup: int = 0,
+    prepare: Callable[[], Any] | None = None,
+) -> BenchmarkResult:
+    """Time ``iterations`` calls of ``run`` one after another.
+
+    ``prepare`` runs untimed before each call and its return value is passed
+    to ``run``, e.g. to create the row a delete benchmark removes.
+    """
+    if iterations < 1:
+        raise ValueError("iterations must be at least 1")
+    for _ in range(warmup):
+        run(prepare() if prepare else None)
+
+    timings = []
+    for _ in range(iterations):
+        prepared = prepare() if prepare else None
+        started = perf_counter()
+        run(prepared)
+        timings.append(perf_counter() - started)
+    return summarize(name, timings)
+
+
+def summarize(name: str, timings: Sequence[float]) -> BenchmarkResult:
+    ordered = sorted(timings)
+    total = sum(ordered)
+    return BenchmarkResult(
+        name=name,
+        iterations=len(ordered),
+        throughput=len(ordered) / total if total else math.inf,
+        mean_ms=total / len(ordered) * 1000,
+        p50_ms=percentile(ordered, 50) * 1000,
+        p95_ms=percentile(ordered, 95) * 1000,
+        p99_ms=percentile(ordered, 99) * 1000,
+        max_ms=ordered[-1] * 1000,
+    )
+
+
+def percentile(ordered: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not ordered:
+        raise ValueError("no values")
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def compare(
+    baseline: BenchmarkRun,
+    current: BenchmarkRun,
+    *,
+    threshold: float = 0.2,
+    min_delta_ms: float = 1.0,
+) -> list[Regression]:
+    """Cases of ``current`` that are more than ``threshold`` worse than ``baseline``.
+
+    Latency changes smaller than ``min_delta_ms`` are ignored, so jitter on
+    sub-millisecond cases does not read as a regression. Cases missing from
+    either run are skipped.
+    """
+    previous = {result.name: result for result in baseline.results}
+    regressions = []
+    for result in current.results:
+        before = previous.get(result.name)
+        if before is None:
+            continue
+        for metric in LATENCY_PERCENTILES:
+            old, new = getattr(before, metric), getattr(result, metric)
+            if new > old * (1 + threshold) and new - old >= min_delta_ms:
+                regressions.append(Regression(result.name, metric, old, new))
+        if result.throughput < before.throughput * (1 - threshold):
+            regressions.append(
+                Regression(
+                    result.name, "throughput", before.throughput, result.throughput
+                )
+            )
+    return regressions
+
+
+def write_run(run: BenchmarkRun, path: str | os.PathLike) -> None:
+    payload = {"version": RESULTS_VERSION, **asdict(run)}
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+        f.write("\n")
+
+
+def read_run(path: str | os.PathLike) -> BenchmarkRun:
+    with open(path) as f:
+        payload = json.load(f)
+    if payload.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path}: unsupported results version {payload.get('version')}")
+    return BenchmarkRun(
+        label=payload["label"],
+        dataset=payload["dataset"],
+        results=[BenchmarkResult(**result) for result in payload["results"]],
+        created_at=payload["created_at"],
+    )
+
+
+def format_results(results: Iterable[BenchmarkResult]) -> str:
+    lines = [
+        f"{'case':<32} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.name:<32} {result.throughput:>9.1f} {result.p50_ms:>9.2f} "
+            f"{result.p95_ms:>9.2f} {result.p99_ms:>9.2f}"
+        )
+    return "\n".join(lines)
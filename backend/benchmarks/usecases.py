@@ -0,0 +1,365 @@
+"""Latency and throughput of every incident use case against a seeded database.
+
+Usage::
+
+    python -m backend.benchmarks.dataset --events 1m --replace
+    python -m backend.benchmarks.usecases run --output after.json
+    python -m backend.benchmarks.usecases compare before.json after.json
+
+Each iteration opens its own unit of work, like an API request, so commits
+are part of the timing. Write cases leave their rows behind: run them
+against a database loaded for benchmarking, never a real one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import subprocess
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from backend.adapters.persistence.sqlalchemy.uow import SqlAlchemyUnitOfWork
+from backend.benchmarks.dataset import dataset_size
+from backend.benchmarks.results import (
+    BenchmarkResult,
+    BenchmarkRun,
+    compare,
+    format_results,
+    measure,
+    read_run,
+    write_run,
+)
+from backend.db.sessions import get_session_factory
+from backend.domain.incidents.entities import Incident
+from backend.domain.incidents.enums import Severity
+from backend.services.incidents.commands import (
+    CreateIncidentCmd,
+    CreateTimelineEventCmd,
+    UpdateIncidentCmd,
+    UpdateTimelineEventCmd,
+)
+from backend.services.incidents.report_markdown import render_incident_report_markdown
+from backend.services.incidents.usecases import IncidentUseCases
+
+SAMPLE_SIZE = 500
+
+
+@dataclass
+class Workload:
+    """Ids the cases pick from, sampled once from the loaded dataset."""
+
+    incident_ids: list[int]
+    events: list[tuple[int, int]]
+    report: Incident
+    since: int
+    rng: random.Random = field(default_factory=lambda: random.Random(0))
+
+    def incident_id(self) -> int:
+        return self.rng.choice(self.incident_ids)
+
+    def event(self) -> tuple[int, int]:
+        return self.rng.choice(self.events)
+
+    @classmethod
+    def sample(
+        cls, session: Session, *, size: int = SAMPLE_SIZE, seed: int = 0
+    ) -> "Workload":
+        incident_ids = list(
+            session.execute(
+                text(
+                    "SELECT id FROM incidents ORDER BY md5(id::text || :seed) "
+                    "LIMIT :size"
+                ),
+                {"seed": str(seed), "size": size},
+            ).scalars()
+        )
+        if not incident_ids:
+            raise ValueError("no incidents to benchmark; load a dataset first")
+        events = [
+            tuple(row)
+            for row in session.execute(
+                text(
+                    "SELECT incident_id, id FROM timeline_events "
+                    "WHERE incident_id = ANY(:ids) ORDER BY id LIMIT :size"
+                ),
+                {"ids": incident_ids, "size": size},
+            )
+        ]
+        # Reports are benchmarked on the longest timeline, the slowest case.
+        report_incident_id = session.execute(
+            text("SELECT id FROM incidents ORDER BY event_count DESC, id LIMIT 1")
+        ).scalar_one()
+        with SqlAlchemyUnitOfWork(session=session, close_on_exit=False) as uow:
+            report = IncidentUseCases(uow).get_incident_report(report_incident_id)
+            # Sync clients poll from near the head of the log.
+            since = max(uow.changes.latest_seq() - 500, 0)
+        return cls(
+            incident_ids=incident_ids,
+            events=events,
+            report=report,
+            since=since,
+            rng=random.Random(seed),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    """One benchmarked operation.
+
+    ``run`` gets the use cases of a fresh unit of work (``None`` when the
+    case does not touch the database), the workload and whatever ``prepare``
+    returned. ``prepare`` runs untimed in a unit of work of its own.
+    """
+
+    name: str
+    run: Callable[[IncidentUseCases | None, Workload, Any], object]
+    prepare: Callable[[IncidentUseCases, Workload], Any] | None = None
+    uses_database: bool = True
+
+
+def _days_ago(days: int) -> dict[str, datetime]:
+    now = datetime.now(timezone.utc)
+    return {"created_after": now - timedelta(days=days), "created_before": now}
+
+
+def _new_incident(use_cases: IncidentUseCases, workload: Workload) -> int:
+    return use_cases.create_incident(
+        CreateIncidentCmd(
+            title="Benchmark incident",
+            description="Created by the use case benchmarks",
+            severity=workload.rng.choice(list(Severity)),
+        )
+    ).id
+
+
+def _new_event(use_cases: IncidentUseCases, workload: Workload) -> tuple[int, int]:
+    incident_id = workload.incident_id()
+    event = use_cases.create_event(
+        incident_id,
+        CreateTimelineEventCmd(
+            occurred_at=datetime.now(timezone.utc),
+            event_type="note",
+            message="Created by the use case benchmarks",
+        ),
+    )
+    return incident_id, event.id
+
+
+CASES = (
+    Case("list_incidents", lambda uc, w, _: uc.list_incidents()),
+    Case("get_dashboard", lambda uc, w, _: uc.get_dashboard()),
+    Case("list_changes", lambda uc, w, _: uc.list_changes(since=w.since)),
+    Case(
+        "get_incident_stats",
+        lambda uc, w, _: uc.get_incident_stats(**_days_ago(30)),
+    ),
+    Case(
+        "get_response_times",
+        lambda uc, w, _: uc.get_response_times(**_days_ago(7)),
+    ),
+    Case("get_incident", lambda uc, w, _: uc.get_incident(w.incident_id())),
+    Case(
+        "ensure_incident_exists",
+        lambda uc, w, _: uc.ensure_incident_exists(w.incident_id()),
+    ),
+    Case(
+        "get_incidents",
+        lambda uc, w, _: uc.get_incidents(
+            w.rng.sample(w.incident_ids, min(len(w.incident_ids), 50))
+        ),
+    ),
+    Case(
+        "get_incident_report",
+        lambda uc, w, _: uc.get_incident_report(w.report.id),
+    ),
+    Case(
+        "create_incident",
+        lambda uc, w, _: _new_incident(uc, w),
+    ),
+    Case(
+        "update_incident",
+        lambda uc, w, _: uc.update_incident(
+            w.incident_id(),
+            UpdateIncidentCmd(severity=w.rng.choice(list(Severity))),
+        ),
+    ),
+    Case(
+        "delete_incident",
+        lambda uc, w, incident_id: uc.delete_incident(incident_id),
+        prepare=_new_incident,
+    ),
+    Case("list_events", lambda uc, w, _: uc.list_events(w.incident_id())),
+    Case("list_recent_events", lambda uc, w, _: uc.list_recent_events()),
+    Case("get_event", lambda uc, w, _: uc.get_event(*w.event())),
+    Case(
+        "create_event",
+        lambda uc, w, _: _new_event(uc, w),
+    ),
+    Case(
+        "update_event",
+        lambda uc, w, _: uc.update_event(
+            *w.event(), UpdateTimelineEventCmd(message="Updated by the benchmarks")
+        ),
+    ),
+    Case(
+        "delete_event",
+        lambda uc, w, event: uc.delete_event(*event),
+        prepare=_new_event,
+    ),
+    Case(
+        "render_incident_report_markdown",
+        lambda uc, w, _: render_incident_report_markdown(w.report),
+        uses_database=False,
+    ),
+)
+
+
+def run_cases(
+    session_factory: Callable[[], Session],
+    workload: Workload,
+    *,
+    iterations: int,
+    warmup: int = 0,
+    cases: Sequence[Case] = CASES,
+) -> list[BenchmarkResult]:
+    def in_unit_of_work(operation: Callable[[IncidentUseCases], Any]) -> Any:
+        with SqlAlchemyUnitOfWork(session_factory=session_factory) as uow:
+            return operation(IncidentUseCases(uow))
+
+    results = []
+    for case in cases:
+        if case.uses_database:
+
+            def run(prepared, case=case):
+                return in_unit_of_work(lambda uc: case.run(uc, workload, prepared))
+
+        else:
+
+            def run(prepared, case=case):
+                return case.run(None, workload, prepared)
+
+        prepare = None
+        if case.prepare is not None:
+
+            def prepare(case=case):
+                return in_unit_of_work(lambda uc: case.prepare(uc, workload))
+
+        results.append(
+            measure(
+                case.name, run, iterations=iterations, warmup=warmup, prepare=prepare
+            )
+        )
+    return results
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main(
+    argv: Sequence[str] | None = None,
+    *,
+    session_factory: Callable[[], Session] | None = None,
+) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.benchmarks.usecases",
+        description="Benchmark the incident use cases against a loaded dataset.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Benchmark every case.")
+    run_parser.add_argument("--iterations", type=int, default=200)
+    run_parser.add_argument("--warmup", type=int, default=10)
+    run_parser.add_argument(
+        "--case",
+        action="append",
+        choices=[case.name for case in CASES],
+        help="only run this case; repeatable",
+    )
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--label", help="defaults to the current git revision")
+    run_parser.add_argument("--output", help="write the results to this JSON file")
+
+    compare_parser = commands.add_parser(
+        "compare", help="Fail when a run regressed against a baseline."
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown that counts as a regression (default 0.2)",
+    )
+    compare_parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=1.0,
+        help="ignore latency changes smaller than this (default 1.0)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        baseline, current = read_run(args.baseline), read_run(args.current)
+        if baseline.dataset != current.dataset:
+            print(
+                f"warning: datasets differ ({baseline.dataset} vs "
+                f"{current.dataset}); compare runs at the same scale"
+            )
+        regressions = compare(
+            baseline,
+            current,
+            threshold=args.threshold,
+            min_delta_ms=args.min_delta_ms,
+        )
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression.name} {regression.metric}: "
+                f"{regression.baseline:.2f} -> {regression.current:.2f} "
+                f"({regression.change:+.0%})"
+            )
+        if not regressions:
+            print("no regressions")
+        return 1 if regressions else 0
+
+    session_factory = session_factory or get_session_factory()
+    with session_factory() as session:
+        size = dataset_size(session)
+        workload = Workload.sample(session, seed=args.seed)
+    cases = [case for case in CASES if not args.case or case.name in args.case]
+    results = run_cases(
+        session_factory,
+        workload,
+        iterations=args.iterations,
+        warmup=args.warmup,
+        cases=cases,
+    )
+    print(format_results(results))
+    if args.output:
+        write_run(
+            BenchmarkRun(
+                label=args.label or _git_revision(),
+                dataset={"incidents": size.incidents, "events": size.events},
+                results=results,
+            ),
+            args.output,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,6 +6,9 @@ from pydantic import field_validator
 class Settings(BaseSettings, case_sensitive=True):
     APP_ENV: str = "local"
     LOG_LEVEL: str = "info"
+    LOG_JSON: bool = True
+    LOG_QUEUE_SIZE: int = 10_000
+    REQUEST_LOG_SAMPLE_RATE: float = 1
 
     API_TITLE: str = "Incident Co-Pilot API"
     API_DESCRIPTION: str = "Incident Co-Pilot is a lightweight incident timeline capture and summarisation tool."
@@ -19,6 +22,26 @@ class Settings(BaseSettings, case_sensitive=True):
 
     CORS_ORIGINS: str = ""
 
+    INCIDENT_STATS_CACHE_TTL_SECONDS: float = 0
+    DASHBOARD_CACHE_TTL_SECONDS: float = 0
+
+    CHANGE_STREAM_MAX_PENDING: int = 100
+    CHANGE_STREAM_HEARTBEAT_SECONDS: float = 15
+
+    SQL_COMMENTS_ENABLED: bool = True
+    SQL_COMMENTS_STABLE: bool = False
+
+    SLOW_QUERY_THRESHOLD_MS: float = 0
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
+    SLOW_QUERY_BUFFER_SIZE: int = 100
+
+    PROFILING_ENABLED: bool = False
+    PROFILING_INTERVAL_MS: float = 1
+    PROFILING_BUFFER_SIZE: int = 20
+
+    METRICS_DIR: str = ""
+    METRICS_FLUSH_SECONDS: float = 5
+
     DEBUG: bool = False
 
     OPENAI_API_KEY: str = "Dummy-key"
@@ -1,15 +1,63 @@
+"""Logging that never makes the caller wait for I/O.
+
+Records from the ``backend`` loggers and anything else reaching the root
+logger are put on a bounded queue by a ``QueueHandler``. A ``QueueListener``
+thread formats them, as one JSON object per line by default, and writes
+them to stderr. When the queue is full new records are dropped rather than
+blocking a request; how many is logged once the queue has room again.
+
+Pass structured fields with ``extra``; they become keys of the JSON object,
+or ``key=value`` pairs after the message in text mode.
+"""
+
 from __future__ import annotations
 
+import atexit
+import copy
+import json
 import logging
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
 
 
 LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+DEFAULT_QUEUE_SIZE = 10_000
+
+_STANDARD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None))
+) | {"message", "asctime"}
 
+_handler: DroppingQueueHandler | None = None
+_listener: _Listener | None = None
+
+
+def configure_logging(
+    level: str,
+    *,
+    json_format: bool = True,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> None:
+    global _handler, _listener
 
-def configure_logging(level: str) -> None:
     resolved_level = _resolve_level(level)
 
-    logging.basicConfig(format=LOG_FORMAT)
+    root_logger = logging.getLogger()
+    if _handler is not None:
+        root_logger.removeHandler(_handler)
+    if _listener is not None:
+        _listener.stop()
+
+    writer = _StderrHandler()
+    writer.setFormatter(JsonFormatter() if json_format else TextFormatter(LOG_FORMAT))
+    _handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+    _listener = _Listener(_handler.queue, writer)
+    _listener.start()
+    root_logger.addHandler(_handler)
+
     backend_logger = logging.getLogger("backend")
     backend_logger.disabled = False
     backend_logger.setLevel(resolved_level)
@@ -22,6 +70,120 @@ def configure_logging(level: str) -> None:
             existing_logger.disabled = False
 
 
+def flush_logging() -> None:
+    """Write out every queued record; stops the writer thread until reconfigured."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(flush_logging)
+
+
+def log_fields(record: logging.LogRecord) -> dict[str, Any]:
+    """The structured fields passed to a log call with ``extra``."""
+    return {
+        key: value
+        for key, value in vars(record).items()
+        if key not in _STANDARD_ATTRIBUTES and not key.startswith("_")
+    }
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **log_fields(record),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(payload, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        message = super().formatMessage(record)
+        fields = log_fields(record)
+        if not fields:
+            return message
+        return message + " " + " ".join(f"{key}={value}" for key, value in fields.items())
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Queues records without ever blocking, dropping them while the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._unreported = 0
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting is left to the listener thread. Only the message is
+        # resolved here, while its arguments still hold the logged values.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+                self._unreported += 1
+            return
+        if self._unreported:
+            self._report_drops()
+
+    def _report_drops(self) -> None:
+        with self._drop_lock:
+            count, self._unreported = self._unreported, 0
+        if not count:
+            return
+        record = logging.LogRecord(
+            __name__,
+            logging.WARNING,
+            __file__,
+            0,
+            "log records dropped",
+            None,
+            None,
+        )
+        record.dropped = count
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._drop_lock:
+                self._unreported += count
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Wait for room rather than fail when stopping with a full queue.
+        self.queue.put(self._sentinel)
+
+
+class _StderrHandler(logging.StreamHandler):
+    # Looks sys.stderr up on every write, so redirecting it (as test runners
+    # do) does not leave the writer holding a closed stream.
+    def __init__(self) -> None:
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+
 def _resolve_level(level: str) -> int:
     normalized_level = level.upper()
     resolved_level = getattr(logging, normalized_level, logging.INFO)
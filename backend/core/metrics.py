@@ -0,0 +1,344 @@
+"""Request and runtime metrics rendered in the Prometheus text format.
+
+Requests are observed on the event loop thread, so recording one is a dict
+lookup and two list increments; the lock is only taken the first time a
+method/route/status series is seen. Gauges such as connection pool usage are
+read by collectors when the registry is scraped.
+
+Each uvicorn worker only sees its own requests. ``MetricsSnapshotDirectory``
+shares them: every worker writes its snapshot to a common directory and a
+scrape of any worker merges all of them. Counters of exited workers carry
+over; their gauges are dropped once their snapshot stops being refreshed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from backend.core.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = "unmatched"
+
+REQUESTS_TOTAL = "http_requests_total"
+REQUEST_DURATION = "http_request_duration_seconds"
+
+
+@dataclass(frozen=True, slots=True)
+class Metric:
+    """One metric family read by a collector at scrape time."""
+
+    name: str
+    kind: str
+    help: str
+    samples: list[tuple[dict[str, str], float]]
+
+
+Collector = Callable[[], Iterable[Metric]]
+
+
+class MetricsRegistry:
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        # Per series: one count per bucket, one for +Inf, then the sum.
+        self._requests: dict[tuple[str, str, str], list[float]] = {}
+        self._collectors: list[Collector] = []
+        self._lock = threading.Lock()
+
+    def observe_request(
+        self, method: str, route: str, status_code: int, seconds: float
+    ) -> None:
+        key = (method, route, f"{status_code // 100}xx")
+        series = self._requests.get(key)
+        if series is None:
+            with self._lock:
+                series = self._requests.setdefault(
+                    key, [0] * (len(self.buckets) + 1) + [0.0]
+                )
+        series[bisect_left(self.buckets, seconds)] += 1
+        series[-1] += seconds
+
+    def add_collector(self, collector: Collector) -> None:
+        self._collectors.append(collector)
+
+    def snapshot(self) -> dict:
+        """JSON-ready copy of every series, mergeable with other workers'."""
+        metrics = []
+        for collector in self._collectors:
+            try:
+                collected = list(collector())
+            except Exception:
+                logger.exception("metrics collector failed")
+                continue
+            metrics.extend(
+                {
+                    "name": metric.name,
+                    "kind": metric.kind,
+                    "help": metric.help,
+                    "samples": [[labels, value] for labels, value in metric.samples],
+                }
+                for metric in collected
+            )
+        return {
+            "buckets": list(self.buckets),
+            "requests": [
+                [*key, *series] for key, series in list(self._requests.items())
+            ],
+            "metrics": metrics,
+        }
+
+
+def merge_snapshots(snapshots: Iterable[dict]) -> dict:
+    """Sum counters, histograms and gauges across worker snapshots.
+
+    Summed gauges read as totals for the deployment, e.g. connections
+    checked out across every worker's pool, so only snapshots of live
+    workers should still carry them (see ``without_gauges``).
+    """
+    buckets: list[float] | None = None
+    requests: dict[tuple, list[float]] = {}
+    metrics: dict[str, dict] = {}
+    for snapshot in snapshots:
+        if buckets is None:
+            buckets = snapshot["buckets"]
+        elif snapshot["buckets"] != buckets:
+            logger.warning("skipping metrics snapshot with different buckets")
+            continue
+        for row in snapshot["requests"]:
+            key, series = tuple(row[:3]), row[3:]
+            totals = requests.setdefault(key, [0] * len(series))
+            for i, value in enumerate(series):
+                totals[i] += value
+        for metric in snapshot["metrics"]:
+            merged = metrics.setdefault(metric["name"], {**metric, "samples": {}})
+            for labels, value in metric["samples"]:
+                label_key = tuple(sorted(labels.items()))
+                merged["samples"][label_key] = (
+                    merged["samples"].get(label_key, 0) + value
+                )
+    return {
+        "buckets": buckets or list(LATENCY_BUCKETS),
+        "requests": [[*key, *series] for key, series in requests.items()],
+        "metrics": [
+            {**metric, "samples": [[dict(k), v] for k, v in metric["samples"].items()]}
+            for metric in metrics.values()
+        ],
+    }
+
+
+def without_gauges(snapshot: dict) -> dict:
+    """``snapshot`` with only the metrics that stay valid after its worker exits."""
+    return {
+        **snapshot,
+        "metrics": [
+            metric for metric in snapshot["metrics"] if metric["kind"] != "gauge"
+        ],
+    }
+
+
+def render(snapshot: dict) -> str:
+    """Prometheus text exposition of a registry snapshot."""
+    buckets = snapshot["buckets"]
+    rows = sorted(snapshot["requests"], key=lambda row: row[:3])
+    lines = [
+        f"# HELP {REQUESTS_TOTAL} Requests handled, by method, route template "
+        "and status class.",
+        f"# TYPE {REQUESTS_TOTAL} counter",
+    ]
+    for method, route, status, *series in rows:
+        labels = {"method": method, "route": route, "status": status}
+        count = sum(series[:-1])
+        lines.append(f"{REQUESTS_TOTAL}{_labels(labels)} {_number(count)}")
+
+    lines += [
+        f"# HELP {REQUEST_DURATION} Request latency, by method, route template "
+        "and status class.",
+        f"# TYPE {REQUEST_DURATION} histogram",
+    ]
+    for method, route, status, *series in rows:
+        labels = {"method": method, "route": route, "status": status}
+        cumulative = 0
+        for bound, count in zip([*buckets, "+Inf"], series[:-1]):
+            cumulative += count
+            le = bound if isinstance(bound, str) else _number(bound)
+            lines.append(
+                f"{REQUEST_DURATION}_bucket{_labels({**labels, 'le': le})} "
+                f"{_number(cumulative)}"
+            )
+        lines.append(f"{REQUEST_DURATION}_sum{_labels(labels)} {_number(series[-1])}")
+        lines.append(f"{REQUEST_DURATION}_count{_labels(labels)} {_number(cumulative)}")
+
+    for metric in snapshot["metrics"]:
+        lines.append(f"# HELP {metric['name']} {metric['help']}")
+        lines.append(f"# TYPE {metric['name']} {metric['kind']}")
+        for labels, value in metric["samples"]:
+            lines.append(f"{metric['name']}{_labels(labels)} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def pool_metrics(get_engine: Callable) -> Collector:
+    """Collector for the connection pool of the engine ``get_engine`` returns."""
+
+    def collect() -> list[Metric]:
+        pool = get_engine().pool
+        if not hasattr(pool, "checkedout"):
+            return []
+        return [
+            Metric(
+                "db_pool_size",
+                "gauge",
+                "Connections the pool keeps open.",
+                [({}, pool.size())],
+            ),
+            Metric(
+                "db_pool_checked_out_connections",
+                "gauge",
+                "Connections currently in use.",
+                [({}, pool.checkedout())],
+            ),
+            Metric(
+                "db_pool_checked_in_connections",
+                "gauge",
+                "Idle connections waiting in the pool.",
+                [({}, pool.checkedin())],
+            ),
+            Metric(
+                "db_pool_overflow_connections",
+                "gauge",
+                "Connections open beyond the pool size.",
+                [({}, max(pool.overflow(), 0))],
+            ),
+        ]
+
+    return collect
+
+
+def cache_metrics(caches: Mapping[str, Callable[[], TTLCache]]) -> Collector:
+    """Collector for TTL cache hits and misses, labelled by cache name."""
+
+    def collect() -> list[Metric]:
+        current = {name: get_cache() for name, get_cache in caches.items()}
+        return [
+            Metric(
+                "cache_hits_total",
+                "counter",
+                "Cache lookups served from the cache.",
+                [({"cache": name}, cache.hits) for name, cache in current.items()],
+            ),
+            Metric(
+                "cache_misses_total",
+                "counter",
+                "Cache lookups that fell through to the database.",
+                [({"cache": name}, cache.misses) for name, cache in current.items()],
+            ),
+        ]
+
+    return collect
+
+
+class MetricsSnapshotDirectory:
+    """Shares registry snapshots between workers through a directory.
+
+    Each process writes ``<pid>.json`` every ``flush_seconds`` and when it
+    stops. Files of exited workers are kept, so their counts stay in the
+    totals; clear the directory when the deployment restarts.
+
+    A file not written for ``stale_seconds`` (three flushes by default) is
+    taken to belong to a worker that has exited, and its gauges are left
+    out of the merge: a dead worker holds no pool connections. Staleness is
+    judged by modification time rather than by pid, because workers sharing
+    the directory may run in different containers and pids get reused.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        registry: MetricsRegistry,
+        *,
+        flush_seconds: float = 5,
+        stale_seconds: float | None = None,
+    ):
+        self.directory = Path(directory)
+        self.registry = registry
+        self.flush_seconds = flush_seconds
+        self.stale_seconds = (
+            stale_seconds if stale_seconds is not None else 3 * flush_seconds
+        )
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def flush(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{os.getpid()}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.registry.snapshot()))
+        os.replace(tmp, path)
+
+    def collect(self) -> dict:
+        """This worker's fresh snapshot merged with every other worker's."""
+        self.flush()
+        stale_before = time.time() - self.stale_seconds
+        snapshots = []
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                snapshot = json.loads(path.read_text())
+                stale = path.stat().st_mtime < stale_before
+            except (OSError, ValueError):
+                logger.warning("skipping unreadable metrics snapshot %s", path)
+                continue
+            snapshots.append(without_gauges(snapshot) if stale else snapshot)
+        return merge_snapshots(snapshots)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-flush", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.flush_seconds):
+            try:
+                self.flush()
+            except OSError:
+                logger.exception("failed to write metrics snapshot")
+
+
+def _labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in labels.items()
+    )
+    return f"{{{pairs}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
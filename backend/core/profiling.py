@@ -0,0 +1,194 @@
+"""Sampling profiles of single requests, written as collapsed stacks.
+
+A profiled request gets a sampler thread of its own that reads every
+thread's stack once per interval. A sample counts towards the request when
+its stack passes through one of the request's anchor frames: the profiling
+middleware's, seen on the event loop while the request's coroutines run,
+and the callers of use case methods, seen on the threadpool threads sync
+endpoints run on. Other requests served meanwhile are left out.
+
+Stacks are kept from the outermost anchor down, root first, one line per
+distinct stack followed by its sample count: the format flamegraph.pl,
+inferno and speedscope read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from time import perf_counter
+from types import CodeType, FrameType
+
+from backend.core.request_context import RequestContext
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RequestProfile:
+    request_id: str
+    method: str
+    path: str
+    interval_ms: float
+    recorded_at: datetime
+    route: str | None = None
+    status_code: int | None = None
+    duration_ms: float = 0.0
+    stacks: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def collapsed(self) -> str:
+        return "".join(
+            f"{stack} {count}\n" for stack, count in sorted(self.stacks.items())
+        )
+
+
+class RequestProfiler:
+    """Starts request samplers and keeps the most recent profiles."""
+
+    def __init__(self, *, interval_ms: float = 1.0, max_entries: int = 20):
+        self.interval_ms = interval_ms
+        self._entries: deque[RequestProfile] = deque(maxlen=max_entries)
+
+    def start(
+        self,
+        request: RequestContext,
+        *,
+        anchor: FrameType,
+        method: str,
+        path: str,
+    ) -> ProfileSampler:
+        sampler = ProfileSampler(
+            self,
+            request,
+            RequestProfile(
+                request_id=request.request_id,
+                method=method,
+                path=path,
+                interval_ms=self.interval_ms,
+                recorded_at=datetime.now(timezone.utc),
+            ),
+            anchor=anchor,
+        )
+        sampler.start()
+        return sampler
+
+    def entries(self) -> list[RequestProfile]:
+        """Recorded profiles, newest first."""
+        return list(reversed(self._entries))
+
+    def get(self, request_id: str) -> RequestProfile | None:
+        return next(
+            (entry for entry in self.entries() if entry.request_id == request_id),
+            None,
+        )
+
+    def _record(self, profile: RequestProfile) -> None:
+        self._entries.append(profile)
+        logger.info(
+            "request profiled request_id=%s route=%s samples=%s duration_ms=%.2f",
+            profile.request_id,
+            profile.route or "-",
+            profile.samples,
+            profile.duration_ms,
+        )
+
+
+class ProfileSampler:
+    def __init__(
+        self,
+        profiler: RequestProfiler,
+        request: RequestContext,
+        profile: RequestProfile,
+        *,
+        anchor: FrameType,
+    ):
+        self.profile = profile
+        self._profiler = profiler
+        self._request = request
+        self._anchors = {anchor}
+        self._stopped = threading.Event()
+        self._stop_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"request-profiler-{request.request_id}",
+            daemon=True,
+        )
+        self._started_at = 0.0
+
+    def start(self) -> None:
+        self._request.profile_frames = self._anchors
+        self._started_at = perf_counter()
+        self._thread.start()
+
+    def stop(self, status_code: int | None = None) -> RequestProfile:
+        """Stop sampling and record the profile; later calls do nothing.
+
+        Waits for the sampler thread to finish its current sample, so call
+        ``stop_async`` from the event loop instead.
+        """
+        with self._stop_lock:
+            if self._stopped.is_set():
+                return self.profile
+            self._stopped.set()
+            self._thread.join()
+            self._request.profile_frames = None
+            self.profile.duration_ms = (perf_counter() - self._started_at) * 1000
+            self.profile.route = self._request.route
+            self.profile.status_code = status_code
+            self._profiler._record(self.profile)
+            return self.profile
+
+    async def stop_async(self, status_code: int | None = None) -> RequestProfile:
+        """``stop`` without blocking the event loop on the sampler thread."""
+        return await asyncio.to_thread(self.stop, status_code)
+
+    def _run(self) -> None:
+        interval = self.profile.interval_ms / 1000
+        own_thread = threading.get_ident()
+        while not self._stopped.wait(interval):
+            # Use case calls on other threads add anchors while we sample.
+            anchors = set(self._anchors)
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                stack = collapsed_stack(frame, anchors)
+                if stack:
+                    self.profile.stacks[stack] += 1
+
+
+def collapsed_stack(frame: FrameType | None, anchors: set[FrameType]) -> str | None:
+    """``frame``'s stack from the outermost of ``anchors`` down, root first."""
+    names: list[str] = []
+    outermost = 0
+    while frame is not None:
+        names.append(_frame_name(frame.f_code))
+        if frame in anchors:
+            outermost = len(names)
+        frame = frame.f_back
+    if not outermost:
+        return None
+    return ";".join(reversed(names[:outermost]))
+
+
+@lru_cache(maxsize=4096)
+def _frame_name(code: CodeType) -> str:
+    return f"{code.co_qualname} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _short_path(filename: str) -> str:
+    # Relative to the sys.path entry it was imported from, like a module path.
+    roots = [root for root in sys.path if root and filename.startswith(root + os.sep)]
+    if not roots:
+        return filename
+    return os.path.relpath(filename, max(roots, key=len))
@@ -0,0 +1,92 @@
+"""What the current request is doing, for code far from the ASGI scope.
+
+``RequestIDMiddleware`` binds a ``RequestContext``; the route is filled in
+once the router has matched and the use case while one of its methods runs.
+While the request is profiled, the frames that call use case methods are
+collected too, so threadpool work can be told apart from other requests'.
+The object itself is shared, so work the request hands to the threadpool
+(which copies the context) reads and updates the same one.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import FrameType
+from typing import Any, TypeVar
+
+from starlette.types import Scope
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class RequestContext:
+    request_id: str
+    route: str | None = None
+    controller: str | None = None
+    action: str | None = None
+    # Set by the profiler for the requests it samples; see core/profiling.
+    profile_frames: set[FrameType] | None = None
+
+
+_current: ContextVar[RequestContext | None] = ContextVar(
+    "request_context", default=None
+)
+
+
+@contextmanager
+def bind_request(request_id: str) -> Iterator[RequestContext]:
+    request = RequestContext(request_id=request_id)
+    token = _current.set(request)
+    try:
+        yield request
+    finally:
+        _current.reset(token)
+
+
+def current_request() -> RequestContext | None:
+    return _current.get()
+
+
+def route_template(scope: Scope) -> str | None:
+    """Template of the route matched for ``scope``, e.g. ``/incidents/{id}``."""
+    # Recent FastAPI versions keep routes of included routers unprefixed and
+    # record the full template in their own scope entry; older ones copy each
+    # route with the prefix applied.
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    template = getattr(context, "path_format", None)
+    if template:
+        return template
+    return getattr(scope.get("route"), "path", None)
+
+
+def records_use_cases(cls: type[T]) -> type[T]:
+    """Record each public method of ``cls`` as the request's action while it runs."""
+    for name, method in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.isfunction(method):
+            setattr(cls, name, _recording(cls.__name__, method))
+    return cls
+
+
+def _recording(controller: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        request = _current.get()
+        if request is None:
+            return method(*args, **kwargs)
+        if request.profile_frames is not None:
+            request.profile_frames.add(sys._getframe(1))
+        previous = (request.controller, request.action)
+        request.controller, request.action = controller, method.__name__
+        try:
+            return method(*args, **kwargs)
+        finally:
+            request.controller, request.action = previous
+
+    return wrapper
@@ -15,7 +15,10 @@ sys.path.insert(0, project_root)
 
 from backend.core.config import get_settings
 from backend.db.base import Base
+from backend.db.models.change_log import ChangeLogEntry
 from backend.db.models.incident import Incident
+from backend.db.models.incident_status_change import IncidentStatusChange
+from backend.db.models.rollup import IncidentHourlyRollup, TimelineEventHourlyRollup
 from backend.db.models.timeline_event import TimelineEvent
 
 from logging.config import fileConfig
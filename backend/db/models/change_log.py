@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, TIMESTAMP, func, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.db.base import Base
+from backend.domain.incidents.enums import ChangeAction, ChangeEntity
+
+
+class ChangeLogEntry(Base):
+    """Append-only log of committed incident and timeline event writes.
+
+    ``seq`` is the sync token: entries become visible in ``seq`` order, so a
+    client that has read up to some ``seq`` never misses an earlier one.
+    Deletes stay in the log as tombstones. Rows are not tied to the incident
+    by a foreign key so they outlive it.
+    """
+
+    __tablename__ = "change_log"
+
+    seq: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    entity: Mapped[ChangeEntity] = mapped_column(SQLEnum(ChangeEntity), nullable=False)
+    action: Mapped[ChangeAction] = mapped_column(SQLEnum(ChangeAction), nullable=False)
+    incident_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    entity_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
+    )
@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING, List
-from sqlalchemy import BigInteger, CheckConstraint, Index, String, TIMESTAMP, func, Enum as SQLEnum
+from sqlalchemy import BigInteger, CheckConstraint, Index, String, TIMESTAMP, func, text, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 
@@ -33,6 +33,13 @@ class Incident(Base):
         server_default=func.now(), 
         onupdate=func.now()
     )
+    # Maintained by the timeline event repository alongside event writes.
+    event_count: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
+    last_event_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True
+    )
 
     events: Mapped[List["TimelineEvent"]] = relationship(
         back_populates="incident",
@@ -42,6 +49,27 @@ class Incident(Base):
 
     __table_args__ = (
         CheckConstraint("length(trim(title)) > 0", name="title_not_empty"),
-        Index("ix_incidents_created_at", created_at.desc()),
-        Index("ix_incidents_status_created_at", status, created_at),
+        Index("ix_incidents_created_at", created_at.desc(), id.desc()),
+        Index("ix_incidents_updated_at", updated_at.desc(), id.desc()),
+        Index("ix_incidents_status_created_at", status, created_at, id),
+        Index("ix_incidents_severity_created_at", severity, created_at, id),
+        Index(
+            "ix_incidents_status_severity_created_at",
+            status,
+            severity,
+            created_at,
+            id,
+        ),
+        # Resolved incidents dominate the table; the active board only needs the rest.
+        Index(
+            "ix_incidents_active_created_at",
+            created_at.desc(),
+            id.desc(),
+            postgresql_where=text("status <> 'RESOLVED'"),
+        ),
+        Index(
+            "ix_incidents_last_activity",
+            func.coalesce(last_event_at, created_at).desc(),
+            id.desc(),
+        ),
     )
@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, ForeignKey, Index, TIMESTAMP, func, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.db.base import Base
+from backend.domain.incidents.enums import Status
+
+
+class IncidentStatusChange(Base):
+    """Append-only history of incident status transitions.
+
+    The row written when an incident is created has no ``from_status``.
+    """
+
+    __tablename__ = "incident_status_changes"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    incident_id: Mapped[int] = mapped_column(
+        ForeignKey("incidents.id", ondelete="CASCADE"), nullable=False
+    )
+    from_status: Mapped[Status | None] = mapped_column(SQLEnum(Status), nullable=True)
+    to_status: Mapped[Status] = mapped_column(SQLEnum(Status), nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("ix_incident_status_changes_incident_changed", incident_id, changed_at),
+    )
@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, String, TIMESTAMP, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.db.base import Base
+from backend.domain.incidents.enums import Severity, Status
+
+
+class IncidentHourlyRollup(Base):
+    """Incidents created per UTC hour, by current severity and status."""
+
+    __tablename__ = "incident_hourly_rollups"
+
+    bucket_hour: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), primary_key=True
+    )
+    severity: Mapped[Severity] = mapped_column(SQLEnum(Severity), primary_key=True)
+    status: Mapped[Status] = mapped_column(SQLEnum(Status), primary_key=True)
+    incident_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class TimelineEventHourlyRollup(Base):
+    """Timeline events created per UTC hour, by event type."""
+
+    __tablename__ = "timeline_event_hourly_rollups"
+
+    bucket_hour: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), primary_key=True
+    )
+    event_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    event_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -32,5 +32,20 @@ class TimelineEvent(Base):
     __table_args__ = (
         CheckConstraint("length(trim(event_type)) > 0", name="event_type_not_empty"),
         CheckConstraint("length(trim(message)) > 0", name="message_not_empty"),
-        Index("ix_timeline_incident_occurred", incident_id, occurred_at),
+        Index("ix_timeline_incident_occurred", incident_id, occurred_at, id),
+        Index("ix_timeline_incident_created", incident_id, created_at, id),
+        Index("ix_timeline_events_created_at", created_at.desc(), id.desc()),
+        Index(
+            "ix_timeline_events_type_created_at",
+            event_type,
+            created_at.desc(),
+            id.desc(),
+        ),
+        Index(
+            "ix_timeline_incident_type_occurred",
+            incident_id,
+            event_type,
+            occurred_at,
+            id,
+        ),
     )
\ No newline at end of file
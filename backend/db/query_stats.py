@@ -0,0 +1,84 @@
+"""Per-request SQL statement counts and database time.
+
+``track_queries`` binds a ``QueryStats`` to the current context; engine
+events registered by ``instrument_engine`` add every statement executed
+while it is bound. The stats object itself is shared, so statements run by
+sync endpoints in the threadpool (which copies the context) still count.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy import Engine, event
+
+_QUERY_START_KEY = "query_stats_start"
+
+
+@dataclass(slots=True)
+class QueryStats:
+    request_id: str
+    count: int = 0
+    duration: float = 0.0
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(request_id: str) -> Iterator[QueryStats]:
+    stats = QueryStats(request_id=request_id)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current.get()
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """Count statements run through ``engine`` against the current request."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+    return engine
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault(_QUERY_START_KEY, []).append(perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _finish(conn)
+
+
+def _handle_error(exception_context):
+    # Failed statements skip after_cursor_execute; still count their time.
+    if exception_context.connection is not None:
+        _finish(exception_context.connection)
+
+
+def _finish(conn) -> None:
+    starts = conn.info.get(_QUERY_START_KEY)
+    if not starts:
+        return
+    # Popped even if the request's stats were unbound meanwhile, so no start
+    # time is left behind on the pooled connection.
+    started = starts.pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += perf_counter() - started
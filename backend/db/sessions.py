@@ -5,14 +5,38 @@ from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from backend.core.config import get_settings
+from backend.db import query_stats, sql_comments
+from backend.db.slow_queries import SlowQueryMonitor
 
 @lru_cache(maxsize=1)
 def get_engine() -> Engine:
     settings = get_settings()
-    return create_engine(
-        settings.DATABASE_URL,
-        echo=settings.DEBUG,
-        pool_pre_ping=True,
+    engine = query_stats.instrument_engine(
+        create_engine(
+            settings.DATABASE_URL,
+            echo=settings.DEBUG,
+            pool_pre_ping=True,
+        )
+    )
+    if settings.SQL_COMMENTS_ENABLED:
+        sql_comments.instrument_engine(
+            engine, include_request_id=not settings.SQL_COMMENTS_STABLE
+        )
+    monitor = get_slow_query_monitor()
+    if monitor is not None:
+        monitor.instrument(engine)
+    return engine
+
+@lru_cache(maxsize=1)
+def get_slow_query_monitor() -> SlowQueryMonitor | None:
+    """The slow query monitor, or ``None`` while no threshold is set."""
+    settings = get_settings()
+    if settings.SLOW_QUERY_THRESHOLD_MS <= 0:
+        return None
+    return SlowQueryMonitor(
+        threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+        explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+        max_entries=settings.SLOW_QUERY_BUFFER_SIZE,
     )
 
 def get_session_factory() -> sessionmaker[Session]:
@@ -0,0 +1,181 @@
+"""Opt-in log of slow SQL statements with sampled query plans.
+
+Statements slower than the threshold are logged with the shapes of their
+bound parameters (types and sizes, never values) and kept in a bounded ring
+buffer. A sample of them is explained with ``EXPLAIN (ANALYZE off, FORMAT
+JSON)`` on a background thread and a connection of its own, so capturing a
+plan never extends the request that ran the statement.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from backend.core.request_context import current_request
+
+logger = logging.getLogger(__name__)
+
+EXPLAIN_PREFIX = "EXPLAIN (ANALYZE off, FORMAT JSON) "
+_EXPLAINABLE = ("SELECT", "WITH")
+_QUERY_START_KEY = "slow_query_start"
+_SKIP_OPTION = "skip_slow_query_log"
+
+
+@dataclass(slots=True)
+class SlowQuery:
+    statement: str
+    parameters: dict[str, str]
+    duration_ms: float
+    recorded_at: datetime
+    request_id: str | None = None
+    route: str | None = None
+    plan: Any | None = None
+    explain_error: str | None = None
+
+
+class SlowQueryMonitor:
+    def __init__(
+        self,
+        *,
+        threshold_ms: float,
+        explain_sample_rate: float = 0.1,
+        max_entries: int = 100,
+        max_pending_explains: int = 10,
+        sample: Callable[[], float] = random.random,
+    ):
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.max_pending_explains = max_pending_explains
+        self._sample = sample
+        self._entries: deque[SlowQuery] = deque(maxlen=max_entries)
+        self._pending = threading.BoundedSemaphore(max_pending_explains)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="slow-query-explain"
+        )
+
+    def instrument(self, engine: Engine) -> Engine:
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+        return engine
+
+    def uninstrument(self, engine: Engine) -> None:
+        event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.remove(engine, "handle_error", self._handle_error)
+
+    def entries(self) -> list[SlowQuery]:
+        """Recorded slow statements, newest first."""
+        return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def wait_for_explains(self) -> None:
+        """Block until every plan submitted so far has been captured."""
+        self._executor.submit(lambda: None).result()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        if not conn.get_execution_options().get(_SKIP_OPTION):
+            conn.info.setdefault(_QUERY_START_KEY, []).append(perf_counter())
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        starts = conn.info.get(_QUERY_START_KEY)
+        if conn.get_execution_options().get(_SKIP_OPTION) or not starts:
+            return
+        duration_ms = (perf_counter() - starts.pop()) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        request = current_request()
+        entry = SlowQuery(
+            statement=statement,
+            parameters=parameter_shapes(parameters, executemany=executemany),
+            duration_ms=duration_ms,
+            recorded_at=datetime.now(timezone.utc),
+            request_id=request.request_id if request else None,
+            route=request.route if request else None,
+        )
+        self._entries.append(entry)
+        logger.warning(
+            "slow query duration_ms=%.2f request_id=%s route=%s params=%s "
+            "statement=%s",
+            duration_ms,
+            entry.request_id or "-",
+            entry.route or "-",
+            entry.parameters,
+            " ".join(statement.split()),
+        )
+
+        if (
+            not executemany
+            and statement.lstrip().upper().startswith(_EXPLAINABLE)
+            and self._sample() < self.explain_sample_rate
+            and self._pending.acquire(blocking=False)
+        ):
+            self._executor.submit(self._explain, conn.engine, entry, parameters)
+
+    def _handle_error(self, exception_context):
+        # Failed statements skip after_cursor_execute; drop their start time
+        # so the next statement on the connection is not timed from it.
+        conn = exception_context.connection
+        if conn is None or conn.get_execution_options().get(_SKIP_OPTION):
+            return
+        starts = conn.info.get(_QUERY_START_KEY)
+        if starts:
+            starts.pop()
+
+    def _explain(self, engine: Engine, entry: SlowQuery, parameters) -> None:
+        try:
+            with engine.connect() as conn:
+                conn = conn.execution_options(**{_SKIP_OPTION: True})
+                [plan] = conn.exec_driver_sql(
+                    EXPLAIN_PREFIX + entry.statement, parameters
+                ).scalar_one()
+            entry.plan = plan
+        except Exception as exc:
+            entry.explain_error = f"{type(exc).__name__}: {exc}".splitlines()[0]
+            logger.warning("could not explain slow query: %s", entry.explain_error)
+        finally:
+            self._pending.release()
+
+
+def parameter_shapes(parameters, *, executemany: bool = False) -> dict[str, str]:
+    """Types and sizes of bound parameters, leaving their values out of logs."""
+    if executemany and isinstance(parameters, Sequence) and parameters:
+        shapes = parameter_shapes(parameters[0])
+        return {**shapes, "rows": str(len(parameters))}
+    if isinstance(parameters, Mapping):
+        return {str(name): _shape(value) for name, value in parameters.items()}
+    if isinstance(parameters, Sequence) and not isinstance(parameters, (str, bytes)):
+        return {str(i): _shape(value) for i, value in enumerate(parameters)}
+    return {}
+
+
+def _shape(value) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, (str, bytes)):
+        return f"{type(value).__name__}[{len(value)}]"
+    if isinstance(value, (list, tuple, set, frozenset)):
+        inner = sorted({type(item).__name__ for item in value})
+        return f"{type(value).__name__}[{len(value)}]<{'|'.join(inner)}>"
+    return type(value).__name__
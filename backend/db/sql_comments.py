@@ -0,0 +1,57 @@
+"""Tag SQL statements with the request that issued them (sqlcommenter).
+
+Each statement run while a request is bound gets a trailing comment such as
+
+    /*action='list_incidents',controller='IncidentUseCases',
+      request_id='3f2c...',route='/api/v1/incidents'*/
+
+so ``pg_stat_statements``, ``auto_explain`` and the slow query log can be
+traced back to an API route. The comment is appended to the compiled string
+at cursor execution, which leaves SQLAlchemy's compiled statement cache
+untouched; Postgres ignores comments when fingerprinting queries.
+
+Values are restricted to URL-safe characters instead of being
+percent-encoded, because a ``%`` would be read as a parameter placeholder by
+the driver.
+"""
+
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import Engine, event
+
+from backend.core.request_context import RequestContext, current_request
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._~/{}:-]")
+
+
+def instrument_engine(engine: Engine, *, include_request_id: bool = True) -> Engine:
+    """Append a sqlcommenter comment to statements ``engine`` runs in a request.
+
+    Without the request id, a route and use case always produce the same
+    statement text, so the statements group together in database-side logs.
+    """
+
+    def _add_comment(conn, cursor, statement, parameters, context, executemany):
+        request = current_request()
+        if request is None:
+            return statement, parameters
+        comment = sql_comment(request, include_request_id=include_request_id)
+        return f"{statement} {comment}" if comment else statement, parameters
+
+    event.listen(engine, "before_cursor_execute", _add_comment, retval=True)
+    return engine
+
+
+def sql_comment(request: RequestContext, *, include_request_id: bool = True) -> str:
+    tags = {
+        "action": request.action,
+        "controller": request.controller,
+        "request_id": request.request_id if include_request_id else None,
+        "route": request.route,
+    }
+    pairs = [
+        f"{key}='{_UNSAFE.sub('_', value)}'" for key, value in tags.items() if value
+    ]
+    return f"/*{','.join(pairs)}*/" if pairs else ""
@@ -27,3 +27,5 @@ class Incident:
     created_at: datetime
     updated_at: datetime
     events: list[TimelineEvent] = field(default_factory=list)
+    event_count: int = 0
+    last_event_at: datetime | None = None
@@ -10,4 +10,35 @@ class Status(str, Enum):
     OPEN = "open"
     INVESTIGATING = "investigating"
     MITIGATED = "mitigated"
-    RESOLVED = "resolved"
\ No newline at end of file
+    RESOLVED = "resolved"
+
+class TimelineOrder(str, Enum):
+    CREATED_AT = "created_at"
+    OCCURRED_AT = "occurred_at"
+
+class StatsBucket(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+
+class StatsSource(str, Enum):
+    RAW = "raw"
+    ROLLUP = "rollup"
+
+class IncidentSort(str, Enum):
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    SEVERITY = "severity"
+    LAST_ACTIVITY = "last_activity"
+
+class SortDirection(str, Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+class ChangeEntity(str, Enum):
+    INCIDENT = "incident"
+    EVENT = "event"
+
+class ChangeAction(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
@@ -1,22 +1,82 @@
 from __future__ import annotations
+from collections.abc import Collection
+from datetime import datetime
 from typing import Protocol, Self
 
 from backend.domain.incidents.entities import Incident, TimelineEvent
-from backend.domain.incidents.enums import Severity, Status
+from backend.domain.incidents.enums import (
+    IncidentSort,
+    Severity,
+    SortDirection,
+    StatsBucket,
+    StatsSource,
+    Status,
+    TimelineOrder,
+)
+from backend.domain.incidents.read_models import (
+    DashboardSnapshot,
+    IncidentChange,
+    IncidentStats,
+    SeverityResponseTimes,
+)
 
 
 class IncidentRepository(Protocol):
     def list(
         self,
         *,
-        status: Status | None = None,
-        severity: Severity | None = None,
+        status: Status | Collection[Status] | None = None,
+        severity: Severity | Collection[Severity] | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        active_only: bool = False,
+        sort: IncidentSort = IncidentSort.CREATED_AT,
+        direction: SortDirection = SortDirection.DESC,
+        after: tuple | None = None,
+        include_latest_events: int = 0,
+        fields: Collection[str] | None = None,
         limit: int = 50,
         offset: int = 0,
     ) -> list[Incident]: ...
-    def count(self, *, status: Status | None = None, severity: Severity | None = None) -> int: ...
-    def get(self, incident_id: int) -> Incident | None: ...
-    def get_with_events(self, incident_id: int) -> Incident | None: ...
+    def count(
+        self,
+        *,
+        status: Status | Collection[Status] | None = None,
+        severity: Severity | Collection[Severity] | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        active_only: bool = False,
+    ) -> int: ...
+    def dashboard(
+        self, *, active_limit: int = 50, recent_events: int = 20
+    ) -> DashboardSnapshot: ...
+    def stats(
+        self,
+        *,
+        bucket: StatsBucket = StatsBucket.DAY,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        source: StatsSource = StatsSource.RAW,
+    ) -> IncidentStats: ...
+    def response_times(
+        self,
+        *,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> list[SeverityResponseTimes]: ...
+    def get(
+        self, incident_id: int, *, fields: Collection[str] | None = None
+    ) -> Incident | None: ...
+    def get_many(
+        self, incident_ids: Collection[int], *, with_events: bool = False
+    ) -> list[Incident]: ...
+    def get_with_events(
+        self,
+        incident_id: int,
+        *,
+        events_order_by: TimelineOrder = TimelineOrder.CREATED_AT,
+        fields: Collection[str] | None = None,
+    ) -> Incident | None: ...
     def create(self, incident_data: dict) -> Incident: ...
     def update(self, incident_id: int, changes: dict) -> Incident | None: ...
     def delete(self, incident_id: int) -> bool: ...
@@ -25,18 +85,55 @@ class IncidentRepository(Protocol):
 
 class TimelineEventRepository(Protocol):
     def list_incident_events(
-        self, incident_id: int, *, limit: int = 50, offset: int = 0
+        self,
+        incident_id: int,
+        *,
+        event_type: str | None = None,
+        occurred_after: datetime | None = None,
+        occurred_before: datetime | None = None,
+        order_by: TimelineOrder = TimelineOrder.CREATED_AT,
+        fields: Collection[str] | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[TimelineEvent]: ...
+    def list_recent(
+        self,
+        *,
+        event_type: str | None = None,
+        severity: Severity | Collection[Severity] | None = None,
+        after: tuple[datetime, int] | None = None,
+        limit: int = 50,
     ) -> list[TimelineEvent]: ...
-    def count_incident_events(self, incident_id: int) -> int: ...
-    def get(self, incident_id: int, event_id: int) -> TimelineEvent | None: ...
+    def count_incident_events(
+        self,
+        incident_id: int,
+        *,
+        event_type: str | None = None,
+        occurred_after: datetime | None = None,
+        occurred_before: datetime | None = None,
+    ) -> int: ...
+    def get(
+        self,
+        incident_id: int,
+        event_id: int,
+        *,
+        fields: Collection[str] | None = None,
+    ) -> TimelineEvent | None: ...
+    def get_many(self, event_ids: Collection[int]) -> list[TimelineEvent]: ...
     def create(self, incident_id: int, event_data: dict) -> TimelineEvent: ...
     def update(self, incident_id: int, event_id: int, changes: dict) -> TimelineEvent | None: ...
     def delete(self, incident_id: int, event_id: int) -> bool: ...
 
 
+class ChangeLogRepository(Protocol):
+    def list_since(self, since: int, *, limit: int) -> list[IncidentChange]: ...
+    def latest_seq(self) -> int: ...
+
+
 class UnitOfWork(Protocol):
     incidents: IncidentRepository
     events: TimelineEventRepository
+    changes: ChangeLogRepository
 
     def commit(self) -> None: ...
     def rollback(self) -> None: ...
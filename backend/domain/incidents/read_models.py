@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from backend.domain.incidents.entities import Incident, TimelineEvent
+from backend.domain.incidents.enums import (
+    ChangeAction,
+    ChangeEntity,
+    Severity,
+    StatsBucket,
+    StatsSource,
+    Status,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class StatusSeverityCount:
+    status: Status
+    severity: Severity
+    count: int
+
+
+@dataclass(slots=True, frozen=True)
+class CreatedBucketCount:
+    bucket_start: datetime
+    count: int
+
+
+@dataclass(slots=True, frozen=True)
+class EventTypeCount:
+    event_type: str
+    count: int
+
+
+@dataclass(slots=True)
+class IncidentStats:
+    bucket: StatsBucket
+    total: int
+    source: StatsSource = StatsSource.RAW
+    by_status_severity: list[StatusSeverityCount] = field(default_factory=list)
+    created: list[CreatedBucketCount] = field(default_factory=list)
+    events_by_type: list[EventTypeCount] = field(default_factory=list)
+
+
+@dataclass(slots=True, frozen=True)
+class DurationPercentiles:
+    """Distribution of a duration in seconds; percentiles are ``None`` when empty."""
+
+    count: int
+    p50: float | None = None
+    p90: float | None = None
+    p95: float | None = None
+    p99: float | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class SeverityResponseTimes:
+    severity: Severity
+    time_to_acknowledge: DurationPercentiles
+    time_to_resolve: DurationPercentiles
+
+
+@dataclass(slots=True)
+class DashboardSnapshot:
+    """Everything the incident dashboard shows, read in one round trip."""
+
+    active_incidents: list[Incident] = field(default_factory=list)
+    by_status_severity: list[StatusSeverityCount] = field(default_factory=list)
+    recent_events: list[TimelineEvent] = field(default_factory=list)
+
+
+@dataclass(slots=True, frozen=True)
+class IncidentChange:
+    """A committed write to an incident or to one of its timeline events.
+
+    ``id`` is the id of the changed row; for incident changes it equals
+    ``incident_id``. ``seq`` is the change log position, assigned when the
+    writing transaction commits.
+    """
+
+    entity: ChangeEntity
+    action: ChangeAction
+    incident_id: int
+    id: int
+    seq: int | None = None
+
+
+@dataclass(slots=True)
+class ChangeSet:
+    """Everything that changed after a sync token, up to ``next_token``.
+
+    Created and updated rows are returned in their current state; deletes
+    only by id. Deleting an incident also deletes its events, which are not
+    listed separately.
+    """
+
+    next_token: int
+    has_more: bool = False
+    incidents: list[Incident] = field(default_factory=list)
+    events: list[TimelineEvent] = field(default_factory=list)
+    deleted_incident_ids: list[int] = field(default_factory=list)
+    deleted_event_ids: list[int] = field(default_factory=list)
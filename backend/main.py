@@ -1,20 +1,104 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from backend.api.dependencies import (
+    get_dashboard_cache,
+    get_incident_stats_cache,
+    record_route,
+)
+from backend.adapters.notifications.postgres_listener import (
+    PostgresChangeListener,
+    libpq_dsn,
+)
 from backend.api.exception_handlers import register_exception_handlers
-from backend.api.middleware import RequestIDMiddleware, RequestLoggingMiddleware
+from backend.api.middleware import (
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    RequestIDMiddleware,
+    RequestLoggingMiddleware,
+)
 from backend.core.config import get_settings, Settings
 from backend.core.logging import configure_logging
-from backend.api.routes import auth, health, incidents
+from backend.core.metrics import (
+    MetricsRegistry,
+    MetricsSnapshotDirectory,
+    cache_metrics,
+    pool_metrics,
+)
+from backend.core.profiling import RequestProfiler
+from backend.db.sessions import get_engine
+from backend.api.routes import (
+    admin,
+    auth,
+    changes,
+    dashboard,
+    events,
+    health,
+    incidents,
+    metrics,
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    snapshots = app.state.metrics_snapshots
+    if snapshots is not None:
+        snapshots.start()
+    await app.state.change_listener.start()
+    try:
+        yield
+    finally:
+        await app.state.change_listener.stop()
+        if snapshots is not None:
+            snapshots.stop()
 
 def create_app(settings: Settings | None = None) -> FastAPI:
     settings = settings or get_settings()
-    configure_logging(settings.LOG_LEVEL)
+    configure_logging(
+        settings.LOG_LEVEL,
+        json_format=settings.LOG_JSON,
+        queue_size=settings.LOG_QUEUE_SIZE,
+    )
 
     app = FastAPI(
         title=settings.API_TITLE,
         description=settings.API_DESCRIPTION,
         version=settings.API_VERSION,
+        lifespan=lifespan,
+        dependencies=[Depends(record_route)],
+    )
+
+    app.state.metrics = MetricsRegistry()
+    app.state.metrics.add_collector(pool_metrics(get_engine))
+    app.state.metrics.add_collector(
+        cache_metrics(
+            {
+                "incident_stats": get_incident_stats_cache,
+                "dashboard": get_dashboard_cache,
+            }
+        )
+    )
+    app.state.metrics_snapshots = (
+        MetricsSnapshotDirectory(
+            settings.METRICS_DIR,
+            app.state.metrics,
+            flush_seconds=settings.METRICS_FLUSH_SECONDS,
+        )
+        if settings.METRICS_DIR
+        else None
+    )
+    app.state.change_listener = PostgresChangeListener(
+        libpq_dsn(settings.DATABASE_URL),
+        max_pending=settings.CHANGE_STREAM_MAX_PENDING,
+    )
+    app.state.profiler = (
+        RequestProfiler(
+            interval_ms=settings.PROFILING_INTERVAL_MS,
+            max_entries=settings.PROFILING_BUFFER_SIZE,
+        )
+        if settings.PROFILING_ENABLED
+        else None
     )
 
     register_exception_handlers(app)
@@ -27,12 +111,25 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         allow_headers=["*"],
     )
 
-    app.add_middleware(RequestLoggingMiddleware)
+    if app.state.profiler is not None:
+        app.add_middleware(
+            ProfilingMiddleware, profiler=app.state.profiler, settings=settings
+        )
+    app.add_middleware(
+        RequestLoggingMiddleware,
+        success_sample_rate=settings.REQUEST_LOG_SAMPLE_RATE,
+    )
+    app.add_middleware(MetricsMiddleware, registry=app.state.metrics)
     app.add_middleware(RequestIDMiddleware)
 
     app.include_router(auth.router)
     app.include_router(health.router)
+    app.include_router(metrics.router)
     app.include_router(incidents.router, prefix=settings.API_PREFIX)
+    app.include_router(events.router, prefix=settings.API_PREFIX)
+    app.include_router(dashboard.router, prefix=settings.API_PREFIX)
+    app.include_router(changes.router, prefix=settings.API_PREFIX)
+    app.include_router(admin.router, prefix=settings.API_PREFIX)
     
     return app
 
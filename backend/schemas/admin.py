@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SlowQueryRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    statement: str = Field(..., description="SQL as sent to the database.")
+    parameters: dict[str, str] = Field(
+        ...,
+        description="Type and size of each bound parameter; values are not kept.",
+        examples=[{"title_1": "str[14]", "param_1": "int"}],
+    )
+    duration_ms: float = Field(..., examples=[412.7])
+    recorded_at: datetime
+    request_id: str | None = Field(None, description="Request that ran the statement.")
+    route: str | None = Field(None, examples=["/api/v1/incidents"])
+    plan: Any | None = Field(
+        None,
+        description=(
+            "EXPLAIN (ANALYZE off, FORMAT JSON) output, when the statement was "
+            "sampled and its plan has been captured."
+        ),
+    )
+    explain_error: str | None = Field(
+        None, description="Why the sampled plan could not be captured."
+    )
+
+
+class SlowQueriesResponse(BaseModel):
+    enabled: bool = Field(
+        ..., description="Whether SLOW_QUERY_THRESHOLD_MS turns the monitor on."
+    )
+    threshold_ms: float = Field(..., examples=[250])
+    items: list[SlowQueryRead] = Field(
+        ..., description="Most recent slow statements, newest first."
+    )
+
+
+class RequestProfileRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    request_id: str = Field(..., examples=["3f2c0d9b6a2e4c1f8e7d5b4a3c2b1a09"])
+    method: str = Field(..., examples=["GET"])
+    path: str = Field(..., examples=["/api/v1/incidents/42/report/markdown"])
+    route: str | None = Field(
+        None, examples=["/api/v1/incidents/{incident_id}/report/markdown"]
+    )
+    status_code: int | None = Field(None, examples=[200])
+    duration_ms: float = Field(..., examples=[184.2])
+    interval_ms: float = Field(..., description="Time between samples.")
+    samples: int = Field(..., description="Samples taken inside the request.")
+    recorded_at: datetime
+
+
+class RequestProfilesResponse(BaseModel):
+    enabled: bool = Field(
+        ..., description="Whether PROFILING_ENABLED turns request profiling on."
+    )
+    items: list[RequestProfileRead] = Field(
+        ..., description="Most recent request profiles, newest first."
+    )
@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.domain.incidents.enums import Severity
+
+
+class DurationPercentilesRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    count: int = Field(..., description="Number of incidents with a measured duration.")
+    p50: Optional[float] = Field(None, description="Median duration in seconds.")
+    p90: Optional[float] = Field(None, description="90th percentile in seconds.")
+    p95: Optional[float] = Field(None, description="95th percentile in seconds.")
+    p99: Optional[float] = Field(None, description="99th percentile in seconds.")
+
+
+class SeverityResponseTimesRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    severity: Severity = Field(
+        ..., description="Current incident severity.", examples=[Severity.SEV1]
+    )
+    time_to_acknowledge: DurationPercentilesRead = Field(
+        ...,
+        description=(
+            "Seconds from creation to the first status transition away from open."
+        ),
+    )
+    time_to_resolve: DurationPercentilesRead = Field(
+        ..., description="Seconds from creation to the first transition to resolved."
+    )
+
+
+class IncidentResponseTimesResponse(BaseModel):
+    """MTTA/MTTR percentiles per severity, from the status change history."""
+
+    created_after: Optional[datetime] = Field(
+        None, description="Inclusive lower bound applied to incident created_at."
+    )
+    created_before: Optional[datetime] = Field(
+        None, description="Exclusive upper bound applied to incident created_at."
+    )
+    by_severity: list[SeverityResponseTimesRead] = Field(
+        ..., description="Response time percentiles for every severity."
+    )
@@ -0,0 +1,38 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.schemas.incident import IncidentRead
+from backend.schemas.timeline_event import TimelineEventRead
+
+
+class ChangeSetResponse(BaseModel):
+    """Incidents and timeline events changed after a sync token."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    next_token: int = Field(
+        ...,
+        description="Pass as since on the next call to continue from here.",
+        examples=[1042],
+    )
+    has_more: bool = Field(
+        ...,
+        description="Whether more changes are waiting after next_token.",
+    )
+    incidents: list[IncidentRead] = Field(
+        ...,
+        description=(
+            "Created or updated incidents in their current state, without "
+            "events; changed events are listed under events."
+        ),
+    )
+    events: list[TimelineEventRead] = Field(
+        ..., description="Created or updated timeline events in their current state."
+    )
+    deleted_incident_ids: list[int] = Field(
+        ...,
+        description=(
+            "Deleted incidents. Their timeline events are deleted with them "
+            "and are not listed in deleted_event_ids."
+        ),
+    )
+    deleted_event_ids: list[int] = Field(..., description="Deleted timeline events.")
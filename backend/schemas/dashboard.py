@@ -0,0 +1,33 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.schemas.incident import IncidentListItem
+from backend.schemas.stats import StatusSeverityCountRead
+from backend.schemas.timeline_event import TimelineEventRead
+
+
+class DashboardResponse(BaseModel):
+    """Active incidents, status/severity counts and recent activity."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    active_incidents: list[IncidentListItem] = Field(
+        ...,
+        description=(
+            "Incidents that are not resolved, newest first by created_at DESC "
+            "and id DESC."
+        ),
+    )
+    by_status_severity: list[StatusSeverityCountRead] = Field(
+        ...,
+        description=(
+            "Incident counts for every status and severity combination, "
+            "including zero counts."
+        ),
+    )
+    recent_events: list[TimelineEventRead] = Field(
+        ...,
+        description=(
+            "The most recent timeline events across all incidents, newest "
+            "first by created_at DESC and id DESC."
+        ),
+    )
@@ -67,6 +67,17 @@ class IncidentListItem(BaseModel):
     )
     created_at: datetime = Field(..., description="ISO-8601 timestamp of record creation.")
     updated_at: datetime = Field(..., description="ISO-8601 timestamp of the last modification.")
+    event_count: int = Field(0, description="Number of timeline events recorded on the incident.")
+    last_event_at: datetime | None = Field(
+        None, description="ISO-8601 creation timestamp of the most recent timeline event."
+    )
+    events: list[TimelineEventRead] = Field(
+        default_factory=list,
+        description=(
+            "The most recent timeline events, newest first by created_at DESC "
+            "and id DESC. Empty unless include_latest_events is set."
+        ),
+    )
 
 
 class IncidentListResponse(BaseModel):
@@ -80,6 +91,13 @@ class IncidentListResponse(BaseModel):
     total: int = Field(
         ..., description="Total number of matching incidents before pagination."
     )
+    next_cursor: str | None = Field(
+        None,
+        description=(
+            "Opaque cursor for the next page in the same sort order; null "
+            "when this page is the last one."
+        ),
+    )
 
 
 class IncidentRead(IncidentBase):
@@ -96,6 +114,36 @@ class IncidentRead(IncidentBase):
     )
 
 
+class IncidentBatchGetRequest(BaseModel):
+    """Request body for fetching several incidents in one call."""
+    model_config = ConfigDict(extra="forbid")
+
+    ids: list[int] = Field(
+        ...,
+        description="Incident IDs to fetch (1-200); duplicates are ignored.",
+        examples=[[1, 2, 3]],
+    )
+    include_events: bool = Field(
+        default=False,
+        description="Embed each incident's timeline events, newest first.",
+    )
+
+
+class IncidentBatchGetResponse(BaseModel):
+    """Incidents found for a batch get, plus the IDs that do not exist."""
+
+    items: list[IncidentRead] = Field(
+        ...,
+        description=(
+            "Incidents in the order their IDs were first requested. events is "
+            "empty unless include_events was set."
+        ),
+    )
+    missing_ids: list[int] = Field(
+        ..., description="Requested IDs that do not match any incident."
+    )
+
+
 class IncidentReportIncident(BaseModel):
     """Incident fields included in a structured report."""
 
@@ -115,7 +163,9 @@ class IncidentReportResponse(BaseModel):
 
     incident: IncidentReportIncident
     timeline_events: list[TimelineEventRead]
-    timeline_order: Literal["created_at_desc_id_desc"] = "created_at_desc_id_desc"
+    timeline_order: Literal[
+        "created_at_desc_id_desc", "occurred_at_desc_id_desc"
+    ] = "created_at_desc_id_desc"
     timeline_event_count: int
 
 
@@ -0,0 +1,84 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from backend.domain.incidents.enums import Severity, StatsBucket, StatsSource, Status
+
+
+class StatusSeverityCountRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    status: Status = Field(..., description="Incident status.", examples=[Status.OPEN])
+    severity: Severity = Field(
+        ..., description="Incident severity.", examples=[Severity.SEV1]
+    )
+    count: int = Field(..., description="Number of matching incidents.", examples=[3])
+
+
+class CreatedBucketCountRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    bucket_start: datetime = Field(
+        ...,
+        description="UTC start of the hour or day bucket.",
+        examples=["2026-01-23T00:00:00Z"],
+    )
+    count: int = Field(
+        ..., description="Number of incidents created in the bucket.", examples=[7]
+    )
+
+
+class EventTypeCountRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    event_type: str = Field(..., description="Timeline event type.", examples=["note"])
+    count: int = Field(
+        ..., description="Number of events of the type in the window.", examples=[12]
+    )
+
+
+class IncidentStatsResponse(BaseModel):
+    """Aggregated incident counts for dashboards."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    bucket: StatsBucket = Field(
+        ..., description="Width of the created_at buckets.", examples=[StatsBucket.DAY]
+    )
+    created_after: Optional[datetime] = Field(
+        None, description="Inclusive lower bound applied to created_at."
+    )
+    created_before: Optional[datetime] = Field(
+        None, description="Exclusive upper bound applied to created_at."
+    )
+    source: StatsSource = Field(
+        ...,
+        description=(
+            "Whether the counts were aggregated from raw incidents or from the "
+            "hourly rollups (used for windows longer than a day)."
+        ),
+        examples=[StatsSource.ROLLUP],
+    )
+    total: int = Field(..., description="Number of incidents in the window.")
+    by_status_severity: list[StatusSeverityCountRead] = Field(
+        ...,
+        description=(
+            "Incident counts for every status and severity combination, "
+            "including zero counts."
+        ),
+    )
+    created: list[CreatedBucketCountRead] = Field(
+        ...,
+        description=(
+            "Incidents created per bucket, oldest first. Buckets without "
+            "incidents are omitted."
+        ),
+    )
+    events_by_type: list[EventTypeCountRead] = Field(
+        ...,
+        description=(
+            "Timeline events created in the window, by event type. Types "
+            "without events are omitted."
+        ),
+    )
@@ -56,6 +56,26 @@ class TimelineEventListResponse(BaseModel):
     )
 
 
+class RecentTimelineEventsResponse(BaseModel):
+    """One page of the activity feed across all incidents."""
+
+    items: list[TimelineEventRead] = Field(
+        ...,
+        description=(
+            "Timeline events from every incident, newest first by created_at "
+            "DESC and id DESC."
+        ),
+    )
+    limit: int = Field(..., description="Maximum number of timeline events requested.")
+    next_cursor: str | None = Field(
+        None,
+        description=(
+            "Opaque cursor for the next page; pass it back as cursor. Null on "
+            "the last page."
+        ),
+    )
+
+
 class TimelineEventUpdate(BaseModel):
     model_config = ConfigDict(
         str_strip_whitespace=True,
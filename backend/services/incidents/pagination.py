@@ -0,0 +1,160 @@
+"""Opaque keyset cursors for incident lists and the recent-events feed.
+
+A cursor records the order it was issued for plus the sort key and id of the
+last row on a page. The next page starts strictly after that row, so
+fetching page N costs the same as fetching the first page.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+from backend.domain.incidents.entities import Incident, TimelineEvent
+from backend.domain.incidents.enums import IncidentSort, Severity, SortDirection
+from backend.services.errors import ValidationError
+
+
+@dataclass(frozen=True, slots=True)
+class IncidentCursor:
+    sort: IncidentSort
+    direction: SortDirection
+    key: tuple
+    id: int
+
+    def after(self) -> tuple:
+        """Row value the repository compares the sort columns against."""
+        return (*self.key, self.id)
+
+
+@dataclass(frozen=True, slots=True)
+class EventFeedCursor:
+    """Position in the recent-events feed, newest first by created_at and id."""
+
+    created_at: datetime
+    id: int
+
+    def after(self) -> tuple:
+        return (self.created_at, self.id)
+
+
+def default_direction(sort: IncidentSort) -> SortDirection:
+    """Most severe first for severity, newest first for timestamps."""
+    return SortDirection.ASC if sort == IncidentSort.SEVERITY else SortDirection.DESC
+
+
+def incident_sort_key(incident: Incident, sort: IncidentSort) -> tuple:
+    """Domain-side mirror of the repository's sort columns, without ``id``."""
+    if sort == IncidentSort.UPDATED_AT:
+        return (incident.updated_at,)
+    if sort == IncidentSort.SEVERITY:
+        return (incident.severity, incident.created_at)
+    if sort == IncidentSort.LAST_ACTIVITY:
+        return (incident.last_event_at or incident.created_at,)
+    return (incident.created_at,)
+
+
+def encode_cursor(cursor: IncidentCursor) -> str:
+    payload = {
+        "sort": cursor.sort.value,
+        "direction": cursor.direction.value,
+        "key": [_encode_value(value) for value in cursor.key],
+        "id": cursor.id,
+    }
+    return _encode_payload(payload)
+
+
+def decode_cursor(token: str) -> IncidentCursor:
+    try:
+        payload = _decode_payload(token)
+        sort = IncidentSort(payload["sort"])
+        key = tuple(payload["key"])
+        cursor = IncidentCursor(
+            sort=sort,
+            direction=SortDirection(payload["direction"]),
+            key=_decode_key(sort, key),
+            id=int(payload["id"]),
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise ValidationError("cursor is invalid")
+    return cursor
+
+
+def next_page_cursor(
+    incidents: list[Incident],
+    *,
+    sort: IncidentSort,
+    direction: SortDirection | None,
+    limit: int,
+) -> str | None:
+    """Cursor for the page after ``incidents``; ``None`` once a page is short."""
+    if len(incidents) < limit or not incidents:
+        return None
+    last = incidents[-1]
+    return encode_cursor(
+        IncidentCursor(
+            sort=sort,
+            direction=direction or default_direction(sort),
+            key=incident_sort_key(last, sort),
+            id=last.id,
+        )
+    )
+
+
+def encode_event_cursor(cursor: EventFeedCursor) -> str:
+    return _encode_payload(
+        {"created_at": cursor.created_at.isoformat(), "id": cursor.id}
+    )
+
+
+def decode_event_cursor(token: str) -> EventFeedCursor:
+    try:
+        payload = _decode_payload(token)
+        cursor = EventFeedCursor(
+            created_at=_decode_datetime(payload["created_at"]),
+            id=int(payload["id"]),
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError):
+        raise ValidationError("cursor is invalid")
+    return cursor
+
+
+def next_event_page_cursor(events: list[TimelineEvent], *, limit: int) -> str | None:
+    """Cursor for the feed page after ``events``; ``None`` once a page is short."""
+    if len(events) < limit or not events:
+        return None
+    last = events[-1]
+    return encode_event_cursor(EventFeedCursor(created_at=last.created_at, id=last.id))
+
+
+def _encode_payload(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_payload(token: str) -> dict:
+    return json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+
+
+def _encode_value(value):
+    if isinstance(value, Severity):
+        return value.value
+    return value.isoformat()
+
+
+def _decode_key(sort: IncidentSort, key: tuple) -> tuple:
+    if sort == IncidentSort.SEVERITY:
+        severity, created_at = key
+        return (Severity(severity), _decode_datetime(created_at))
+    (value,) = key
+    return (_decode_datetime(value),)
+
+
+def _decode_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        raise ValueError("cursor timestamps must be timezone-aware")
+    return parsed
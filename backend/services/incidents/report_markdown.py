@@ -4,13 +4,22 @@ from datetime import datetime
 from enum import Enum
 
 from backend.domain.incidents.entities import Incident
+from backend.domain.incidents.enums import TimelineOrder
 
 
 TIMELINE_ORDER = "created_at_desc_id_desc"
+TIMELINE_ORDERS = {
+    TimelineOrder.CREATED_AT: TIMELINE_ORDER,
+    TimelineOrder.OCCURRED_AT: "occurred_at_desc_id_desc",
+}
 _MARKDOWN_ESCAPE_CHARS = set(r"`*_{}[]()#+-.!|<>")
 
 
-def render_incident_report_markdown(incident: Incident) -> str:
+def render_incident_report_markdown(
+    incident: Incident,
+    *,
+    order_by: TimelineOrder = TimelineOrder.CREATED_AT,
+) -> str:
     lines = [
         f"# Incident Report: {_escape_single_line(incident.title)}",
         "",
@@ -25,7 +34,7 @@ def render_incident_report_markdown(incident: Incident) -> str:
         "",
         "## Timeline",
         "",
-        f"Timeline order: {TIMELINE_ORDER}",
+        f"Timeline order: {TIMELINE_ORDERS[order_by]}",
         f"Timeline event count: {len(incident.events)}",
         "",
     ]
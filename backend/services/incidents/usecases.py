@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Collection, Sequence
+from datetime import datetime, timedelta, timezone
+
+from backend.core.request_context import records_use_cases
 from backend.services.errors import NotFoundError, ValidationError
 from backend.services.incidents.commands import (
     CreateIncidentCmd,
@@ -7,8 +11,30 @@ from backend.services.incidents.commands import (
     CreateTimelineEventCmd,
     UpdateTimelineEventCmd,
 )
+from backend.services.incidents.pagination import (
+    decode_cursor,
+    decode_event_cursor,
+    default_direction,
+)
 from backend.domain.incidents.entities import Incident, TimelineEvent
-from backend.domain.incidents.enums import Severity, Status
+from backend.domain.incidents.enums import (
+    ChangeAction,
+    ChangeEntity,
+    IncidentSort,
+    Severity,
+    SortDirection,
+    StatsBucket,
+    StatsSource,
+    Status,
+    TimelineOrder,
+)
+from backend.domain.incidents.read_models import (
+    ChangeSet,
+    DashboardSnapshot,
+    IncidentChange,
+    IncidentStats,
+    SeverityResponseTimes,
+)
 from backend.domain.incidents.ports import UnitOfWork
 
 
@@ -19,7 +45,35 @@ _ALLOWED_STATUS_TRANSITIONS: dict[Status, set[Status]] = {
     Status.RESOLVED: {Status.RESOLVED},
 }
 
+MAX_BATCH_GET_IDS = 200
+MAX_EMBEDDED_EVENTS = 10
+MAX_DASHBOARD_ITEMS = 100
+MAX_SYNC_CHANGES = 1000
+
+# Windows longer than this are answered from the hourly rollups rather than
+# by aggregating raw incidents.
+_STATS_ROLLUP_MIN_RANGE = timedelta(days=1)
+
+
+def as_utc(value: datetime | None) -> datetime | None:
+    """``value`` converted to UTC; timestamps without an offset are taken as UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _utc_window(
+    after: datetime | None, before: datetime | None, *, name: str
+) -> tuple[datetime | None, datetime | None]:
+    after, before = as_utc(after), as_utc(before)
+    if after and before and after >= before:
+        raise ValidationError(f"{name}_after must be earlier than {name}_before")
+    return after, before
+
 
+@records_use_cases
 class IncidentUseCases:
     def __init__(self, uow: UnitOfWork):
         self.uow = uow
@@ -27,32 +81,212 @@ class IncidentUseCases:
     def list_incidents(
         self,
         *,
-        status: Status | None = None,
-        severity: Severity | None = None,
+        status: Status | Collection[Status] | None = None,
+        severity: Severity | Collection[Severity] | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        active_only: bool = False,
+        sort: IncidentSort = IncidentSort.CREATED_AT,
+        direction: SortDirection | None = None,
+        cursor: str | None = None,
+        include_latest_events: int = 0,
+        fields: Collection[str] | None = None,
         limit: int = 50,
         offset: int = 0,
     ) -> tuple[list[Incident], int]:
+        created_after, created_before = _utc_window(
+            created_after, created_before, name="created"
+        )
+        if not 0 <= include_latest_events <= MAX_EMBEDDED_EVENTS:
+            raise ValidationError(
+                f"include_latest_events must be between 0 and {MAX_EMBEDDED_EVENTS}"
+            )
+
+        direction = direction or default_direction(sort)
+        after = None
+        if cursor is not None:
+            if offset:
+                raise ValidationError("offset cannot be combined with cursor")
+            decoded = decode_cursor(cursor)
+            if (decoded.sort, decoded.direction) != (sort, direction):
+                raise ValidationError("cursor was issued for a different sort order")
+            after = decoded.after()
+
+        filters = {
+            "status": status,
+            "severity": severity,
+            "created_after": created_after,
+            "created_before": created_before,
+            "active_only": active_only,
+        }
         incidents = self.uow.incidents.list(
-            status=status,
-            severity=severity,
+            **filters,
+            sort=sort,
+            direction=direction,
+            after=after,
+            include_latest_events=include_latest_events,
+            fields=fields,
             limit=limit,
             offset=offset,
         )
-        total = self.uow.incidents.count(status=status, severity=severity)
+        total = self.uow.incidents.count(**filters)
         return incidents, total
 
-    def get_incident(self, incident_id: int, *, with_events: bool = False) -> Incident:
+    def get_dashboard(
+        self, *, active_limit: int = 50, recent_events: int = 20
+    ) -> DashboardSnapshot:
+        for name, value in (
+            ("active_limit", active_limit),
+            ("recent_events", recent_events),
+        ):
+            if not 1 <= value <= MAX_DASHBOARD_ITEMS:
+                raise ValidationError(
+                    f"{name} must be between 1 and {MAX_DASHBOARD_ITEMS}"
+                )
+        return self.uow.incidents.dashboard(
+            active_limit=active_limit, recent_events=recent_events
+        )
+
+    def list_changes(self, *, since: int = 0, limit: int = 500) -> ChangeSet:
+        if since < 0:
+            raise ValidationError("since cannot be negative")
+        if not 1 <= limit <= MAX_SYNC_CHANGES:
+            raise ValidationError(f"limit must be between 1 and {MAX_SYNC_CHANGES}")
+
+        changes = self.uow.changes.list_since(since, limit=limit + 1)
+        if not changes:
+            if since > self.uow.changes.latest_seq():
+                raise ValidationError("since is ahead of the change log")
+            return ChangeSet(next_token=since)
+
+        page = changes[:limit]
+        # Only the latest change to each row matters: a row created and then
+        # deleted within the page is just a tombstone.
+        latest: dict[tuple[ChangeEntity, int], IncidentChange] = {}
+        for change in page:
+            latest.pop((change.entity, change.id), None)
+            latest[(change.entity, change.id)] = change
+
+        def ids(entity: ChangeEntity, *, deleted: bool) -> list[int]:
+            return [
+                change.id
+                for change in latest.values()
+                if change.entity == entity
+                and (change.action == ChangeAction.DELETED) == deleted
+            ]
+
+        # Rows missing here were deleted after this page; their tombstones
+        # arrive with a later page.
+        incident_ids = ids(ChangeEntity.INCIDENT, deleted=False)
+        incidents = {i.id: i for i in self.uow.incidents.get_many(incident_ids)}
+        event_ids = ids(ChangeEntity.EVENT, deleted=False)
+        events = {e.id: e for e in self.uow.events.get_many(event_ids)}
+        return ChangeSet(
+            next_token=page[-1].seq,
+            has_more=len(changes) > limit,
+            incidents=[incidents[i] for i in incident_ids if i in incidents],
+            events=[events[i] for i in event_ids if i in events],
+            deleted_incident_ids=ids(ChangeEntity.INCIDENT, deleted=True),
+            deleted_event_ids=ids(ChangeEntity.EVENT, deleted=True),
+        )
+
+    def get_incident_stats(
+        self,
+        *,
+        bucket: StatsBucket = StatsBucket.DAY,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> IncidentStats:
+        created_after, created_before = _utc_window(
+            created_after, created_before, name="created"
+        )
+
+        use_rollups = (
+            created_after is None
+            or created_before is None
+            or created_before - created_after > _STATS_ROLLUP_MIN_RANGE
+        )
+        return self.uow.incidents.stats(
+            bucket=bucket,
+            created_after=created_after,
+            created_before=created_before,
+            source=StatsSource.ROLLUP if use_rollups else StatsSource.RAW,
+        )
+
+    def get_response_times(
+        self,
+        *,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> list[SeverityResponseTimes]:
+        created_after, created_before = _utc_window(
+            created_after, created_before, name="created"
+        )
+
+        return self.uow.incidents.response_times(
+            created_after=created_after,
+            created_before=created_before,
+        )
+
+    def get_incident(
+        self,
+        incident_id: int,
+        *,
+        with_events: bool = False,
+        fields: Collection[str] | None = None,
+    ) -> Incident:
         incident = (
-            self.uow.incidents.get_with_events(incident_id)
+            self.uow.incidents.get_with_events(incident_id, fields=fields)
             if with_events
-            else self.uow.incidents.get(incident_id)
+            else self.uow.incidents.get(incident_id, fields=fields)
         )
         if not incident:
             raise NotFoundError("Incident not found")
         return incident
 
-    def get_incident_report(self, incident_id: int) -> Incident:
-        return self.get_incident(incident_id, with_events=True)
+    def ensure_incident_exists(self, incident_id: int) -> None:
+        if not self.uow.incidents.exists(incident_id):
+            raise NotFoundError("Incident not found")
+
+    def get_incidents(
+        self, incident_ids: Sequence[int], *, with_events: bool = False
+    ) -> tuple[list[Incident], list[int]]:
+        """Fetch several incidents at once.
+
+        Returns the incidents found, in the order their ids were first
+        requested, and the requested ids that do not exist.
+        """
+        requested = list(dict.fromkeys(incident_ids))
+        if not requested:
+            raise ValidationError("At least one incident id is required")
+        if len(requested) > MAX_BATCH_GET_IDS:
+            raise ValidationError(
+                f"At most {MAX_BATCH_GET_IDS} incident ids can be fetched at once"
+            )
+
+        found = {
+            incident.id: incident
+            for incident in self.uow.incidents.get_many(
+                requested, with_events=with_events
+            )
+        }
+        incidents = [found[i] for i in requested if i in found]
+        missing = [i for i in requested if i not in found]
+        return incidents, missing
+
+    def get_incident_report(
+        self,
+        incident_id: int,
+        *,
+        order_by: TimelineOrder = TimelineOrder.CREATED_AT,
+    ) -> Incident:
+        incident = self.uow.incidents.get_with_events(
+            incident_id,
+            events_order_by=order_by,
+        )
+        if not incident:
+            raise NotFoundError("Incident not found")
+        return incident
 
     def create_incident(self, cmd: CreateIncidentCmd) -> Incident:
         title = cmd.title.strip()
@@ -109,20 +343,74 @@ class IncidentUseCases:
             raise NotFoundError("Incident not found")
 
     def list_events(
-        self, incident_id: int, *, limit: int = 50, offset: int = 0
+        self,
+        incident_id: int,
+        *,
+        event_type: str | None = None,
+        occurred_after: datetime | None = None,
+        occurred_before: datetime | None = None,
+        order_by: TimelineOrder = TimelineOrder.CREATED_AT,
+        fields: Collection[str] | None = None,
+        limit: int = 50,
+        offset: int = 0,
     ) -> tuple[list[TimelineEvent], int]:
+        if event_type is not None:
+            event_type = event_type.strip()
+            if not event_type:
+                raise ValidationError("event_type cannot be empty")
+
+        occurred_after, occurred_before = _utc_window(
+            occurred_after, occurred_before, name="occurred"
+        )
+
         if not self.uow.incidents.exists(incident_id):
             raise NotFoundError("Incident not found")
+
+        filters = {
+            "event_type": event_type,
+            "occurred_after": occurred_after,
+            "occurred_before": occurred_before,
+        }
         events = self.uow.events.list_incident_events(
             incident_id,
+            **filters,
+            order_by=order_by,
+            fields=fields,
             limit=limit,
             offset=offset,
         )
-        total = self.uow.events.count_incident_events(incident_id)
+        total = self.uow.events.count_incident_events(incident_id, **filters)
         return events, total
 
-    def get_event(self, incident_id: int, event_id: int) -> TimelineEvent:
-        event = self.uow.events.get(incident_id, event_id)
+    def list_recent_events(
+        self,
+        *,
+        event_type: str | None = None,
+        severity: Severity | Collection[Severity] | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> list[TimelineEvent]:
+        if event_type is not None:
+            event_type = event_type.strip()
+            if not event_type:
+                raise ValidationError("event_type cannot be empty")
+
+        after = decode_event_cursor(cursor).after() if cursor is not None else None
+        return self.uow.events.list_recent(
+            event_type=event_type,
+            severity=severity,
+            after=after,
+            limit=limit,
+        )
+
+    def get_event(
+        self,
+        incident_id: int,
+        event_id: int,
+        *,
+        fields: Collection[str] | None = None,
+    ) -> TimelineEvent:
+        event = self.uow.events.get(incident_id, event_id, fields=fields)
         if event:
             return event
 
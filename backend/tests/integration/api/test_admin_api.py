@@ -0,0 +1,47 @@
+import pytest
+
+from backend.db.sessions import get_slow_query_monitor
+from backend.db.slow_queries import SlowQueryMonitor
+
+
+@pytest.fixture
+def slow_query_monitor(app_fixture, engine):
+    monitor = SlowQueryMonitor(threshold_ms=0, explain_sample_rate=1, sample=lambda: 0)
+    monitor.instrument(engine)
+    app_fixture.dependency_overrides[get_slow_query_monitor] = lambda: monitor
+    yield monitor
+    app_fixture.dependency_overrides.pop(get_slow_query_monitor, None)
+    monitor.uninstrument(engine)
+    monitor.close()
+
+
+def test_slow_queries_list_statements_over_the_threshold(
+    client_fixture, slow_query_monitor
+):
+    client_fixture.get("/api/v1/incidents", params={"limit": 5})
+    slow_query_monitor.wait_for_explains()
+
+    response = client_fixture.get("/api/v1/admin/slow-queries")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["enabled"] is True
+    assert body["threshold_ms"] == 0
+    listed = [
+        item for item in body["items"] if item["route"] == "/api/v1/incidents"
+    ]
+    assert listed
+    assert all(item["request_id"] for item in listed)
+    assert any(item["plan"] for item in listed)
+    assert all(set(item["parameters"].values()) <= {"int"} for item in listed)
+
+
+def test_slow_queries_report_a_disabled_monitor(app_fixture, client_fixture):
+    app_fixture.dependency_overrides[get_slow_query_monitor] = lambda: None
+    try:
+        response = client_fixture.get("/api/v1/admin/slow-queries")
+    finally:
+        app_fixture.dependency_overrides.pop(get_slow_query_monitor, None)
+
+    assert response.status_code == 200
+    assert response.json() == {"enabled": False, "threshold_ms": 0, "items": []}
@@ -0,0 +1,100 @@
+def _create_incident(client_fixture, title):
+    response = client_fixture.post(
+        "/api/v1/incidents",
+        json={
+            "title": title,
+            "description": f"{title} description",
+            "status": "open",
+            "severity": "sev2",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_event(client_fixture, incident_id, message):
+    response = client_fixture.post(
+        f"/api/v1/incidents/{incident_id}/events",
+        json={
+            "event_type": "update",
+            "message": message,
+            "occurred_at": "2026-01-23T12:00:00Z",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _caught_up_token(client_fixture):
+    params = {"since": 0, "limit": 1000}
+    while True:
+        body = client_fixture.get("/api/v1/changes", params=params).json()
+        if not body["has_more"]:
+            return body["next_token"]
+        params["since"] = body["next_token"]
+
+
+def test_changes_return_rows_touched_since_the_token(client_fixture):
+    since = _caught_up_token(client_fixture)
+    incident_id = _create_incident(client_fixture, "Synced")
+    event_id = _create_event(client_fixture, incident_id, "First update")
+    client_fixture.patch(
+        f"/api/v1/incidents/{incident_id}", json={"status": "investigating"}
+    )
+
+    response = client_fixture.get("/api/v1/changes", params={"since": since})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["next_token"] > since
+    assert body["has_more"] is False
+    assert [i["id"] for i in body["incidents"]] == [incident_id]
+    assert body["incidents"][0]["status"] == "investigating"
+    assert [e["id"] for e in body["events"]] == [event_id]
+    assert body["deleted_incident_ids"] == []
+    assert body["deleted_event_ids"] == []
+
+    unchanged = client_fixture.get(
+        "/api/v1/changes", params={"since": body["next_token"]}
+    ).json()
+    assert unchanged["next_token"] == body["next_token"]
+    assert unchanged["incidents"] == [] and unchanged["events"] == []
+
+
+def test_changes_report_deletes_as_tombstones(client_fixture):
+    incident_id = _create_incident(client_fixture, "Doomed")
+    event_id = _create_event(client_fixture, incident_id, "Soon gone")
+    since = _caught_up_token(client_fixture)
+
+    client_fixture.delete(f"/api/v1/incidents/{incident_id}/events/{event_id}")
+    client_fixture.delete(f"/api/v1/incidents/{incident_id}")
+    body = client_fixture.get("/api/v1/changes", params={"since": since}).json()
+
+    assert body["incidents"] == [] and body["events"] == []
+    assert body["deleted_incident_ids"] == [incident_id]
+    assert body["deleted_event_ids"] == [event_id]
+
+
+def test_changes_page_with_has_more_and_next_token(client_fixture):
+    since = _caught_up_token(client_fixture)
+    created = [_create_incident(client_fixture, f"Incident {n}") for n in range(3)]
+
+    first = client_fixture.get(
+        "/api/v1/changes", params={"since": since, "limit": 2}
+    ).json()
+    second = client_fixture.get(
+        "/api/v1/changes", params={"since": first["next_token"], "limit": 2}
+    ).json()
+
+    assert first["has_more"] is True
+    assert second["has_more"] is False
+    assert [i["id"] for i in first["incidents"] + second["incidents"]] == created
+
+
+def test_changes_reject_a_token_ahead_of_the_log_with_400(client_fixture):
+    token = _caught_up_token(client_fixture)
+
+    response = client_fixture.get("/api/v1/changes", params={"since": token + 1000})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "since is ahead of the change log"}
@@ -0,0 +1,87 @@
+from backend.api.dependencies import get_dashboard_cache
+from backend.core.cache import TTLCache
+
+
+def _create_incident(client_fixture, title, status="open", severity="sev2"):
+    response = client_fixture.post(
+        "/api/v1/incidents",
+        json={
+            "title": title,
+            "description": f"{title} description",
+            "status": status,
+            "severity": severity,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def _create_event(client_fixture, incident_id, message):
+    response = client_fixture.post(
+        f"/api/v1/incidents/{incident_id}/events",
+        json={
+            "event_type": "update",
+            "message": message,
+            "occurred_at": "2026-01-23T12:00:00Z",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_dashboard_returns_active_incidents_counts_and_recent_events(client_fixture):
+    active = _create_incident(client_fixture, "Active", severity="sev1")
+    _create_incident(client_fixture, "Resolved", status="resolved")
+    event = _create_event(client_fixture, active["id"], "Failover started.")
+
+    response = client_fixture.get("/api/v1/dashboard")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [i["title"] for i in body["active_incidents"]] == ["Active"]
+    assert body["active_incidents"][0]["event_count"] == 1
+    counts = {
+        (c["status"], c["severity"]): c["count"] for c in body["by_status_severity"]
+    }
+    assert len(counts) == 16
+    assert counts[("open", "sev1")] == 1
+    assert counts[("resolved", "sev2")] == 1
+    assert sum(counts.values()) == 2
+    assert body["recent_events"] == [event]
+
+
+def test_dashboard_applies_limits(client_fixture):
+    for n in range(3):
+        incident = _create_incident(client_fixture, f"Incident {n}")
+        _create_event(client_fixture, incident["id"], f"Update {n}")
+
+    response = client_fixture.get(
+        "/api/v1/dashboard", params={"active_limit": 2, "recent_events": 1}
+    )
+
+    body = response.json()
+    assert len(body["active_incidents"]) == 2
+    assert len(body["recent_events"]) == 1
+
+
+def test_dashboard_rejects_out_of_range_limits_with_422(client_fixture):
+    response = client_fixture.get("/api/v1/dashboard", params={"active_limit": 0})
+
+    assert response.status_code == 422
+
+
+def test_dashboard_is_served_from_cache_within_ttl(app_fixture, client_fixture):
+    cache = TTLCache(60)
+    app_fixture.dependency_overrides[get_dashboard_cache] = lambda: cache
+    try:
+        first = client_fixture.get("/api/v1/dashboard")
+        _create_incident(client_fixture, "Created After Caching")
+        cached = client_fixture.get("/api/v1/dashboard")
+        cache.clear()
+        refreshed = client_fixture.get("/api/v1/dashboard")
+    finally:
+        app_fixture.dependency_overrides.pop(get_dashboard_cache, None)
+
+    assert first.json()["active_incidents"] == []
+    assert cached.json()["active_incidents"] == []
+    assert len(refreshed.json()["active_incidents"]) == 1
@@ -0,0 +1,82 @@
+def _create_incident(client_fixture, title, severity="sev2"):
+    response = client_fixture.post(
+        "/api/v1/incidents",
+        json={
+            "title": title,
+            "description": f"{title} description",
+            "status": "open",
+            "severity": severity,
+        },
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_event(client_fixture, incident_id, message, event_type="update"):
+    response = client_fixture.post(
+        f"/api/v1/incidents/{incident_id}/events",
+        json={
+            "event_type": event_type,
+            "message": message,
+            "occurred_at": "2026-01-23T12:00:00Z",
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_recent_events_list_events_from_every_incident(client_fixture):
+    first = _create_incident(client_fixture, "First")
+    second = _create_incident(client_fixture, "Second")
+    older = _create_event(client_fixture, first, "Older")
+    newer = _create_event(client_fixture, second, "Newer")
+
+    response = client_fixture.get("/api/v1/events/recent")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert {e["id"] for e in body["items"]} == {older["id"], newer["id"]}
+    assert body["limit"] == 50
+    assert body["next_cursor"] is None
+
+
+def test_recent_events_follow_next_cursor_to_the_end(client_fixture):
+    incident_id = _create_incident(client_fixture, "Busy")
+    created = [_create_event(client_fixture, incident_id, f"Event {n}") for n in range(5)]
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        body = client_fixture.get("/api/v1/events/recent", params=params).json()
+        seen.extend(body["items"])
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    assert sorted(e["id"] for e in seen) == sorted(e["id"] for e in created)
+    assert len(seen) == len({e["id"] for e in seen})
+
+
+def test_recent_events_filter_by_event_type_and_severity(client_fixture):
+    critical = _create_incident(client_fixture, "Critical", severity="sev1")
+    minor = _create_incident(client_fixture, "Minor", severity="sev4")
+    wanted = _create_event(client_fixture, critical, "Wanted", event_type="mitigation")
+    _create_event(client_fixture, critical, "Other type", event_type="note")
+    _create_event(client_fixture, minor, "Other severity", event_type="mitigation")
+
+    response = client_fixture.get(
+        "/api/v1/events/recent",
+        params={"event_type": "mitigation", "severity": "sev1"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["items"] == [wanted]
+
+
+def test_recent_events_reject_invalid_cursor_with_400(client_fixture):
+    response = client_fixture.get(
+        "/api/v1/events/recent", params={"cursor": "not-a-cursor"}
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "cursor is invalid"}
@@ -1,3 +1,7 @@
+from backend.api.dependencies import get_incident_stats_cache
+from backend.core.cache import TTLCache
+
+
 def _create_incident(client_fixture):
     payload = {
         "title": "Event Test Incident",
@@ -238,6 +242,45 @@ def test_get_incident_report_preserves_timeline_event_order(client_fixture):
     ]
 
 
+def test_get_incident_report_orders_timeline_by_occurred_at_when_requested(
+    client_fixture,
+):
+    incident_id = _create_incident(client_fixture)
+    happened_last = _create_event(
+        client_fixture,
+        incident_id,
+        occurred_at="2026-01-23T14:30:00Z",
+    )
+    happened_first = _create_event(
+        client_fixture,
+        incident_id,
+        occurred_at="2026-01-23T14:02:00Z",
+    )
+
+    response = client_fixture.get(
+        f"/api/v1/incidents/{incident_id}/report",
+        params={"order_by": "occurred_at"},
+    )
+    markdown_response = client_fixture.get(
+        f"/api/v1/incidents/{incident_id}/report/markdown",
+        params={"order_by": "occurred_at"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["timeline_order"] == "occurred_at_desc_id_desc"
+    assert [event["id"] for event in body["timeline_events"]] == [
+        happened_last["id"],
+        happened_first["id"],
+    ]
+    assert markdown_response.status_code == 200
+    markdown = markdown_response.text
+    assert "Timeline order: occurred_at_desc_id_desc" in markdown
+    assert markdown.index(f"### Event {happened_last['id']}") < markdown.index(
+        f"### Event {happened_first['id']}"
+    )
+
+
 def test_get_incident_report_markdown_returns_markdown_report(client_fixture):
     incident = _create_list_incident(
         client_fixture,
@@ -492,6 +535,400 @@ def test_list_incidents_filters_by_status_and_severity(client_fixture):
     assert items[0]["severity"] == "sev1"
 
 
+def test_list_incidents_matches_any_of_repeated_filter_values(client_fixture):
+    open_sev1 = _create_list_incident(client_fixture, "Open SEV1", severity="sev1")
+    investigating_sev2 = _create_list_incident(
+        client_fixture,
+        "Investigating SEV2",
+        status="investigating",
+        severity="sev2",
+    )
+    _create_list_incident(client_fixture, "Open SEV3", severity="sev3")
+    _create_list_incident(
+        client_fixture,
+        "Investigating SEV4",
+        status="investigating",
+        severity="sev4",
+    )
+
+    res = client_fixture.get(
+        "/api/v1/incidents",
+        params=[
+            ("status_filter", "open"),
+            ("status_filter", "investigating"),
+            ("severity_filter", "sev1"),
+            ("severity_filter", "sev2"),
+        ],
+    )
+
+    assert res.status_code == 200
+    body = res.json()
+    assert body["total"] == 2
+    assert {item["id"] for item in body["items"]} == {
+        open_sev1["id"],
+        investigating_sev2["id"],
+    }
+
+
+def test_list_incidents_filters_by_created_window(client_fixture):
+    incident = _create_list_incident(client_fixture, "Windowed Incident")
+
+    inside = client_fixture.get(
+        "/api/v1/incidents",
+        params={
+            "created_after": "2000-01-01T00:00:00Z",
+            "created_before": "2999-01-01T00:00:00Z",
+        },
+    )
+    after = client_fixture.get(
+        "/api/v1/incidents",
+        params={"created_after": "2999-01-01T00:00:00Z"},
+    )
+
+    assert inside.status_code == 200
+    assert [item["id"] for item in inside.json()["items"]] == [incident["id"]]
+    assert after.status_code == 200
+    assert after.json()["items"] == []
+    assert after.json()["total"] == 0
+
+
+def test_list_incidents_active_only_excludes_resolved(client_fixture):
+    active = _create_list_incident(client_fixture, "Active Incident")
+    _create_list_incident(client_fixture, "Resolved Incident", status="resolved")
+
+    response = client_fixture.get(
+        "/api/v1/incidents",
+        params={"active_only": "true"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [active["id"]]
+    assert body["total"] == 1
+
+
+def test_list_incidents_reports_event_activity_and_accepts_last_activity_sort(
+    client_fixture,
+):
+    quiet = _create_list_incident(client_fixture, "Quiet Incident")
+    busy = _create_list_incident(client_fixture, "Busy Incident")
+    _create_event(client_fixture, busy["id"])
+    _create_event(client_fixture, busy["id"])
+
+    response = client_fixture.get(
+        "/api/v1/incidents",
+        params={"sort": "last_activity"},
+    )
+
+    assert response.status_code == 200
+    items = {item["id"]: item for item in response.json()["items"]}
+    assert items[busy["id"]]["event_count"] == 2
+    assert items[busy["id"]]["last_event_at"] is not None
+    assert items[quiet["id"]]["event_count"] == 0
+    assert items[quiet["id"]]["last_event_at"] is None
+
+
+def test_list_incidents_cursor_pages_follow_the_requested_sort(client_fixture):
+    created = [
+        _create_list_incident(client_fixture, f"Incident {severity}", severity=severity)
+        for severity in ("sev3", "sev1", "sev4", "sev2", "sev1")
+    ]
+    params = {"sort": "severity", "limit": 2}
+
+    seen = []
+    response = client_fixture.get("/api/v1/incidents", params=params)
+    while True:
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == len(created)
+        seen.extend(body["items"])
+        if body["next_cursor"] is None:
+            break
+        response = client_fixture.get(
+            "/api/v1/incidents",
+            params={**params, "cursor": body["next_cursor"]},
+        )
+
+    assert [item["severity"] for item in seen] == [
+        "sev1",
+        "sev1",
+        "sev2",
+        "sev3",
+        "sev4",
+    ]
+    assert sorted(item["id"] for item in seen) == sorted(i["id"] for i in created)
+
+
+def test_list_incidents_rejects_cursor_from_another_sort_with_400(client_fixture):
+    _create_list_incident(client_fixture, "First")
+    _create_list_incident(client_fixture, "Second")
+    first_page = client_fixture.get("/api/v1/incidents", params={"limit": 1}).json()
+
+    response = client_fixture.get(
+        "/api/v1/incidents",
+        params={"sort": "updated_at", "cursor": first_page["next_cursor"]},
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "detail": "cursor was issued for a different sort order"
+    }
+
+
+def test_list_incidents_rejects_malformed_cursor_with_400(client_fixture):
+    response = client_fixture.get("/api/v1/incidents", params={"cursor": "garbage"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "cursor is invalid"}
+
+
+def test_batch_get_incidents_returns_items_in_request_order(client_fixture):
+    first = _create_list_incident(client_fixture, "First Batch Incident")
+    second = _create_list_incident(client_fixture, "Second Batch Incident")
+    _create_event(client_fixture, second["id"], message="Rolled back the deploy.")
+
+    response = client_fixture.post(
+        "/api/v1/incidents:batchGet",
+        json={"ids": [second["id"], 999_999, first["id"]], "include_events": True},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [second["id"], first["id"]]
+    assert [e["message"] for e in body["items"][0]["events"]] == [
+        "Rolled back the deploy."
+    ]
+    assert body["items"][1]["events"] == []
+    assert body["missing_ids"] == [999_999]
+
+
+def test_batch_get_incidents_rejects_empty_id_list_with_400(client_fixture):
+    response = client_fixture.post("/api/v1/incidents:batchGet", json={"ids": []})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "At least one incident id is required"}
+
+
+def test_list_incidents_embeds_latest_events_when_requested(client_fixture):
+    incident = _create_list_incident(client_fixture, "Board Incident")
+    for n in range(4):
+        _create_event(client_fixture, incident["id"], message=f"Update {n}")
+
+    plain = client_fixture.get("/api/v1/incidents")
+    embedded = client_fixture.get(
+        "/api/v1/incidents", params={"include_latest_events": 3}
+    )
+
+    assert plain.status_code == 200
+    assert plain.json()["items"][0]["events"] == []
+    assert embedded.status_code == 200
+    events = embedded.json()["items"][0]["events"]
+    assert len(events) == 3
+    assert {e["incident_id"] for e in events} == {incident["id"]}
+
+
+def test_list_incidents_rejects_too_many_embedded_events_with_422(client_fixture):
+    response = client_fixture.get(
+        "/api/v1/incidents", params={"include_latest_events": 11}
+    )
+
+    assert response.status_code == 422
+
+
+def test_sparse_fields_narrow_incident_and_event_responses(client_fixture):
+    incident = _create_list_incident(client_fixture, "Sparse Incident", severity="sev1")
+    event = _create_event(client_fixture, incident["id"], event_type="note")
+    base = f"/api/v1/incidents/{incident['id']}"
+
+    listed = client_fixture.get(
+        "/api/v1/incidents", params={"fields": "id,status,severity"}
+    )
+    detail = client_fixture.get(base, params={"fields": "title,events"})
+    events = client_fixture.get(f"{base}/events", params={"fields": "id,event_type"})
+    one_event = client_fixture.get(
+        f"{base}/events/{event['id']}", params={"fields": "message"}
+    )
+
+    assert listed.status_code == 200
+    assert listed.json()["items"] == [
+        {"id": incident["id"], "status": "open", "severity": "sev1"}
+    ]
+    assert set(listed.json()) == {"items", "limit", "offset", "total", "next_cursor"}
+    assert detail.json()["title"] == "Sparse Incident"
+    assert [e["id"] for e in detail.json()["events"]] == [event["id"]]
+    assert set(detail.json()) == {"title", "events"}
+    assert events.json()["items"] == [{"id": event["id"], "event_type": "note"}]
+    assert one_event.json() == {"message": event["message"]}
+
+
+def test_sparse_fields_reject_unknown_names_with_400(client_fixture):
+    response = client_fixture.get(
+        "/api/v1/incidents", params={"fields": "id,secret,status"}
+    )
+    empty = client_fixture.get("/api/v1/incidents", params={"fields": " , "})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Unknown fields: secret"}
+    assert empty.status_code == 400
+    assert empty.json() == {"detail": "fields cannot be empty"}
+
+
+def test_list_incidents_rejects_unknown_sort_with_422(client_fixture):
+    response = client_fixture.get("/api/v1/incidents", params={"sort": "title"})
+
+    assert response.status_code == 422
+
+
+def test_list_incidents_rejects_inverted_created_window_with_400(client_fixture):
+    response = client_fixture.get(
+        "/api/v1/incidents",
+        params={
+            "created_after": "2026-02-01T00:00:00Z",
+            "created_before": "2026-01-01T00:00:00Z",
+        },
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "detail": "created_after must be earlier than created_before"
+    }
+
+
+def test_incident_stats_returns_matrix_and_created_buckets(client_fixture):
+    _create_list_incident(client_fixture, "Open SEV1", severity="sev1")
+    _create_list_incident(client_fixture, "Another Open SEV1", severity="sev1")
+    _create_list_incident(
+        client_fixture, "Resolved SEV3", status="resolved", severity="sev3"
+    )
+
+    response = client_fixture.get(
+        "/api/v1/incidents/stats",
+        params={"bucket": "hour"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    counts = {
+        (item["status"], item["severity"]): item["count"]
+        for item in body["by_status_severity"]
+    }
+    assert body["bucket"] == "hour"
+    assert body["source"] == "rollup"
+    assert body["total"] == 3
+    assert len(counts) == 16
+    assert counts[("open", "sev1")] == 2
+    assert counts[("resolved", "sev3")] == 1
+    assert counts[("mitigated", "sev4")] == 0
+    assert sum(bucket["count"] for bucket in body["created"]) == 3
+
+
+def test_incident_stats_rejects_inverted_created_window_with_400(client_fixture):
+    response = client_fixture.get(
+        "/api/v1/incidents/stats",
+        params={
+            "created_after": "2026-02-01T00:00:00Z",
+            "created_before": "2026-01-01T00:00:00Z",
+        },
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "detail": "created_after must be earlier than created_before"
+    }
+
+
+def test_incident_stats_rejects_unknown_bucket_with_422(client_fixture):
+    response = client_fixture.get(
+        "/api/v1/incidents/stats",
+        params={"bucket": "week"},
+    )
+
+    assert response.status_code == 422
+
+
+def test_incident_stats_are_served_from_cache_within_ttl(
+    app_fixture, client_fixture
+):
+    cache = TTLCache(60)
+    app_fixture.dependency_overrides[get_incident_stats_cache] = lambda: cache
+    try:
+        first = client_fixture.get("/api/v1/incidents/stats")
+        _create_list_incident(client_fixture, "Created After Caching")
+        cached = client_fixture.get("/api/v1/incidents/stats")
+        cache.clear()
+        refreshed = client_fixture.get("/api/v1/incidents/stats")
+    finally:
+        app_fixture.dependency_overrides.pop(get_incident_stats_cache, None)
+
+    assert first.json()["total"] == 0
+    assert cached.json()["total"] == 0
+    assert refreshed.json()["total"] == 1
+
+
+def test_incident_stats_share_a_cache_entry_for_the_same_instant(
+    app_fixture, client_fixture
+):
+    cache = TTLCache(60)
+    app_fixture.dependency_overrides[get_incident_stats_cache] = lambda: cache
+    try:
+        naive = client_fixture.get(
+            "/api/v1/incidents/stats",
+            params={
+                "created_after": "2026-01-01T00:00:00",
+                "created_before": "2026-02-01T00:00:00Z",
+            },
+        )
+        offset = client_fixture.get(
+            "/api/v1/incidents/stats",
+            params={
+                "created_after": "2026-01-01T01:00:00+01:00",
+                "created_before": "2026-02-01T00:00:00Z",
+            },
+        )
+    finally:
+        app_fixture.dependency_overrides.pop(get_incident_stats_cache, None)
+
+    assert naive.status_code == 200
+    assert offset.json() == naive.json()
+    assert naive.json()["created_after"] == "2026-01-01T00:00:00Z"
+    assert len(cache) == 1
+
+
+def test_incident_response_times_cover_every_severity(client_fixture):
+    incident = _create_list_incident(client_fixture, "Acknowledged", severity="sev1")
+    client_fixture.patch(
+        f"/api/v1/incidents/{incident['id']}",
+        json={"status": "investigating"},
+    )
+
+    response = client_fixture.get("/api/v1/incidents/analytics/response-times")
+
+    assert response.status_code == 200
+    by_severity = {item["severity"]: item for item in response.json()["by_severity"]}
+    assert list(by_severity) == ["sev1", "sev2", "sev3", "sev4"]
+    assert by_severity["sev1"]["time_to_acknowledge"]["count"] == 1
+    assert by_severity["sev1"]["time_to_acknowledge"]["p50"] >= 0
+    assert by_severity["sev1"]["time_to_resolve"] == {
+        "count": 0,
+        "p50": None,
+        "p90": None,
+        "p95": None,
+        "p99": None,
+    }
+
+
+def test_incident_response_times_reject_inverted_window_with_400(client_fixture):
+    response = client_fixture.get(
+        "/api/v1/incidents/analytics/response-times",
+        params={
+            "created_after": "2026-02-01T00:00:00Z",
+            "created_before": "2026-01-01T00:00:00Z",
+        },
+    )
+
+    assert response.status_code == 400
+
+
 def test_list_incidents_combines_filters_with_pagination(client_fixture):
     first_match = _create_list_incident(
         client_fixture,
@@ -910,6 +1347,90 @@ def test_list_timeline_events_supports_limit_and_offset(client_fixture):
     assert body["items"][0]["id"] != first["id"]
 
 
+def test_list_timeline_events_filters_by_occurred_window_and_event_type(
+    client_fixture,
+):
+    incident_id = _create_incident(client_fixture)
+    _create_event(
+        client_fixture,
+        incident_id,
+        event_type="status_change",
+        occurred_at="2026-01-23T14:01:00Z",
+    )
+    window_start = _create_event(
+        client_fixture,
+        incident_id,
+        event_type="status_change",
+        occurred_at="2026-01-23T14:02:00Z",
+    )
+    _create_event(
+        client_fixture,
+        incident_id,
+        event_type="note",
+        occurred_at="2026-01-23T14:10:00Z",
+    )
+    window_middle = _create_event(
+        client_fixture,
+        incident_id,
+        event_type="status_change",
+        occurred_at="2026-01-23T14:20:00Z",
+    )
+    _create_event(
+        client_fixture,
+        incident_id,
+        event_type="status_change",
+        occurred_at="2026-01-23T14:30:00Z",
+    )
+
+    response = client_fixture.get(
+        f"/api/v1/incidents/{incident_id}/events",
+        params={
+            "event_type": "status_change",
+            "occurred_after": "2026-01-23T14:02:00Z",
+            "occurred_before": "2026-01-23T14:30:00Z",
+            "order_by": "occurred_at",
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    assert [event["id"] for event in body["items"]] == [
+        window_middle["id"],
+        window_start["id"],
+    ]
+
+
+def test_list_timeline_events_rejects_inverted_occurred_window_with_400(
+    client_fixture,
+):
+    incident_id = _create_incident(client_fixture)
+
+    response = client_fixture.get(
+        f"/api/v1/incidents/{incident_id}/events",
+        params={
+            "occurred_after": "2026-01-23T14:30:00Z",
+            "occurred_before": "2026-01-23T14:02:00Z",
+        },
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {
+        "detail": "occurred_after must be earlier than occurred_before"
+    }
+
+
+def test_list_timeline_events_rejects_invalid_order_by_with_422(client_fixture):
+    incident_id = _create_incident(client_fixture)
+
+    response = client_fixture.get(
+        f"/api/v1/incidents/{incident_id}/events",
+        params={"order_by": "message"},
+    )
+
+    assert response.status_code == 422
+
+
 def test_list_timeline_events_rejects_limit_below_minimum_with_422(client_fixture):
     incident_id = _create_incident(client_fixture)
 
@@ -1157,3 +1678,10 @@ def test_delete_event_success_returns_204(client_fixture):
     incident_response = client_fixture.get(f"/api/v1/incidents/{incident_id}")
     assert incident_response.status_code == 200
     assert incident_response.json()["events"] == []
+
+
+def test_incident_change_stream_returns_404_for_missing_incident(client_fixture):
+    response = client_fixture.get("/api/v1/incidents/999999/stream")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Incident not found"}
@@ -0,0 +1,43 @@
+def _scrape(client_fixture):
+    response = client_fixture.get("/metrics")
+    assert response.status_code == 200
+    return response
+
+
+def _request_count(text, labels):
+    prefix = f"http_requests_total{{{labels}}} "
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return int(line.removeprefix(prefix))
+    return 0
+
+
+def test_metrics_are_exposed_in_the_prometheus_text_format(client_fixture):
+    response = _scrape(client_fixture)
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+    assert 'cache_hits_total{cache="dashboard"}' in response.text
+    assert "# TYPE db_pool_checked_out_connections gauge" in response.text
+
+
+def test_requests_are_labelled_by_route_template(client_fixture):
+    labels = 'method="GET",route="/api/v1/incidents/{incident_id}",status="4xx"'
+    before = _request_count(_scrape(client_fixture).text, labels)
+
+    client_fixture.get("/api/v1/incidents/999999991")
+    client_fixture.get("/api/v1/incidents/999999992")
+    text = _scrape(client_fixture).text
+
+    assert _request_count(text, labels) == before + 2
+    assert "/api/v1/incidents/999999991" not in text
+
+
+def test_unknown_paths_share_one_series(client_fixture):
+    labels = 'method="GET",route="unmatched",status="4xx"'
+    before = _request_count(_scrape(client_fixture).text, labels)
+
+    client_fixture.get("/no/such/path")
+    client_fixture.get("/another/missing/path")
+
+    assert _request_count(_scrape(client_fixture).text, labels) == before + 2
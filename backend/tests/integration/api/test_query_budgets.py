@@ -0,0 +1,89 @@
+import pytest
+
+
+INCIDENT_COUNT = 5
+EVENTS_PER_INCIDENT = 3
+
+
+@pytest.fixture
+def incident_ids(client_fixture):
+    ids = []
+    for n in range(INCIDENT_COUNT):
+        response = client_fixture.post(
+            "/api/v1/incidents",
+            json={
+                "title": f"Budget {n}",
+                "description": "Query budget fixture",
+                "status": "open",
+                "severity": "sev2",
+            },
+        )
+        incident_id = response.json()["id"]
+        for e in range(EVENTS_PER_INCIDENT):
+            client_fixture.post(
+                f"/api/v1/incidents/{incident_id}/events",
+                json={
+                    "event_type": "update",
+                    "message": f"Update {e}",
+                    "occurred_at": "2026-01-23T12:00:00Z",
+                },
+            )
+        ids.append(incident_id)
+    return ids
+
+
+@pytest.mark.parametrize(
+    "path, params, budget",
+    [
+        ("/api/v1/incidents", {}, 2),
+        ("/api/v1/incidents", {"include_latest_events": 2}, 3),
+        ("/api/v1/incidents", {"sort": "last_activity", "limit": 2}, 2),
+        ("/api/v1/events/recent", {}, 1),
+        ("/api/v1/dashboard", {}, 1),
+        ("/api/v1/changes", {}, 3),
+    ],
+)
+def test_list_endpoints_stay_within_query_budget(
+    client_fixture, assert_max_queries, incident_ids, path, params, budget
+):
+    with assert_max_queries(budget):
+        response = client_fixture.get(path, params=params)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize(
+    "path, budget",
+    [
+        ("/api/v1/incidents/{incident_id}", 2),
+        ("/api/v1/incidents/{incident_id}/events", 3),
+        ("/api/v1/incidents/{incident_id}/report", 2),
+    ],
+)
+def test_detail_endpoints_stay_within_query_budget(
+    client_fixture, assert_max_queries, incident_ids, path, budget
+):
+    with assert_max_queries(budget):
+        response = client_fixture.get(path.format(incident_id=incident_ids[0]))
+
+    assert response.status_code == 200
+
+
+def test_batch_get_uses_one_query_however_many_ids(
+    client_fixture, assert_max_queries, incident_ids
+):
+    with assert_max_queries(1):
+        response = client_fixture.post(
+            "/api/v1/incidents:batchGet", json={"ids": incident_ids}
+        )
+
+    assert response.status_code == 200
+
+
+def test_server_timing_reports_request_queries(client_fixture, incident_ids):
+    response = client_fixture.get(f"/api/v1/incidents/{incident_ids[0]}")
+
+    name, duration, description = response.headers["Server-Timing"].split(";")
+    assert name == "db"
+    assert float(duration.removeprefix("dur=")) >= 0
+    assert description.startswith('desc="') and description.endswith(' queries"')
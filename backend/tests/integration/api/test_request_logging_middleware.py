@@ -1,7 +1,7 @@
 import logging
 
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.testclient import TestClient
 
 from backend.api.exception_handlers import register_exception_handlers
@@ -11,7 +11,7 @@ from backend.api.middleware import (
     RequestLoggingMiddleware,
 )
 from backend.core.config import get_settings
-from backend.core.logging import configure_logging
+from backend.core.logging import JsonFormatter, configure_logging
 
 
 REQUEST_LOGGER = "backend.api.request"
@@ -31,26 +31,34 @@ def _request_log_records(caplog):
     ]
 
 
+def _rendered_logs(caplog):
+    # Structured fields only show up once a record is formatted.
+    formatter = JsonFormatter()
+    return "\n".join(formatter.format(record) for record in caplog.records)
+
+
 def _single_request_log(caplog):
     records = _request_log_records(caplog)
     assert len(records) == 1
-    return records[0].getMessage()
+    return records[0]
 
 
 def _assert_log_contains_request(
-    log_text,
+    record,
     *,
     request_id,
     method,
     path,
     status_code,
 ):
-    assert "request completed" in log_text
-    assert f"request_id={request_id}" in log_text
-    assert f"method={method}" in log_text
-    assert f"path={path}" in log_text
-    assert f"status_code={status_code}" in log_text
-    assert "duration_ms=" in log_text
+    assert record.getMessage() == "request completed"
+    assert record.request_id == request_id
+    assert record.method == method
+    assert record.path == path
+    assert record.status_code == status_code
+    assert record.duration_ms >= 0
+    assert record.db_queries >= 0
+    assert record.db_ms >= 0
 
 
 def test_successful_liveness_request_logs_completion(client_fixture, caplog):
@@ -59,9 +67,8 @@ def test_successful_liveness_request_logs_completion(client_fixture, caplog):
     response = client_fixture.get("/health/live")
 
     assert response.status_code == 200
-    log_text = _single_request_log(caplog)
     _assert_log_contains_request(
-        log_text,
+        _single_request_log(caplog),
         request_id=response.headers[REQUEST_ID_HEADER],
         method="GET",
         path="/health/live",
@@ -78,9 +85,7 @@ def test_caller_provided_request_id_appears_in_request_log(client_fixture, caplo
     )
 
     assert response.status_code == 200
-    assert f"request_id={response.headers[REQUEST_ID_HEADER]}" in _single_request_log(
-        caplog
-    )
+    assert _single_request_log(caplog).request_id == "caller-request-id"
 
 
 def test_domain_404_logs_status_and_request_id(client_fixture, caplog):
@@ -89,9 +94,8 @@ def test_domain_404_logs_status_and_request_id(client_fixture, caplog):
     response = client_fixture.get("/api/v1/incidents/999999")
 
     assert response.status_code == 404
-    log_text = _single_request_log(caplog)
     _assert_log_contains_request(
-        log_text,
+        _single_request_log(caplog),
         request_id=response.headers[REQUEST_ID_HEADER],
         method="GET",
         path="/api/v1/incidents/999999",
@@ -128,16 +132,15 @@ def test_auth_401_logs_status_without_api_key(
     )
 
     assert response.status_code == 401
-    log_text = _single_request_log(caplog)
     _assert_log_contains_request(
-        log_text,
+        _single_request_log(caplog),
         request_id=response.headers[REQUEST_ID_HEADER],
         method="GET",
         path="/api/v1/incidents",
         status_code=401,
     )
-    assert "wrong-api-key" not in caplog.text
-    assert api_key not in caplog.text
+    assert "wrong-api-key" not in _rendered_logs(caplog)
+    assert api_key not in _rendered_logs(caplog)
 
 
 def test_validation_422_logs_status(client_fixture, caplog):
@@ -146,9 +149,8 @@ def test_validation_422_logs_status(client_fixture, caplog):
     response = client_fixture.get("/api/v1/incidents", params={"limit": 0})
 
     assert response.status_code == 422
-    log_text = _single_request_log(caplog)
     _assert_log_contains_request(
-        log_text,
+        _single_request_log(caplog),
         request_id=response.headers[REQUEST_ID_HEADER],
         method="GET",
         path="/api/v1/incidents",
@@ -171,9 +173,8 @@ def test_unhandled_500_logs_status_and_request_id(caplog):
         response = client.get("/boom")
 
     assert response.status_code == 500
-    log_text = _single_request_log(caplog)
     _assert_log_contains_request(
-        log_text,
+        _single_request_log(caplog),
         request_id=response.headers[REQUEST_ID_HEADER],
         method="GET",
         path="/boom",
@@ -196,7 +197,7 @@ def test_post_body_content_is_not_logged(client_fixture, caplog):
     )
 
     assert response.status_code == 201
-    assert sensitive_description not in caplog.text
+    assert sensitive_description not in _rendered_logs(caplog)
     _assert_log_contains_request(
         _single_request_log(caplog),
         request_id=response.headers[REQUEST_ID_HEADER],
@@ -215,8 +216,8 @@ def test_query_string_is_not_logged(client_fixture, caplog):
     )
 
     assert response.status_code == 200
-    assert "secret-query-value" not in caplog.text
-    assert "api_key=" not in caplog.text
+    assert "secret-query-value" not in _rendered_logs(caplog)
+    assert "api_key" not in _rendered_logs(caplog)
     _assert_log_contains_request(
         _single_request_log(caplog),
         request_id=response.headers[REQUEST_ID_HEADER],
@@ -224,3 +225,48 @@ def test_query_string_is_not_logged(client_fixture, caplog):
         path="/api/v1/incidents",
         status_code=200,
     )
+
+
+def test_request_log_counts_database_queries(client_fixture, caplog):
+    caplog.set_level(logging.INFO, logger=REQUEST_LOGGER)
+
+    live = client_fixture.get("/health/live")
+    live_log = _single_request_log(caplog)
+    caplog.clear()
+    client_fixture.get("/api/v1/incidents/999999")
+    lookup_log = _single_request_log(caplog)
+
+    assert (live_log.db_queries, live_log.db_ms) == (0, 0)
+    assert live.headers["Server-Timing"] == 'db;dur=0.00;desc="0 queries"'
+    assert lookup_log.db_queries > 0
+
+
+def test_successful_requests_are_sampled(caplog):
+    samples = iter([0.9, 0.1, 0.9])
+    app = FastAPI()
+    app.add_middleware(
+        RequestLoggingMiddleware,
+        success_sample_rate=0.5,
+        sample=lambda: next(samples),
+    )
+
+    @app.get("/ok")
+    def ok():
+        return {}
+
+    @app.get("/missing")
+    def missing():
+        raise HTTPException(status_code=404)
+
+    caplog.set_level(logging.INFO, logger=REQUEST_LOGGER)
+    with TestClient(app) as client:
+        for path in ("/ok", "/ok", "/missing", "/ok"):
+            client.get(path)
+
+    records = _request_log_records(caplog)
+    assert [(record.path, record.status_code) for record in records] == [
+        ("/ok", 200),
+        ("/missing", 404),
+    ]
+    assert records[0].sample_rate == 0.5
+    assert not hasattr(records[1], "sample_rate")
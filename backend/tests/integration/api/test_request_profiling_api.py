@@ -0,0 +1,94 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from backend.benchmarks import dataset
+from backend.core.config import get_settings
+from backend.db.sessions import get_db
+from backend.main import create_app
+
+AUTH_HEADER = {"X-API-Key": "test-api-key"}
+PROFILE_HEADER = {"X-Profile": "1", **AUTH_HEADER}
+
+
+@pytest.fixture
+def profiling_client(settings_fixture, db_session):
+    settings = settings_fixture.model_copy(
+        update={
+            "API_AUTH_ENABLED": True,
+            "API_KEY": "test-api-key",
+            "PROFILING_ENABLED": True,
+            "PROFILING_INTERVAL_MS": 0.2,
+        }
+    )
+    app = create_app(settings)
+    app.dependency_overrides[get_settings] = lambda: settings
+    app.dependency_overrides[get_db] = lambda: db_session
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def report_incident_id(db_session):
+    dataset.load(db_session, events=2000, seed=5)
+    return db_session.execute(
+        text("SELECT id FROM incidents ORDER BY event_count DESC LIMIT 1")
+    ).scalar_one()
+
+
+def test_profiled_request_records_its_threadpool_stacks(
+    profiling_client, report_incident_id
+):
+    response = profiling_client.get(
+        f"/api/v1/incidents/{report_incident_id}/report/markdown",
+        headers=PROFILE_HEADER,
+    )
+    assert response.status_code == 200
+    request_id = response.headers["X-Request-ID"]
+
+    listed = profiling_client.get("/api/v1/admin/profiles", headers=AUTH_HEADER)
+    assert listed.status_code == 200
+    [item] = listed.json()["items"]
+    assert item["request_id"] == request_id
+    assert item["route"] == "/api/v1/incidents/{incident_id}/report/markdown"
+    assert item["status_code"] == 200
+    assert item["samples"] > 0
+
+    profile = profiling_client.get(
+        f"/api/v1/admin/profiles/{request_id}", headers=AUTH_HEADER
+    )
+    assert profile.status_code == 200
+    lines = profile.text.splitlines()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == item["samples"]
+    # Threadpool stacks start at the endpoint that called the use case.
+    assert any(
+        line.startswith("get_incident_report_markdown (")
+        and "IncidentUseCases.get_incident_report" in line
+        for line in lines
+    )
+
+
+def test_requests_without_the_flag_or_the_api_key_are_not_profiled(
+    profiling_client, report_incident_id
+):
+    path = f"/api/v1/incidents/{report_incident_id}/report"
+    profiling_client.get(path, headers=AUTH_HEADER)
+    profiling_client.get(path, headers={"X-Profile": "1", "X-API-Key": "wrong"})
+
+    listed = profiling_client.get("/api/v1/admin/profiles", headers=AUTH_HEADER)
+
+    assert listed.json() == {"enabled": True, "items": []}
+
+
+def test_profiles_are_unavailable_while_profiling_is_disabled(client_fixture):
+    response = client_fixture.get("/api/v1/incidents", headers={"X-Profile": "1"})
+
+    assert response.status_code == 200
+    assert client_fixture.get("/api/v1/admin/profiles").json() == {
+        "enabled": False,
+        "items": [],
+    }
+    missing = client_fixture.get(
+        f"/api/v1/admin/profiles/{response.headers['X-Request-ID']}"
+    )
+    assert missing.status_code == 404
@@ -0,0 +1,38 @@
+from sqlalchemy import event, text
+
+from backend.api.middleware import REQUEST_ID_HEADER
+
+
+def _record_statements(db_session):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_session.connection(), "after_cursor_execute", _record)
+    return statements
+
+
+def test_statements_are_tagged_with_route_use_case_and_request_id(
+    client_fixture, db_session
+):
+    statements = _record_statements(db_session)
+
+    response = client_fixture.get(
+        "/api/v1/incidents/999999", headers={REQUEST_ID_HEADER: "trace-me"}
+    )
+
+    assert response.status_code == 404
+    [lookup] = [s for s in statements if "FROM incidents" in s]
+    assert lookup.endswith(
+        "/*action='get_incident',controller='IncidentUseCases',"
+        "request_id='trace-me',route='/api/v1/incidents/{incident_id}'*/"
+    )
+
+
+def test_statements_outside_requests_are_not_tagged(db_session):
+    statements = _record_statements(db_session)
+
+    db_session.execute(text("SELECT 1"))
+
+    assert statements == ["SELECT 1"]
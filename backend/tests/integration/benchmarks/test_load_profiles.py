@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from backend.benchmarks import dataset
+from backend.benchmarks.load import PROFILES, open_client, run_profile, sustained
+
+
+def _run(app, profile, **kwargs):
+    async def run():
+        async with open_client(None, api_key="", concurrency=1, app=app) as client:
+            return await run_profile(client, profile, **kwargs)
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("name", sorted(PROFILES))
+def test_profiles_run_cleanly_in_process(app_fixture, db_session, name):
+    dataset.load(db_session, events=300, seed=1)
+    profile = PROFILES[name]
+
+    # One virtual user: every request shares the test's database session.
+    [result] = _run(app_fixture, profile, levels=[1], seconds=0.3)
+
+    assert result.requests > 0
+    assert result.errors == 0, result.error_kinds
+    assert set(result.endpoints) <= {endpoint.name for endpoint in profile.endpoints}
+    assert result.p50_ms <= result.p95_ms <= result.p99_ms
+    assert sustained([result], p99_ms=result.p99_ms) == result
+    assert sustained([result], p99_ms=result.p99_ms / 2) is None
+
+
+def test_profiles_need_a_loaded_dataset(app_fixture):
+    with pytest.raises(ValueError, match="load a dataset"):
+        _run(app_fixture, PROFILES["dashboard-polling"], levels=[1], seconds=0.1)
@@ -0,0 +1,126 @@
+import inspect
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import text
+
+from backend.adapters.persistence.sqlalchemy.uow import SqlAlchemyUnitOfWork
+
+from backend.benchmarks import dataset
+from backend.benchmarks.results import read_run
+from backend.benchmarks.usecases import CASES, Workload, main, run_cases
+from backend.domain.incidents.enums import Severity
+from backend.services.incidents.commands import (
+    CreateIncidentCmd,
+    CreateTimelineEventCmd,
+)
+from backend.services.incidents.usecases import IncidentUseCases
+
+
+def test_every_use_case_and_the_report_renderer_is_benchmarked():
+    use_cases = {
+        name
+        for name, member in vars(IncidentUseCases).items()
+        if not name.startswith("_") and inspect.isfunction(member)
+    }
+
+    assert {case.name for case in CASES} == use_cases | {
+        "render_incident_report_markdown"
+    }
+
+
+def test_dataset_load_copies_a_consistent_dataset(db_session):
+    size = dataset.load(db_session, events=500, seed=3)
+
+    assert size.events == 500
+    assert dataset.dataset_size(db_session) == size
+    # The denormalized activity columns match the copied timelines.
+    assert db_session.execute(
+        text(
+            """
+            SELECT count(*) FROM incidents AS i
+            WHERE i.event_count <> (
+                SELECT count(*) FROM timeline_events WHERE incident_id = i.id
+            ) OR i.last_event_at IS DISTINCT FROM (
+                SELECT max(created_at) FROM timeline_events WHERE incident_id = i.id
+            )
+            """
+        )
+    ).scalar_one() == 0
+    assert db_session.execute(
+        text("SELECT count(*) FROM change_log")
+    ).scalar_one() == size.incidents + size.events
+    assert db_session.execute(
+        text("SELECT sum(incident_count) FROM incident_hourly_rollups")
+    ).scalar_one() == size.incidents
+    with pytest.raises(dataset.DatasetNotEmptyError):
+        dataset.load(db_session, events=500)
+
+
+def test_rows_created_after_a_load_get_fresh_ids(db_session):
+    dataset.load(db_session, events=100)
+    [last_event_id] = db_session.execute(
+        text("SELECT max(id) FROM timeline_events")
+    ).one()
+
+    with SqlAlchemyUnitOfWork(session=db_session, close_on_exit=False) as uow:
+        incident = IncidentUseCases(uow).create_incident(
+            CreateIncidentCmd(
+                title="After the load", description="New", severity=Severity.SEV2
+            )
+        )
+        event = IncidentUseCases(uow).create_event(
+            incident.id,
+            CreateTimelineEventCmd(
+                occurred_at=datetime.now(timezone.utc),
+                event_type="note",
+                message="New",
+            ),
+        )
+
+    assert event.id > last_event_id
+
+
+def test_every_case_runs_against_a_loaded_dataset(db_session):
+    dataset.load(db_session, events=200)
+    workload = Workload.sample(db_session)
+
+    results = run_cases(lambda: db_session, workload, iterations=2)
+
+    assert [result.name for result in results] == [case.name for case in CASES]
+    assert all(result.iterations == 2 for result in results)
+    assert all(result.p99_ms >= result.p50_ms > 0 for result in results)
+
+
+def test_run_writes_results_that_compare_against_themselves(db_session, tmp_path):
+    size = dataset.load(db_session, events=200)
+    output = tmp_path / "results.json"
+
+    exit_code = main(
+        [
+            "run",
+            "--iterations",
+            "1",
+            "--warmup",
+            "0",
+            "--case",
+            "get_incident",
+            "--case",
+            "list_incidents",
+            "--label",
+            "baseline",
+            "--output",
+            str(output),
+        ],
+        session_factory=lambda: db_session,
+    )
+
+    run = read_run(output)
+    assert exit_code == 0
+    assert run.label == "baseline"
+    assert run.dataset == {"incidents": size.incidents, "events": 200}
+    assert [result.name for result in run.results] == [
+        "list_incidents",
+        "get_incident",
+    ]
+    assert main(["compare", str(output), str(output)]) == 0
@@ -1,19 +1,25 @@
 import os
+from contextlib import contextmanager
+
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import Session
 from alembic.config import Config
 from alembic import command
 
+from backend.db import query_stats, sql_comments
 from backend.db.sessions import get_db
 
 @pytest.fixture(scope="session")
 def engine(settings_fixture):
-    eng = create_engine(
-        settings_fixture.DATABASE_URL,
-        echo=False,
-        pool_pre_ping=True
+    eng = query_stats.instrument_engine(
+        create_engine(
+            settings_fixture.DATABASE_URL,
+            echo=False,
+            pool_pre_ping=True
+        )
     )
+    sql_comments.instrument_engine(eng)
 
     yield eng
     eng.dispose()
@@ -55,4 +61,36 @@ def db_setup(app_fixture, db_session, dependency_override_guard):
 @pytest.fixture(autouse=True)
 def assert_clean_incidents_table(db_session):
     count = db_session.execute(text("SELECT COUNT(*) FROM incidents")).scalar_one()
-    assert count == 0, f"incidents table not clean at test start, found {count} row(s)"
\ No newline at end of file
+    assert count == 0, f"incidents table not clean at test start, found {count} row(s)"
+
+
+_SAVEPOINT_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+@pytest.fixture
+def assert_max_queries(db_session):
+    """Fail when the block runs more than ``limit`` SQL statements.
+
+    Query budgets per endpoint make N+1 regressions fail the suite. Savepoints
+    opened by the test transaction do not count.
+    """
+
+    @contextmanager
+    def _assert(limit: int):
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if not statement.lstrip().upper().startswith(_SAVEPOINT_STATEMENTS):
+                statements.append(statement)
+
+        connection = db_session.connection()
+        event.listen(connection, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(connection, "before_cursor_execute", _record)
+        assert len(statements) <= limit, (
+            f"expected at most {limit} queries, ran {len(statements)}:\n"
+            + "\n\n".join(statements)
+        )
+
+    return _assert
@@ -0,0 +1,179 @@
+import asyncio
+import json
+import uuid
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import event as sqlalchemy_event
+
+from backend.adapters.notifications.postgres_listener import (
+    PostgresChangeListener,
+    libpq_dsn,
+)
+from backend.adapters.persistence.sqlalchemy.notifications import (
+    CHANGES_CHANNEL,
+    encode_change,
+)
+from backend.adapters.persistence.sqlalchemy.uow import SqlAlchemyUnitOfWork
+from backend.domain.incidents.enums import ChangeAction, ChangeEntity, Severity, Status
+from backend.domain.incidents.read_models import IncidentChange
+
+
+def _incident_data(title="Notified Incident"):
+    return {
+        "title": title,
+        "description": "Something went wrong",
+        "severity": Severity.SEV2,
+        "status": Status.OPEN,
+    }
+
+
+def _record_notifications(db_session):
+    notifications = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if "pg_notify" in statement:
+            channel, payload = sorted(
+                parameters.values(), key=lambda value: value != CHANGES_CHANNEL
+            )
+            notifications.append((channel, json.loads(payload)))
+
+    sqlalchemy_event.listen(db_session.connection(), "before_cursor_execute", _record)
+    return notifications
+
+
+def test_uow_commit_notifies_every_recorded_change(db_session):
+    notifications = _record_notifications(db_session)
+
+    with SqlAlchemyUnitOfWork(session=db_session, close_on_exit=False) as uow:
+        incident = uow.incidents.create(_incident_data())
+        event = uow.events.create(
+            incident.id,
+            {
+                "occurred_at": incident.created_at,
+                "event_type": "update",
+                "message": "Restarting the primary node.",
+            },
+        )
+        uow.incidents.update(incident.id, {"status": Status.INVESTIGATING})
+        assert notifications == []
+
+    payloads = [payload for _, payload in notifications]
+    seqs = [payload.pop("seq") for payload in payloads]
+    assert {channel for channel, _ in notifications} == {CHANGES_CHANNEL}
+    assert seqs == sorted(seqs) and len(set(seqs)) == 4
+    assert payloads == [
+        {"entity": "incident", "action": "created", "incident_id": incident.id, "id": incident.id},
+        {"entity": "incident", "action": "updated", "incident_id": incident.id, "id": incident.id},
+        {"entity": "event", "action": "created", "incident_id": incident.id, "id": event.id},
+        {"entity": "incident", "action": "updated", "incident_id": incident.id, "id": incident.id},
+    ]
+
+
+def test_uow_commit_appends_changes_to_the_log(db_session):
+    with SqlAlchemyUnitOfWork(session=db_session, close_on_exit=False) as uow:
+        since = uow.changes.latest_seq()
+        incident = uow.incidents.create(_incident_data())
+        uow.incidents.delete(incident.id)
+        assert uow.changes.latest_seq() == since
+
+    with SqlAlchemyUnitOfWork(session=db_session, close_on_exit=False) as uow:
+        logged = uow.changes.list_since(since, limit=10)
+        latest = uow.changes.latest_seq()
+
+    assert [(c.entity, c.action, c.id) for c in logged] == [
+        (ChangeEntity.INCIDENT, ChangeAction.CREATED, incident.id),
+        (ChangeEntity.INCIDENT, ChangeAction.DELETED, incident.id),
+    ]
+    assert since < logged[0].seq < logged[1].seq
+    assert latest == logged[-1].seq
+
+
+def test_event_writes_log_the_parent_incident_as_updated(db_session):
+    with SqlAlchemyUnitOfWork(session=db_session, close_on_exit=False) as uow:
+        incident = uow.incidents.create(_incident_data())
+    with SqlAlchemyUnitOfWork(session=db_session, close_on_exit=False) as uow:
+        since = uow.changes.latest_seq()
+
+    with SqlAlchemyUnitOfWork(session=db_session, close_on_exit=False) as uow:
+        event = uow.events.create(
+            incident.id,
+            {
+                "occurred_at": incident.created_at,
+                "event_type": "note",
+                "message": "Paged the database on-call.",
+            },
+        )
+    with SqlAlchemyUnitOfWork(session=db_session, close_on_exit=False) as uow:
+        uow.events.delete(incident.id, event.id)
+    with SqlAlchemyUnitOfWork(session=db_session, close_on_exit=False) as uow:
+        logged = uow.changes.list_since(since, limit=10)
+
+    # Creating and deleting an event changes the incident's event_count and
+    # last_event_at, so clients syncing incidents must refetch it.
+    assert [(c.entity, c.action, c.id) for c in logged] == [
+        (ChangeEntity.INCIDENT, ChangeAction.UPDATED, incident.id),
+        (ChangeEntity.EVENT, ChangeAction.CREATED, event.id),
+        (ChangeEntity.INCIDENT, ChangeAction.UPDATED, incident.id),
+        (ChangeEntity.EVENT, ChangeAction.DELETED, event.id),
+    ]
+
+
+def test_uow_rollback_discards_recorded_changes(db_session):
+    notifications = _record_notifications(db_session)
+
+    try:
+        with SqlAlchemyUnitOfWork(session=db_session, close_on_exit=False) as uow:
+            uow.incidents.create(_incident_data(title="Rolled Back"))
+            raise RuntimeError("force rollback")
+    except RuntimeError:
+        pass
+    with SqlAlchemyUnitOfWork(session=db_session, close_on_exit=False) as uow:
+        kept = uow.incidents.create(_incident_data(title="Committed"))
+
+    assert [payload["id"] for _, payload in notifications] == [kept.id]
+
+
+def test_listener_fans_out_committed_notifications(settings_fixture):
+    dsn = libpq_dsn(settings_fixture.DATABASE_URL)
+    channel = f"test_changes_{uuid.uuid4().hex}"
+    changes = [
+        IncidentChange(ChangeEntity.EVENT, ChangeAction.CREATED, incident_id=1, id=10),
+        IncidentChange(ChangeEntity.INCIDENT, ChangeAction.DELETED, incident_id=2, id=2),
+    ]
+
+    async def scenario():
+        listener = PostgresChangeListener(dsn, channel=channel)
+        await listener.start()
+        assert listener.listening
+        everything = listener.subscribe()
+        one_incident = listener.subscribe(incident_id=2)
+
+        sender = psycopg2.connect(dsn)
+        sender.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        try:
+            with sender.cursor() as cursor:
+                for change in changes:
+                    cursor.execute(
+                        "SELECT pg_notify(%s, %s)", (channel, encode_change(change))
+                    )
+        finally:
+            sender.close()
+
+        async def take(subscription, count):
+            return [await subscription.get() for _ in range(count)]
+
+        received = await asyncio.wait_for(
+            asyncio.gather(take(everything, 2), take(one_incident, 1)), timeout=5
+        )
+        listener.unsubscribe(everything)
+        listener.unsubscribe(one_incident)
+        remaining = listener.subscriber_count
+        await listener.stop()
+        return received, remaining
+
+    (everything, one_incident), remaining = asyncio.run(scenario())
+
+    assert everything == changes
+    assert one_incident == [changes[1]]
+    assert remaining == 0
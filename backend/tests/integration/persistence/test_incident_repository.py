@@ -1,11 +1,24 @@
 from datetime import datetime, timezone
 
+import pytest
+from sqlalchemy import event as sqlalchemy_event
+
 from backend.adapters.persistence.sqlalchemy.repositories import (
     SqlAlchemyIncidentRepository,
+    SqlAlchemyTimelineEventRepository,
 )
+from backend.db.models.incident import Incident as IncidentModel
 from backend.db.models.timeline_event import TimelineEvent as TimelineEventModel
 from backend.domain.incidents.entities import Incident
-from backend.domain.incidents.enums import Severity, Status
+from backend.services.incidents.pagination import incident_sort_key
+from backend.domain.incidents.enums import (
+    IncidentSort,
+    Severity,
+    SortDirection,
+    StatsBucket,
+    Status,
+    TimelineOrder,
+)
 
 
 def _repo(db_session):
@@ -161,6 +174,200 @@ def test_list_incidents_filters_by_status_and_severity(db_session):
     assert repo.count(status=Status.OPEN, severity=Severity.SEV1) == 1
 
 
+def test_list_incidents_matches_any_of_several_statuses_and_severities(db_session):
+    repo = _repo(db_session)
+    open_sev1 = repo.create(
+        _incident_data(title="Open SEV1", status=Status.OPEN, severity=Severity.SEV1)
+    )
+    investigating_sev2 = repo.create(
+        _incident_data(
+            title="Investigating SEV2",
+            status=Status.INVESTIGATING,
+            severity=Severity.SEV2,
+        )
+    )
+    repo.create(
+        _incident_data(
+            title="Resolved SEV1",
+            status=Status.RESOLVED,
+            severity=Severity.SEV1,
+        )
+    )
+    repo.create(
+        _incident_data(title="Open SEV4", status=Status.OPEN, severity=Severity.SEV4)
+    )
+    filters = {
+        "status": [Status.OPEN, Status.INVESTIGATING],
+        "severity": [Severity.SEV1, Severity.SEV2],
+    }
+
+    incidents = repo.list(**filters)
+
+    assert [incident.id for incident in incidents] == [
+        investigating_sev2.id,
+        open_sev1.id,
+    ]
+    assert repo.count(**filters) == 2
+
+
+def test_list_incidents_filters_by_created_window(db_session):
+    repo = _repo(db_session)
+
+    def day(n):
+        return datetime(2026, 1, n, tzinfo=timezone.utc)
+
+    created = {
+        n: repo.create({**_incident_data(title=f"Day {n}"), "created_at": day(n)})
+        for n in (1, 2, 3, 4)
+    }
+    window = {"created_after": day(2), "created_before": day(4)}
+
+    incidents = repo.list(**window)
+
+    assert [incident.id for incident in incidents] == [created[3].id, created[2].id]
+    assert repo.count(**window) == 2
+
+
+def test_list_incidents_active_only_excludes_resolved(db_session):
+    repo = _repo(db_session)
+    open_incident = repo.create(_incident_data(title="Open", status=Status.OPEN))
+    repo.create(_incident_data(title="Resolved", status=Status.RESOLVED))
+    investigating = repo.create(
+        _incident_data(title="Investigating", status=Status.INVESTIGATING)
+    )
+
+    incidents = repo.list(active_only=True)
+
+    assert [incident.id for incident in incidents] == [
+        investigating.id,
+        open_incident.id,
+    ]
+    assert repo.count(active_only=True) == 2
+    assert repo.list(active_only=True, status=Status.RESOLVED) == []
+
+
+def test_list_incidents_sorts_by_last_activity(db_session):
+    repo = _repo(db_session)
+
+    def at(hour):
+        return datetime(2026, 1, 1, hour, tzinfo=timezone.utc)
+
+    quiet = repo.create({**_incident_data(title="Quiet"), "created_at": at(12)})
+    busy = repo.create({**_incident_data(title="Busy"), "created_at": at(9)})
+    idle = repo.create({**_incident_data(title="Idle"), "created_at": at(10)})
+    SqlAlchemyTimelineEventRepository(db_session).create(
+        busy.id,
+        {
+            "occurred_at": at(14),
+            "event_type": "update",
+            "message": "Mitigated.",
+            "created_at": at(14),
+        },
+    )
+
+    incidents = repo.list(sort=IncidentSort.LAST_ACTIVITY)
+
+    assert [incident.id for incident in incidents] == [busy.id, quiet.id, idle.id]
+    assert [incident.id for incident in repo.list()] == [quiet.id, idle.id, busy.id]
+
+
+@pytest.mark.parametrize("direction", list(SortDirection))
+@pytest.mark.parametrize("sort", list(IncidentSort))
+def test_list_incidents_keyset_pages_match_the_full_order(db_session, sort, direction):
+    repo = _repo(db_session)
+    events = SqlAlchemyTimelineEventRepository(db_session)
+
+    def at(hour):
+        return datetime(2026, 1, 1, hour, tzinfo=timezone.utc)
+
+    for n in range(9):
+        incident = repo.create(
+            {
+                **_incident_data(severity=list(Severity)[n % 4]),
+                "created_at": at(n % 3),
+                "updated_at": at(n % 4 + 5),
+            }
+        )
+        if n % 2:
+            events.create(
+                incident.id,
+                {
+                    "occurred_at": at(n),
+                    "event_type": "update",
+                    "message": "Progress.",
+                    "created_at": at(n + 10),
+                },
+            )
+
+    def key(incident):
+        return (*incident_sort_key(incident, sort), incident.id)
+
+    full = repo.list(sort=sort, direction=direction)
+    assert [key(i) for i in full] == sorted(
+        (key(i) for i in full), reverse=direction == SortDirection.DESC
+    )
+
+    seen, after = [], None
+    while page := repo.list(sort=sort, direction=direction, after=after, limit=2):
+        seen.extend(page)
+        after = key(page[-1])
+
+    assert [i.id for i in seen] == [i.id for i in full]
+
+
+def test_stats_returns_status_severity_matrix_and_created_buckets(db_session):
+    repo = _repo(db_session)
+
+    def at(day, hour):
+        return datetime(2026, 1, day, hour, 30, tzinfo=timezone.utc)
+
+    for day, hour, status, severity in (
+        (1, 9, Status.OPEN, Severity.SEV1),
+        (1, 9, Status.OPEN, Severity.SEV1),
+        (1, 17, Status.RESOLVED, Severity.SEV3),
+        (2, 9, Status.INVESTIGATING, Severity.SEV2),
+        (5, 9, Status.OPEN, Severity.SEV4),
+    ):
+        repo.create(
+            {
+                **_incident_data(status=status, severity=severity),
+                "created_at": at(day, hour),
+            }
+        )
+    window = {
+        "created_after": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "created_before": datetime(2026, 1, 3, tzinfo=timezone.utc),
+    }
+
+    by_day = repo.stats(**window)
+    by_hour = repo.stats(bucket=StatsBucket.HOUR, **window)
+
+    counts = {(c.status, c.severity): c.count for c in by_day.by_status_severity}
+    assert by_day.total == 4
+    assert len(counts) == len(Status) * len(Severity)
+    assert counts[(Status.OPEN, Severity.SEV1)] == 2
+    assert counts[(Status.RESOLVED, Severity.SEV3)] == 1
+    assert counts[(Status.INVESTIGATING, Severity.SEV2)] == 1
+    assert counts[(Status.OPEN, Severity.SEV4)] == 0
+    assert [(c.bucket_start, c.count) for c in by_day.created] == [
+        (datetime(2026, 1, 1, tzinfo=timezone.utc), 3),
+        (datetime(2026, 1, 2, tzinfo=timezone.utc), 1),
+    ]
+    assert [(c.bucket_start, c.count) for c in by_hour.created] == [
+        (datetime(2026, 1, 1, 9, tzinfo=timezone.utc), 2),
+        (datetime(2026, 1, 1, 17, tzinfo=timezone.utc), 1),
+        (datetime(2026, 1, 2, 9, tzinfo=timezone.utc), 1),
+    ]
+
+
+def test_stats_on_empty_table_returns_zero_matrix(db_session):
+    stats = _repo(db_session).stats()
+
+    assert stats.total == 0
+    assert stats.created == []
+    assert {c.count for c in stats.by_status_severity} == {0}
+
+
 def test_update_incident_persists_changes(db_session):
     repo = _repo(db_session)
     created = repo.create(_incident_data(title="Original Title"))
@@ -246,7 +453,267 @@ def test_get_with_events_returns_incident_with_events(db_session):
     assert incident.events[0].message == "Restarting the primary node."
 
 
+def _record_statements(db_session, operation):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    connection = db_session.connection()
+    sqlalchemy_event.listen(connection, "before_cursor_execute", _record)
+    try:
+        result = operation()
+    finally:
+        sqlalchemy_event.remove(connection, "before_cursor_execute", _record)
+    return result, statements
+
+
+def test_get_many_fetches_all_requested_incidents_in_one_query(db_session):
+    repo = _repo(db_session)
+    created = [repo.create(_incident_data(title=f"Batch {n}")) for n in range(5)]
+    wanted = [created[3].id, created[0].id, 999_999]
+
+    incidents, statements = _record_statements(
+        db_session, lambda: repo.get_many(wanted)
+    )
+
+    assert sorted(i.id for i in incidents) == sorted([created[3].id, created[0].id])
+    assert all(i.events == [] for i in incidents)
+    assert len(statements) == 1
+    assert "= ANY (" in statements[0]
+
+
+def _bigint_incident(db_session, title="Beyond int4"):
+    model = IncidentModel(id=2**31 + 7, **_incident_data(title=title))
+    db_session.add(model)
+    db_session.flush()
+    return model
+
+
+def test_get_many_binds_ids_beyond_the_int4_range(db_session):
+    big = _bigint_incident(db_session)
+
+    incidents = _repo(db_session).get_many([big.id, 2**40])
+
+    assert [i.id for i in incidents] == [big.id]
+
+
+def test_get_many_with_events_adds_a_single_events_query(db_session):
+    repo = _repo(db_session)
+    first = repo.create(_incident_data(title="Batch With Events"))
+    second = repo.create(_incident_data(title="Batch Without Events"))
+    for n in range(3):
+        db_session.add(
+            TimelineEventModel(
+                incident_id=first.id,
+                occurred_at=datetime(2026, 1, 23, 12, n, tzinfo=timezone.utc),
+                event_type="update",
+                message=f"Update {n}",
+                created_at=datetime(2026, 1, 23, 12, n, tzinfo=timezone.utc),
+            )
+        )
+    db_session.flush()
+    db_session.expire_all()
+
+    incidents, statements = _record_statements(
+        db_session,
+        lambda: repo.get_many([first.id, second.id], with_events=True),
+    )
+
+    by_id = {i.id: i for i in incidents}
+    assert [e.message for e in by_id[first.id].events] == [
+        "Update 2",
+        "Update 1",
+        "Update 0",
+    ]
+    assert by_id[second.id].events == []
+    assert len(statements) == 2
+
+
+def test_list_embeds_latest_events_for_the_page_in_one_query(db_session):
+    repo = _repo(db_session)
+    busy = repo.create(_incident_data(title="Busy"))
+    quiet = repo.create(_incident_data(title="Quiet"))
+    for n in range(5):
+        db_session.add(
+            TimelineEventModel(
+                incident_id=busy.id,
+                occurred_at=datetime(2026, 1, 23, 12, n, tzinfo=timezone.utc),
+                event_type="update",
+                message=f"Update {n}",
+                created_at=datetime(2026, 1, 23, 12, n, tzinfo=timezone.utc),
+            )
+        )
+    db_session.flush()
+
+    incidents, statements = _record_statements(
+        db_session, lambda: repo.list(include_latest_events=2)
+    )
+
+    by_id = {i.id: i for i in incidents}
+    assert [e.message for e in by_id[busy.id].events] == ["Update 4", "Update 3"]
+    assert by_id[quiet.id].events == []
+    assert len(statements) == 2
+    assert "LATERAL" in statements[1]
+    assert all(i.events == [] for i in repo.list())
+
+
+def test_list_embeds_latest_events_for_ids_beyond_the_int4_range(db_session):
+    big = _bigint_incident(db_session, title="Busy beyond int4")
+    db_session.add(
+        TimelineEventModel(
+            incident_id=big.id,
+            occurred_at=datetime(2026, 1, 23, 12, 0, tzinfo=timezone.utc),
+            event_type="update",
+            message="Still busy",
+        )
+    )
+    db_session.flush()
+
+    incidents = _repo(db_session).list(include_latest_events=1)
+
+    [listed] = [i for i in incidents if i.id == big.id]
+    assert [e.message for e in listed.events] == ["Still busy"]
+
+
+def test_dashboard_reads_active_incidents_counts_and_recent_events_in_one_query(
+    db_session,
+):
+    repo = _repo(db_session)
+
+    def at(minute):
+        return datetime(2026, 1, 23, 12, minute, tzinfo=timezone.utc)
+
+    older = repo.create({**_incident_data(title="Older"), "created_at": at(0)})
+    repo.create(
+        {
+            **_incident_data(title="Resolved", status=Status.RESOLVED),
+            "created_at": at(1),
+        }
+    )
+    newer = repo.create(
+        {
+            **_incident_data(title="Newer", severity=Severity.SEV1),
+            "created_at": at(2),
+        }
+    )
+    events = SqlAlchemyTimelineEventRepository(db_session)
+    for n in range(4):
+        events.create(
+            older.id if n % 2 else newer.id,
+            {
+                "occurred_at": at(n),
+                "event_type": "update",
+                "message": f"Update {n}",
+                "created_at": at(10 + n),
+            },
+        )
+
+    snapshot, statements = _record_statements(
+        db_session, lambda: repo.dashboard(active_limit=5, recent_events=3)
+    )
+
+    assert len(statements) == 1
+    assert [i.title for i in snapshot.active_incidents] == ["Newer", "Older"]
+    assert snapshot.active_incidents[0] == Incident(
+        id=newer.id,
+        title="Newer",
+        description=None,
+        severity=Severity.SEV1,
+        status=Status.OPEN,
+        created_at=at(2),
+        updated_at=newer.updated_at,
+        event_count=2,
+        last_event_at=at(12),
+    )
+    counts = {(c.status, c.severity): c.count for c in snapshot.by_status_severity}
+    assert len(counts) == len(Status) * len(Severity)
+    assert counts[(Status.OPEN, Severity.SEV2)] == 1
+    assert counts[(Status.OPEN, Severity.SEV1)] == 1
+    assert counts[(Status.RESOLVED, Severity.SEV2)] == 1
+    assert sum(counts.values()) == 3
+    assert [e.message for e in snapshot.recent_events] == [
+        "Update 3",
+        "Update 2",
+        "Update 1",
+    ]
+    assert snapshot.recent_events[0].incident_id == older.id
+    assert snapshot.recent_events[0].created_at == at(13)
+
+
+def test_dashboard_on_empty_tables_returns_zero_matrix(db_session):
+    snapshot = _repo(db_session).dashboard()
+
+    assert snapshot.active_incidents == []
+    assert snapshot.recent_events == []
+    assert {c.count for c in snapshot.by_status_severity} == {0}
+
+
+def test_sparse_list_and_get_load_only_requested_columns(db_session):
+    repo = _repo(db_session)
+    created = repo.create(
+        _incident_data(title="Sparse", description="Long description " * 50)
+    )
+    db_session.expire_all()
+
+    [listed], statements = _record_statements(
+        db_session, lambda: repo.list(fields=["status", "severity"])
+    )
+    fetched = repo.get(created.id, fields=["title"])
+
+    assert (listed.id, listed.status, listed.severity) == (
+        created.id,
+        Status.OPEN,
+        Severity.SEV2,
+    )
+    # created_at is kept for the keyset cursor of the default sort.
+    assert listed.created_at == created.created_at
+    assert listed.title is None and listed.description is None
+    projection = statements[0].split(" FROM ")[0]
+    assert "incidents.description" not in projection
+    assert "incidents.title" not in projection
+    assert fetched.title == "Sparse"
+    assert fetched.description is None
+    assert fetched.status is None
+
+
 def test_get_with_events_missing_returns_none(db_session):
     repo = _repo(db_session)
 
     assert repo.get_with_events(999) is None
+
+
+def test_get_with_events_orders_events_by_requested_timeline_order(db_session):
+    repo = _repo(db_session)
+    created = repo.create(_incident_data(title="Ordered Report Incident"))
+    occurred_late = TimelineEventModel(
+        incident_id=created.id,
+        occurred_at=datetime(2026, 1, 23, 14, 30, tzinfo=timezone.utc),
+        event_type="update",
+        message="Recorded first, happened last.",
+    )
+    db_session.add(occurred_late)
+    db_session.flush()
+    occurred_early = TimelineEventModel(
+        incident_id=created.id,
+        occurred_at=datetime(2026, 1, 23, 14, 2, tzinfo=timezone.utc),
+        event_type="update",
+        message="Recorded last, happened first.",
+    )
+    db_session.add(occurred_early)
+    db_session.flush()
+
+    by_created = repo.get_with_events(created.id)
+    by_occurred = repo.get_with_events(
+        created.id,
+        events_order_by=TimelineOrder.OCCURRED_AT,
+    )
+
+    assert [event.id for event in by_created.events] == [
+        occurred_early.id,
+        occurred_late.id,
+    ]
+    assert [event.id for event in by_occurred.events] == [
+        occurred_late.id,
+        occurred_early.id,
+    ]
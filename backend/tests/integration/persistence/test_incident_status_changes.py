@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from backend.adapters.persistence.sqlalchemy.repositories import (
+    SqlAlchemyIncidentRepository,
+)
+from backend.db.models.incident_status_change import IncidentStatusChange
+from backend.domain.incidents.enums import Severity, Status
+
+
+def _repo(db_session):
+    return SqlAlchemyIncidentRepository(db_session)
+
+
+def _create(repo, *, created_at=None, severity=Severity.SEV2, status=Status.OPEN):
+    data = {
+        "title": "Status History Incident",
+        "description": "Tracks status transitions",
+        "severity": severity,
+        "status": status,
+    }
+    if created_at is not None:
+        data["created_at"] = created_at
+    return repo.create(data)
+
+
+def _history(db_session, incident_id):
+    return db_session.execute(
+        select(IncidentStatusChange.from_status, IncidentStatusChange.to_status)
+        .where(IncidentStatusChange.incident_id == incident_id)
+        .order_by(IncidentStatusChange.id)
+    ).all()
+
+
+def _transition(db_session, incident_id, from_status, to_status, changed_at):
+    db_session.add(
+        IncidentStatusChange(
+            incident_id=incident_id,
+            from_status=from_status,
+            to_status=to_status,
+            changed_at=changed_at,
+        )
+    )
+    db_session.flush()
+
+
+def test_create_and_status_updates_append_history_rows(db_session):
+    repo = _repo(db_session)
+    incident = _create(repo)
+
+    repo.update(incident.id, {"status": Status.INVESTIGATING})
+    repo.update(incident.id, {"title": "Renamed without a status change"})
+    repo.update(incident.id, {"status": Status.RESOLVED})
+
+    assert _history(db_session, incident.id) == [
+        (None, Status.OPEN),
+        (Status.OPEN, Status.INVESTIGATING),
+        (Status.INVESTIGATING, Status.RESOLVED),
+    ]
+
+
+def test_response_times_returns_percentiles_per_severity(db_session):
+    repo = _repo(db_session)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for minutes in (10, 20, 30, 40):
+        incident = _create(repo, created_at=start, severity=Severity.SEV1)
+        _transition(
+            db_session,
+            incident.id,
+            Status.OPEN,
+            Status.INVESTIGATING,
+            start + timedelta(minutes=minutes),
+        )
+        _transition(
+            db_session,
+            incident.id,
+            Status.INVESTIGATING,
+            Status.RESOLVED,
+            start + timedelta(hours=1, minutes=minutes),
+        )
+    _create(repo, created_at=start, severity=Severity.SEV1)
+    outside = _create(repo, created_at=start + timedelta(days=40), severity=Severity.SEV1)
+    _transition(
+        db_session,
+        outside.id,
+        Status.OPEN,
+        Status.INVESTIGATING,
+        start + timedelta(days=41),
+    )
+
+    by_severity = {
+        item.severity: item
+        for item in repo.response_times(
+            created_after=start,
+            created_before=start + timedelta(days=31),
+        )
+    }
+
+    assert list(by_severity) == list(Severity)
+    sev1 = by_severity[Severity.SEV1]
+    assert sev1.time_to_acknowledge.count == 4
+    assert sev1.time_to_acknowledge.p50 == pytest.approx(25 * 60)
+    assert sev1.time_to_acknowledge.p90 == pytest.approx(37 * 60)
+    assert sev1.time_to_resolve.count == 4
+    assert sev1.time_to_resolve.p50 == pytest.approx(85 * 60)
+    assert sev1.time_to_resolve.p99 == pytest.approx(99.7 * 60)
+    assert by_severity[Severity.SEV4].time_to_acknowledge.count == 0
+    assert by_severity[Severity.SEV4].time_to_acknowledge.p50 is None
+
+
+def test_response_times_ignore_incidents_created_past_open(db_session):
+    repo = _repo(db_session)
+    _create(repo, status=Status.RESOLVED)
+
+    sev2 = {item.severity: item for item in repo.response_times()}[Severity.SEV2]
+
+    assert sev2.time_to_acknowledge.count == 0
+    assert sev2.time_to_resolve.count == 0
@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+from backend.db.query_stats import current_query_stats, track_queries
+
+
+def test_tracked_statements_are_counted_and_timed(db_session):
+    with track_queries("req-1") as stats:
+        db_session.execute(text("SELECT 1"))
+        db_session.execute(text("SELECT pg_sleep(0.01)"))
+        assert current_query_stats() is stats
+
+    assert stats.request_id == "req-1"
+    assert stats.count == 2
+    assert stats.duration_ms >= 10
+    assert current_query_stats() is None
+
+
+def test_statements_outside_a_request_are_not_counted(db_session):
+    with track_queries("req-2") as stats:
+        pass
+    db_session.execute(text("SELECT 1"))
+
+    assert stats.count == 0
+
+
+def test_failed_statements_are_counted(db_session):
+    with track_queries("req-3") as stats:
+        with pytest.raises(ProgrammingError):
+            with db_session.begin_nested():
+                db_session.execute(text("SELECT * FROM no_such_table"))
+        db_session.execute(text("SELECT 1"))
+
+    assert stats.count >= 2
+    assert not db_session.connection().info.get("query_stats_start")
@@ -0,0 +1,172 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from backend.adapters.persistence.sqlalchemy.repositories import (
+    SqlAlchemyIncidentRepository,
+    SqlAlchemyTimelineEventRepository,
+)
+from backend.adapters.persistence.sqlalchemy.rollups import rebuild_rollups
+from backend.adapters.persistence.sqlalchemy.uow import SqlAlchemyUnitOfWork
+from backend.background.rollups import main as rollups_main
+from backend.db.models.rollup import IncidentHourlyRollup, TimelineEventHourlyRollup
+from backend.domain.incidents.enums import Severity, StatsBucket, StatsSource, Status
+from backend.services.incidents.usecases import IncidentUseCases
+
+
+def _at(day, hour, minute=0):
+    return datetime(2026, 1, day, hour, minute, tzinfo=timezone.utc)
+
+
+def _incident(repo, created_at, *, status=Status.OPEN, severity=Severity.SEV2):
+    return repo.create(
+        {
+            "title": "Rollup Incident",
+            "description": "Counted in the hourly rollups",
+            "status": status,
+            "severity": severity,
+            "created_at": created_at,
+        }
+    )
+
+
+def _event(repo, incident_id, created_at, event_type="note"):
+    return repo.create(
+        incident_id,
+        {
+            "occurred_at": created_at,
+            "event_type": event_type,
+            "message": "Rollup event",
+            "created_at": created_at,
+        },
+    )
+
+
+def _rollup_rows(db_session):
+    incidents = db_session.execute(
+        select(
+            IncidentHourlyRollup.bucket_hour,
+            IncidentHourlyRollup.severity,
+            IncidentHourlyRollup.status,
+            IncidentHourlyRollup.incident_count,
+        ).where(IncidentHourlyRollup.incident_count != 0)
+    ).all()
+    events = db_session.execute(
+        select(
+            TimelineEventHourlyRollup.bucket_hour,
+            TimelineEventHourlyRollup.event_type,
+            TimelineEventHourlyRollup.event_count,
+        ).where(TimelineEventHourlyRollup.event_count != 0)
+    ).all()
+    return sorted(map(tuple, incidents)), sorted(map(tuple, events))
+
+
+def test_repository_writes_keep_rollups_in_step_with_raw_tables(db_session):
+    incidents = SqlAlchemyIncidentRepository(db_session)
+    events = SqlAlchemyTimelineEventRepository(db_session)
+    kept = _incident(incidents, _at(1, 9, 15), severity=Severity.SEV1)
+    moved = _incident(incidents, _at(1, 9, 45))
+    removed = _incident(incidents, _at(1, 10, 5))
+    _event(events, kept.id, _at(1, 9, 20))
+    retyped = _event(events, kept.id, _at(1, 9, 30))
+    dropped = _event(events, kept.id, _at(1, 11, 0), event_type="update")
+    _event(events, removed.id, _at(1, 10, 10), event_type="update")
+
+    incidents.update(moved.id, {"status": Status.RESOLVED, "severity": Severity.SEV3})
+    events.update(kept.id, retyped.id, {"event_type": "mitigation"})
+    events.delete(kept.id, dropped.id)
+    incidents.delete(removed.id)
+
+    incremental = _rollup_rows(db_session)
+    rebuild_rollups(db_session)
+
+    assert incremental == _rollup_rows(db_session)
+    incident_rows, event_rows = incremental
+    assert incident_rows == [
+        (_at(1, 9), Severity.SEV1, Status.OPEN, 1),
+        (_at(1, 9), Severity.SEV3, Status.RESOLVED, 1),
+    ]
+    assert event_rows == [
+        (_at(1, 9), "mitigation", 1),
+        (_at(1, 9), "note", 1),
+    ]
+
+
+def test_rollup_stats_match_raw_stats_for_unaligned_windows(db_session):
+    repo = SqlAlchemyIncidentRepository(db_session)
+    events = SqlAlchemyTimelineEventRepository(db_session)
+    start = _at(1, 0, 7)
+    for n in range(60):
+        created_at = start + timedelta(minutes=47 * n)
+        incident = _incident(
+            repo,
+            created_at,
+            status=list(Status)[n % 4],
+            severity=list(Severity)[n % 3],
+        )
+        _event(
+            events,
+            incident.id,
+            created_at + timedelta(minutes=13),
+            event_type=["note", "update", "mitigation"][n % 3],
+        )
+    windows = [
+        {},
+        {"created_after": _at(1, 3, 30)},
+        {"created_before": _at(2, 14, 10)},
+        {"created_after": _at(1, 3, 30), "created_before": _at(2, 14, 10)},
+        {"created_after": _at(1, 5, 10), "created_before": _at(1, 5, 50)},
+        {"created_after": _at(1, 5, 10), "created_before": _at(1, 6, 50)},
+        {"created_after": _at(1, 5), "created_before": _at(1, 9)},
+    ]
+
+    for window in windows:
+        for bucket in StatsBucket:
+            raw = repo.stats(bucket=bucket, **window)
+            rollup = repo.stats(bucket=bucket, source=StatsSource.ROLLUP, **window)
+
+            assert rollup.source == StatsSource.ROLLUP
+            assert rollup.total == raw.total, window
+            assert rollup.by_status_severity == raw.by_status_severity, window
+            assert rollup.created == raw.created, window
+            assert rollup.events_by_type == raw.events_by_type, window
+
+    assert [
+        (item.event_type, item.count)
+        for item in repo.stats(bucket=StatsBucket.DAY).events_by_type
+    ] == [("mitigation", 20), ("note", 20), ("update", 20)]
+
+
+def test_rollup_edges_are_split_in_utc_for_naive_bounds(db_session):
+    repo = SqlAlchemyIncidentRepository(db_session)
+    for created_at in (_at(1, 9, 15), _at(1, 10, 5), _at(2, 9, 50), _at(2, 10, 20)):
+        _incident(repo, created_at)
+    # Naive 09:30 is 09:30 UTC; the upper bound is 10:00 UTC written at +02:00.
+    naive_after = datetime(2026, 1, 1, 9, 30)
+    before = datetime(2026, 1, 2, 12, tzinfo=timezone(timedelta(hours=2)))
+
+    with pytest.raises(ValueError):
+        repo.stats(source=StatsSource.ROLLUP, created_after=naive_after)
+    with SqlAlchemyUnitOfWork(session=db_session, close_on_exit=False) as uow:
+        stats = IncidentUseCases(uow).get_incident_stats(
+            bucket=StatsBucket.HOUR, created_after=naive_after, created_before=before
+        )
+
+    assert stats.source == StatsSource.ROLLUP
+    assert stats.total == 2
+    assert [(item.bucket_start, item.count) for item in stats.created] == [
+        (_at(1, 10), 1),
+        (_at(2, 9), 1),
+    ]
+
+
+def test_rebuild_command_recomputes_rollups(db_session):
+    repo = SqlAlchemyIncidentRepository(db_session)
+    _incident(repo, _at(3, 12))
+    db_session.execute(IncidentHourlyRollup.__table__.delete())
+
+    exit_code = rollups_main(["rebuild"], session_factory=lambda: db_session)
+
+    assert exit_code == 0
+    assert _rollup_rows(db_session)[0] == [(_at(3, 12), Severity.SEV2, Status.OPEN, 1)]
@@ -0,0 +1,97 @@
+import json
+import logging
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import ProgrammingError
+
+from backend.core.logging import configure_logging
+from backend.core.request_context import bind_request
+from backend.db.slow_queries import SlowQueryMonitor
+
+
+@pytest.fixture(autouse=True)
+def logging_configured_after_db_setup(db_setup):
+    configure_logging("info")
+
+
+@pytest.fixture
+def monitor(engine):
+    monitor = SlowQueryMonitor(
+        threshold_ms=20, explain_sample_rate=1, max_entries=2, sample=lambda: 0
+    )
+    monitor.instrument(engine)
+    yield monitor
+    monitor.uninstrument(engine)
+    monitor.close()
+
+
+def test_slow_statements_are_logged_with_parameter_shapes(monitor, db_session, caplog):
+    caplog.set_level(logging.WARNING, logger="backend.db.slow_queries")
+
+    with bind_request("req-slow") as request:
+        request.route = "/api/v1/incidents"
+        db_session.execute(
+            text("SELECT pg_sleep(0.05), CAST(:label AS text)"), {"label": "secret"}
+        )
+        db_session.execute(text("SELECT 1"))
+
+    [entry] = monitor.entries()
+    assert entry.duration_ms >= 50
+    assert entry.parameters == {"label": "str[6]"}
+    assert (entry.request_id, entry.route) == ("req-slow", "/api/v1/incidents")
+    assert "slow query duration_ms=" in caplog.text
+    assert "request_id=req-slow" in caplog.text
+    assert "secret" not in caplog.text
+
+
+def test_sampled_slow_statements_get_a_plan_in_the_background(monitor, db_session):
+    db_session.execute(
+        text("SELECT (SELECT pg_sleep(0.03)), count(*) FROM incidents WHERE id = :id"),
+        {"id": 1},
+    )
+    monitor.wait_for_explains()
+
+    [entry] = monitor.entries()
+    assert entry.explain_error is None
+    assert entry.plan["Plan"]["Node Type"] == "Aggregate"
+    assert '"Relation Name": "incidents"' in json.dumps(entry.plan)
+
+
+def test_only_reads_are_explained(monitor, db_session):
+    db_session.execute(text("DO $$ BEGIN PERFORM pg_sleep(0.03); END $$"))
+    monitor.wait_for_explains()
+
+    [entry] = monitor.entries()
+    assert entry.plan is None and entry.explain_error is None
+
+
+def test_ring_buffer_keeps_the_newest_entries(monitor, db_session):
+    for n in range(3):
+        db_session.execute(text(f"SELECT pg_sleep(0.025), {n}"))
+    monitor.wait_for_explains()
+
+    assert [e.statement[-1] for e in monitor.entries()] == ["2", "1"]
+
+
+def test_failed_statements_leave_no_start_time_behind(monitor, db_session):
+    with pytest.raises(ProgrammingError):
+        with db_session.begin_nested():
+            db_session.execute(text("SELECT pg_sleep(0.03), * FROM no_such_table"))
+
+    assert not db_session.connection().info.get("slow_query_start")
+    assert monitor.entries() == []
+
+
+def test_uninstrument_removes_every_listener(engine):
+    monitor = SlowQueryMonitor(threshold_ms=20)
+    monitor.instrument(engine)
+    monitor.uninstrument(engine)
+    monitor.close()
+
+    for name, listener in (
+        ("before_cursor_execute", monitor._before_cursor_execute),
+        ("after_cursor_execute", monitor._after_cursor_execute),
+        ("handle_error", monitor._handle_error),
+    ):
+        assert not event.contains(engine, name, listener)
@@ -5,7 +5,7 @@ from backend.adapters.persistence.sqlalchemy.repositories import (
     SqlAlchemyTimelineEventRepository,
 )
 from backend.domain.incidents.entities import TimelineEvent
-from backend.domain.incidents.enums import Severity, Status
+from backend.domain.incidents.enums import Severity, Status, TimelineOrder
 
 
 def _incident_repo(db_session):
@@ -140,6 +140,61 @@ def test_list_incident_events_returns_newest_first(db_session):
     assert [event.id for event in events] == [second.id, first.id]
 
 
+def test_list_incident_events_orders_by_occurred_at_when_requested(db_session):
+    incident = _incident_repo(db_session).create(_incident_data(title="Occurred Order"))
+    repo = _event_repo(db_session)
+    happened_last = repo.create(
+        incident.id,
+        _event_data(occurred_at=datetime(2026, 1, 23, 14, 30, tzinfo=timezone.utc)),
+    )
+    happened_first = repo.create(
+        incident.id,
+        _event_data(occurred_at=datetime(2026, 1, 23, 14, 2, tzinfo=timezone.utc)),
+    )
+
+    events = repo.list_incident_events(
+        incident.id,
+        order_by=TimelineOrder.OCCURRED_AT,
+    )
+
+    assert [event.id for event in events] == [happened_last.id, happened_first.id]
+
+
+def test_list_incident_events_filters_by_occurred_window_and_type(db_session):
+    incident = _incident_repo(db_session).create(_incident_data(title="Filtered Events"))
+    repo = _event_repo(db_session)
+
+    def at(minute):
+        return datetime(2026, 1, 23, 14, minute, tzinfo=timezone.utc)
+
+    repo.create(incident.id, _event_data(occurred_at=at(1), event_type="status_change"))
+    window_start = repo.create(
+        incident.id,
+        _event_data(occurred_at=at(2), event_type="status_change"),
+    )
+    repo.create(incident.id, _event_data(occurred_at=at(15), event_type="note"))
+    window_middle = repo.create(
+        incident.id,
+        _event_data(occurred_at=at(20), event_type="status_change"),
+    )
+    repo.create(incident.id, _event_data(occurred_at=at(30), event_type="status_change"))
+    filters = {
+        "event_type": "status_change",
+        "occurred_after": at(2),
+        "occurred_before": at(30),
+    }
+
+    events = repo.list_incident_events(
+        incident.id,
+        **filters,
+        order_by=TimelineOrder.OCCURRED_AT,
+    )
+
+    assert [event.id for event in events] == [window_middle.id, window_start.id]
+    assert repo.count_incident_events(incident.id, **filters) == 2
+    assert repo.count_incident_events(incident.id) == 5
+
+
 def test_update_event_persists_changes(db_session):
     incident = _incident_repo(db_session).create(_incident_data(title="Update Event"))
     repo = _event_repo(db_session)
@@ -227,3 +282,116 @@ def test_delete_event_wrong_incident_returns_false(db_session):
 
     assert deleted is False
     assert repo.get(first_incident.id, event.id) == event
+
+
+def test_event_writes_maintain_incident_event_count_and_last_event_at(db_session):
+    incident_repo = _incident_repo(db_session)
+    incident = incident_repo.create(_incident_data(title="Activity Incident"))
+    repo = _event_repo(db_session)
+
+    def at(hour):
+        return datetime(2026, 1, 23, hour, tzinfo=timezone.utc)
+
+    earlier = repo.create(incident.id, {**_event_data(), "created_at": at(9)})
+    later = repo.create(incident.id, {**_event_data(), "created_at": at(11)})
+    repo.create(incident.id, {**_event_data(), "created_at": at(10)})
+
+    current = incident_repo.get(incident.id)
+    assert current.event_count == 3
+    assert current.last_event_at == at(11)
+    assert current.updated_at == incident.updated_at
+    assert repo.count_incident_events(incident.id) == 3
+
+    repo.delete(incident.id, later.id)
+    repo.delete(incident.id, earlier.id)
+
+    current = incident_repo.get(incident.id)
+    assert current.event_count == 1
+    assert current.last_event_at == at(10)
+    assert current.updated_at == incident.updated_at
+    assert repo.count_incident_events(incident.id) == 1
+
+
+def test_deleting_last_event_clears_last_event_at(db_session):
+    incident_repo = _incident_repo(db_session)
+    incident = incident_repo.create(_incident_data(title="Emptied Incident"))
+    repo = _event_repo(db_session)
+    event = repo.create(incident.id, _event_data())
+
+    repo.delete(incident.id, event.id)
+
+    current = incident_repo.get(incident.id)
+    assert current.event_count == 0
+    assert current.last_event_at is None
+    assert repo.count_incident_events(incident.id) == 0
+
+
+def test_sparse_event_reads_leave_unrequested_fields_empty(db_session):
+    incident = _incident_repo(db_session).create(_incident_data(title="Sparse Events"))
+    repo = _event_repo(db_session)
+    created = repo.create(incident.id, _event_data(event_type="note"))
+    db_session.expire_all()
+
+    [listed] = repo.list_incident_events(incident.id, fields=["event_type"])
+    fetched = repo.get(incident.id, created.id, fields=["message"])
+
+    assert (listed.id, listed.event_type) == (created.id, "note")
+    assert listed.message is None and listed.occurred_at is None
+    assert fetched.message == created.message
+    assert fetched.event_type is None
+
+
+def test_list_recent_pages_events_across_incidents_newest_first(db_session):
+    incidents = _incident_repo(db_session)
+    repo = _event_repo(db_session)
+    sev1 = incidents.create(_incident_data(severity=Severity.SEV1))
+    sev3 = incidents.create(_incident_data(severity=Severity.SEV3))
+
+    def at(minute):
+        return datetime(2026, 1, 23, 12, minute, tzinfo=timezone.utc)
+
+    for n in range(6):
+        repo.create(
+            sev1.id if n % 2 else sev3.id,
+            {
+                **_event_data(event_type="note" if n < 3 else "update"),
+                "message": f"Event {n}",
+                "created_at": at(n),
+            },
+        )
+
+    seen = []
+    after = None
+    while page := repo.list_recent(after=after, limit=4):
+        seen.extend(page)
+        after = (page[-1].created_at, page[-1].id)
+
+    assert [e.message for e in seen] == [f"Event {n}" for n in range(5, -1, -1)]
+    assert [e.message for e in repo.list_recent(event_type="note")] == [
+        "Event 2",
+        "Event 1",
+        "Event 0",
+    ]
+    assert [e.message for e in repo.list_recent(severity=Severity.SEV1)] == [
+        "Event 5",
+        "Event 3",
+        "Event 1",
+    ]
+    assert [
+        e.message
+        for e in repo.list_recent(
+            event_type="update", severity=[Severity.SEV1, Severity.SEV3]
+        )
+    ] == ["Event 5", "Event 4", "Event 3"]
+
+
+def test_get_many_events_skips_missing_ids(db_session):
+    incident = _incident_repo(db_session).create(_incident_data(title="Many Events"))
+    repo = _event_repo(db_session)
+    first = repo.create(incident.id, _event_data(message="First"))
+    second = repo.create(incident.id, _event_data(message="Second"))
+
+    events = repo.get_many([second.id, first.id, 999_999_999])
+
+    assert sorted(e.id for e in events) == sorted([first.id, second.id])
+    assert repo.get_many([]) == []
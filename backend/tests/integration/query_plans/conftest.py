@@ -0,0 +1,255 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from backend.adapters.persistence.sqlalchemy.rollups import rebuild_rollups
+from backend.db import query_stats, sql_comments
+from backend.db.base import Base
+# Imported so that create_all sees every table, as in the migrations env.
+from backend.db.models.change_log import ChangeLogEntry
+from backend.db.models.incident import Incident
+from backend.db.models.incident_status_change import IncidentStatusChange
+from backend.db.models.rollup import IncidentHourlyRollup, TimelineEventHourlyRollup
+from backend.db.models.timeline_event import TimelineEvent
+
+
+PLAN_SCHEMA = "query_plans"
+SEEDED_TABLES = (
+    "incidents",
+    "timeline_events",
+    "incident_hourly_rollups",
+    "timeline_event_hourly_rollups",
+    "incident_status_changes",
+    "change_log",
+)
+SEED_INCIDENT_COUNT = 20_000
+SEED_EVENTS_PER_INCIDENT = 5
+LONG_TIMELINE_EVENT_COUNT = 5_000
+
+SEED_INCIDENTS_SQL = text(
+    """
+    INSERT INTO incidents (title, description, severity, status, created_at, updated_at)
+    SELECT
+        'Seeded incident ' || n,
+        'Seeded incident description ' || n,
+        (ARRAY['SEV1', 'SEV2', 'SEV3', 'SEV4'])[1 + n % 4]::severity,
+        CASE WHEN n % 25 = 0
+            THEN (ARRAY['OPEN', 'INVESTIGATING', 'MITIGATED'])[1 + n % 3]
+            ELSE 'RESOLVED'
+        END::status,
+        now() - make_interval(mins => n * 20),
+        now() - make_interval(mins => n * 20)
+    FROM generate_series(1, :incident_count) AS n
+    """
+)
+SEED_EVENTS_SQL = text(
+    """
+    INSERT INTO timeline_events (incident_id, occurred_at, event_type, message, created_at, updated_at)
+    SELECT
+        i.id,
+        i.created_at + make_interval(mins => e),
+        (ARRAY['note', 'status_change', 'update', 'mitigation'])[1 + e % 4],
+        'Seeded event ' || e || ' for incident ' || i.id,
+        i.created_at + make_interval(mins => e),
+        i.created_at + make_interval(mins => e)
+    FROM incidents AS i
+    CROSS JOIN generate_series(1, :events_per_incident) AS e
+    """
+)
+SEED_LONG_TIMELINE_SQL = text(
+    """
+    INSERT INTO timeline_events (incident_id, occurred_at, event_type, message, created_at, updated_at)
+    SELECT
+        :incident_id,
+        now() - make_interval(secs => e),
+        (ARRAY['note', 'status_change', 'update', 'mitigation'])[1 + e % 4],
+        'Long timeline event ' || e,
+        now() - make_interval(secs => e),
+        now() - make_interval(secs => e)
+    FROM generate_series(1, :event_count) AS e
+    """
+)
+# Raw inserts bypass the repository, so derive the denormalized activity
+# columns the same way the migration backfill does.
+SEED_ACTIVITY_SQL = text(
+    """
+    UPDATE incidents AS i
+    SET event_count = e.event_count, last_event_at = e.last_event_at
+    FROM (
+        SELECT incident_id, count(*) AS event_count, max(created_at) AS last_event_at
+        FROM timeline_events
+        GROUP BY incident_id
+    ) AS e
+    WHERE e.incident_id = i.id
+    """
+)
+
+# A creation row for every incident, plus the transition to its current
+# status for those that have moved on, so response times have data to read.
+SEED_STATUS_CHANGES_SQL = text(
+    """
+    INSERT INTO incident_status_changes (incident_id, from_status, to_status, changed_at)
+    SELECT id, NULL, 'OPEN'::status, created_at
+    FROM incidents
+    UNION ALL
+    SELECT id, 'OPEN'::status, status, created_at + make_interval(mins => 5 + (id % 55)::int)
+    FROM incidents
+    WHERE status <> 'OPEN'
+    """
+)
+
+# Log every seeded row as created, like the change log migration backfill.
+SEED_CHANGE_LOG_SQL = text(
+    """
+    INSERT INTO change_log (entity, action, incident_id, entity_id, changed_at)
+    SELECT entity::changeentity, 'CREATED'::changeaction, incident_id, entity_id, changed_at
+    FROM (
+        SELECT 'INCIDENT' AS entity, id AS incident_id, id AS entity_id, updated_at AS changed_at
+        FROM incidents
+        UNION ALL
+        SELECT 'EVENT', incident_id, id, updated_at
+        FROM timeline_events
+    ) AS existing
+    ORDER BY changed_at, entity_id
+    """
+)
+
+
+@pytest.fixture(scope="session")
+def plan_engine(settings_fixture):
+    """Engine whose connections see only the ``query_plans`` schema.
+
+    The plan tests seed, commit and analyze their dataset there, so the
+    statistics they plan against are never disturbed by, and never disturb,
+    the tables the rest of the integration suite uses.
+    """
+    eng = query_stats.instrument_engine(
+        create_engine(
+            settings_fixture.DATABASE_URL,
+            connect_args={"options": f"-csearch_path={PLAN_SCHEMA}"},
+        )
+    )
+    sql_comments.instrument_engine(eng)
+    with eng.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {PLAN_SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {PLAN_SCHEMA}"))
+        Base.metadata.create_all(connection)
+
+    try:
+        yield eng
+    finally:
+        with eng.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA {PLAN_SCHEMA} CASCADE"))
+        eng.dispose()
+
+
+@pytest.fixture(scope="session")
+def seeded_plan_schema(plan_engine):
+    """Seed the plan schema once and return the incident with a long timeline."""
+    with plan_engine.begin() as connection:
+        connection.execute(SEED_INCIDENTS_SQL, {"incident_count": SEED_INCIDENT_COUNT})
+        # Analyze before loading events so the foreign key checks are planned
+        # against the seeded incidents rather than statistics for an empty table.
+        connection.execute(text("ANALYZE incidents"))
+        connection.execute(
+            SEED_EVENTS_SQL,
+            {"events_per_incident": SEED_EVENTS_PER_INCIDENT},
+        )
+        long_timeline_incident_id = connection.execute(
+            text("SELECT max(id) FROM incidents")
+        ).scalar_one()
+        connection.execute(
+            SEED_LONG_TIMELINE_SQL,
+            {
+                "incident_id": long_timeline_incident_id,
+                "event_count": LONG_TIMELINE_EVENT_COUNT,
+            },
+        )
+        connection.execute(SEED_ACTIVITY_SQL)
+        connection.execute(SEED_STATUS_CHANGES_SQL)
+        connection.execute(SEED_CHANGE_LOG_SQL)
+        with Session(bind=connection) as session:
+            rebuild_rollups(session)
+            session.flush()
+    with plan_engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as connection:
+        for table in SEEDED_TABLES:
+            connection.execute(text(f"ANALYZE {table}"))
+    return long_timeline_incident_id
+
+
+@pytest.fixture(scope="module")
+def seeded_session(plan_engine, seeded_plan_schema):
+    """Session over the seeded plan schema, rolled back after the module."""
+    connection = plan_engine.connect()
+    trans = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    session.info["long_timeline_incident_id"] = seeded_plan_schema
+
+    try:
+        yield session
+    finally:
+        session.close()
+        trans.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def capture_plans(seeded_session):
+    """Run a callable and return the EXPLAIN plan of every statement it emits."""
+
+    def _capture(operation):
+        connection = seeded_session.connection()
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(connection, "before_cursor_execute", _record)
+        try:
+            operation()
+        finally:
+            event.remove(connection, "before_cursor_execute", _record)
+
+        plans = []
+        for statement, parameters in statements:
+            if isinstance(parameters, list):
+                # executemany batches share one plan; explain the first row.
+                parameters = parameters[0]
+            explained = connection.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}",
+                parameters,
+            ).scalar_one()
+            plans.append((statement, explained[0]["Plan"]))
+        return plans
+
+    return _capture
+
+
+def plan_node_types(plan: dict) -> list[str]:
+    node_types = [plan["Node Type"]]
+    for child in plan.get("Plans", []):
+        node_types.extend(plan_node_types(child))
+    return node_types
+
+
+def plan_index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= plan_index_names(child)
+    return names
+
+
+@pytest.fixture
+def assert_index_backed():
+    def _assert(plan: dict, *, index_name: str | None = None, allow_sort=False):
+        node_types = plan_node_types(plan)
+        assert "Seq Scan" not in node_types, node_types
+        if not allow_sort:
+            assert "Sort" not in node_types, node_types
+            assert "Incremental Sort" not in node_types, node_types
+        if index_name is not None:
+            assert index_name in plan_index_names(plan), plan_index_names(plan)
+
+    return _assert
@@ -0,0 +1,17 @@
+from backend.adapters.persistence.sqlalchemy.repositories import (
+    SqlAlchemyChangeLogRepository,
+)
+
+
+def test_changes_since_a_token_scan_the_log_primary_key(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyChangeLogRepository(seeded_session)
+    since = repo.latest_seq() - 200
+
+    plans = capture_plans(
+        lambda: (repo.list_since(since, limit=501), repo.latest_seq())
+    )
+
+    for _, plan in plans:
+        assert_index_backed(plan, index_name="change_log_pkey")
@@ -0,0 +1,236 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.adapters.persistence.sqlalchemy.repositories import (
+    SqlAlchemyIncidentRepository,
+)
+from backend.services.incidents.pagination import incident_sort_key
+from backend.domain.incidents.enums import (
+    IncidentSort,
+    Severity,
+    SortDirection,
+    StatsBucket,
+    StatsSource,
+    Status,
+)
+
+
+def _last_days(days):
+    now = datetime.now(timezone.utc)
+    return {"created_after": now - timedelta(days=days), "created_before": now}
+
+
+LIST_FILTER_COMBINATIONS = {
+    "unfiltered": {},
+    "status": {"status": Status.OPEN},
+    "statuses": {"status": [Status.OPEN, Status.INVESTIGATING]},
+    "severity": {"severity": Severity.SEV1},
+    "severities": {"severity": [Severity.SEV1, Severity.SEV2]},
+    "status_and_severity": {"status": Status.OPEN, "severity": Severity.SEV2},
+    "statuses_and_severities": {
+        "status": [Status.OPEN, Status.INVESTIGATING],
+        "severity": [Severity.SEV1, Severity.SEV2],
+    },
+    "created_window": _last_days(7),
+    "status_and_created_window": {"status": Status.OPEN, **_last_days(30)},
+    "severities_and_created_window": {
+        "severity": [Severity.SEV1, Severity.SEV2],
+        **_last_days(7),
+    },
+    "statuses_severities_and_created_window": {
+        "status": [Status.OPEN, Status.INVESTIGATING],
+        "severity": [Severity.SEV1, Severity.SEV2],
+        **_last_days(90),
+    },
+}
+
+# Counts read every matching row, so only selective filters are expected to
+# avoid a full scan of the incidents table.
+SELECTIVE_COUNT_COMBINATIONS = (
+    "status",
+    "statuses",
+    "status_and_severity",
+    "statuses_and_severities",
+    "created_window",
+    "status_and_created_window",
+    "severities_and_created_window",
+    "statuses_severities_and_created_window",
+)
+
+
+@pytest.mark.parametrize("combination", sorted(LIST_FILTER_COMBINATIONS))
+def test_incident_list_filters_are_index_backed(
+    combination, seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+    filters = LIST_FILTER_COMBINATIONS[combination]
+
+    [(_, plan)] = capture_plans(lambda: repo.list(**filters))
+
+    # Multi-value filters read several index ranges, which the planner may
+    # merge with a top-N sort; single ranges must come back already ordered.
+    assert_index_backed(plan, allow_sort=True)
+    if combination in ("unfiltered", "status", "severity", "status_and_severity"):
+        assert_index_backed(plan)
+
+
+@pytest.mark.parametrize("combination", SELECTIVE_COUNT_COMBINATIONS)
+def test_selective_incident_counts_are_index_backed(
+    combination, seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+    filters = LIST_FILTER_COMBINATIONS[combination]
+
+    [(_, plan)] = capture_plans(lambda: repo.count(**filters))
+
+    assert_index_backed(plan)
+
+
+def test_active_incident_list_uses_partial_index(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+
+    [(_, plan)] = capture_plans(lambda: repo.list(active_only=True))
+
+    assert_index_backed(plan, index_name="ix_incidents_active_created_at")
+
+
+def test_active_incident_count_uses_partial_index(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+
+    [(_, plan)] = capture_plans(lambda: repo.count(active_only=True))
+
+    assert_index_backed(plan, index_name="ix_incidents_active_created_at")
+
+
+def test_incident_list_by_last_activity_uses_expression_index(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+
+    [(_, plan)] = capture_plans(lambda: repo.list(sort=IncidentSort.LAST_ACTIVITY))
+
+    assert_index_backed(plan, index_name="ix_incidents_last_activity")
+
+
+SORT_INDEXES = {
+    IncidentSort.CREATED_AT: "ix_incidents_created_at",
+    IncidentSort.UPDATED_AT: "ix_incidents_updated_at",
+    IncidentSort.SEVERITY: "ix_incidents_severity_created_at",
+    IncidentSort.LAST_ACTIVITY: "ix_incidents_last_activity",
+}
+
+
+@pytest.mark.parametrize("direction", list(SortDirection))
+@pytest.mark.parametrize("sort", list(IncidentSort))
+def test_deep_keyset_pages_start_inside_the_sort_index(
+    sort, direction, seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+    [deep] = repo.list(sort=sort, direction=direction, offset=15_000, limit=1)
+    after = (*incident_sort_key(deep, sort), deep.id)
+
+    plans = capture_plans(
+        lambda: (
+            repo.list(sort=sort, direction=direction),
+            repo.list(sort=sort, direction=direction, after=after),
+        )
+    )
+
+    # The keyset row comparison must become an index condition: a filter would
+    # walk every earlier row and make deep pages as slow as offsets.
+    for _, plan in plans:
+        assert_index_backed(plan, index_name=SORT_INDEXES[sort])
+        assert plan["Plans"][0].get("Filter") is None, plan
+    assert "Index Cond" in plans[1][1]["Plans"][0]
+
+
+def test_embedded_latest_events_read_a_bounded_slice_of_each_timeline(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+    long_timeline_id = seeded_session.info["long_timeline_incident_id"]
+
+    # Oldest first puts the incident with the long timeline on the page.
+    list_plan, events_plan = capture_plans(
+        lambda: repo.list(direction=SortDirection.ASC, include_latest_events=3)
+    )
+    page = repo.list(direction=SortDirection.ASC, include_latest_events=3)
+
+    assert long_timeline_id in {incident.id for incident in page}
+    assert all(len(incident.events) == 3 for incident in page)
+    assert_index_backed(list_plan[1])
+    # Only the k rows per incident are sorted into the response order.
+    assert_index_backed(
+        events_plan[1], index_name="ix_timeline_incident_created", allow_sort=True
+    )
+    assert events_plan[1]["Plan Rows"] <= 50 * 3
+
+
+@pytest.mark.parametrize("bucket", list(StatsBucket))
+def test_windowed_incident_stats_are_index_backed(
+    bucket, seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+
+    [(_, plan), (_, events_plan)] = capture_plans(
+        lambda: repo.stats(bucket=bucket, **_last_days(7))
+    )
+
+    # Grouping sets hash or sort the windowed rows; only the scan must be indexed.
+    assert_index_backed(plan, allow_sort=True)
+    assert_index_backed(
+        events_plan, index_name="ix_timeline_events_created_at", allow_sort=True
+    )
+
+
+@pytest.mark.parametrize("bucket", list(StatsBucket))
+def test_long_range_incident_stats_read_rollups_through_indexes(
+    bucket, seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+    window = _last_days(30)
+
+    [(_, plan), (_, events_plan)] = capture_plans(
+        lambda: repo.stats(bucket=bucket, source=StatsSource.ROLLUP, **window)
+    )
+
+    assert_index_backed(
+        plan, index_name="incident_hourly_rollups_pkey", allow_sort=True
+    )
+    assert_index_backed(
+        events_plan, index_name="timeline_event_hourly_rollups_pkey", allow_sort=True
+    )
+
+
+def _scans(plan: dict) -> set[tuple[str, str, str | None]]:
+    scans = set()
+    if "Relation Name" in plan:
+        scans.add((plan["Node Type"], plan["Relation Name"], plan.get("Index Name")))
+    for child in plan.get("Plans", []):
+        scans |= _scans(child)
+    return scans
+
+
+def test_dashboard_reads_each_section_through_an_index(
+    seeded_session, capture_plans
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+
+    [(_, plan)] = capture_plans(lambda: repo.dashboard())
+
+    # The counts come from the small rollup table; incidents and the event log
+    # must only be read through the bounded index scans behind each CTE.
+    assert {
+        (node_type, relation)
+        for node_type, relation, index_name in _scans(plan)
+        if relation in {"incidents", "timeline_events"}
+    } == {("Index Scan", "incidents"), ("Index Scan", "timeline_events")}, plan
+    assert {
+        "ix_incidents_active_created_at",
+        "ix_timeline_events_created_at",
+    } <= {index_name for _, _, index_name in _scans(plan)}
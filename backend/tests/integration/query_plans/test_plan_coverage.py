@@ -0,0 +1,69 @@
+import ast
+import inspect
+from pathlib import Path
+
+import pytest
+
+from backend.adapters.persistence.sqlalchemy.repositories import (
+    SqlAlchemyChangeLogRepository,
+    SqlAlchemyIncidentRepository,
+    SqlAlchemyTimelineEventRepository,
+)
+
+PLAN_TEST_DIR = Path(__file__).parent
+
+
+def _public_methods(cls) -> set[str]:
+    return {
+        name
+        for name, member in vars(cls).items()
+        if not name.startswith("_") and inspect.isfunction(member)
+    }
+
+
+def _repo_calls_in_plan_tests() -> set[tuple[str, str]]:
+    """``(repository class, method)`` pairs called by the plan tests.
+
+    Plan tests bind the repository under test to a local named ``repo``.
+    """
+    called = set()
+    for path in PLAN_TEST_DIR.glob("test_*.py"):
+        for function in ast.walk(ast.parse(path.read_text())):
+            if not isinstance(function, ast.FunctionDef):
+                continue
+            repository = None
+            for node in ast.walk(function):
+                if (
+                    isinstance(node, ast.Assign)
+                    and [ast.unparse(target) for target in node.targets] == ["repo"]
+                    and isinstance(node.value, ast.Call)
+                ):
+                    repository = ast.unparse(node.value.func)
+                elif (
+                    isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Attribute)
+                    and ast.unparse(node.func.value) == "repo"
+                ):
+                    called.add((repository, node.func.attr))
+    return called
+
+
+@pytest.mark.parametrize(
+    "repository",
+    [
+        SqlAlchemyIncidentRepository,
+        SqlAlchemyTimelineEventRepository,
+        SqlAlchemyChangeLogRepository,
+    ],
+)
+def test_every_repository_query_has_a_plan_test(repository):
+    called = {
+        method
+        for name, method in _repo_calls_in_plan_tests()
+        if name == repository.__name__
+    }
+    missing = _public_methods(repository) - called
+
+    assert not missing, (
+        f"{repository.__name__} methods without a query plan test: {sorted(missing)}"
+    )
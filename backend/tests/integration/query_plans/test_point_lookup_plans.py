@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from backend.adapters.persistence.sqlalchemy.repositories import (
+    SqlAlchemyIncidentRepository,
+    SqlAlchemyTimelineEventRepository,
+)
+from backend.db.models.timeline_event import TimelineEvent as TimelineEventModel
+
+
+def _some_event_ids(seeded_session, limit=20):
+    incident_id = seeded_session.info["long_timeline_incident_id"]
+    return seeded_session.scalars(
+        select(TimelineEventModel.id)
+        .where(TimelineEventModel.incident_id == incident_id)
+        .limit(limit)
+    ).all()
+
+
+def test_incident_lookups_by_id_use_the_primary_key(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+    incident_id = seeded_session.info["long_timeline_incident_id"]
+
+    plans = capture_plans(
+        lambda: (
+            repo.get(incident_id),
+            repo.get(incident_id, fields=["id", "title", "status"]),
+            repo.exists(incident_id),
+            repo.get_many(range(incident_id - 50, incident_id + 1)),
+        )
+    )
+
+    assert len(plans) == 4
+    for _, plan in plans:
+        assert_index_backed(plan, index_name="incidents_pkey")
+
+
+def test_batch_incident_lookup_with_events_reads_each_timeline_by_index(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+    incident_id = seeded_session.info["long_timeline_incident_id"]
+
+    incidents_plan, events_plan = capture_plans(
+        lambda: repo.get_many(range(incident_id - 50, incident_id), with_events=True)
+    )
+
+    assert_index_backed(incidents_plan[1], index_name="incidents_pkey")
+    # Every event of the batch is loaded, then sorted into relationship order.
+    assert_index_backed(events_plan[1], allow_sort=True)
+
+
+def test_event_lookups_by_id_use_the_primary_key(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyTimelineEventRepository(seeded_session)
+    incident_id = seeded_session.info["long_timeline_incident_id"]
+    event_ids = _some_event_ids(seeded_session)
+
+    plans = capture_plans(
+        lambda: (
+            repo.get(incident_id, event_ids[0]),
+            repo.get(incident_id, event_ids[0], fields=["id", "message"]),
+            repo.get_many(event_ids),
+        )
+    )
+
+    assert len(plans) == 3
+    for _, plan in plans:
+        assert_index_backed(plan, index_name="timeline_events_pkey")
+
+
+def test_recent_response_times_join_status_changes_by_index(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+    now = datetime.now(timezone.utc)
+
+    [(_, plan)] = capture_plans(
+        lambda: repo.response_times(
+            created_after=now - timedelta(days=1), created_before=now
+        )
+    )
+
+    # Wide windows cover enough incidents that hashing the whole history is
+    # cheaper; a short window must look up each incident's transitions.
+    # Percentiles are ordered-set aggregates, so the grouped rows are sorted.
+    assert_index_backed(
+        plan,
+        index_name="ix_incident_status_changes_incident_changed",
+        allow_sort=True,
+    )
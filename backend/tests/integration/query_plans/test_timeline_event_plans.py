@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta, timezone
+
+from backend.adapters.persistence.sqlalchemy.repositories import (
+    SqlAlchemyIncidentRepository,
+    SqlAlchemyTimelineEventRepository,
+)
+from backend.domain.incidents.enums import Severity, TimelineOrder
+
+
+def _long_timeline(seeded_session):
+    return seeded_session.info["long_timeline_incident_id"]
+
+
+def _window():
+    now = datetime.now(timezone.utc)
+    return now - timedelta(minutes=30), now - timedelta(minutes=2)
+
+
+def test_list_events_by_created_at_uses_incident_created_index(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyTimelineEventRepository(seeded_session)
+    incident_id = _long_timeline(seeded_session)
+
+    [(_, plan)] = capture_plans(lambda: repo.list_incident_events(incident_id))
+
+    assert_index_backed(plan, index_name="ix_timeline_incident_created")
+
+
+def test_list_events_by_occurred_at_window_uses_range_scan(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyTimelineEventRepository(seeded_session)
+    incident_id = _long_timeline(seeded_session)
+    occurred_after, occurred_before = _window()
+
+    [(_, plan)] = capture_plans(
+        lambda: repo.list_incident_events(
+            incident_id,
+            occurred_after=occurred_after,
+            occurred_before=occurred_before,
+            order_by=TimelineOrder.OCCURRED_AT,
+        )
+    )
+
+    assert_index_backed(plan, index_name="ix_timeline_incident_occurred")
+
+
+def test_list_events_by_type_and_window_uses_type_index(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyTimelineEventRepository(seeded_session)
+    incident_id = _long_timeline(seeded_session)
+    occurred_after, occurred_before = _window()
+
+    plans = capture_plans(
+        lambda: (
+            repo.list_incident_events(
+                incident_id,
+                event_type="status_change",
+                occurred_after=occurred_after,
+                occurred_before=occurred_before,
+                order_by=TimelineOrder.OCCURRED_AT,
+            ),
+            repo.count_incident_events(
+                incident_id,
+                event_type="status_change",
+                occurred_after=occurred_after,
+                occurred_before=occurred_before,
+            ),
+        )
+    )
+
+    # A narrow window may be fetched as a bitmap range scan followed by a
+    # top-N sort of the matching rows, which is still bounded by the index.
+    for _, plan in plans:
+        assert_index_backed(
+            plan,
+            index_name="ix_timeline_incident_type_occurred",
+            allow_sort=True,
+        )
+
+
+def test_unfiltered_event_count_reads_the_incident_row(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyTimelineEventRepository(seeded_session)
+    incident_id = _long_timeline(seeded_session)
+
+    [(_, plan)] = capture_plans(lambda: repo.count_incident_events(incident_id))
+
+    assert_index_backed(plan, index_name="incidents_pkey")
+    assert repo.count_incident_events(incident_id) == repo.count_incident_events(
+        incident_id, occurred_before=datetime.now(timezone.utc)
+    )
+
+
+def test_report_timeline_is_fetched_through_incident_indexes(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(seeded_session)
+    incident_id = _long_timeline(seeded_session)
+
+    for order_by in TimelineOrder:
+        plans = capture_plans(
+            lambda: repo.get_with_events(incident_id, events_order_by=order_by)
+        )
+
+        # The report reads the whole timeline, so the planner may prefer a
+        # bitmap scan plus an in-memory sort of that one incident's events.
+        for _, plan in plans:
+            assert_index_backed(plan, allow_sort=True)
+
+
+def test_recent_event_feed_walks_the_global_created_index(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyTimelineEventRepository(seeded_session)
+    [*_, deep] = repo.list_recent(limit=100)
+
+    plans = capture_plans(
+        lambda: (
+            repo.list_recent(),
+            repo.list_recent(after=(deep.created_at, deep.id)),
+        )
+    )
+
+    for _, plan in plans:
+        assert_index_backed(plan, index_name="ix_timeline_events_created_at")
+    assert "Index Cond" in plans[1][1]["Plans"][0]
+
+
+def test_recent_event_feed_by_type_uses_type_index(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyTimelineEventRepository(seeded_session)
+
+    [(_, plan)] = capture_plans(lambda: repo.list_recent(event_type="mitigation"))
+
+    assert_index_backed(plan, index_name="ix_timeline_events_type_created_at")
+
+
+def test_recent_event_feed_by_severity_joins_incidents_by_primary_key(
+    seeded_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyTimelineEventRepository(seeded_session)
+
+    [(_, plan)] = capture_plans(
+        lambda: repo.list_recent(severity=[Severity.SEV1, Severity.SEV2])
+    )
+
+    assert_index_backed(plan, index_name="ix_timeline_events_created_at")
+    assert_index_backed(plan, index_name="incidents_pkey")
@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.adapters.persistence.sqlalchemy.repositories import (
+    SqlAlchemyIncidentRepository,
+    SqlAlchemyTimelineEventRepository,
+)
+from backend.domain.incidents.enums import Severity, Status
+
+
+@pytest.fixture
+def write_session(seeded_session):
+    """The seeded session inside a savepoint that undoes each test's writes."""
+    savepoint = seeded_session.begin_nested()
+    try:
+        yield seeded_session
+    finally:
+        savepoint.rollback()
+
+
+def _seeded_incident_id(session):
+    # Any incident with the regular five events, not the long timeline.
+    return session.info["long_timeline_incident_id"] - 1
+
+
+def _assert_statements_index_backed(plans, assert_index_backed):
+    assert plans
+    for statement, plan in plans:
+        try:
+            # Deleting an incident groups its own events into rollup deltas,
+            # which may sort that handful of rows; no write may scan a table.
+            assert_index_backed(plan, allow_sort=plan["Node Type"] == "Aggregate")
+        except AssertionError as exc:
+            raise AssertionError(f"{statement}\n{exc}") from exc
+
+
+def test_incident_writes_touch_rows_through_indexes(
+    write_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyIncidentRepository(write_session)
+    incident_id = _seeded_incident_id(write_session)
+
+    plans = capture_plans(
+        lambda: (
+            repo.create(
+                {
+                    "title": "Write path",
+                    "severity": Severity.SEV2,
+                    "status": Status.OPEN,
+                }
+            ),
+            repo.update(
+                incident_id, {"status": Status.MITIGATED, "severity": Severity.SEV1}
+            ),
+            repo.delete(incident_id),
+        )
+    )
+
+    _assert_statements_index_backed(plans, assert_index_backed)
+
+
+def test_event_writes_touch_rows_through_indexes(
+    write_session, capture_plans, assert_index_backed
+):
+    repo = SqlAlchemyTimelineEventRepository(write_session)
+    incident_id = _seeded_incident_id(write_session)
+    [event, *_] = repo.list_incident_events(incident_id)
+
+    plans = capture_plans(
+        lambda: (
+            repo.create(
+                incident_id,
+                {
+                    "occurred_at": datetime.now(timezone.utc),
+                    "event_type": "note",
+                    "message": "Write path",
+                },
+            ),
+            repo.update(incident_id, event.id, {"event_type": "mitigation"}),
+            repo.delete(incident_id, event.id),
+        )
+    )
+
+    _assert_statements_index_backed(plans, assert_index_backed)
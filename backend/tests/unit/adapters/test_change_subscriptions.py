@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import socket
+import threading
+from types import SimpleNamespace
+
+import psycopg2
+
+from backend.adapters.notifications.postgres_listener import (
+    ChangeSubscription,
+    PostgresChangeListener,
+    libpq_dsn,
+)
+from backend.adapters.persistence.sqlalchemy.notifications import (
+    decode_change,
+    encode_change,
+)
+from backend.domain.incidents.enums import ChangeAction, ChangeEntity
+from backend.domain.incidents.read_models import IncidentChange
+
+
+def _change(incident_id: int, event_id: int) -> IncidentChange:
+    return IncidentChange(
+        entity=ChangeEntity.EVENT,
+        action=ChangeAction.CREATED,
+        incident_id=incident_id,
+        id=event_id,
+    )
+
+
+class FakeConnection:
+    """Stands in for a psycopg2 connection, with a socket to wake the loop."""
+
+    def __init__(self):
+        self._reader, self._writer = socket.socketpair()
+        self.notifies = []
+        self.statements = []
+        self.failed = False
+        self.closed = False
+
+    def fileno(self):
+        return self._reader.fileno()
+
+    def set_isolation_level(self, level):
+        pass
+
+    def cursor(self):
+        return contextlib.nullcontext(self)
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+    def poll(self):
+        self._reader.recv(1024)
+        if self.failed:
+            raise psycopg2.OperationalError("server closed the connection")
+
+    def notify(self, change):
+        self.notifies.append(SimpleNamespace(payload=encode_change(change)))
+        self._writer.send(b"x")
+
+    def fail(self):
+        self.failed = True
+        self._writer.send(b"x")
+
+    def close(self):
+        self.closed = True
+        self._reader.close()
+        self._writer.close()
+
+
+class FakeConnect:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.connections = []
+        self.threads = set()
+
+    def __call__(self, dsn):
+        self.threads.add(threading.current_thread())
+        if self.failures:
+            self.failures -= 1
+            raise psycopg2.OperationalError("connection refused")
+        connection = FakeConnection()
+        self.connections.append(connection)
+        return connection
+
+
+async def _until(predicate, timeout=2):
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+
+def test_change_payload_round_trips():
+    change = _change(3, 7)
+
+    assert decode_change(encode_change(change)) == change
+
+
+def test_libpq_dsn_drops_the_sqlalchemy_driver_name():
+    assert (
+        libpq_dsn("postgresql+psycopg2://app:s%40cret@db:5432/incidents")
+        == "postgresql://app:s%40cret@db:5432/incidents"
+    )
+
+
+def test_dispatch_delivers_only_matching_changes():
+    async def scenario():
+        listener = PostgresChangeListener("postgresql://unused")
+        everything = listener.subscribe()
+        one_incident = listener.subscribe(incident_id=1)
+
+        listener.dispatch(_change(1, 10))
+        listener.dispatch(_change(2, 20))
+
+        return (
+            [await everything.get(), await everything.get()],
+            [await one_incident.get()],
+            one_incident._queue.empty(),
+        )
+
+    everything, one_incident, drained = asyncio.run(scenario())
+
+    assert [c.id for c in everything] == [10, 20]
+    assert [c.id for c in one_incident] == [10]
+    assert drained
+
+
+def test_slow_subscriber_is_dropped_without_affecting_others():
+    async def scenario():
+        listener = PostgresChangeListener("postgresql://unused", max_pending=2)
+        slow = listener.subscribe()
+        fast = listener.subscribe()
+
+        received = []
+        for n in range(3):
+            listener.dispatch(_change(1, n))
+            received.append(await fast.get())
+
+        return listener, slow, received, await slow.get()
+
+    listener, slow, received, slow_next = asyncio.run(scenario())
+
+    assert [c.id for c in received] == [0, 1, 2]
+    assert slow.overflowed
+    assert slow_next is None
+    assert listener.subscriber_count == 1
+
+
+def test_listener_connects_off_the_event_loop_and_outlives_its_subscribers():
+    connect = FakeConnect()
+
+    async def scenario():
+        listener = PostgresChangeListener("postgresql://unused", connect=connect)
+        await listener.start()
+        subscription = listener.subscribe()
+        [connection] = connect.connections
+        connection.notify(_change(1, 10))
+        received = await asyncio.wait_for(subscription.get(), 2)
+        listener.unsubscribe(subscription)
+        still_listening = listener.listening
+        await listener.stop()
+        return received, still_listening, connection, listener.listening
+
+    received, still_listening, connection, listening = asyncio.run(scenario())
+
+    assert received == _change(1, 10)
+    assert threading.main_thread() not in connect.threads
+    assert connection.statements == ['LISTEN "incident_changes"']
+    assert still_listening
+    assert connection.closed
+    assert not listening
+
+
+def test_listener_reconnects_and_ends_subscriptions_after_a_failure():
+    connect = FakeConnect(failures=1)
+
+    async def scenario():
+        listener = PostgresChangeListener(
+            "postgresql://unused", connect=connect, reconnect_delay=0.01
+        )
+        await listener.start()
+        started_listening = listener.listening
+        await _until(lambda: listener.listening)
+        subscription = listener.subscribe()
+        connect.connections[0].fail()
+        ended = await asyncio.wait_for(subscription.get(), 2)
+        await _until(lambda: len(connect.connections) == 2 and listener.listening)
+        resubscribed = listener.subscribe()
+        connect.connections[1].notify(_change(2, 20))
+        received = await asyncio.wait_for(resubscribed.get(), 2)
+        await listener.stop()
+        return started_listening, ended, received
+
+    started_listening, ended, received = asyncio.run(scenario())
+
+    assert not started_listening
+    assert ended is None
+    assert received == _change(2, 20)
+    assert [c.closed for c in connect.connections] == [True, True]
+
+
+def test_closed_subscription_discards_pending_changes():
+    async def scenario():
+        subscription = ChangeSubscription(incident_id=None, max_pending=5)
+        subscription.offer(_change(1, 1))
+        subscription.close()
+        return await subscription.get(), subscription.offer(_change(1, 2))
+
+    next_change, accepted = asyncio.run(scenario())
+
+    assert next_change is None
+    assert not accepted
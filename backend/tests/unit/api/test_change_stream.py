@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+
+from backend.adapters.notifications.postgres_listener import ChangeSubscription
+from backend.api.change_stream import format_change, stream_changes
+from backend.domain.incidents.enums import ChangeAction, ChangeEntity
+from backend.domain.incidents.read_models import IncidentChange
+
+
+class FakeListener:
+    def __init__(self, max_pending: int = 10):
+        self.max_pending = max_pending
+        self.subscriptions: list[ChangeSubscription] = []
+        self.unsubscribed: list[ChangeSubscription] = []
+
+    def subscribe(self, *, incident_id=None) -> ChangeSubscription:
+        subscription = ChangeSubscription(
+            incident_id=incident_id, max_pending=self.max_pending
+        )
+        self.subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ChangeSubscription) -> None:
+        self.unsubscribed.append(subscription)
+
+
+CHANGE = IncidentChange(
+    entity=ChangeEntity.INCIDENT,
+    action=ChangeAction.UPDATED,
+    incident_id=4,
+    id=4,
+    seq=12,
+)
+
+
+def test_format_change_names_the_event_after_entity_and_action():
+    assert format_change(CHANGE) == (
+        "id: 12\n"
+        "event: incident.updated\n"
+        'data: {"entity":"incident","action":"updated","incident_id":4,"id":4,'
+        '"seq":12}\n\n'
+    )
+
+
+def test_format_change_omits_the_id_line_without_a_log_sequence():
+    unlogged = IncidentChange(
+        entity=ChangeEntity.EVENT,
+        action=ChangeAction.DELETED,
+        incident_id=4,
+        id=9,
+    )
+
+    assert format_change(unlogged).startswith("event: event.deleted\n")
+
+
+def test_stream_sends_changes_and_unsubscribes_when_closed():
+    async def scenario():
+        listener = FakeListener()
+        stream = stream_changes(listener, incident_id=4, heartbeat_seconds=5)
+        connected = await anext(stream)
+        listener.subscriptions[0].offer(CHANGE)
+        message = await anext(stream)
+        await stream.aclose()
+        return listener, connected, message
+
+    listener, connected, message = asyncio.run(scenario())
+
+    assert connected == ": connected\n\n"
+    assert message == format_change(CHANGE)
+    assert listener.subscriptions[0].incident_id == 4
+    assert listener.unsubscribed == listener.subscriptions
+
+
+def test_idle_stream_sends_keep_alive_comments():
+    async def scenario():
+        stream = stream_changes(FakeListener(), heartbeat_seconds=0.01)
+        await anext(stream)
+        message = await anext(stream)
+        await stream.aclose()
+        return message
+
+    assert asyncio.run(scenario()) == ": keep-alive\n\n"
+
+
+def test_lagging_client_is_told_to_resync_and_the_stream_ends():
+    async def scenario():
+        listener = FakeListener(max_pending=1)
+        stream = stream_changes(listener, heartbeat_seconds=5)
+        await anext(stream)
+        subscription = listener.subscriptions[0]
+        subscription.offer(CHANGE)
+        subscription.offer(CHANGE)
+        return [message async for message in stream], listener
+
+    messages, listener = asyncio.run(scenario())
+
+    assert messages == ["event: resync\ndata: {}\n\n"]
+    assert listener.unsubscribed == listener.subscriptions
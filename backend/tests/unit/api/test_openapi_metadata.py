@@ -59,6 +59,7 @@ def test_openapi_documents_api_key_security_for_incident_routes(app_fixture):
     assert "security" not in openapi["paths"]["/health/ready"]["get"]
     assert "401" not in openapi["paths"]["/health/live"]["get"]["responses"]
     assert "401" not in openapi["paths"]["/health/ready"]["get"]["responses"]
+    assert "401" not in openapi["paths"]["/metrics"]["get"]["responses"]
 
 
 def test_openapi_documents_401_for_protected_incident_routes(app_fixture):
@@ -66,11 +67,20 @@ def test_openapi_documents_401_for_protected_incident_routes(app_fixture):
     protected_operations = (
         ("/api/v1/incidents", "get"),
         ("/api/v1/incidents", "post"),
+        ("/api/v1/incidents/stats", "get"),
+        ("/api/v1/incidents:batchGet", "post"),
+        ("/api/v1/incidents/analytics/response-times", "get"),
         ("/api/v1/incidents/{incident_id}/report", "get"),
         ("/api/v1/incidents/{incident_id}/report/markdown", "get"),
         ("/api/v1/incidents/{incident_id}", "get"),
         ("/api/v1/incidents/{incident_id}/events", "get"),
         ("/api/v1/incidents/{incident_id}/events/{event_id}", "get"),
+        ("/api/v1/dashboard", "get"),
+        ("/api/v1/events/recent", "get"),
+        ("/api/v1/incidents/stream", "get"),
+        ("/api/v1/incidents/{incident_id}/stream", "get"),
+        ("/api/v1/changes", "get"),
+        ("/api/v1/admin/slow-queries", "get"),
     )
 
     for path, method in protected_operations:
@@ -254,9 +264,24 @@ def test_incident_list_openapi_documents_pagination_metadata(app_fixture):
     for name in ("status_filter", "severity_filter", "limit", "offset"):
         assert parameters[name]["description"]
 
-    assert _parameter_example(parameters["status_filter"]) == "open"
-    assert _parameter_example(parameters["severity_filter"]) == "sev1"
-    assert set(example) == {"items", "limit", "offset", "total"}
+    assert _parameter_example(parameters["status_filter"]) == ["open", "investigating"]
+    assert _parameter_example(parameters["severity_filter"]) == ["sev1", "sev2"]
+    assert parameters["status_filter"]["schema"]["anyOf"][0]["type"] == "array"
+    assert {"created_after", "created_before", "active_only"} <= set(parameters)
+    assert parameters["active_only"]["schema"]["default"] is False
+    assert parameters["sort"]["schema"]["default"] == "created_at"
+    assert _parameter_example(parameters["sort"]) == "severity"
+    sort_schema = openapi["components"]["schemas"]["IncidentSort"]
+    assert set(sort_schema["enum"]) == {
+        "created_at",
+        "updated_at",
+        "severity",
+        "last_activity",
+    }
+    assert {"direction", "cursor", "include_latest_events"} <= set(parameters)
+    assert parameters["include_latest_events"]["schema"]["maximum"] == 10
+    assert parameters["cursor"]["description"]
+    assert set(example) == {"items", "limit", "offset", "total", "next_cursor"}
     assert example["items"][0]["status"] == "investigating"
     assert example["items"][0]["severity"] == "sev1"
 
@@ -363,3 +388,179 @@ def test_nested_timeline_event_write_routes_preserve_404_metadata(app_fixture):
         assert operation["responses"]["404"]["description"] == (
             "Incident or event not found"
         )
+
+
+def test_timeline_event_list_openapi_documents_filters_and_ordering(app_fixture):
+    openapi = app_fixture.openapi()
+    events_path = "/api/v1/incidents/{incident_id}/events"
+    parameters = _parameters_by_name(openapi["paths"][events_path]["get"])
+    report_parameters = _parameters_by_name(
+        openapi["paths"]["/api/v1/incidents/{incident_id}/report"]["get"]
+    )
+
+    assert set(parameters) >= {
+        "event_type",
+        "occurred_after",
+        "occurred_before",
+        "order_by",
+    }
+    for name in ("event_type", "occurred_after", "occurred_before", "order_by"):
+        assert parameters[name]["description"]
+    assert _parameter_example(parameters["order_by"]) == "occurred_at"
+    assert "order_by" in report_parameters
+    assert _response_schema(openapi, events_path, "get", 400)["$ref"].endswith(
+        "/ErrorResponse"
+    )
+
+
+def test_incident_stats_openapi_documents_buckets_and_example(app_fixture):
+    openapi = app_fixture.openapi()
+    stats_path = "/api/v1/incidents/stats"
+    operation = openapi["paths"][stats_path]["get"]
+    parameters = _parameters_by_name(operation)
+    example = _response_content(openapi, stats_path, "get", 200)["example"]
+
+    assert _response_schema(openapi, stats_path, "get", 200)["$ref"].endswith(
+        "/IncidentStatsResponse"
+    )
+    assert set(parameters) == {"bucket", "created_after", "created_before"}
+    assert parameters["bucket"]["schema"]["default"] == "day"
+    assert _parameter_example(parameters["bucket"]) == "hour"
+    assert _response_schema(openapi, stats_path, "get", 400)["$ref"].endswith(
+        "/ErrorResponse"
+    )
+    assert set(example) == {
+        "bucket",
+        "created_after",
+        "created_before",
+        "source",
+        "total",
+        "by_status_severity",
+        "created",
+    }
+
+
+def test_dashboard_openapi_documents_limits_and_example(app_fixture):
+    openapi = app_fixture.openapi()
+    path = "/api/v1/dashboard"
+    operation = openapi["paths"][path]["get"]
+    parameters = _parameters_by_name(operation)
+    example = _response_content(openapi, path, "get", 200)["example"]
+
+    assert operation["tags"] == ["dashboard"]
+    assert _response_schema(openapi, path, "get", 200)["$ref"].endswith(
+        "/DashboardResponse"
+    )
+    assert set(parameters) == {"active_limit", "recent_events"}
+    assert parameters["active_limit"]["schema"]["maximum"] == 100
+    assert parameters["recent_events"]["schema"]["default"] == 20
+    assert set(example) == {"active_incidents", "by_status_severity", "recent_events"}
+
+
+def test_recent_events_openapi_documents_filters_and_cursor(app_fixture):
+    openapi = app_fixture.openapi()
+    path = "/api/v1/events/recent"
+    operation = openapi["paths"][path]["get"]
+    parameters = _parameters_by_name(operation)
+    example = _response_content(openapi, path, "get", 200)["example"]
+
+    assert operation["tags"] == ["events"]
+    assert _response_schema(openapi, path, "get", 200)["$ref"].endswith(
+        "/RecentTimelineEventsResponse"
+    )
+    assert set(parameters) == {"event_type", "severity", "cursor", "limit"}
+    assert set(example) == {"items", "limit", "next_cursor"}
+    assert example["next_cursor"]
+
+
+def test_change_streams_openapi_documents_event_stream_media_type(app_fixture):
+    openapi = app_fixture.openapi()
+
+    for path in ("/api/v1/incidents/stream", "/api/v1/incidents/{incident_id}/stream"):
+        response = openapi["paths"][path]["get"]["responses"]["200"]
+        content = response["content"]["text/event-stream"]
+
+        assert content["schema"] == {"type": "string"}
+        assert "event: event.created" in content["example"]
+    assert "404" in openapi["paths"]["/api/v1/incidents/{incident_id}/stream"]["get"][
+        "responses"
+    ]
+
+
+def test_changes_openapi_documents_sync_token_and_tombstones(app_fixture):
+    openapi = app_fixture.openapi()
+    path = "/api/v1/changes"
+    operation = openapi["paths"][path]["get"]
+    parameters = _parameters_by_name(operation)
+    example = _response_content(openapi, path, "get", 200)["example"]
+
+    assert operation["tags"] == ["changes"]
+    assert _response_schema(openapi, path, "get", 200)["$ref"].endswith(
+        "/ChangeSetResponse"
+    )
+    assert set(parameters) == {"since", "limit"}
+    assert parameters["since"]["schema"]["default"] == 0
+    assert parameters["limit"]["schema"]["maximum"] == 1000
+    assert set(example) == {
+        "next_token",
+        "has_more",
+        "incidents",
+        "events",
+        "deleted_incident_ids",
+        "deleted_event_ids",
+    }
+
+
+def test_incident_response_times_openapi_documents_window_and_example(app_fixture):
+    openapi = app_fixture.openapi()
+    path = "/api/v1/incidents/analytics/response-times"
+    parameters = _parameters_by_name(openapi["paths"][path]["get"])
+    example = _response_content(openapi, path, "get", 200)["example"]
+
+    assert _response_schema(openapi, path, "get", 200)["$ref"].endswith(
+        "/IncidentResponseTimesResponse"
+    )
+    assert set(parameters) == {"created_after", "created_before"}
+    assert set(example["by_severity"][0]) == {
+        "severity",
+        "time_to_acknowledge",
+        "time_to_resolve",
+    }
+
+
+def test_incident_batch_get_openapi_documents_request_and_response(app_fixture):
+    openapi = app_fixture.openapi()
+    path = "/api/v1/incidents:batchGet"
+    operation = openapi["paths"][path]["post"]
+    request_schema = operation["requestBody"]["content"]["application/json"]["schema"]
+
+    assert request_schema["$ref"].endswith("/IncidentBatchGetRequest")
+    assert _response_schema(openapi, path, "post", 200)["$ref"].endswith(
+        "/IncidentBatchGetResponse"
+    )
+    assert _response_schema(openapi, path, "post", 400)["$ref"].endswith(
+        "/ErrorResponse"
+    )
+    assert "200" in operation["description"]
+
+
+def test_read_routes_document_sparse_fieldsets(app_fixture):
+    openapi = app_fixture.openapi()
+    operations = {
+        "/api/v1/incidents": ("event_count", "id,status,severity"),
+        "/api/v1/incidents/{incident_id}": ("events", "id,status,severity"),
+        "/api/v1/incidents/{incident_id}/events": (
+            "occurred_at",
+            "id,event_type,occurred_at",
+        ),
+        "/api/v1/incidents/{incident_id}/events/{event_id}": (
+            "message",
+            "id,event_type,occurred_at",
+        ),
+    }
+
+    for path, (field, example) in operations.items():
+        parameter = _parameters_by_name(openapi["paths"][path]["get"])["fields"]
+
+        assert field in parameter["description"]
+        assert _parameter_example(parameter) == example
@@ -0,0 +1,108 @@
+import itertools
+
+import pytest
+
+from backend.benchmarks.results import (
+    BenchmarkResult,
+    BenchmarkRun,
+    compare,
+    measure,
+    percentile,
+    read_run,
+    summarize,
+    write_run,
+)
+
+
+def _result(name="get_incident", *, p50=10.0, p95=20.0, p99=30.0, throughput=100.0):
+    return BenchmarkResult(
+        name=name,
+        iterations=100,
+        throughput=throughput,
+        mean_ms=p50,
+        p50_ms=p50,
+        p95_ms=p95,
+        p99_ms=p99,
+        max_ms=p99,
+    )
+
+
+def _run(*results):
+    return BenchmarkRun(
+        label="abc123", dataset={"incidents": 1, "events": 10}, results=list(results)
+    )
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(n) for n in range(1, 101)]
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7.0], 99) == 7.0
+
+
+def test_summarize_reports_latency_in_milliseconds_and_throughput():
+    result = summarize("case", [0.004, 0.001, 0.002, 0.003])
+
+    assert result.iterations == 4
+    assert result.p50_ms == pytest.approx(2.0)
+    assert result.p99_ms == pytest.approx(4.0)
+    assert result.max_ms == pytest.approx(4.0)
+    assert result.mean_ms == pytest.approx(2.5)
+    assert result.throughput == pytest.approx(400.0)
+
+
+def test_measure_prepares_each_iteration_outside_the_timing():
+    prepared = itertools.count(1)
+    ran = []
+
+    result = measure(
+        "case", ran.append, iterations=3, warmup=2, prepare=lambda: next(prepared)
+    )
+
+    assert result.iterations == 3
+    assert ran == [1, 2, 3, 4, 5]
+
+
+def test_compare_flags_slower_percentiles_and_lower_throughput():
+    baseline = _run(_result(), _result("list_incidents"))
+    current = _run(
+        _result(p95=30.0, throughput=70.0),
+        _result("list_incidents", p50=11.0),
+    )
+
+    regressions = compare(baseline, current, threshold=0.2)
+
+    assert [(r.name, r.metric) for r in regressions] == [
+        ("get_incident", "p95_ms"),
+        ("get_incident", "throughput"),
+    ]
+    assert regressions[0].change == pytest.approx(0.5)
+
+
+def test_compare_ignores_jitter_below_the_minimum_delta_and_new_cases():
+    baseline = _run(_result(p50=0.2, p95=0.3, p99=0.4))
+    current = _run(
+        _result(p50=0.5, p95=0.9, p99=1.2),
+        _result("new_case", p99=500.0),
+    )
+
+    assert compare(baseline, current, min_delta_ms=1.0) == []
+
+
+def test_runs_round_trip_through_json(tmp_path):
+    run = _run(_result())
+    path = tmp_path / "results.json"
+
+    write_run(run, path)
+
+    assert read_run(path) == run
+
+
+def test_read_run_rejects_unknown_versions(tmp_path):
+    path = tmp_path / "results.json"
+    path.write_text('{"version": 99}')
+
+    with pytest.raises(ValueError, match="unsupported results version"):
+        read_run(path)
@@ -0,0 +1,57 @@
+from collections import Counter
+from datetime import datetime, timezone
+
+from backend.benchmarks.dataset import generate
+from backend.domain.incidents.enums import Severity, Status
+
+ANCHOR = datetime(2026, 3, 2, 12, tzinfo=timezone.utc)
+
+
+def _dataset(events=20_000, **kwargs):
+    return list(generate(events, anchor=ANCHOR, **kwargs))
+
+
+def test_the_same_seed_generates_the_same_dataset():
+    assert _dataset(2_000, seed=7) == _dataset(2_000, seed=7)
+    assert _dataset(2_000, seed=7) != _dataset(2_000, seed=8)
+
+
+def test_generates_exactly_the_requested_number_of_events():
+    incidents = _dataset(12_345)
+
+    assert sum(len(incident.events) for incident in incidents) == 12_345
+    assert all(incident.events for incident in incidents)
+
+
+def test_timelines_are_heavy_tailed():
+    lengths = sorted(len(incident.events) for incident in _dataset())
+
+    median = lengths[len(lengths) // 2]
+    assert median < 10
+    assert lengths[-1] > 20 * median
+
+
+def test_severities_and_statuses_follow_a_realistic_mix():
+    incidents = _dataset()
+    severities = Counter(incident.severity for incident in incidents)
+    statuses = Counter(incident.status for incident in incidents)
+
+    assert severities[Severity.SEV4] > severities[Severity.SEV3]
+    assert severities[Severity.SEV3] > severities[Severity.SEV2]
+    assert severities[Severity.SEV2] > severities[Severity.SEV1] > 0
+    assert statuses[Status.RESOLVED] > 0.9 * len(incidents)
+    assert len(statuses) > 1
+
+
+def test_timestamps_follow_each_incident_and_stop_at_the_anchor():
+    for incident in _dataset(5_000, days=30):
+        changes = incident.status_changes
+        assert changes[0] == (None, Status.OPEN, incident.created_at)
+        assert changes[-1][1] == incident.status
+        assert incident.updated_at == changes[-1][2] <= ANCHOR
+        assert [c[2] for c in changes] == sorted(c[2] for c in changes)
+        assert all(prev[1] == nxt[0] for prev, nxt in zip(changes, changes[1:]))
+        for occurred_at, created_at, event_type, message in incident.events:
+            assert incident.created_at <= occurred_at <= created_at <= ANCHOR
+            assert event_type and 0 < len(message) <= 5_000
+        assert [e[0] for e in incident.events] == sorted(e[0] for e in incident.events)
@@ -0,0 +1,58 @@
+from backend.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_returns_value_until_it_expires():
+    clock = FakeClock()
+    cache = TTLCache(10, clock=clock)
+
+    cache.set("key", "value")
+    clock.now = 9.9
+    assert cache.get("key") == "value"
+
+    clock.now = 10
+    assert cache.get("key") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 0
+
+
+def test_ttl_cache_with_zero_ttl_never_stores():
+    cache = TTLCache(0)
+
+    cache.set("key", "value")
+
+    assert cache.enabled is False
+    assert cache.get("key") is None
+    assert cache.misses == 1
+
+
+def test_ttl_cache_evicts_oldest_entry_when_full():
+    clock = FakeClock()
+    cache = TTLCache(10, max_entries=2, clock=clock)
+
+    cache.set("first", 1)
+    clock.now = 1
+    cache.set("second", 2)
+    cache.set("third", 3)
+
+    assert cache.get("first") is None
+    assert cache.get("second") == 2
+    assert cache.get("third") == 3
+
+
+def test_ttl_cache_clear_drops_entries_and_counters():
+    cache = TTLCache(10)
+    cache.set("key", "value")
+    cache.get("key")
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
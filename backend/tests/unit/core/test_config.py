@@ -17,3 +17,44 @@ def test_auth_settings_accept_explicit_overrides():
 
     assert settings.API_AUTH_ENABLED is True
     assert settings.API_KEY == "test-key"
+
+
+def test_incident_stats_cache_is_disabled_by_default():
+    settings = Settings(_env_file=None)
+
+    assert settings.INCIDENT_STATS_CACHE_TTL_SECONDS == 0
+
+
+def test_dashboard_cache_is_disabled_by_default():
+    settings = Settings(_env_file=None)
+
+    assert settings.DASHBOARD_CACHE_TTL_SECONDS == 0
+
+
+def test_change_stream_defaults_bound_each_client_queue():
+    settings = Settings(_env_file=None)
+
+    assert settings.CHANGE_STREAM_MAX_PENDING == 100
+    assert settings.CHANGE_STREAM_HEARTBEAT_SECONDS == 15
+
+
+def test_metrics_default_to_a_single_process():
+    settings = Settings(_env_file=None)
+
+    assert settings.METRICS_DIR == ""
+    assert settings.METRICS_FLUSH_SECONDS == 5
+
+
+def test_sql_comments_include_the_request_id_by_default():
+    settings = Settings(_env_file=None)
+
+    assert settings.SQL_COMMENTS_ENABLED is True
+    assert settings.SQL_COMMENTS_STABLE is False
+
+
+def test_slow_query_monitor_is_off_by_default():
+    settings = Settings(_env_file=None)
+
+    assert settings.SLOW_QUERY_THRESHOLD_MS == 0
+    assert settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE == 0.1
+    assert settings.SLOW_QUERY_BUFFER_SIZE == 100
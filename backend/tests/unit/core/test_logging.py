@@ -1,6 +1,10 @@
+import json
 import logging
+import queue
 
-from backend.core.logging import configure_logging
+import pytest
+
+from backend.core.logging import DroppingQueueHandler, configure_logging, flush_logging
 
 
 def test_configure_logging_applies_debug_to_backend_logger():
@@ -13,3 +17,63 @@ def test_configure_logging_falls_back_to_info_for_invalid_level():
     configure_logging("invalid")
 
     assert logging.getLogger("backend").level == logging.INFO
+
+
+@pytest.fixture
+def restore_logging():
+    yield
+    configure_logging("info")
+
+
+def test_records_are_written_as_json_by_the_background_writer(
+    restore_logging, capsys
+):
+    configure_logging("info")
+
+    logging.getLogger("backend.test").info(
+        "incident %s opened", 42, extra={"request_id": "req-1"}
+    )
+    flush_logging()
+
+    [line] = capsys.readouterr().err.splitlines()
+    payload = json.loads(line)
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "backend.test"
+    assert payload["message"] == "incident 42 opened"
+    assert payload["request_id"] == "req-1"
+
+
+def test_text_format_appends_structured_fields(restore_logging, capsys):
+    configure_logging("info", json_format=False)
+
+    logging.getLogger("backend.test").warning("slow", extra={"duration_ms": 12.5})
+    flush_logging()
+
+    assert capsys.readouterr().err.rstrip().endswith(
+        "WARNING [backend.test] slow duration_ms=12.5"
+    )
+
+
+def test_full_queue_drops_records_and_reports_them_later():
+    log_queue = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(log_queue)
+    logger = logging.getLogger("backend.test.dropping")
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        for n in range(3):
+            logger.warning("record %s", n)
+        assert handler.dropped == 1
+        assert [log_queue.get_nowait().msg for _ in range(2)] == [
+            "record 0",
+            "record 1",
+        ]
+
+        logger.warning("record 3")
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+
+    assert log_queue.get_nowait().msg == "record 3"
+    report = log_queue.get_nowait()
+    assert (report.msg, report.dropped) == ("log records dropped", 1)
@@ -0,0 +1,156 @@
+import os
+import time
+
+import pytest
+
+from backend.core.cache import TTLCache
+from backend.core.metrics import (
+    Metric,
+    MetricsRegistry,
+    MetricsSnapshotDirectory,
+    cache_metrics,
+    merge_snapshots,
+    render,
+)
+
+
+def _registry_with_requests():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.observe_request("GET", "/incidents/{incident_id}", 200, 0.05)
+    registry.observe_request("GET", "/incidents/{incident_id}", 204, 0.1)
+    registry.observe_request("GET", "/incidents/{incident_id}", 200, 3.5)
+    registry.observe_request("POST", "/incidents", 422, 0.2)
+    return registry
+
+
+def test_render_groups_requests_by_route_template_and_status_class():
+    text = render(_registry_with_requests().snapshot())
+
+    assert "# TYPE http_requests_total counter" in text
+    assert (
+        'http_requests_total{method="GET",route="/incidents/{incident_id}",'
+        'status="2xx"} 3'
+    ) in text
+    assert 'http_requests_total{method="POST",route="/incidents",status="4xx"} 1' in text
+
+
+def test_render_writes_cumulative_histogram_buckets():
+    text = render(_registry_with_requests().snapshot())
+    labels = 'method="GET",route="/incidents/{incident_id}",status="2xx"'
+
+    assert "# TYPE http_request_duration_seconds histogram" in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.1"}} 2' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="1"}} 2' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+    assert f"http_request_duration_seconds_sum{{{labels}}} 3.65" in text
+    assert f"http_request_duration_seconds_count{{{labels}}} 3" in text
+
+
+def test_render_escapes_label_values():
+    registry = MetricsRegistry()
+    registry.add_collector(
+        lambda: [Metric("odd", "gauge", "Odd labels.", [({"name": 'a"b\\c'}, 1)])]
+    )
+
+    assert 'odd{name="a\\"b\\\\c"} 1' in render(registry.snapshot())
+
+
+def test_cache_metrics_report_hits_and_misses_per_cache():
+    cache = TTLCache(60)
+    cache.set("key", "value")
+    cache.get("key")
+    cache.get("missing")
+    registry = MetricsRegistry()
+    registry.add_collector(cache_metrics({"dashboard": lambda: cache}))
+
+    text = render(registry.snapshot())
+
+    assert 'cache_hits_total{cache="dashboard"} 1' in text
+    assert 'cache_misses_total{cache="dashboard"} 1' in text
+
+
+def test_failing_collector_does_not_break_the_scrape():
+    registry = _registry_with_requests()
+
+    def broken():
+        raise RuntimeError("pool unavailable")
+
+    registry.add_collector(broken)
+
+    assert "http_requests_total" in render(registry.snapshot())
+
+
+def test_merge_snapshots_sums_every_worker():
+    first = _registry_with_requests()
+    second = MetricsRegistry(buckets=(0.1, 1.0))
+    second.observe_request("GET", "/incidents/{incident_id}", 200, 0.5)
+    for registry, checked_out in ((first, 2), (second, 3)):
+        gauge = Metric(
+            "db_pool_checked_out_connections", "gauge", "In use.", [({}, checked_out)]
+        )
+        registry.add_collector(lambda gauge=gauge: [gauge])
+
+    text = render(merge_snapshots([first.snapshot(), second.snapshot()]))
+
+    assert (
+        'http_requests_total{method="GET",route="/incidents/{incident_id}",'
+        'status="2xx"} 4'
+    ) in text
+    assert "db_pool_checked_out_connections 5" in text
+
+
+def test_snapshot_directory_merges_workers_sharing_it(tmp_path, monkeypatch):
+    other_worker = _registry_with_requests()
+    monkeypatch.setattr("backend.core.metrics.os.getpid", lambda: 1001)
+    MetricsSnapshotDirectory(tmp_path, other_worker).flush()
+
+    this_worker = MetricsRegistry(buckets=(0.1, 1.0))
+    this_worker.observe_request("POST", "/incidents", 201, 0.01)
+    monkeypatch.setattr("backend.core.metrics.os.getpid", lambda: 1002)
+    text = render(MetricsSnapshotDirectory(tmp_path, this_worker).collect())
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["1001.json", "1002.json"]
+    assert 'http_requests_total{method="POST",route="/incidents",status="2xx"} 1' in text
+    assert 'http_requests_total{method="POST",route="/incidents",status="4xx"} 1' in text
+
+
+def test_snapshot_directory_drops_gauges_of_dead_workers(tmp_path, monkeypatch):
+    def worker(pid, checked_out):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.observe_request("GET", "/incidents", 200, 0.01)
+        gauge = Metric(
+            "db_pool_checked_out_connections", "gauge", "In use.", [({}, checked_out)]
+        )
+        registry.add_collector(lambda: [gauge])
+        monkeypatch.setattr("backend.core.metrics.os.getpid", lambda: pid)
+        return MetricsSnapshotDirectory(tmp_path, registry, flush_seconds=5)
+
+    worker(1001, 4).flush()
+    # The dead worker stopped refreshing its snapshot a minute ago.
+    minute_ago = time.time() - 60
+    os.utime(tmp_path / "1001.json", (minute_ago, minute_ago))
+
+    text = render(worker(1002, 3).collect())
+
+    assert 'http_requests_total{method="GET",route="/incidents",status="2xx"} 2' in text
+    assert "db_pool_checked_out_connections 3" in text
+
+
+def test_snapshot_directory_flushes_when_stopped(tmp_path):
+    registry = MetricsRegistry()
+    snapshots = MetricsSnapshotDirectory(tmp_path, registry, flush_seconds=60)
+
+    snapshots.start()
+    registry.observe_request("GET", "/health/live", 200, 0.001)
+    snapshots.stop()
+
+    [path] = tmp_path.glob("*.json")
+    assert '"/health/live"' in path.read_text()
+
+
+@pytest.mark.parametrize("status_code, status", [(101, "1xx"), (302, "3xx"), (503, "5xx")])
+def test_status_codes_are_grouped_into_classes(status_code, status):
+    registry = MetricsRegistry()
+    registry.observe_request("GET", "/", status_code, 0.01)
+
+    assert f'status="{status}"' in render(registry.snapshot())
@@ -0,0 +1,115 @@
+import asyncio
+import contextvars
+import sys
+import threading
+import time
+
+from backend.core.profiling import RequestProfiler, collapsed_stack
+from backend.core.request_context import bind_request, records_use_cases
+
+
+def _spin(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+@records_use_cases
+class SlowUseCases:
+    def report(self):
+        _spin(0.05)
+
+
+def endpoint():
+    SlowUseCases().report()
+
+
+def _inner(anchors):
+    return collapsed_stack(sys._getframe(), anchors)
+
+
+def _outer(anchors):
+    anchors.add(sys._getframe())
+    return _inner(anchors)
+
+
+def test_collapsed_stacks_start_at_the_outermost_anchor():
+    anchors = {sys._getframe()}
+
+    stack = _outer(anchors)
+
+    assert stack.split(";")[0].startswith(
+        "test_collapsed_stacks_start_at_the_outermost_anchor ("
+    )
+    assert [frame.split(" ")[0] for frame in stack.split(";")[1:]] == [
+        "_outer",
+        "_inner",
+    ]
+    assert collapsed_stack(sys._getframe(), set()) is None
+
+
+def test_sampler_keeps_use_case_work_of_the_request_only():
+    profiler = RequestProfiler(interval_ms=0.5, max_entries=2)
+    bystander = threading.Thread(target=_spin, args=(0.1,))
+    bystander.start()
+
+    with bind_request("req-1") as request:
+        sampler = profiler.start(
+            request, anchor=sys._getframe(), method="GET", path="/report"
+        )
+        # Sync endpoints run on a worker thread in a copy of the context.
+        worker = threading.Thread(
+            target=contextvars.copy_context().run, args=(endpoint,)
+        )
+        worker.start()
+        worker.join()
+        profile = sampler.stop(200)
+    bystander.join()
+
+    assert profile.samples > 0
+    assert any(
+        stack.startswith("endpoint (") and "SlowUseCases.report" in stack
+        for stack in profile.stacks
+    )
+    # The bystander thread spins too, outside the request.
+    assert all(
+        stack.startswith("endpoint (")
+        for stack in profile.stacks
+        if "_spin" in stack
+    )
+    assert request.profile_frames is None
+    assert profiler.get("req-1") is profile
+    assert profile.status_code == 200
+    assert profile.collapsed().splitlines() == [
+        f"{stack} {count}" for stack, count in sorted(profile.stacks.items())
+    ]
+
+
+def test_stop_async_joins_the_sampler_off_the_event_loop():
+    profiler = RequestProfiler(interval_ms=0.5, max_entries=2)
+
+    async def scenario():
+        with bind_request("req-2") as request:
+            sampler = profiler.start(
+                request, anchor=sys._getframe(), method="GET", path="/"
+            )
+            await asyncio.sleep(0.01)
+            loop_thread = threading.current_thread()
+            joined_on = []
+            join = sampler._thread.join
+
+            def recording_join():
+                joined_on.append(threading.current_thread())
+                join()
+
+            sampler._thread.join = recording_join
+            profile = await sampler.stop_async(204)
+            again = await sampler.stop_async(500)
+            return loop_thread, joined_on, profile, again
+
+    loop_thread, joined_on, profile, again = asyncio.run(scenario())
+
+    assert joined_on and loop_thread not in joined_on
+    assert again is profile
+    assert profile.status_code == 204
+    assert profiler.get("req-2") is profile
@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+from backend.core.request_context import (
+    bind_request,
+    current_request,
+    records_use_cases,
+    route_template,
+)
+
+
+@records_use_cases
+class FakeUseCases:
+    def outer(self):
+        seen = (current_request().controller, current_request().action)
+        return seen, self.inner()
+
+    def inner(self):
+        return current_request().action
+
+    def _private(self):
+        return current_request().action
+
+    def add(self, a, b):
+        return a + b
+
+
+def test_use_case_methods_are_recorded_while_they_run():
+    with bind_request("req-1") as request:
+        (outer, inner) = FakeUseCases().outer()
+        private = FakeUseCases()._private()
+
+    assert outer == ("FakeUseCases", "outer")
+    assert inner == "inner"
+    assert private is None
+    assert (request.controller, request.action) == (None, None)
+
+
+def test_use_cases_run_unchanged_outside_a_request():
+    assert FakeUseCases().add(2, b=3) == 5
+    assert FakeUseCases.add.__name__ == "add"
+
+
+def test_bind_request_restores_the_previous_context():
+    with bind_request("outer") as outer:
+        with bind_request("inner"):
+            assert current_request().request_id == "inner"
+        assert current_request() is outer
+    assert current_request() is None
+
+
+def test_route_template_prefers_the_prefixed_template():
+    route = SimpleNamespace(path="/incidents/{incident_id}")
+    context = SimpleNamespace(path_format="/api/v1/incidents/{incident_id}")
+
+    assert route_template({"route": route}) == "/incidents/{incident_id}"
+    assert (
+        route_template({"route": route, "fastapi": {"effective_route_context": context}})
+        == "/api/v1/incidents/{incident_id}"
+    )
+    assert route_template({}) is None
@@ -0,0 +1,29 @@
+from backend.db.slow_queries import parameter_shapes
+
+
+def test_parameter_shapes_keep_types_and_sizes_but_not_values():
+    shapes = parameter_shapes(
+        {
+            "title": "Database Outage",
+            "id_1": 42,
+            "ids": [1, 2, 3],
+            "body": b"\x00\x01",
+            "missing": None,
+        }
+    )
+
+    assert shapes == {
+        "title": "str[15]",
+        "id_1": "int",
+        "ids": "list[3]<int>",
+        "body": "bytes[2]",
+        "missing": "null",
+    }
+
+
+def test_parameter_shapes_of_positional_and_executemany_parameters():
+    assert parameter_shapes(("a", 1.5)) == {"0": "str[1]", "1": "float"}
+    assert parameter_shapes(
+        [{"title": "one"}, {"title": "three"}], executemany=True
+    ) == {"title": "str[3]", "rows": "2"}
+    assert parameter_shapes(None) == {}
@@ -0,0 +1,41 @@
+from backend.core.request_context import RequestContext
+from backend.db.sql_comments import sql_comment
+
+
+def _request(**overrides):
+    values = {
+        "request_id": "abc123",
+        "route": "/api/v1/incidents/{incident_id}",
+        "controller": "IncidentUseCases",
+        "action": "get_incident",
+    }
+    return RequestContext(**{**values, **overrides})
+
+
+def test_sql_comment_lists_tags_in_key_order():
+    assert sql_comment(_request()) == (
+        "/*action='get_incident',controller='IncidentUseCases',"
+        "request_id='abc123',route='/api/v1/incidents/{incident_id}'*/"
+    )
+
+
+def test_stable_sql_comment_leaves_out_the_request_id():
+    assert sql_comment(_request(), include_request_id=False) == (
+        "/*action='get_incident',controller='IncidentUseCases',"
+        "route='/api/v1/incidents/{incident_id}'*/"
+    )
+
+
+def test_sql_comment_skips_unknown_tags():
+    request = _request(route=None, controller=None, action=None)
+
+    assert sql_comment(request) == "/*request_id='abc123'*/"
+    assert sql_comment(request, include_request_id=False) == ""
+
+
+def test_sql_comment_values_cannot_close_the_comment_or_add_placeholders():
+    comment = sql_comment(_request(request_id="x*/; DROP TABLE incidents; --'%s"))
+
+    assert comment.count("*/") == 1 and comment.endswith("*/")
+    assert "%" not in comment
+    assert "'" not in comment.split("request_id=")[1].split(",")[0][1:-1]
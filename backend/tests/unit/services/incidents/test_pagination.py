@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.domain.incidents.entities import Incident, TimelineEvent
+from backend.domain.incidents.enums import IncidentSort, Severity, SortDirection, Status
+from backend.services.errors import ValidationError
+from backend.services.incidents.pagination import (
+    EventFeedCursor,
+    IncidentCursor,
+    decode_cursor,
+    decode_event_cursor,
+    default_direction,
+    encode_cursor,
+    encode_event_cursor,
+    incident_sort_key,
+    next_event_page_cursor,
+    next_page_cursor,
+)
+
+
+def _dt(hour: int) -> datetime:
+    return datetime(2026, 1, 23, hour, tzinfo=timezone.utc)
+
+
+def _incident(incident_id: int, **overrides) -> Incident:
+    fields = {
+        "id": incident_id,
+        "title": "Incident",
+        "description": "Desc",
+        "status": Status.OPEN,
+        "severity": Severity.SEV2,
+        "created_at": _dt(9),
+        "updated_at": _dt(10),
+        **overrides,
+    }
+    return Incident(**fields)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        IncidentCursor(IncidentSort.CREATED_AT, SortDirection.DESC, (_dt(9),), 7),
+        IncidentCursor(IncidentSort.UPDATED_AT, SortDirection.ASC, (_dt(10),), 8),
+        IncidentCursor(
+            IncidentSort.SEVERITY, SortDirection.ASC, (Severity.SEV1, _dt(9)), 9
+        ),
+        IncidentCursor(IncidentSort.LAST_ACTIVITY, SortDirection.DESC, (_dt(11),), 10),
+    ],
+)
+def test_cursor_round_trips(cursor):
+    token = encode_cursor(cursor)
+
+    assert "=" not in token
+    assert decode_cursor(token) == cursor
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not-a-cursor",
+        "",
+        encode_cursor(
+            IncidentCursor(IncidentSort.CREATED_AT, SortDirection.DESC, (_dt(9),), 1)
+        )[:-4],
+    ],
+)
+def test_decode_cursor_rejects_malformed_tokens(token):
+    with pytest.raises(ValidationError) as e:
+        decode_cursor(token)
+
+    assert str(e.value) == "cursor is invalid"
+
+
+def test_decode_cursor_rejects_naive_timestamps():
+    cursor = IncidentCursor(
+        IncidentSort.CREATED_AT,
+        SortDirection.DESC,
+        (datetime(2026, 1, 23, 9),),
+        1,
+    )
+
+    with pytest.raises(ValidationError):
+        decode_cursor(encode_cursor(cursor))
+
+
+def test_default_direction_puts_most_severe_and_newest_first():
+    assert default_direction(IncidentSort.SEVERITY) is SortDirection.ASC
+    assert default_direction(IncidentSort.CREATED_AT) is SortDirection.DESC
+    assert default_direction(IncidentSort.UPDATED_AT) is SortDirection.DESC
+    assert default_direction(IncidentSort.LAST_ACTIVITY) is SortDirection.DESC
+
+
+def test_incident_sort_key_falls_back_to_created_at_without_events():
+    quiet = _incident(1)
+    busy = _incident(2, last_event_at=_dt(12))
+
+    assert incident_sort_key(quiet, IncidentSort.LAST_ACTIVITY) == (_dt(9),)
+    assert incident_sort_key(busy, IncidentSort.LAST_ACTIVITY) == (_dt(12),)
+    assert incident_sort_key(busy, IncidentSort.SEVERITY) == (Severity.SEV2, _dt(9))
+
+
+def test_next_page_cursor_points_after_the_last_incident_of_a_full_page():
+    page = [_incident(3), _incident(2, severity=Severity.SEV3)]
+
+    token = next_page_cursor(page, sort=IncidentSort.SEVERITY, direction=None, limit=2)
+
+    assert decode_cursor(token) == IncidentCursor(
+        IncidentSort.SEVERITY, SortDirection.ASC, (Severity.SEV3, _dt(9)), 2
+    )
+
+
+def test_next_page_cursor_is_none_for_a_short_page():
+    def cursor(page, limit):
+        return next_page_cursor(
+            page, sort=IncidentSort.CREATED_AT, direction=None, limit=limit
+        )
+
+    assert cursor([_incident(1)], limit=2) is None
+    assert cursor([], limit=1) is None
+
+
+def test_event_cursor_round_trips():
+    cursor = EventFeedCursor(created_at=_dt(9), id=42)
+
+    assert decode_event_cursor(encode_event_cursor(cursor)) == cursor
+    assert cursor.after() == (_dt(9), 42)
+
+
+def test_decode_event_cursor_rejects_incident_cursors():
+    token = encode_cursor(
+        IncidentCursor(IncidentSort.CREATED_AT, SortDirection.DESC, (_dt(9),), 1)
+    )
+
+    with pytest.raises(ValidationError) as e:
+        decode_event_cursor(token)
+
+    assert str(e.value) == "cursor is invalid"
+
+
+def test_next_event_page_cursor_points_after_the_last_event_of_a_full_page():
+    def event(event_id, hour):
+        return TimelineEvent(
+            id=event_id,
+            incident_id=1,
+            occurred_at=_dt(hour),
+            event_type="note",
+            message="hello",
+            created_at=_dt(hour),
+            updated_at=_dt(hour),
+        )
+
+    page = [event(5, 11), event(4, 10)]
+
+    assert decode_event_cursor(next_event_page_cursor(page, limit=2)) == (
+        EventFeedCursor(created_at=_dt(10), id=4)
+    )
+    assert next_event_page_cursor(page, limit=3) is None
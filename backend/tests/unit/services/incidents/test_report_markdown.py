@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 from backend.domain.incidents.entities import Incident, TimelineEvent
-from backend.domain.incidents.enums import Severity, Status
+from backend.domain.incidents.enums import Severity, Status, TimelineOrder
 from backend.services.incidents.report_markdown import render_incident_report_markdown
 
 
@@ -71,6 +71,15 @@ def test_markdown_report_includes_timeline_order_count_and_supplied_event_order(
     assert markdown.index("First supplied event") < markdown.index("Second supplied event")
 
 
+def test_markdown_report_labels_occurred_at_timeline_order():
+    markdown = render_incident_report_markdown(
+        _incident(events=[_event(event_id=10)]),
+        order_by=TimelineOrder.OCCURRED_AT,
+    )
+
+    assert "Timeline order: occurred_at_desc_id_desc" in markdown
+
+
 def test_markdown_report_renders_no_events_message():
     markdown = render_incident_report_markdown(_incident(events=[]))
 
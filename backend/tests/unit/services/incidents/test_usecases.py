@@ -2,10 +2,28 @@ from __future__ import annotations
 
 import pytest
 from dataclasses import replace
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from backend.domain.incidents.entities import Incident, TimelineEvent
-from backend.domain.incidents.enums import Severity, Status
+from backend.domain.incidents.enums import (
+    ChangeAction,
+    ChangeEntity,
+    IncidentSort,
+    Severity,
+    SortDirection,
+    StatsBucket,
+    StatsSource,
+    Status,
+    TimelineOrder,
+)
+from backend.domain.incidents.read_models import (
+    DashboardSnapshot,
+    IncidentChange,
+    DurationPercentiles,
+    IncidentStats,
+    SeverityResponseTimes,
+    StatusSeverityCount,
+)
 from backend.services.errors import NotFoundError, ValidationError
 from backend.services.incidents.commands import (
     CreateIncidentCmd,
@@ -13,7 +31,20 @@ from backend.services.incidents.commands import (
     CreateTimelineEventCmd,
     UpdateTimelineEventCmd,
 )
-from backend.services.incidents.usecases import IncidentUseCases
+from backend.services.incidents.pagination import (
+    IncidentCursor,
+    encode_cursor,
+    incident_sort_key,
+    next_event_page_cursor,
+    next_page_cursor,
+)
+from backend.services.incidents.usecases import (
+    MAX_BATCH_GET_IDS,
+    MAX_DASHBOARD_ITEMS,
+    MAX_EMBEDDED_EVENTS,
+    MAX_SYNC_CHANGES,
+    IncidentUseCases,
+)
 
 
 def _now() -> datetime:
@@ -26,41 +57,138 @@ class FakeIncidentRepo:
         self.exists_calls = 0
         self.get_calls = 0
         self.get_with_events_calls = 0
+        self.last_events_order_by = None
+        self.last_list_order = None
+        self.last_fields = None
+        self.last_include_latest_events = None
+        self.get_many_calls = []
         self._next_id = (max(self._incidents.keys()) + 1) if self._incidents else 1
 
     def list(
         self,
         *,
-        status: Status | None = None,
-        severity: Severity | None = None,
+        sort: IncidentSort = IncidentSort.CREATED_AT,
+        direction: SortDirection = SortDirection.DESC,
+        after: tuple | None = None,
+        include_latest_events: int = 0,
+        fields=None,
         limit: int = 50,
         offset: int = 0,
+        **filters,
     ) -> list[Incident]:
-        items = self._filter(status=status, severity=severity)
-        items = sorted(items, key=lambda x: (x.created_at, x.id), reverse=True)
+        self.last_fields = fields
+        self.last_list_order = (sort, direction, after)
+        self.last_include_latest_events = include_latest_events
+        descending = direction == SortDirection.DESC
+
+        def key(incident):
+            return (*incident_sort_key(incident, sort), incident.id)
+
+        items = sorted(self._filter(**filters), key=key, reverse=descending)
+        if after is not None:
+            items = [
+                i for i in items if (key(i) < after if descending else key(i) > after)
+            ]
+        items = [replace(i, events=i.events[:include_latest_events]) for i in items]
         return items[offset : offset + limit]
 
-    def count(
-        self, *, status: Status | None = None, severity: Severity | None = None
-    ) -> int:
-        return len(self._filter(status=status, severity=severity))
+    def count(self, **filters) -> int:
+        return len(self._filter(**filters))
 
     def _filter(
-        self, *, status: Status | None = None, severity: Severity | None = None
+        self,
+        *,
+        status=None,
+        severity=None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        active_only: bool = False,
     ) -> list[Incident]:
         items = list(self._incidents.values())
-        if status is not None:
-            items = [i for i in items if i.status == status]
-        if severity is not None:
-            items = [i for i in items if i.severity == severity]
+        if active_only:
+            items = [i for i in items if i.status != Status.RESOLVED]
+        if status:
+            statuses = {status} if isinstance(status, Status) else set(status)
+            items = [i for i in items if i.status in statuses]
+        if severity:
+            severities = {severity} if isinstance(severity, Severity) else set(severity)
+            items = [i for i in items if i.severity in severities]
+        if created_after is not None:
+            items = [i for i in items if i.created_at >= created_after]
+        if created_before is not None:
+            items = [i for i in items if i.created_at < created_before]
         return items
 
-    def get(self, incident_id: int) -> Incident | None:
+    def dashboard(
+        self, *, active_limit: int = 50, recent_events: int = 20
+    ) -> DashboardSnapshot:
+        active = sorted(
+            self._filter(active_only=True),
+            key=lambda i: (i.created_at, i.id),
+            reverse=True,
+        )
+        return DashboardSnapshot(active_incidents=active[:active_limit])
+
+    def stats(
+        self,
+        *,
+        bucket: StatsBucket = StatsBucket.DAY,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        source: StatsSource = StatsSource.RAW,
+    ) -> IncidentStats:
+        items = self._filter(created_after=created_after, created_before=created_before)
+        return IncidentStats(
+            bucket=bucket,
+            total=len(items),
+            source=source,
+            by_status_severity=[
+                StatusSeverityCount(
+                    status,
+                    severity,
+                    sum(1 for i in items if (i.status, i.severity) == (status, severity)),
+                )
+                for status in Status
+                for severity in Severity
+            ],
+        )
+
+    def response_times(
+        self,
+        *,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> list[SeverityResponseTimes]:
+        self.last_response_times_window = (created_after, created_before)
+        return [
+            SeverityResponseTimes(
+                severity=severity,
+                time_to_acknowledge=DurationPercentiles(count=0),
+                time_to_resolve=DurationPercentiles(count=0),
+            )
+            for severity in Severity
+        ]
+
+    def get(self, incident_id: int, *, fields=None) -> Incident | None:
         self.get_calls += 1
+        self.last_fields = fields
         return self._incidents.get(incident_id)
 
-    def get_with_events(self, incident_id: int) -> Incident | None:
+    def get_many(self, incident_ids, *, with_events: bool = False) -> list[Incident]:
+        self.get_many_calls.append((list(incident_ids), with_events))
+        # Like the SQL query, results come back in storage order.
+        return [i for i in self._incidents.values() if i.id in set(incident_ids)]
+
+    def get_with_events(
+        self,
+        incident_id: int,
+        *,
+        events_order_by: TimelineOrder = TimelineOrder.CREATED_AT,
+        fields=None,
+    ) -> Incident | None:
         self.get_with_events_calls += 1
+        self.last_fields = fields
+        self.last_events_order_by = events_order_by
         return self._incidents.get(incident_id)
 
     def create(self, incident_data: dict) -> Incident:
@@ -103,18 +231,92 @@ class FakeEventRepo:
         for e in events or []:
             self._events[(e.incident_id, e.id)] = e
         self._next_id = max((e.id for e in (events or [])), default=0) + 1
+        self.last_fields = None
+        self.last_recent_filters = None
 
     def list_incident_events(
-        self, incident_id: int, *, limit: int = 50, offset: int = 0
+        self,
+        incident_id: int,
+        *,
+        event_type: str | None = None,
+        occurred_after: datetime | None = None,
+        occurred_before: datetime | None = None,
+        order_by: TimelineOrder = TimelineOrder.CREATED_AT,
+        fields=None,
+        limit: int = 50,
+        offset: int = 0,
     ) -> list[TimelineEvent]:
-        items = [e for (iid, _), e in self._events.items() if iid == incident_id]
-        items = sorted(items, key=lambda x: (x.created_at, x.id), reverse=True)
+        self.last_fields = fields
+        items = self._filter(
+            incident_id,
+            event_type=event_type,
+            occurred_after=occurred_after,
+            occurred_before=occurred_before,
+        )
+        if order_by == TimelineOrder.OCCURRED_AT:
+            key = lambda x: (x.occurred_at, x.id)
+        else:
+            key = lambda x: (x.created_at, x.id)
+        items = sorted(items, key=key, reverse=True)
         return items[offset : offset + limit]
 
-    def count_incident_events(self, incident_id: int) -> int:
-        return len([e for (iid, _), e in self._events.items() if iid == incident_id])
+    def list_recent(
+        self,
+        *,
+        event_type: str | None = None,
+        severity=None,
+        after: tuple[datetime, int] | None = None,
+        limit: int = 50,
+    ) -> list[TimelineEvent]:
+        self.last_recent_filters = {"event_type": event_type, "severity": severity}
+        items = sorted(
+            self._events.values(), key=lambda x: (x.created_at, x.id), reverse=True
+        )
+        if event_type is not None:
+            items = [e for e in items if e.event_type == event_type]
+        if after is not None:
+            items = [e for e in items if (e.created_at, e.id) < after]
+        return items[:limit]
+
+    def get_many(self, event_ids) -> list[TimelineEvent]:
+        return [e for e in self._events.values() if e.id in set(event_ids)]
 
-    def get(self, incident_id: int, event_id: int) -> TimelineEvent | None:
+    def count_incident_events(
+        self,
+        incident_id: int,
+        *,
+        event_type: str | None = None,
+        occurred_after: datetime | None = None,
+        occurred_before: datetime | None = None,
+    ) -> int:
+        return len(
+            self._filter(
+                incident_id,
+                event_type=event_type,
+                occurred_after=occurred_after,
+                occurred_before=occurred_before,
+            )
+        )
+
+    def _filter(
+        self,
+        incident_id: int,
+        *,
+        event_type: str | None = None,
+        occurred_after: datetime | None = None,
+        occurred_before: datetime | None = None,
+    ) -> list[TimelineEvent]:
+        items = [e for (iid, _), e in self._events.items() if iid == incident_id]
+        if event_type is not None:
+            items = [e for e in items if e.event_type == event_type]
+        if occurred_after is not None:
+            items = [e for e in items if e.occurred_at >= occurred_after]
+        if occurred_before is not None:
+            items = [e for e in items if e.occurred_at < occurred_before]
+        return items
+
+    def get(self, incident_id: int, event_id: int, *, fields=None) -> TimelineEvent | None:
+        self.last_fields = fields
         return self._events.get((incident_id, event_id))
 
     def create(self, incident_id: int, event_data: dict) -> TimelineEvent:
@@ -147,15 +349,32 @@ class FakeEventRepo:
         return self._events.pop((incident_id, event_id), None) is not None
 
 
+class FakeChangeLogRepo:
+    def __init__(self, changes: list[IncidentChange] | None = None):
+        self._changes = changes or []
+
+    def list_since(self, since: int, *, limit: int) -> list[IncidentChange]:
+        return [c for c in self._changes if c.seq > since][:limit]
+
+    def latest_seq(self) -> int:
+        return max((c.seq for c in self._changes), default=0)
+
+
 class FakeUoW:
     """
     Mimics your SqlAlchemyUnitOfWork behaviour:
     commit on success, rollback on exception, context-managed.
     """
 
-    def __init__(self, incidents: FakeIncidentRepo, events: FakeEventRepo):
+    def __init__(
+        self,
+        incidents: FakeIncidentRepo,
+        events: FakeEventRepo,
+        changes: FakeChangeLogRepo | None = None,
+    ):
         self.incidents = incidents
         self.events = events
+        self.changes = changes or FakeChangeLogRepo()
         self.committed = False
         self.rolled_back = False
 
@@ -216,6 +435,113 @@ def make_event(*, incident_id: int, event_id: int = 1) -> TimelineEvent:
     )
 
 
+def test_list_recent_events_pages_across_incidents_with_a_cursor():
+    events = FakeEventRepo(
+        [
+            make_event(incident_id=1, event_id=1),
+            make_event(incident_id=2, event_id=2),
+            make_event(incident_id=1, event_id=3),
+        ]
+    )
+
+    with FakeUoW(FakeIncidentRepo(), events) as uow:
+        uc = IncidentUseCases(uow)
+        first = uc.list_recent_events(limit=2)
+        token = next_event_page_cursor(first, limit=2)
+        second = uc.list_recent_events(cursor=token, limit=2)
+
+    assert [e.id for e in first] + [e.id for e in second] == [3, 2, 1]
+
+
+def test_list_recent_events_trims_event_type_and_passes_severity():
+    events = FakeEventRepo()
+
+    with FakeUoW(FakeIncidentRepo(), events) as uow:
+        uc = IncidentUseCases(uow)
+        uc.list_recent_events(event_type=" note ", severity=[Severity.SEV1])
+        with pytest.raises(ValidationError) as exc:
+            uc.list_recent_events(event_type="   ")
+
+    assert events.last_recent_filters == {
+        "event_type": "note",
+        "severity": [Severity.SEV1],
+    }
+    assert str(exc.value) == "event_type cannot be empty"
+
+
+def _logged(seq, entity, action, incident_id, row_id=None):
+    return IncidentChange(
+        entity=entity,
+        action=action,
+        incident_id=incident_id,
+        id=incident_id if row_id is None else row_id,
+        seq=seq,
+    )
+
+
+def test_list_changes_returns_current_rows_and_tombstones():
+    incident = make_incident(incident_id=1)
+    event = make_event(incident_id=1, event_id=10)
+    log = FakeChangeLogRepo(
+        [
+            _logged(1, ChangeEntity.INCIDENT, ChangeAction.CREATED, 1),
+            _logged(2, ChangeEntity.EVENT, ChangeAction.CREATED, 1, 10),
+            _logged(3, ChangeEntity.INCIDENT, ChangeAction.CREATED, 2),
+            _logged(4, ChangeEntity.EVENT, ChangeAction.CREATED, 1, 11),
+            _logged(5, ChangeEntity.INCIDENT, ChangeAction.UPDATED, 1),
+            _logged(6, ChangeEntity.EVENT, ChangeAction.DELETED, 1, 11),
+            _logged(7, ChangeEntity.INCIDENT, ChangeAction.DELETED, 2),
+        ]
+    )
+
+    with FakeUoW(FakeIncidentRepo([incident]), FakeEventRepo([event]), log) as uow:
+        change_set = IncidentUseCases(uow).list_changes(since=0)
+
+    assert change_set.next_token == 7
+    assert change_set.has_more is False
+    assert change_set.incidents == [incident]
+    assert change_set.events == [event]
+    assert change_set.deleted_incident_ids == [2]
+    assert change_set.deleted_event_ids == [11]
+
+
+def test_list_changes_pages_through_the_log():
+    log = FakeChangeLogRepo(
+        [
+            _logged(seq, ChangeEntity.INCIDENT, ChangeAction.DELETED, seq)
+            for seq in range(1, 6)
+        ]
+    )
+
+    with FakeUoW(FakeIncidentRepo(), FakeEventRepo(), log) as uow:
+        uc = IncidentUseCases(uow)
+        first = uc.list_changes(since=0, limit=3)
+        second = uc.list_changes(since=first.next_token, limit=3)
+        caught_up = uc.list_changes(since=second.next_token, limit=3)
+
+    assert (first.next_token, first.has_more) == (3, True)
+    assert first.deleted_incident_ids == [1, 2, 3]
+    assert (second.next_token, second.has_more) == (5, False)
+    assert second.deleted_incident_ids == [4, 5]
+    assert (caught_up.next_token, caught_up.deleted_incident_ids) == (5, [])
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"since": -1}, "since cannot be negative"),
+        ({"limit": 0}, f"limit must be between 1 and {MAX_SYNC_CHANGES}"),
+        ({"since": 99}, "since is ahead of the change log"),
+    ],
+)
+def test_list_changes_rejects_invalid_tokens_and_limits(kwargs, message):
+    with FakeUoW(FakeIncidentRepo(), FakeEventRepo()) as uow:
+        with pytest.raises(ValidationError) as exc:
+            IncidentUseCases(uow).list_changes(**kwargs)
+
+    assert str(exc.value) == message
+
+
 def test_create_incident_trims_and_persists():
     incidents = FakeIncidentRepo()
     events = FakeEventRepo()
@@ -369,6 +695,133 @@ def test_list_events_missing_incident_raises_not_found():
     assert uow.rolled_back is True
 
 
+def test_list_events_filters_by_type_and_occurred_window_before_counting():
+    def at(hour: int, minute: int) -> datetime:
+        return datetime(2026, 1, 23, hour, minute, tzinfo=timezone.utc)
+
+    before_window = replace(
+        make_event(incident_id=1, event_id=10),
+        event_type="status_change",
+        occurred_at=at(14, 0),
+    )
+    in_window = replace(
+        make_event(incident_id=1, event_id=11),
+        event_type="status_change",
+        occurred_at=at(14, 2),
+    )
+    wrong_type = replace(
+        make_event(incident_id=1, event_id=12),
+        event_type="note",
+        occurred_at=at(14, 10),
+    )
+    at_window_end = replace(
+        make_event(incident_id=1, event_id=13),
+        event_type="status_change",
+        occurred_at=at(14, 30),
+    )
+    incidents = FakeIncidentRepo([make_incident(incident_id=1)])
+    events = FakeEventRepo([before_window, in_window, wrong_type, at_window_end])
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        got, total = uc.list_events(
+            1,
+            event_type=" status_change ",
+            occurred_after=at(14, 2),
+            occurred_before=at(14, 30),
+        )
+
+    assert [event.id for event in got] == [11]
+    assert total == 1
+
+
+def test_list_events_orders_by_occurred_at_when_requested():
+    occurred_late = replace(
+        make_event(incident_id=1, event_id=10),
+        occurred_at=datetime(2026, 1, 23, 15, 0, tzinfo=timezone.utc),
+        created_at=datetime(2026, 1, 23, 9, 0, tzinfo=timezone.utc),
+    )
+    occurred_early = replace(
+        make_event(incident_id=1, event_id=11),
+        occurred_at=datetime(2026, 1, 23, 14, 0, tzinfo=timezone.utc),
+        created_at=datetime(2026, 1, 23, 10, 0, tzinfo=timezone.utc),
+    )
+    incidents = FakeIncidentRepo([make_incident(incident_id=1)])
+    events = FakeEventRepo([occurred_late, occurred_early])
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        by_created, _ = uc.list_events(1)
+        by_occurred, _ = uc.list_events(1, order_by=TimelineOrder.OCCURRED_AT)
+
+    assert [event.id for event in by_created] == [11, 10]
+    assert [event.id for event in by_occurred] == [10, 11]
+
+
+def test_list_events_rejects_inverted_occurred_window():
+    incidents = FakeIncidentRepo([make_incident(incident_id=1)])
+    events = FakeEventRepo()
+
+    with pytest.raises(ValidationError) as e:
+        with FakeUoW(incidents, events) as uow:
+            uc = IncidentUseCases(uow)
+            uc.list_events(
+                1,
+                occurred_after=datetime(2026, 1, 23, 14, 30, tzinfo=timezone.utc),
+                occurred_before=datetime(2026, 1, 23, 14, 2, tzinfo=timezone.utc),
+            )
+
+    assert str(e.value) == "occurred_after must be earlier than occurred_before"
+    assert incidents.exists_calls == 0
+    assert uow.rolled_back is True
+
+
+def test_list_events_reads_bounds_without_an_offset_as_utc():
+    in_window = replace(
+        make_event(incident_id=1, event_id=10),
+        occurred_at=datetime(2026, 1, 23, 14, 0, tzinfo=timezone.utc),
+    )
+    incidents = FakeIncidentRepo([make_incident(incident_id=1)])
+    events = FakeEventRepo([in_window])
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        got, total = uc.list_events(
+            1,
+            occurred_after=datetime(2026, 1, 23, 13, 0),
+            occurred_before=datetime(
+                2026, 1, 23, 16, 0, tzinfo=timezone(timedelta(hours=1))
+            ),
+        )
+
+    assert [event.id for event in got] == [10]
+    assert total == 1
+
+    with pytest.raises(ValidationError) as e:
+        with FakeUoW(incidents, events) as uow:
+            IncidentUseCases(uow).list_events(
+                1,
+                occurred_after=datetime(2026, 1, 23, 15, 0),
+                occurred_before=datetime(
+                    2026, 1, 23, 16, 0, tzinfo=timezone(timedelta(hours=1))
+                ),
+            )
+
+    assert str(e.value) == "occurred_after must be earlier than occurred_before"
+
+
+def test_list_events_rejects_blank_event_type_filter():
+    incidents = FakeIncidentRepo([make_incident(incident_id=1)])
+    events = FakeEventRepo()
+
+    with pytest.raises(ValidationError) as e:
+        with FakeUoW(incidents, events) as uow:
+            uc = IncidentUseCases(uow)
+            uc.list_events(1, event_type="   ")
+
+    assert str(e.value) == "event_type cannot be empty"
+
+
 def test_list_incidents_returns_all_when_no_filters():
     older_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
     newer_time = datetime(2024, 1, 2, tzinfo=timezone.utc)
@@ -418,6 +871,412 @@ def test_list_incidents_passes_severity_filter():
     assert total == 1
 
 
+def test_list_incidents_matches_any_of_several_statuses_and_severities():
+    incidents = FakeIncidentRepo(
+        [
+            make_incident(incident_id=1, status=Status.OPEN, severity=Severity.SEV1),
+            make_incident(
+                incident_id=2, status=Status.INVESTIGATING, severity=Severity.SEV2
+            ),
+            make_incident(incident_id=3, status=Status.RESOLVED, severity=Severity.SEV1),
+            make_incident(incident_id=4, status=Status.OPEN, severity=Severity.SEV3),
+        ]
+    )
+    events = FakeEventRepo()
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        got, total = uc.list_incidents(
+            status=[Status.OPEN, Status.INVESTIGATING],
+            severity=[Severity.SEV1, Severity.SEV2],
+        )
+
+    assert sorted(i.id for i in got) == [1, 2]
+    assert total == 2
+
+
+def test_list_incidents_filters_by_created_window():
+    def day(n: int) -> datetime:
+        return datetime(2024, 1, n, tzinfo=timezone.utc)
+
+    incidents = FakeIncidentRepo(
+        [
+            make_incident(incident_id=n, created_at=day(n))
+            for n in (1, 2, 3, 4)
+        ]
+    )
+    events = FakeEventRepo()
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        got, total = uc.list_incidents(created_after=day(2), created_before=day(4))
+
+    assert [i.id for i in got] == [3, 2]
+    assert total == 2
+
+
+def test_list_incidents_compares_mixed_offset_windows_in_utc():
+    incidents = FakeIncidentRepo(
+        [
+            make_incident(
+                incident_id=n, created_at=datetime(2024, 1, n, tzinfo=timezone.utc)
+            )
+            for n in (1, 2, 3)
+        ]
+    )
+
+    with FakeUoW(incidents, FakeEventRepo()) as uow:
+        uc = IncidentUseCases(uow)
+        got, total = uc.list_incidents(
+            created_after=datetime(2024, 1, 2),
+            created_before=datetime(2024, 1, 3, 2, tzinfo=timezone(timedelta(hours=2))),
+        )
+
+    assert [i.id for i in got] == [2]
+    assert total == 1
+
+
+def test_list_incidents_active_only_excludes_resolved():
+    incidents = FakeIncidentRepo(
+        [
+            make_incident(incident_id=1, status=Status.OPEN),
+            make_incident(incident_id=2, status=Status.RESOLVED),
+            make_incident(incident_id=3, status=Status.INVESTIGATING),
+        ]
+    )
+    events = FakeEventRepo()
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        got, total = uc.list_incidents(active_only=True)
+
+    assert sorted(i.id for i in got) == [1, 3]
+    assert total == 2
+
+
+def test_list_incidents_sorts_by_last_activity():
+    base = _now()
+    incidents = FakeIncidentRepo(
+        [
+            make_incident(incident_id=1, created_at=base),
+            replace(
+                make_incident(incident_id=2, created_at=base.replace(year=2000)),
+                last_event_at=base.replace(year=2100),
+            ),
+        ]
+    )
+    events = FakeEventRepo()
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        by_created, _ = uc.list_incidents()
+        by_activity, total = uc.list_incidents(sort=IncidentSort.LAST_ACTIVITY)
+
+    assert [i.id for i in by_created] == [1, 2]
+    assert [i.id for i in by_activity] == [2, 1]
+    assert total == 2
+
+
+@pytest.mark.parametrize("sort", list(IncidentSort))
+@pytest.mark.parametrize("direction", [None, *SortDirection])
+def test_list_incidents_cursor_pages_cover_every_incident_once(sort, direction):
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    incidents = FakeIncidentRepo(
+        [
+            make_incident(
+                incident_id=i,
+                severity=list(Severity)[i % 4],
+                created_at=base.replace(hour=i % 3),
+                updated_at=base.replace(hour=i % 5),
+            )
+            for i in range(1, 12)
+        ]
+    )
+    events = FakeEventRepo()
+    full, _ = IncidentUseCases(FakeUoW(incidents, events)).list_incidents(
+        sort=sort, direction=direction, limit=100
+    )
+
+    seen, cursor = [], None
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        while True:
+            page, total = uc.list_incidents(
+                sort=sort, direction=direction, cursor=cursor, limit=4
+            )
+            seen.extend(i.id for i in page)
+            cursor = next_page_cursor(page, sort=sort, direction=direction, limit=4)
+            if cursor is None:
+                break
+
+    assert seen == [i.id for i in full]
+    assert total == 11
+
+
+def test_list_incidents_sorts_by_severity_most_severe_first_by_default():
+    incidents = FakeIncidentRepo(
+        [
+            make_incident(incident_id=1, severity=Severity.SEV3),
+            make_incident(incident_id=2, severity=Severity.SEV1),
+            make_incident(incident_id=3, severity=Severity.SEV2),
+        ]
+    )
+    events = FakeEventRepo()
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        got, _ = uc.list_incidents(sort=IncidentSort.SEVERITY)
+
+    assert [i.severity for i in got] == [Severity.SEV1, Severity.SEV2, Severity.SEV3]
+    assert incidents.last_list_order == (IncidentSort.SEVERITY, SortDirection.ASC, None)
+
+
+def test_list_incidents_embeds_latest_events_when_requested():
+    events = [make_event(event_id=n, incident_id=1) for n in (3, 2, 1)]
+    incidents = FakeIncidentRepo([make_incident(incident_id=1, events=events)])
+
+    with FakeUoW(incidents, FakeEventRepo()) as uow:
+        uc = IncidentUseCases(uow)
+        [plain], _ = uc.list_incidents()
+        [embedded], _ = uc.list_incidents(include_latest_events=2)
+
+    assert plain.events == []
+    assert [e.id for e in embedded.events] == [3, 2]
+    assert incidents.last_include_latest_events == 2
+
+
+@pytest.mark.parametrize("count", [-1, MAX_EMBEDDED_EVENTS + 1])
+def test_list_incidents_rejects_out_of_range_include_latest_events(count):
+    incidents = FakeIncidentRepo()
+
+    with pytest.raises(ValidationError) as e:
+        with FakeUoW(incidents, FakeEventRepo()) as uow:
+            IncidentUseCases(uow).list_incidents(include_latest_events=count)
+
+    assert str(e.value) == (
+        f"include_latest_events must be between 0 and {MAX_EMBEDDED_EVENTS}"
+    )
+    assert incidents.last_include_latest_events is None
+
+
+def test_list_incidents_rejects_cursor_for_a_different_sort():
+    cursor = encode_cursor(
+        IncidentCursor(IncidentSort.CREATED_AT, SortDirection.DESC, (_now(),), 1)
+    )
+
+    with pytest.raises(ValidationError) as e:
+        with FakeUoW(FakeIncidentRepo(), FakeEventRepo()) as uow:
+            IncidentUseCases(uow).list_incidents(
+                sort=IncidentSort.CREATED_AT,
+                direction=SortDirection.ASC,
+                cursor=cursor,
+            )
+
+    assert str(e.value) == "cursor was issued for a different sort order"
+
+
+def test_list_incidents_rejects_cursor_combined_with_offset():
+    cursor = encode_cursor(
+        IncidentCursor(IncidentSort.CREATED_AT, SortDirection.DESC, (_now(),), 1)
+    )
+
+    with pytest.raises(ValidationError) as e:
+        with FakeUoW(FakeIncidentRepo(), FakeEventRepo()) as uow:
+            IncidentUseCases(uow).list_incidents(cursor=cursor, offset=10)
+
+    assert str(e.value) == "offset cannot be combined with cursor"
+
+
+def test_list_incidents_rejects_inverted_created_window():
+    incidents = FakeIncidentRepo()
+    events = FakeEventRepo()
+
+    with pytest.raises(ValidationError) as e:
+        with FakeUoW(incidents, events) as uow:
+            uc = IncidentUseCases(uow)
+            uc.list_incidents(
+                created_after=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                created_before=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+
+    assert str(e.value) == "created_after must be earlier than created_before"
+
+
+def test_get_dashboard_returns_newest_active_incidents_first():
+    incidents = FakeIncidentRepo(
+        [
+            make_incident(incident_id=1),
+            make_incident(incident_id=2, status=Status.RESOLVED),
+            make_incident(incident_id=3),
+            make_incident(incident_id=4),
+        ]
+    )
+    events = FakeEventRepo()
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        snapshot = uc.get_dashboard(active_limit=2)
+
+    assert [i.id for i in snapshot.active_incidents] == [4, 3]
+
+
+@pytest.mark.parametrize("name", ["active_limit", "recent_events"])
+@pytest.mark.parametrize("value", [0, MAX_DASHBOARD_ITEMS + 1])
+def test_get_dashboard_rejects_out_of_range_limits(name, value):
+    incidents = FakeIncidentRepo()
+    events = FakeEventRepo()
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        with pytest.raises(ValidationError) as exc:
+            uc.get_dashboard(**{name: value})
+
+    assert str(exc.value) == f"{name} must be between 1 and {MAX_DASHBOARD_ITEMS}"
+
+
+def test_get_incident_stats_counts_every_status_and_severity_in_window():
+    def day(n: int) -> datetime:
+        return datetime(2024, 1, n, tzinfo=timezone.utc)
+
+    incidents = FakeIncidentRepo(
+        [
+            make_incident(incident_id=1, severity=Severity.SEV1, created_at=day(1)),
+            make_incident(incident_id=2, severity=Severity.SEV1, created_at=day(2)),
+            make_incident(
+                incident_id=3,
+                status=Status.RESOLVED,
+                severity=Severity.SEV3,
+                created_at=day(3),
+            ),
+        ]
+    )
+    events = FakeEventRepo()
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        stats = uc.get_incident_stats(
+            bucket=StatsBucket.HOUR,
+            created_after=day(2),
+            created_before=day(4),
+        )
+
+    counts = {(c.status, c.severity): c.count for c in stats.by_status_severity}
+    assert stats.bucket == StatsBucket.HOUR
+    assert stats.total == 2
+    assert len(counts) == len(Status) * len(Severity)
+    assert counts[(Status.OPEN, Severity.SEV1)] == 1
+    assert counts[(Status.RESOLVED, Severity.SEV3)] == 1
+
+
+@pytest.mark.parametrize(
+    ("window", "expected_source"),
+    [
+        ({}, StatsSource.ROLLUP),
+        ({"created_after": datetime(2024, 1, 1, tzinfo=timezone.utc)}, StatsSource.ROLLUP),
+        (
+            {
+                "created_after": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                "created_before": datetime(2024, 1, 3, tzinfo=timezone.utc),
+            },
+            StatsSource.ROLLUP,
+        ),
+        (
+            {
+                "created_after": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                "created_before": datetime(2024, 1, 2, tzinfo=timezone.utc),
+            },
+            StatsSource.RAW,
+        ),
+        (
+            {
+                "created_after": datetime(2024, 1, 1),
+                "created_before": datetime(
+                    2024, 1, 2, 1, tzinfo=timezone(timedelta(hours=1))
+                ),
+            },
+            StatsSource.RAW,
+        ),
+    ],
+)
+def test_get_incident_stats_reads_rollups_for_windows_longer_than_a_day(
+    window, expected_source
+):
+    incidents = FakeIncidentRepo()
+    events = FakeEventRepo()
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        stats = uc.get_incident_stats(**window)
+
+    assert stats.source == expected_source
+
+
+def test_get_incident_stats_rejects_inverted_created_window():
+    incidents = FakeIncidentRepo()
+    events = FakeEventRepo()
+
+    with pytest.raises(ValidationError) as e:
+        with FakeUoW(incidents, events) as uow:
+            uc = IncidentUseCases(uow)
+            uc.get_incident_stats(
+                created_after=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                created_before=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            )
+
+    assert str(e.value) == "created_after must be earlier than created_before"
+
+
+def test_get_response_times_passes_window_to_repository():
+    incidents = FakeIncidentRepo()
+    events = FakeEventRepo()
+    window = (
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        datetime(2024, 2, 1, tzinfo=timezone.utc),
+    )
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        by_severity = uc.get_response_times(
+            created_after=window[0],
+            created_before=window[1],
+        )
+
+    assert incidents.last_response_times_window == window
+    assert [item.severity for item in by_severity] == list(Severity)
+
+
+def test_get_response_times_passes_mixed_offset_windows_in_utc():
+    incidents = FakeIncidentRepo()
+    events = FakeEventRepo()
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        uc.get_response_times(
+            created_after=datetime(2024, 1, 1),
+            created_before=datetime(2024, 2, 1, 9, tzinfo=timezone(timedelta(hours=9))),
+        )
+
+    assert incidents.last_response_times_window == (
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        datetime(2024, 2, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_get_response_times_rejects_inverted_created_window():
+    incidents = FakeIncidentRepo()
+    events = FakeEventRepo()
+
+    with pytest.raises(ValidationError) as e:
+        with FakeUoW(incidents, events) as uow:
+            uc = IncidentUseCases(uow)
+            uc.get_response_times(
+                created_after=datetime(2024, 2, 1, tzinfo=timezone.utc),
+                created_before=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+
+    assert str(e.value) == "created_after must be earlier than created_before"
+
+
 def test_list_incidents_applies_limit_offset_after_counting_total():
     older_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
     middle_time = datetime(2024, 1, 2, tzinfo=timezone.utc)
@@ -485,6 +1344,19 @@ def test_get_incident_report_uses_get_with_events():
     assert [event.id for event in got.events] == [10]
     assert incidents.get_with_events_calls == 1
     assert incidents.get_calls == 0
+    assert incidents.last_events_order_by == TimelineOrder.CREATED_AT
+
+
+def test_get_incident_report_passes_timeline_order():
+    inc = make_incident(incident_id=1)
+    incidents = FakeIncidentRepo([inc])
+    events = FakeEventRepo()
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        uc.get_incident_report(1, order_by=TimelineOrder.OCCURRED_AT)
+
+    assert incidents.last_events_order_by == TimelineOrder.OCCURRED_AT
 
 
 def test_get_incident_missing_raises_not_found():
@@ -499,6 +1371,58 @@ def test_get_incident_missing_raises_not_found():
     assert str(e.value) == "Incident not found"
 
 
+def test_get_incidents_returns_requested_order_and_missing_ids_in_one_call():
+    incidents = FakeIncidentRepo([make_incident(incident_id=i) for i in (1, 2, 3)])
+    events = FakeEventRepo()
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        got, missing = uc.get_incidents([3, 99, 1, 3], with_events=True)
+
+    assert [i.id for i in got] == [3, 1]
+    assert missing == [99]
+    assert incidents.get_many_calls == [([3, 99, 1], True)]
+    assert incidents.get_calls == 0
+
+
+@pytest.mark.parametrize(
+    ("ids", "message"),
+    [
+        ([], "At least one incident id is required"),
+        (
+            list(range(1, MAX_BATCH_GET_IDS + 2)),
+            f"At most {MAX_BATCH_GET_IDS} incident ids can be fetched at once",
+        ),
+    ],
+)
+def test_get_incidents_rejects_empty_and_oversized_batches(ids, message):
+    incidents = FakeIncidentRepo()
+    events = FakeEventRepo()
+
+    with pytest.raises(ValidationError) as e:
+        with FakeUoW(incidents, events) as uow:
+            IncidentUseCases(uow).get_incidents(ids)
+
+    assert str(e.value) == message
+    assert incidents.get_many_calls == []
+
+
+def test_get_incident_passes_sparse_fields_to_the_repository():
+    incidents = FakeIncidentRepo([make_incident(incident_id=1)])
+    events = FakeEventRepo([make_event(incident_id=1, event_id=7)])
+
+    with FakeUoW(incidents, events) as uow:
+        uc = IncidentUseCases(uow)
+        uc.get_incident(1, fields=["status"])
+        assert (incidents.get_calls, incidents.last_fields) == (1, ["status"])
+        uc.list_incidents(fields=["id"])
+        assert incidents.last_fields == ["id"]
+        uc.get_event(1, 7, fields=["message"])
+        assert events.last_fields == ["message"]
+        uc.list_events(1, fields=["event_type"])
+        assert events.last_fields == ["event_type"]
+
+
 def test_get_incident_report_missing_raises_not_found():
     incidents = FakeIncidentRepo([])
     events = FakeEventRepo()